@@ -0,0 +1,1769 @@
+"""Read git repository metadata from disk, without running git.
+
+Forking ``git`` costs a few milliseconds per call; reading the same answer
+from ``.git`` costs microseconds. This module covers the read paths libvcs
+asks for most often: refs (``HEAD``, loose refs and ``packed-refs``),
+whether an object is present (pack indexes and loose objects), the index's
+stat data, config files, and a cheap fingerprint of all of them.
+
+Anything it does not understand -- the reftable ref backend, version 1
+pack indexes, malformed files, symref loops -- raises
+:exc:`GitFsUnsupported`, and callers fall back to running git.
+
+Note
+----
+This is an internal API not covered by versioning policy.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import dataclasses
+import mmap
+import os
+import pathlib
+import re
+import stat
+import struct
+import threading
+import typing as t
+import zlib
+
+if t.TYPE_CHECKING:
+    from libvcs._internal.types import StrPath
+
+#: Symbolic refs git follows before giving up (``refs/files-backend.c``).
+SYMREF_MAX_DEPTH = 5
+
+_OID_RE = re.compile(rb"[0-9a-f]{40}(?:[0-9a-f]{24})?")
+
+#: Refs stored per worktree rather than in the common directory.
+_PER_WORKTREE_PREFIXES = ("refs/bisect/", "refs/worktree/", "refs/rewritten/")
+
+_PACKED_REFS_HEADER = b"# pack-refs with:"
+
+_SHA256_RE = re.compile(rb"(?im)^\s*objectformat\s*=\s*sha256\s*$")
+
+
+class GitFsUnsupported(Exception):
+    """The repository cannot be read in-process; ask git instead."""
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class GitDir:
+    """Location of a repository's metadata.
+
+    Parameters
+    ----------
+    git_dir : pathlib.Path
+        Per-worktree directory: ``.git``, the target of a ``gitdir:`` file,
+        or the repository itself when bare.
+    common_dir : pathlib.Path
+        Directory shared by all worktrees (``commondir``), holding objects,
+        most refs and ``packed-refs``. Same as ``git_dir`` outside linked
+        worktrees.
+
+    Examples
+    --------
+    >>> git_dir = GitDir.discover(example_git_repo.path)
+    >>> git_dir.git_dir == example_git_repo.path / '.git'
+    True
+    >>> git_dir.common_dir == git_dir.git_dir
+    True
+    """
+
+    git_dir: pathlib.Path
+    common_dir: pathlib.Path
+
+    @classmethod
+    def discover(cls, path: StrPath) -> GitDir:
+        """Locate the metadata of the repository at ``path``.
+
+        ``path`` is a worktree root (holding ``.git`` as a directory or a
+        ``gitdir:`` file) or a bare repository. Subdirectories are not
+        searched upwards.
+
+        Raises
+        ------
+        GitFsUnsupported
+            ``path`` is not a repository this module can read.
+        """
+        path = pathlib.Path(path)
+        dot_git = path / ".git"
+        if dot_git.is_dir():
+            git_dir = dot_git
+        elif dot_git.is_file():
+            content = dot_git.read_text(encoding="utf-8").strip()
+            if not content.startswith("gitdir:"):
+                msg = f"Unrecognized .git file: {dot_git}"
+                raise GitFsUnsupported(msg)
+            git_dir = path / content.removeprefix("gitdir:").strip()
+        elif (path / "HEAD").is_file() and (path / "objects").is_dir():
+            git_dir = path
+        else:
+            msg = f"Not a git repository: {path}"
+            raise GitFsUnsupported(msg)
+
+        common_dir = git_dir
+        commondir_file = git_dir / "commondir"
+        if commondir_file.is_file():
+            common_dir = git_dir / commondir_file.read_text(encoding="utf-8").strip()
+
+        if (common_dir / "reftable").is_dir():
+            msg = f"reftable ref storage is not supported: {common_dir}"
+            raise GitFsUnsupported(msg)
+        return cls(git_dir=git_dir, common_dir=common_dir)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class PackedRef:
+    """Entry of ``packed-refs``.
+
+    Parameters
+    ----------
+    name : str
+        Full ref name, e.g. ``refs/tags/v1.0``.
+    oid : str
+        Object the ref points to.
+    peeled : str, optional
+        Object an annotated tag ultimately points to (the ``^`` line).
+    """
+
+    name: str
+    oid: str
+    peeled: str | None = None
+
+
+class PackedRefs:
+    r"""Memory-mapped lookup in a ``packed-refs`` file.
+
+    Files written with the ``sorted`` trait (every git since 2.15) are
+    binary-searched in place, so a lookup touches a handful of pages however
+    many refs are packed. Unsorted files are scanned.
+
+    Examples
+    --------
+    >>> packed = tmp_path / 'packed-refs'
+    >>> _ = packed.write_text(
+    ...     '# pack-refs with: peeled fully-peeled sorted \n'
+    ...     + 'a' * 40 + ' refs/heads/master\n'
+    ...     + 'b' * 40 + ' refs/tags/v1.0\n'
+    ...     + '^' + 'c' * 40 + '\n'
+    ... )
+    >>> refs = PackedRefs(packed)
+    >>> refs.sorted, refs.fully_peeled
+    (True, True)
+    >>> refs.get('refs/tags/v1.0').peeled == 'c' * 40
+    True
+    >>> refs.get('refs/tags/missing') is None
+    True
+    >>> [ref.name for ref in refs]
+    ['refs/heads/master', 'refs/tags/v1.0']
+    >>> refs.close()
+    """
+
+    def __init__(self, path: StrPath) -> None:
+        self.path = pathlib.Path(path)
+        self.traits: frozenset[str] = frozenset()
+        self._data: mmap.mmap | bytes = b""
+        self._start = 0
+        with self.path.open("rb") as f:
+            stat = os.fstat(f.fileno())
+            self.signature = _stat_signature(stat)
+            if stat.st_size:
+                self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._data[: len(_PACKED_REFS_HEADER)] == _PACKED_REFS_HEADER:
+            end = self._data.find(b"\n")
+            if end == -1:
+                end = len(self._data)
+            header = bytes(self._data[len(_PACKED_REFS_HEADER) : end])
+            self.traits = frozenset(header.decode().split())
+            self._start = end + 1
+
+    @property
+    def sorted(self) -> bool:
+        """Whether refs are in byte order, allowing a binary search."""
+        return "sorted" in self.traits
+
+    @property
+    def fully_peeled(self) -> bool:
+        """Whether every annotated tag has a ``^`` line."""
+        return "fully-peeled" in self.traits
+
+    def close(self) -> None:
+        """Unmap the file."""
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._data = b""
+
+    def __iter__(self) -> t.Iterator[PackedRef]:
+        """Yield every packed ref in file order."""
+        pos = self._start
+        while pos < len(self._data):
+            ref, pos = self._record(pos)
+            yield ref
+
+    def get(self, name: str) -> PackedRef | None:
+        """Return the packed ref ``name``, or None."""
+        key = name.encode()
+        if not self.sorted:
+            return next((ref for ref in self if ref.name == name), None)
+
+        data = self._data
+        lo, hi = self._start, len(data)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = data.rfind(b"\n", lo, mid) + 1 or lo
+            if data[start : start + 1] == b"^":
+                start = data.rfind(b"\n", lo, start - 1) + 1 or lo
+            end = data.find(b"\n", start)
+            if end == -1:
+                end = len(data)
+            refname = data[start:end].partition(b" ")[2]
+            if refname == key:
+                return self._record(start)[0]
+            if refname < key:
+                lo = self._record(start)[1]
+            else:
+                hi = start
+        return None
+
+    def _record(self, pos: int) -> tuple[PackedRef, int]:
+        """Parse the ref at ``pos``; return it and where the next one starts."""
+        data = self._data
+        end = data.find(b"\n", pos)
+        if end == -1:
+            end = len(data)
+        oid, _, name = bytes(data[pos:end]).partition(b" ")
+        if not _OID_RE.fullmatch(oid) or not name:
+            msg = f"Malformed line in {self.path}: {bytes(data[pos:end])!r}"
+            raise GitFsUnsupported(msg)
+        pos, peeled = end + 1, None
+        if data[pos : pos + 1] == b"^":
+            end = data.find(b"\n", pos)
+            if end == -1:
+                end = len(data)
+            peeled = bytes(data[pos + 1 : end]).decode()
+            pos = end + 1
+        return PackedRef(name=name.decode(), oid=oid.decode(), peeled=peeled), pos
+
+
+def _stat_signature(stat: os.stat_result) -> tuple[int, int, int]:
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+_packed_refs_cache: dict[pathlib.Path, PackedRefs] = {}
+_packed_refs_lock = threading.Lock()
+
+
+def load_packed_refs(path: StrPath) -> PackedRefs | None:
+    """Return the mapped ``packed-refs`` at ``path``, or None if absent.
+
+    Mappings are shared between callers and replaced when the file's mtime,
+    size or inode changes, i.e. when git rewrites it.
+    """
+    path = pathlib.Path(path)
+    try:
+        signature = _stat_signature(path.stat())
+    except FileNotFoundError:
+        signature = None
+    with _packed_refs_lock:
+        cached = _packed_refs_cache.get(path)
+        if cached is not None and cached.signature == signature:
+            return cached
+        # Leave replaced mappings to the garbage collector: another thread
+        # may still be reading from them.
+        _packed_refs_cache.pop(path, None)
+        if signature is None:
+            return None
+        try:
+            refs = PackedRefs(path)
+        except FileNotFoundError:
+            return None
+        _packed_refs_cache[path] = refs
+        return refs
+
+
+class GitRefReader:
+    """Resolve refs of a files-backend repository without running git.
+
+    Examples
+    --------
+    >>> from libvcs.cmd.git import Git
+    >>> git = Git(path=example_git_repo.path)
+    >>> refs = GitRefReader(example_git_repo.path)
+    >>> refs.symbolic_ref('HEAD')
+    'refs/heads/master'
+    >>> refs.head() == git.rev_parse(args='HEAD', trim=True)
+    True
+
+    Packed refs resolve too, including the commit behind an annotated tag:
+
+    >>> git.run(['tag', '-a', 'v1.0', '-m', 'Release'])
+    ''
+    >>> git.run(['pack-refs', '--all'])
+    ''
+    >>> refs.resolve('refs/tags/v1.0') == git.rev_parse(
+    ...     args='refs/tags/v1.0', trim=True
+    ... )
+    True
+    >>> refs.peel('refs/tags/v1.0') == refs.head()
+    True
+
+    Detached:
+
+    >>> git.run(['checkout', '--detach', '-q'])
+    ''
+    >>> refs.symbolic_ref('HEAD') is None
+    True
+    """
+
+    def __init__(self, path: StrPath) -> None:
+        self.dirs = GitDir.discover(path)
+
+    @classmethod
+    def from_dirs(cls, dirs: GitDir) -> GitRefReader:
+        """Return a reader for already discovered ``dirs``."""
+        reader = cls.__new__(cls)
+        reader.dirs = dirs
+        return reader
+
+    def _ref_path(self, name: str) -> pathlib.Path:
+        if (
+            not name
+            or name.startswith(("/", "-"))
+            or ".." in name
+            or "\\" in name
+            or name.endswith(("/", ".lock"))
+        ):
+            msg = f"Invalid ref name: {name!r}"
+            raise GitFsUnsupported(msg)
+        if not name.startswith("refs/") or name.startswith(_PER_WORKTREE_PREFIXES):
+            return self.dirs.git_dir / name
+        return self.dirs.common_dir / name
+
+    def read_ref(self, name: str) -> tuple[str | None, str | None] | None:
+        """Read ``name`` without following symrefs.
+
+        Returns
+        -------
+        tuple of (oid, symref target), or None
+            Exactly one of the pair is set. None when the ref does not exist.
+        """
+        path = self._ref_path(name)
+        try:
+            content = path.read_bytes()
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+            content = None
+        if content is not None:
+            content = content.rstrip(b"\n")
+            if content.startswith(b"ref:"):
+                target = content[4:].strip().decode()
+                if target == "refs/heads/.invalid":
+                    msg = "reftable ref storage is not supported"
+                    raise GitFsUnsupported(msg)
+                return None, target
+            if _OID_RE.fullmatch(content):
+                return content.decode(), None
+            msg = f"Unrecognized ref file: {path}"
+            raise GitFsUnsupported(msg)
+
+        if name.startswith("refs/"):
+            packed = self.packed_refs()
+            ref = packed.get(name) if packed is not None else None
+            if ref is not None:
+                return ref.oid, None
+        return None
+
+    def packed_refs(self) -> PackedRefs | None:
+        """Return the repository's ``packed-refs``, or None."""
+        return load_packed_refs(self.dirs.common_dir / "packed-refs")
+
+    def symbolic_ref(self, name: str = "HEAD") -> str | None:
+        """Return what the symref ``name`` points to, None if it is not one.
+
+        Like ``git symbolic-ref``, the target need not exist (unborn
+        branch).
+        """
+        value = self.read_ref(name)
+        return value[1] if value is not None else None
+
+    def resolve(self, name: str) -> str | None:
+        """Return the object ``name`` points to, following symrefs.
+
+        Returns None if ``name`` (or what it points to) does not exist.
+
+        Raises
+        ------
+        GitFsUnsupported
+            Symrefs nest deeper than :data:`SYMREF_MAX_DEPTH`.
+        """
+        for _ in range(SYMREF_MAX_DEPTH + 1):
+            value = self.read_ref(name)
+            if value is None:
+                return None
+            oid, target = value
+            if oid is not None:
+                return oid
+            assert target is not None
+            name = target
+        msg = f"Symbolic ref nesting too deep: {name}"
+        raise GitFsUnsupported(msg)
+
+    def head(self) -> str | None:
+        """Return the commit ``HEAD`` points to, None on an unborn branch."""
+        return self.resolve("HEAD")
+
+    def peel(self, name: str) -> str | None:
+        """Return the non-tag object ``name`` ultimately points to.
+
+        Only answered from ``packed-refs`` peel lines, as reading tag objects
+        needs the object database.
+
+        Raises
+        ------
+        GitFsUnsupported
+            The answer needs the object database.
+        """
+        for _ in range(SYMREF_MAX_DEPTH + 1):
+            value = self.read_ref(name)
+            if value is None:
+                return None
+            oid, target = value
+            if oid is not None:
+                break
+            assert target is not None
+            name = target
+        else:
+            msg = f"Symbolic ref nesting too deep: {name}"
+            raise GitFsUnsupported(msg)
+
+        packed = self.packed_refs()
+        ref = packed.get(name) if packed is not None else None
+        if packed is None or ref is None or ref.oid != oid:
+            msg = f"{name} is not packed, peeling needs the object database"
+            raise GitFsUnsupported(msg)
+        if ref.peeled is not None:
+            return ref.peeled
+        if packed.fully_peeled or (
+            "peeled" in packed.traits and name.startswith("refs/tags/")
+        ):
+            return ref.oid
+        msg = f"{packed.path} does not record peeled values"
+        raise GitFsUnsupported(msg)
+
+    def shorten(self, name: str) -> str:
+        """Shorten a full branch name like ``git symbolic-ref --short``.
+
+        Raises
+        ------
+        GitFsUnsupported
+            ``name`` is not a branch, or its short form is ambiguous.
+        """
+        short = name.removeprefix("refs/heads/")
+        if short == name:
+            msg = f"Only branches are shortened in-process: {name}"
+            raise GitFsUnsupported(msg)
+        for candidate in (short, f"refs/{short}", f"refs/tags/{short}"):
+            if self.read_ref(candidate) is not None:
+                msg = f"Short name of {name} is ambiguous"
+                raise GitFsUnsupported(msg)
+        return short
+
+
+_IDX_MAGIC = b"\xfftOc"
+_IDX_FANOUT_OFFSET = 8
+_MIDX_MAGIC = b"MIDX"
+
+#: Alternates git follows before giving up (``object-file.c``).
+ALTERNATES_MAX_DEPTH = 5
+
+
+def _bisect_oid(
+    data: mmap.mmap,
+    table: int,
+    lo: int,
+    hi: int,
+    oid: bytes,
+) -> int:
+    """Return the position of ``oid`` in the sorted id table, or -1."""
+    size = len(oid)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        pos = table + mid * size
+        probe = data[pos : pos + size]
+        if probe < oid:
+            lo = mid + 1
+        elif probe > oid:
+            hi = mid
+        else:
+            return mid
+    return -1
+
+
+def _mtime_ns(path: pathlib.Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def _map(path: pathlib.Path) -> mmap.mmap:
+    with path.open("rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class PackIndex:
+    """Memory-mapped version 2 pack index (``objects/pack/*.idx``).
+
+    The fan-out table and sorted object ids answer whether the pack holds an
+    object; the offset table says where in the ``.pack`` file it starts.
+
+    Examples
+    --------
+    >>> from libvcs.cmd.git import Git
+    >>> git = Git(path=example_git_repo.path)
+    >>> git.run(['repack', '-adq'])
+    ''
+    >>> idx_path = next((example_git_repo.path / '.git/objects/pack').glob('*.idx'))
+    >>> idx = PackIndex(idx_path)
+    >>> head = git.rev_parse(args='HEAD', trim=True)
+    >>> bytes.fromhex(head) in idx
+    True
+    >>> bytes(20) in idx
+    False
+    >>> idx.close()
+    """
+
+    def __init__(self, path: StrPath, *, hash_size: int = 20) -> None:
+        self.path = pathlib.Path(path)
+        self.hash_size = hash_size
+        self._data = _map(self.path)
+        if self._data[:4] != _IDX_MAGIC or self._data[4:8] != b"\0\0\0\2":
+            self._data.close()
+            msg = f"Only version 2 pack indexes are supported: {self.path}"
+            raise GitFsUnsupported(msg)
+        self._fanout: tuple[int, ...] = struct.unpack_from(
+            ">256I", self._data, _IDX_FANOUT_OFFSET
+        )
+        self._table = _IDX_FANOUT_OFFSET + 256 * 4
+
+    def __len__(self) -> int:
+        """Return the number of objects in the pack."""
+        return self._fanout[255]
+
+    def _position(self, oid: object) -> int:
+        if not isinstance(oid, bytes) or len(oid) != self.hash_size:
+            return -1
+        first = oid[0]
+        lo = self._fanout[first - 1] if first else 0
+        return _bisect_oid(self._data, self._table, lo, self._fanout[first], oid)
+
+    def __contains__(self, oid: object) -> bool:
+        """Return whether the pack holds the binary object id ``oid``."""
+        return self._position(oid) >= 0
+
+    def offset(self, oid: bytes) -> int | None:
+        """Return where object ``oid`` starts in the ``.pack`` file, or None."""
+        position = self._position(oid)
+        if position < 0:
+            return None
+        offsets = self._table + len(self) * (self.hash_size + 4)
+        return _pack_offset(
+            self._data, offsets + position * 4, large=offsets + len(self) * 4
+        )
+
+    @property
+    def pack_path(self) -> pathlib.Path:
+        """Return the ``.pack`` file this index describes."""
+        return self.path.with_suffix(".pack")
+
+    def close(self) -> None:
+        """Unmap the file."""
+        self._data.close()
+
+
+def _pack_offset(data: mmap.mmap, pos: int, *, large: int) -> int:
+    """Read the 31-bit offset at ``pos``, following it to the 64-bit table."""
+    (offset,) = struct.unpack_from(">I", data, pos)
+    if offset & 0x80000000:
+        (offset,) = struct.unpack_from(">Q", data, large + (offset & 0x7FFFFFFF) * 8)
+    return int(offset)
+
+
+class MultiPackIndex:
+    """Memory-mapped ``objects/pack/multi-pack-index``.
+
+    One sorted table of the object ids in many packs, written by
+    ``git multi-pack-index write`` or ``git repack --write-midx``. Packs
+    listed in :attr:`pack_names` need not be searched separately.
+    """
+
+    def __init__(self, path: StrPath, *, hash_size: int = 20) -> None:
+        self.path = pathlib.Path(path)
+        self.hash_size = hash_size
+        self._data = _map(self.path)
+        try:
+            self._parse()
+        except (GitFsUnsupported, struct.error, KeyError, UnicodeDecodeError):
+            self._data.close()
+            raise
+
+    def _parse(self) -> None:
+        data = self._data
+        (
+            magic,
+            version,
+            oid_version,
+            chunk_count,
+            base_count,
+            pack_count,
+        ) = struct.unpack_from(">4sBBBBI", data, 0)
+        if (
+            magic != _MIDX_MAGIC
+            or version != 1
+            or base_count
+            or oid_version != (2 if self.hash_size == 32 else 1)
+        ):
+            msg = f"Unsupported multi-pack-index: {self.path}"
+            raise GitFsUnsupported(msg)
+        chunks = {}
+        for i in range(chunk_count + 1):
+            chunk_id, offset = struct.unpack_from(">4sQ", data, 12 + i * 12)
+            chunks[chunk_id] = offset
+        start = chunks[b"PNAM"]
+        end = min(offset for offset in chunks.values() if offset > start)
+        names = data[start:end].split(b"\0")[:pack_count]
+        self._pack_list = [name.decode() for name in names]
+        self.pack_names = frozenset(self._pack_list)
+        self._fanout: tuple[int, ...] = struct.unpack_from(
+            ">256I", data, chunks[b"OIDF"]
+        )
+        self._table = chunks[b"OIDL"]
+        self._offsets = chunks[b"OOFF"]
+        self._large_offsets = chunks.get(b"LOFF", 0)
+
+    def __len__(self) -> int:
+        """Return the number of objects indexed."""
+        return self._fanout[255]
+
+    def _position(self, oid: object) -> int:
+        if not isinstance(oid, bytes) or len(oid) != self.hash_size:
+            return -1
+        first = oid[0]
+        lo = self._fanout[first - 1] if first else 0
+        return _bisect_oid(self._data, self._table, lo, self._fanout[first], oid)
+
+    def __contains__(self, oid: object) -> bool:
+        """Return whether an indexed pack holds the binary object id ``oid``."""
+        return self._position(oid) >= 0
+
+    def locate(self, oid: bytes) -> tuple[pathlib.Path, int] | None:
+        """Return the ``.pack`` file holding ``oid`` and its offset, or None."""
+        position = self._position(oid)
+        if position < 0:
+            return None
+        (pack_id,) = struct.unpack_from(">I", self._data, self._offsets + position * 8)
+        offset = _pack_offset(
+            self._data, self._offsets + position * 8 + 4, large=self._large_offsets
+        )
+        name = self._pack_list[pack_id]
+        return self.path.parent / name.replace(".idx", ".pack"), offset
+
+    def close(self) -> None:
+        """Unmap the file."""
+        self._data.close()
+
+
+class GitObjectStore:
+    """Answer "is this object here?" from pack indexes and loose objects.
+
+    Follows ``objects/info/alternates``, so checkouts borrowing objects from
+    a mirror (``git clone --reference``) see the mirror's objects too. Pack
+    indexes are mapped once; a lookup that misses re-reads the pack
+    directories if they changed, as git does, so packs written since are
+    found.
+
+    Examples
+    --------
+    >>> from libvcs.cmd.git import Git
+    >>> git = Git(path=example_git_repo.path)
+    >>> store = GitObjectStore(example_git_repo.path)
+    >>> store.has_object(git.rev_parse(args='HEAD', trim=True))
+    True
+    >>> store.has_object('0' * 40)
+    False
+
+    Objects packed later are still found:
+
+    >>> git.run(['repack', '-adq'])
+    ''
+    >>> store.has_object(git.rev_parse(args='HEAD', trim=True))
+    True
+    """
+
+    def __init__(self, path: StrPath) -> None:
+        self.dirs = GitDir.discover(path)
+        self.hash_size = _hash_size(self.dirs)
+        self.object_dirs = self._object_dirs(self.dirs.common_dir / "objects")
+        self._indexes: list[PackIndex | MultiPackIndex] = []
+        self._signature: tuple[int | None, ...] | None = None
+        self._lock = threading.Lock()
+        self.refresh()
+
+    @staticmethod
+    def _object_dirs(objects: pathlib.Path) -> list[pathlib.Path]:
+        dirs: list[pathlib.Path] = []
+        pending = [(objects, 0)]
+        while pending:
+            directory, depth = pending.pop(0)
+            if directory in dirs:
+                continue
+            dirs.append(directory)
+            alternates = directory / "info" / "alternates"
+            if not alternates.is_file():
+                continue
+            if depth >= ALTERNATES_MAX_DEPTH:
+                msg = f"Alternates nest too deep: {alternates}"
+                raise GitFsUnsupported(msg)
+            for line in alternates.read_text(encoding="utf-8").splitlines():
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                if line.startswith('"'):
+                    msg = f"Quoted alternates are not supported: {alternates}"
+                    raise GitFsUnsupported(msg)
+                pending.append((directory / line, depth + 1))
+        return dirs
+
+    def _pack_signature(self) -> tuple[int | None, ...]:
+        return tuple(_mtime_ns(directory / "pack") for directory in self.object_dirs)
+
+    def refresh(self) -> bool:
+        """Re-read pack directories if they changed; return whether they did."""
+        with self._lock:
+            signature = self._pack_signature()
+            if signature == self._signature:
+                return False
+            indexes: list[PackIndex | MultiPackIndex] = []
+            for directory in self.object_dirs:
+                indexes.extend(self._load_pack_dir(directory / "pack"))
+            # Replaced mappings are left to the garbage collector: another
+            # thread may still be searching them.
+            self._indexes = indexes
+            self._signature = signature
+            return True
+
+    def _load_pack_dir(
+        self,
+        pack_dir: pathlib.Path,
+    ) -> list[PackIndex | MultiPackIndex]:
+        if not pack_dir.is_dir():
+            return []
+        indexes: list[PackIndex | MultiPackIndex] = []
+        covered: frozenset[str] = frozenset()
+        midx_path = pack_dir / "multi-pack-index"
+        if midx_path.is_file():
+            midx = MultiPackIndex(midx_path, hash_size=self.hash_size)
+            indexes.append(midx)
+            covered = midx.pack_names
+        for idx_path in sorted(pack_dir.glob("*.idx")):
+            if idx_path.name in covered or not idx_path.with_suffix(".pack").is_file():
+                continue
+            try:
+                indexes.append(PackIndex(idx_path, hash_size=self.hash_size))
+            except FileNotFoundError:  # Removed by a concurrent repack
+                continue
+        return indexes
+
+    def has_object(self, oid: str) -> bool:
+        """Return whether the object ``oid`` (full hex id) is stored locally.
+
+        Objects a partial clone could fetch on demand are not "stored
+        locally".
+        """
+        if len(oid) != self.hash_size * 2:
+            msg = f"Expected a full object id, got {oid!r}"
+            raise ValueError(msg)
+        try:
+            binary = bytes.fromhex(oid)
+        except ValueError:
+            msg = f"Expected a full object id, got {oid!r}"
+            raise ValueError(msg) from None
+        if self._in_packs(binary) or self._is_loose(oid.lower()):
+            return True
+        return self.refresh() and self._in_packs(binary)
+
+    def _in_packs(self, oid: bytes) -> bool:
+        return any(oid in index for index in self._indexes)
+
+    def _is_loose(self, oid: str) -> bool:
+        return any(
+            (directory / oid[:2] / oid[2:]).is_file() for directory in self.object_dirs
+        )
+
+    def commit_tree(self, oid: str) -> str:
+        """Return the tree of commit ``oid``.
+
+        Raises
+        ------
+        GitFsUnsupported
+            ``oid`` is missing, not a commit, or stored as a delta.
+        """
+        object_type, content = self._read_prefix(oid)
+        tree = content[5 : 5 + self.hash_size * 2]
+        if object_type != "commit" or not content.startswith(b"tree "):
+            msg = f"{oid} is not a commit"
+            raise GitFsUnsupported(msg)
+        return tree.decode()
+
+    def _read_prefix(self, oid: str) -> tuple[str, bytes]:
+        """Return the type and first bytes of ``oid``'s content."""
+        if len(oid) != self.hash_size * 2:
+            msg = f"Expected a full object id, got {oid!r}"
+            raise ValueError(msg)
+        binary = bytes.fromhex(oid)
+        for attempt in range(2):
+            if attempt and not self.refresh():
+                break
+            for index in self._indexes:
+                if isinstance(index, MultiPackIndex):
+                    location = index.locate(binary)
+                else:
+                    offset = index.offset(binary)
+                    location = None if offset is None else (index.pack_path, offset)
+                if location is not None:
+                    return _read_packed_prefix(*location)
+            for directory in self.object_dirs:
+                loose = directory / oid[:2] / oid[2:].lower()
+                if loose.is_file():
+                    return _read_loose_prefix(loose)
+        msg = f"Object {oid} is not stored locally"
+        raise GitFsUnsupported(msg)
+
+
+#: Pack entry type codes (``packfile.h``); 6 and 7 are deltas.
+_PACK_TYPES = {1: "commit", 2: "tree", 3: "blob", 4: "tag"}
+
+#: Enough inflated bytes for the headers of a commit or tag.
+_PREFIX_SIZE = 1024
+
+
+def _read_packed_prefix(pack: pathlib.Path, offset: int) -> tuple[str, bytes]:
+    with pack.open("rb") as f:
+        f.seek(offset)
+        chunk = f.read(_PREFIX_SIZE + 64)
+    byte = chunk[0]
+    object_type = (byte >> 4) & 7
+    pos = 1
+    while byte & 0x80:
+        byte = chunk[pos]
+        pos += 1
+    if object_type not in _PACK_TYPES:
+        msg = f"Deltified object at {pack}:{offset} needs git to read"
+        raise GitFsUnsupported(msg)
+    inflater = zlib.decompressobj()
+    return _PACK_TYPES[object_type], inflater.decompress(chunk[pos:], _PREFIX_SIZE)
+
+
+def _read_loose_prefix(path: pathlib.Path) -> tuple[str, bytes]:
+    with path.open("rb") as f:
+        chunk = f.read(_PREFIX_SIZE + 64)
+    data = zlib.decompressobj().decompress(chunk, _PREFIX_SIZE + 32)
+    header, _, content = data.partition(b"\0")
+    return header.split(b" ", 1)[0].decode(), content
+
+
+_INDEX_MAGIC = b"DIRC"
+
+#: Fixed-size part of an index entry before the object id: ctime, mtime,
+#: dev, ino, mode, uid, gid and size as 32-bit integers.
+_INDEX_STAT = struct.Struct(">10I")
+
+_ENTRY_ASSUME_VALID = 0x8000
+_ENTRY_EXTENDED = 0x4000
+_ENTRY_STAGE_MASK = 0x3000
+_ENTRY_NAME_MASK = 0x0FFF
+_ENTRY_SKIP_WORKTREE = 0x4000
+_ENTRY_INTENT_TO_ADD = 0x2000
+
+_GITLINK_MODE = 0o160000
+_SYMLINK_MODE = 0o120000
+
+_UINT32 = 0xFFFFFFFF
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class GitIndexEntry:
+    """Tracked path in ``.git/index``, with the stat data git cached for it.
+
+    Parameters
+    ----------
+    path : str
+        Path relative to the worktree root, ``/``-separated.
+    mode : int
+        Git mode, e.g. ``0o100644``, ``0o100755``, ``0o120000`` (symlink) or
+        ``0o160000`` (submodule).
+    oid : str
+        Staged blob (or, for submodules, commit).
+    stage : int
+        0 normally; 1-3 for the sides of an unresolved conflict.
+    ctime_ns, mtime_ns, dev, ino, uid, gid, size : int
+        ``lstat()`` of the file when git last saw it, truncated to 32 bits.
+    assume_valid, skip_worktree, intent_to_add : bool
+        ``git update-index --assume-unchanged`` / ``--skip-worktree`` and
+        ``git add --intent-to-add``.
+    """
+
+    path: str
+    mode: int
+    oid: str
+    stage: int
+    ctime_ns: int
+    mtime_ns: int
+    dev: int
+    ino: int
+    uid: int
+    gid: int
+    size: int
+    assume_valid: bool = False
+    skip_worktree: bool = False
+    intent_to_add: bool = False
+
+    def stat_matches(self, st: os.stat_result) -> bool:
+        """Return whether ``st`` (an ``lstat()``) matches the cached data.
+
+        A match means git would consider the file unchanged without reading
+        it. The comparison is at least as strict as git's default
+        ``core.checkStat``.
+        """
+        if self.mode == _SYMLINK_MODE:
+            if not stat.S_ISLNK(st.st_mode):
+                return False
+        elif not stat.S_ISREG(st.st_mode) or (
+            bool(st.st_mode & 0o100) != (self.mode == 0o100755)
+        ):
+            return False
+        return (
+            _stat_ns(st.st_mtime_ns) == self.mtime_ns
+            and _stat_ns(st.st_ctime_ns) == self.ctime_ns
+            and st.st_size & _UINT32 == self.size
+            and st.st_ino & _UINT32 == self.ino
+            and st.st_dev & _UINT32 == self.dev
+            and st.st_uid & _UINT32 == self.uid
+            and st.st_gid & _UINT32 == self.gid
+        )
+
+
+def _stat_ns(ns: int) -> int:
+    """Truncate a timestamp the way the index stores it (32-bit seconds)."""
+    seconds, nanoseconds = divmod(ns, 1_000_000_000)
+    return (seconds & _UINT32) * 1_000_000_000 + nanoseconds
+
+
+class GitIndex:
+    """Memory-mapped reader for ``.git/index`` versions 2 to 4.
+
+    Entries are parsed once; extensions are skipped apart from the root of
+    the cache tree (``TREE``). Split indexes (``link``) and sparse indexes
+    (``sdir``) raise :exc:`GitFsUnsupported`.
+
+    Examples
+    --------
+    >>> index = GitIndex(example_git_repo.path / '.git' / 'index')
+    >>> index.version in (2, 3, 4)
+    True
+    >>> [entry.path for entry in index.entries][:1]
+    ['testfile.test']
+    """
+
+    def __init__(self, path: StrPath, *, hash_size: int = 20) -> None:
+        self.path = pathlib.Path(path)
+        self.hash_size = hash_size
+        with self.path.open("rb") as f:
+            self.mtime_ns = os.fstat(f.fileno()).st_mtime_ns
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self.entries = self._parse(data)
+        except (struct.error, IndexError, UnicodeDecodeError) as e:
+            msg = f"Malformed index: {self.path}"
+            raise GitFsUnsupported(msg) from e
+        finally:
+            data.close()
+
+    def _parse(self, data: mmap.mmap) -> list[GitIndexEntry]:
+        magic, version, count = struct.unpack_from(">4sII", data, 0)
+        if magic != _INDEX_MAGIC or version not in (2, 3, 4):
+            msg = f"Unsupported index version {version}: {self.path}"
+            raise GitFsUnsupported(msg)
+        self.version = version
+        hash_size = self.hash_size
+        entries: list[GitIndexEntry] = []
+        pos = 12
+        previous = b""
+        for _ in range(count):
+            start = pos
+            (
+                ctime_s,
+                ctime_ns,
+                mtime_s,
+                mtime_ns,
+                dev,
+                ino,
+                mode,
+                uid,
+                gid,
+                size,
+            ) = _INDEX_STAT.unpack_from(data, pos)
+            pos += _INDEX_STAT.size
+            oid = data[pos : pos + hash_size].hex()
+            pos += hash_size
+            (flags,) = struct.unpack_from(">H", data, pos)
+            pos += 2
+            extended = 0
+            if flags & _ENTRY_EXTENDED:
+                (extended,) = struct.unpack_from(">H", data, pos)
+                pos += 2
+            if version == 4:
+                strip, pos = _varint(data, pos)
+                end = data.find(b"\0", pos)
+                name = previous[: len(previous) - strip] + data[pos:end]
+                pos = end + 1
+            else:
+                end = data.find(b"\0", pos)
+                name = data[pos:end]
+                # NUL-padded to a multiple of 8 bytes.
+                pos = start + ((end - start + 8) & ~7)
+            previous = name
+            entries.append(
+                GitIndexEntry(
+                    path=name.decode(),
+                    mode=mode,
+                    oid=oid,
+                    stage=(flags & _ENTRY_STAGE_MASK) >> 12,
+                    ctime_ns=ctime_s * 1_000_000_000 + ctime_ns,
+                    mtime_ns=mtime_s * 1_000_000_000 + mtime_ns,
+                    dev=dev,
+                    ino=ino,
+                    uid=uid,
+                    gid=gid,
+                    size=size,
+                    assume_valid=bool(flags & _ENTRY_ASSUME_VALID),
+                    skip_worktree=bool(extended & _ENTRY_SKIP_WORKTREE),
+                    intent_to_add=bool(extended & _ENTRY_INTENT_TO_ADD),
+                )
+            )
+
+        self.tree: str | None = None
+        trailer = len(data) - hash_size
+        while pos + 8 <= trailer:
+            signature, size = struct.unpack_from(">4sI", data, pos)
+            body = pos + 8
+            if signature == b"TREE":
+                self.tree = _cache_tree_root(data[body : body + size], hash_size)
+            elif signature[:1].islower():
+                # Lower-case extensions change how entries must be read.
+                msg = f"Index extension {signature!r} is not supported"
+                raise GitFsUnsupported(msg)
+            pos = body + size
+        return entries
+
+    def changed_paths(
+        self,
+        worktree: StrPath,
+        *,
+        max_workers: int | None = None,
+    ) -> list[str]:
+        """Return tracked paths whose stat data no longer matches the index.
+
+        Directories are scanned with :func:`os.scandir` in a thread pool.
+        Paths are reported "possibly" changed: a file touched without being
+        modified, or written in the same instant the index was (racily
+        clean), is listed although git would find no change. Unmerged,
+        intent-to-add and submodule entries are always listed. Untracked
+        files are not looked at.
+
+        Examples
+        --------
+        >>> from libvcs.cmd.git import Git
+        >>> Git(path=example_git_repo.path).run(['update-index', '--refresh'])
+        ''
+        >>> index = GitIndex(example_git_repo.path / '.git' / 'index')
+        >>> index.changed_paths(example_git_repo.path)
+        []
+        >>> _ = (example_git_repo.path / 'testfile.test').write_text('edit')
+        >>> index.changed_paths(example_git_repo.path)
+        ['testfile.test']
+        """
+        worktree = pathlib.Path(worktree)
+        by_dir: dict[str, list[GitIndexEntry]] = {}
+        changed: list[str] = []
+        for entry in self.entries:
+            if entry.skip_worktree or entry.assume_valid:
+                continue
+            if (
+                entry.stage
+                or entry.intent_to_add
+                or entry.mode == _GITLINK_MODE
+                or entry.mtime_ns >= self.mtime_ns
+            ):
+                changed.append(entry.path)
+                continue
+            directory, _, _ = entry.path.rpartition("/")
+            by_dir.setdefault(directory, []).append(entry)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as pool:
+            for paths in pool.map(
+                lambda item: _scan_dir(worktree, *item), by_dir.items()
+            ):
+                changed.extend(paths)
+        return sorted(set(changed))
+
+
+def _scan_dir(
+    worktree: pathlib.Path,
+    directory: str,
+    entries: list[GitIndexEntry],
+) -> list[str]:
+    """Compare ``entries`` of ``directory`` with what is on disk."""
+    try:
+        with os.scandir(worktree / directory) as it:
+            on_disk = {item.name: item for item in it}
+    except (FileNotFoundError, NotADirectoryError):
+        return [entry.path for entry in entries]
+    changed = []
+    for entry in entries:
+        item = on_disk.get(entry.path.rpartition("/")[2])
+        try:
+            matches = item is not None and entry.stat_matches(
+                item.stat(follow_symlinks=False)
+            )
+        except FileNotFoundError:
+            matches = False
+        if not matches:
+            changed.append(entry.path)
+    return changed
+
+
+def _varint(data: mmap.mmap, pos: int) -> tuple[int, int]:
+    """Decode git's offset varint (``varint.c``) at ``pos``."""
+    byte = data[pos]
+    pos += 1
+    value = byte & 0x7F
+    while byte & 0x80:
+        byte = data[pos]
+        pos += 1
+        value = ((value + 1) << 7) | (byte & 0x7F)
+    return value, pos
+
+
+def _cache_tree_root(data: bytes, hash_size: int) -> str | None:
+    """Return the root tree of a ``TREE`` extension, None if invalidated."""
+    path_end = data.index(b"\0")
+    line_end = data.index(b"\n", path_end)
+    entry_count = int(data[path_end + 1 : line_end].split(b" ")[0])
+    if data[:path_end] or entry_count < 0:
+        return None
+    return data[line_end + 1 : line_end + 1 + hash_size].hex()
+
+
+def possibly_dirty(path: StrPath, *, max_workers: int | None = None) -> bool:
+    """Return whether tracked files of the worktree at ``path`` may be modified.
+
+    False is definitive: the index's stat data matches every tracked file
+    and the index's cache tree matches ``HEAD``'s tree, so
+    ``git status --porcelain --untracked-files=no`` would print nothing.
+    True means git must be asked.
+
+    Raises
+    ------
+    GitFsUnsupported
+        The repository cannot be read in-process.
+
+    Examples
+    --------
+    >>> from libvcs.cmd.git import Git
+    >>> Git(path=example_git_repo.path).run(['update-index', '--refresh'])
+    ''
+    >>> possibly_dirty(example_git_repo.path)
+    False
+    >>> _ = (example_git_repo.path / 'testfile.test').write_text('edit')
+    >>> possibly_dirty(example_git_repo.path)
+    True
+    """
+    refs = GitRefReader(path)
+    index_path = refs.dirs.git_dir / "index"
+    head = refs.head()
+    if head is None or not index_path.is_file():
+        return True
+    store = GitObjectStore(path)
+    index = GitIndex(index_path, hash_size=store.hash_size)
+    if index.tree is None or index.tree != store.commit_tree(head):
+        return True
+    return bool(index.changed_paths(path, max_workers=max_workers))
+
+
+#: Nested includes git follows before giving up (``config.c``).
+CONFIG_INCLUDE_MAX_DEPTH = 10
+
+_CONFIG_NAME_RE = re.compile(r"[A-Za-z][A-Za-z0-9-]*")
+_CONFIG_ESCAPES = {"n": "\n", "t": "\t", "b": "\b", "\\": "\\", '"': '"'}
+
+#: ``(key, value, origin, scope)`` as ``git config --list --show-origin
+#: --show-scope`` reports it; ``value`` is None for a bare ``key`` line.
+ConfigItem = tuple[str, str | None, str, str]
+
+
+def parse_config(
+    text: str, *, origin: str = "<string>"
+) -> list[tuple[str, str | None]]:
+    r"""Parse git-config syntax into ``(key, value)`` pairs, in file order.
+
+    Keys are normalized like ``git config --list``: section and variable
+    lowercased, subsection verbatim. Includes are not followed here.
+
+    Raises
+    ------
+    GitFsUnsupported
+        The text is not valid config; git would refuse it too.
+
+    Examples
+    --------
+    >>> parse_config('[remote "Origin"]\n\turl = "a b"  ; comment\n')
+    [('remote.Origin.url', 'a b')]
+    >>> parse_config('[Core]\n  bare\n  editor = vim  -n \\\n -f\n')
+    [('core.bare', None), ('core.editor', 'vim  -n  -f')]
+    >>> parse_config('[alias.Old]\nlg = "log\\t--oneline"\n')
+    [('alias.old.lg', 'log\t--oneline')]
+    """
+    text = text.replace("\r\n", "\n").removeprefix("\ufeff")
+    entries: list[tuple[str, str | None]] = []
+    section: str | None = None
+    pos, end = 0, len(text)
+
+    def fail(reason: str) -> t.NoReturn:
+        line = text.count("\n", 0, pos) + 1
+        msg = f"Bad config line {line} in {origin}: {reason}"
+        raise GitFsUnsupported(msg)
+
+    while pos < end:
+        char = text[pos]
+        if char.isspace():
+            pos += 1
+        elif char in "#;":
+            newline = text.find("\n", pos)
+            pos = end if newline == -1 else newline + 1
+        elif char == "[":
+            section, pos = _parse_section(text, pos + 1, fail)
+        else:
+            match = _CONFIG_NAME_RE.match(text, pos)
+            if match is None or section is None:
+                fail("expected a section or variable")
+            name = match.group().lower()
+            pos = match.end()
+            while pos < end and text[pos] in " \t":
+                pos += 1
+            value: str | None = None
+            if pos < end and text[pos] != "\n":
+                if text[pos] != "=":
+                    fail(f"expected '=' after {name}")
+                value, pos = _parse_value(text, pos + 1, fail)
+            entries.append((f"{section}.{name}", value))
+    return entries
+
+
+def _parse_section(
+    text: str,
+    pos: int,
+    fail: t.Callable[[str], t.NoReturn],
+) -> tuple[str, int]:
+    """Parse a ``[section]`` or ``[section "subsection"]`` header."""
+    close = text.find("]", pos)
+    if close == -1:
+        fail("unterminated section header")
+    match = re.compile(r"[A-Za-z0-9.-]+").match(text, pos)
+    if match is None:
+        fail("bad section name")
+    name = match.group().lower()
+    pos = match.end()
+    if text[pos] == "]":
+        return name, pos + 1
+    while pos < len(text) and text[pos] in " \t":
+        pos += 1
+    if pos >= len(text) or text[pos] != '"':
+        fail("bad section header")
+    subsection: list[str] = []
+    pos += 1
+    while True:
+        if pos >= len(text) or text[pos] == "\n":
+            fail("unterminated subsection")
+        char = text[pos]
+        if char == '"':
+            break
+        if char == "\\":
+            pos += 1
+            if pos >= len(text) or text[pos] == "\n":
+                fail("unterminated subsection")
+            char = text[pos]
+        subsection.append(char)
+        pos += 1
+    if text[pos + 1 : pos + 2] != "]":
+        fail("bad section header")
+    return f"{name}.{''.join(subsection)}", pos + 2
+
+
+def _parse_value(
+    text: str,
+    pos: int,
+    fail: t.Callable[[str], t.NoReturn],
+) -> tuple[str, int]:
+    """Parse a value the way git's ``parse_value()`` does."""
+    value: list[str] = []
+    quoted = comment = False
+    spaces = 0
+    end = len(text)
+    while True:
+        char = "\n" if pos >= end else text[pos]
+        pos += 1
+        if char == "\n":
+            if quoted:
+                fail("unterminated quoted value")
+            return "".join(value), pos
+        if comment:
+            continue
+        if char.isspace() and not quoted:
+            if value:
+                spaces += 1
+            continue
+        if not quoted and char in "#;":
+            comment = True
+            continue
+        value.append(" " * spaces)
+        spaces = 0
+        if char == "\\":
+            char = "\n" if pos >= end else text[pos]
+            pos += 1
+            if char == "\n":
+                continue
+            if char not in _CONFIG_ESCAPES:
+                fail(f"bad escape \\{char}")
+            value.append(_CONFIG_ESCAPES[char])
+        elif char == '"':
+            quoted = not quoted
+        else:
+            value.append(char)
+
+
+_config_file_cache: dict[pathlib.Path, tuple[object, list[tuple[str, str | None]]]] = {}
+_config_file_lock = threading.Lock()
+
+
+def _parse_config_file(path: pathlib.Path) -> list[tuple[str, str | None]] | None:
+    """Return the parsed ``path``, None if it does not exist.
+
+    Parses are cached until the file's mtime, size or inode changes.
+    """
+    try:
+        signature: object = _stat_signature(path.stat())
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    with _config_file_lock:
+        cached = _config_file_cache.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    try:
+        text = path.read_bytes().decode()
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+        return None
+    except UnicodeDecodeError as e:
+        msg = f"Config is not UTF-8: {path}"
+        raise GitFsUnsupported(msg) from e
+    entries = parse_config(text, origin=str(path))
+    with _config_file_lock:
+        _config_file_cache[path] = (signature, entries)
+    return entries
+
+
+def _wildmatch(pattern: str, text: str, *, icase: bool = False) -> bool:
+    """Match like git's ``wildmatch()`` with ``WM_PATHNAME``.
+
+    Examples
+    --------
+    >>> _wildmatch('**/work/**', '/home/me/work/repo/.git')
+    True
+    >>> _wildmatch('/home/*/.git', '/home/me/sub/.git')
+    False
+    >>> _wildmatch('feature/**', 'feature/a/b')
+    True
+    """
+    regex: list[str] = []
+    pos = 0
+    while pos < len(pattern):
+        char = pattern[pos]
+        at_segment_start = pos == 0 or pattern[pos - 1] == "/"
+        if pattern.startswith("**/", pos) and at_segment_start:
+            regex.append("(?:.*/)?")
+            pos += 3
+        elif (
+            pattern.startswith("**", pos)
+            and at_segment_start
+            and (pos + 2 == len(pattern))
+        ):
+            regex.append(".*")
+            pos += 2
+        elif char == "*":
+            while pos < len(pattern) and pattern[pos] == "*":
+                pos += 1
+            regex.append("[^/]*")
+        elif char == "?":
+            regex.append("[^/]")
+            pos += 1
+        elif char == "[" and (close := pattern.find("]", pos + 2)) != -1:
+            members = pattern[pos + 1 : close]
+            negate = members[:1] in ("!", "^")
+            members = members[1:] if negate else members
+            regex.append(
+                "[" + ("^/" if negate else "") + members.replace("\\", "\\\\") + "]"
+            )
+            pos = close + 1
+        elif char == "\\" and pos + 1 < len(pattern):
+            regex.append(re.escape(pattern[pos + 1]))
+            pos += 2
+        else:
+            regex.append(re.escape(char))
+            pos += 1
+    flags = re.IGNORECASE if icase else 0
+    return re.fullmatch("".join(regex), text, flags | re.DOTALL) is not None
+
+
+def _expand_user(path: str) -> str:
+    if path == "~" or path.startswith("~/"):
+        return str(pathlib.Path.home()) + path[1:]
+    if path.startswith("~"):
+        msg = f"~user paths are not supported: {path}"
+        raise GitFsUnsupported(msg)
+    return path
+
+
+class _IncludeContext:
+    """What ``includeIf`` conditions are evaluated against."""
+
+    def __init__(self, dirs: GitDir | None) -> None:
+        self.dirs = dirs
+
+    def gitdir_matches(
+        self,
+        pattern: str,
+        config_file: pathlib.Path,
+        *,
+        icase: bool,
+    ) -> bool:
+        if self.dirs is None:
+            return False
+        pattern = _expand_user(pattern)
+        if pattern.startswith("./"):
+            pattern = str(config_file.resolve().parent) + pattern[1:]
+        elif not pattern.startswith("/"):
+            pattern = "**/" + pattern
+        if pattern.endswith("/"):
+            pattern += "**"
+        git_dir = self.dirs.git_dir
+        return any(
+            _wildmatch(pattern, str(text), icase=icase)
+            for text in (git_dir.resolve(), git_dir.absolute())
+        )
+
+    def branch_matches(self, pattern: str) -> bool:
+        if self.dirs is None:
+            return False
+        target = GitRefReader.from_dirs(self.dirs).symbolic_ref("HEAD")
+        if target is None or not target.startswith("refs/heads/"):
+            return False
+        if pattern.endswith("/"):
+            pattern += "**"
+        return _wildmatch(pattern, target.removeprefix("refs/heads/"))
+
+    def matches(self, condition: str, config_file: pathlib.Path) -> bool:
+        if condition.startswith("gitdir:"):
+            return self.gitdir_matches(
+                condition.removeprefix("gitdir:"), config_file, icase=False
+            )
+        if condition.startswith("gitdir/i:"):
+            return self.gitdir_matches(
+                condition.removeprefix("gitdir/i:"), config_file, icase=True
+            )
+        if condition.startswith("onbranch:"):
+            return self.branch_matches(condition.removeprefix("onbranch:"))
+        if condition.startswith("hasconfig:"):
+            msg = f"includeIf {condition!r} is not supported"
+            raise GitFsUnsupported(msg)
+        return False
+
+
+def _read_config(
+    path: pathlib.Path,
+    scope: str,
+    context: _IncludeContext,
+    items: list[ConfigItem],
+    sources: set[pathlib.Path],
+    depth: int = 0,
+    *,
+    includes: bool = True,
+) -> None:
+    """Append the entries of ``path`` and, with ``includes``, what it includes."""
+    sources.add(path)
+    entries = _parse_config_file(path)
+    if entries is None:
+        return
+    origin = f"file:{path}"
+    for key, value in entries:
+        items.append((key, value, origin, scope))
+        if not includes:
+            continue
+        if key == "include.path":
+            condition = None
+        elif key.startswith("includeif.") and key.endswith(".path"):
+            condition = key[len("includeif.") : -len(".path")]
+        else:
+            continue
+        if value is None:
+            msg = f"{key} without a value in {path}"
+            raise GitFsUnsupported(msg)
+        if condition is not None and not context.matches(condition, path):
+            continue
+        if depth >= CONFIG_INCLUDE_MAX_DEPTH:
+            msg = f"Config includes nest too deep: {path}"
+            raise GitFsUnsupported(msg)
+        _read_config(
+            path.parent / _expand_user(value),
+            scope,
+            context,
+            items,
+            sources,
+            depth + 1,
+        )
+
+
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "").lower() in ("1", "true", "yes", "on")
+
+
+def load_config(
+    path: StrPath,
+    *,
+    file: StrPath | None = None,
+) -> tuple[list[ConfigItem], set[pathlib.Path]]:
+    """Read config as git would for the repository at ``path``.
+
+    Follows git's order -- system, global, local (``config``), worktree
+    (``config.worktree`` with ``extensions.worktreeConfig``), then
+    ``GIT_CONFIG_COUNT`` pairs -- and expands ``include.path`` and
+    ``includeIf`` (``gitdir:``, ``gitdir/i:``, ``onbranch:``) in place.
+    With ``file``, reads only that file, like ``git config --file``, which
+    leaves includes alone. Parsed files are cached until they change.
+
+    Returns
+    -------
+    tuple of (items, sources)
+        Entries in git's order, and every file consulted, including absent
+        ones whose creation would change the result.
+
+    Raises
+    ------
+    GitFsUnsupported
+        ``GIT_CONFIG_PARAMETERS`` is set, a ``hasconfig:`` condition is
+        met, a file is invalid, or ``path`` is not a repository root.
+
+    Examples
+    --------
+    >>> items, sources = load_config(example_git_repo.path)
+    >>> [value for key, value, origin, scope in items if key == 'core.bare']
+    ['false']
+    >>> example_git_repo.path / '.git' / 'config' in sources
+    True
+    """
+    path = pathlib.Path(path)
+    items: list[ConfigItem] = []
+    sources: set[pathlib.Path] = set()
+    try:
+        dirs: GitDir | None = GitDir.discover(path)
+    except GitFsUnsupported:
+        dirs = None
+    context = _IncludeContext(dirs)
+
+    if file is not None:
+        _read_config(path / file, "command", context, items, sources, includes=False)
+        return items, sources
+    if dirs is None:
+        msg = f"Not a repository root: {path}"
+        raise GitFsUnsupported(msg)
+    if "GIT_CONFIG_PARAMETERS" in os.environ:
+        msg = "GIT_CONFIG_PARAMETERS is not supported"
+        raise GitFsUnsupported(msg)
+
+    if not _env_flag("GIT_CONFIG_NOSYSTEM"):
+        system = os.environ.get("GIT_CONFIG_SYSTEM", "/etc/gitconfig")
+        if system:
+            _read_config(pathlib.Path(system), "system", context, items, sources)
+    if "GIT_CONFIG_GLOBAL" in os.environ:
+        global_files = [os.environ["GIT_CONFIG_GLOBAL"]]
+    else:
+        home = pathlib.Path.home()
+        xdg = os.environ.get("XDG_CONFIG_HOME") or str(home / ".config")
+        global_files = [
+            str(pathlib.Path(xdg) / "git" / "config"),
+            str(home / ".gitconfig"),
+        ]
+    for global_file in global_files:
+        if global_file:
+            _read_config(pathlib.Path(global_file), "global", context, items, sources)
+
+    local_start = len(items)
+    _read_config(dirs.common_dir / "config", "local", context, items, sources)
+    worktree_config = [
+        value
+        for key, value, _origin, _scope in items[local_start:]
+        if key == "extensions.worktreeconfig"
+    ]
+    if worktree_config and _config_bool(worktree_config[-1]):
+        _read_config(
+            dirs.git_dir / "config.worktree", "worktree", context, items, sources
+        )
+
+    count = os.environ.get("GIT_CONFIG_COUNT")
+    for i in range(int(count) if count else 0):
+        key = os.environ[f"GIT_CONFIG_KEY_{i}"]
+        section, _, rest = key.partition(".")
+        subsection, dot, name = rest.rpartition(".")
+        key = (
+            f"{section.lower()}.{subsection}.{name.lower()}"
+            if dot
+            else f"{section.lower()}.{rest.lower()}"
+        )
+        items.append(
+            (key, os.environ[f"GIT_CONFIG_VALUE_{i}"], "command line:", "command")
+        )
+    return items, sources
+
+
+def _config_bool(value: str | None) -> bool:
+    if value is None:
+        return True
+    lowered = value.strip().lower()
+    if lowered in ("true", "yes", "on"):
+        return True
+    if lowered in ("false", "no", "off", ""):
+        return False
+    try:
+        return int(lowered, 0) != 0
+    except ValueError:
+        msg = f"Bad boolean config value {value!r}"
+        raise GitFsUnsupported(msg) from None
+
+
+def _path_signature(path: pathlib.Path) -> tuple[int, int, int] | None:
+    try:
+        return _stat_signature(path.stat())
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def _hash_size(dirs: GitDir) -> int:
+    """Object id length in bytes: 32 for ``objectformat=sha256``, else 20."""
+    config = dirs.common_dir / "config"
+    if config.is_file() and _SHA256_RE.search(config.read_bytes()):
+        return 32
+    return 20
+
+
+def repository_fingerprint(path: StrPath) -> tuple[object, ...]:
+    """Return a value that changes whenever refs or config change.
+
+    Covers ``HEAD``, ``packed-refs``, ``config`` and ``config.worktree``
+    (mtime, size and inode), and the mtime of every directory under
+    ``refs/``: git writes loose refs through a lock file and a rename,
+    which touches the directory. Costs one ``stat`` per file and ref
+    directory. The index is left to :func:`worktree_fingerprint`, since
+    ``git status`` rewrites it just to refresh stat data.
+
+    Raises
+    ------
+    GitFsUnsupported
+        ``path`` is not a repository root, or uses reftable.
+
+    Examples
+    --------
+    >>> from libvcs.cmd.git import Git
+    >>> before = repository_fingerprint(example_git_repo.path)
+    >>> before == repository_fingerprint(example_git_repo.path)
+    True
+    >>> Git(path=example_git_repo.path).run(['branch', 'fingerprinted'])
+    ''
+    >>> before == repository_fingerprint(example_git_repo.path)
+    False
+    """
+    dirs = GitDir.discover(path)
+    files = [
+        dirs.git_dir / "HEAD",
+        dirs.git_dir / "config.worktree",
+        dirs.common_dir / "packed-refs",
+        dirs.common_dir / "config",
+    ]
+    fingerprint: list[object] = [_path_signature(file) for file in files]
+    ref_roots = {dirs.common_dir / "refs", dirs.git_dir / "refs"}
+    for root in sorted(ref_roots):
+        for directory, _subdirs, _files in os.walk(root):
+            fingerprint.append((directory, _mtime_ns(pathlib.Path(directory))))
+    return tuple(fingerprint)
+
+
+def worktree_fingerprint(path: StrPath) -> tuple[object, ...]:
+    """Return a value that changes when files ``git status`` reports change.
+
+    Adds to :func:`repository_fingerprint` the index, the stat data of
+    every tracked path :meth:`GitIndex.changed_paths` flags, the mtime of
+    every directory holding tracked files (creating or deleting an
+    untracked file there touches it), and ``info/exclude``. Files created
+    below a directory that holds no tracked files are not noticed.
+
+    Raises
+    ------
+    GitFsUnsupported
+        As :func:`repository_fingerprint`, or the index cannot be read.
+
+    Examples
+    --------
+    >>> before = worktree_fingerprint(example_git_repo.path)
+    >>> _ = (example_git_repo.path / 'untracked.txt').write_text('new')
+    >>> before == worktree_fingerprint(example_git_repo.path)
+    False
+    """
+    worktree = pathlib.Path(path)
+    dirs = GitDir.discover(worktree)
+    fingerprint: list[object] = [
+        repository_fingerprint(worktree),
+        _path_signature(dirs.common_dir / "info" / "exclude"),
+    ]
+    index_path = dirs.git_dir / "index"
+    fingerprint.append(_path_signature(index_path))
+    if not index_path.is_file():
+        fingerprint.append(_mtime_ns(worktree))
+        return tuple(fingerprint)
+    index = GitIndex(index_path, hash_size=_hash_size(dirs))
+    fingerprint.extend(
+        (changed, _path_signature(worktree / changed))
+        for changed in index.changed_paths(worktree)
+    )
+    directories = {""}
+    for entry in index.entries:
+        directory = entry.path
+        while directory:
+            directory = directory.rpartition("/")[0]
+            if directory in directories:
+                break
+            directories.add(directory)
+    fingerprint.extend(
+        (directory, _mtime_ns(worktree / directory))
+        for directory in sorted(directories)
+    )
+    return tuple(fingerprint)
@@ -12,14 +12,23 @@ from __future__ import annotations
 
 import contextlib
 import datetime
+import io
 import logging
+import math
 import os
 import selectors
 import subprocess
 import sys
+import tempfile
 import time
 import typing as t
-from collections.abc import Iterable, Mapping, MutableMapping, Sequence
+from collections.abc import (
+    Generator,
+    Iterable,
+    Mapping,
+    MutableMapping,
+    Sequence,
+)
 
 from libvcs import exc
 from libvcs._internal.types import StrOrBytesPath
@@ -40,6 +49,8 @@ def console_to_str(s: bytes) -> str:
 
 
 if t.TYPE_CHECKING:
+    from typing_extensions import Self
+
     _LoggerAdapter = logging.LoggerAdapter[logging.Logger]
 else:
     _LoggerAdapter = logging.LoggerAdapter
@@ -250,8 +261,6 @@ def run(
     )
 
     all_output: str = ""
-    code = None
-    line = None
     if log_in_real_time and callback is None:
 
         def progress_cb(output: t.AnyStr, timestamp: datetime.datetime) -> None:
@@ -269,25 +278,16 @@ def run(
 
     timeout_stdout: bytes | None = None
     timeout_stderr: bytes | None = None
-    if timeout is None:
-        while code is None:
-            code = proc.poll()
-
-            if callback and callable(callback) and proc.stderr is not None:
-                line = console_to_str(proc.stderr.read(128))
-                if line:
-                    callback(
-                        output=line,
-                        timestamp=datetime.datetime.now(tz=datetime.timezone.utc),
-                    )
-    else:
-        code, timeout_stdout, timeout_stderr = _wait_with_deadline(
-            proc,
-            deadline=time.monotonic() + timeout,
-            timeout=timeout,
-            callback=callback,
-            cmd=_stringify_command(normalized_args),
-        )
+    # Both paths drain stdout and stderr while waiting: polling the child
+    # without reading would deadlock once it fills a pipe buffer (~64 KiB).
+    # Without a timeout the deadline is unbounded.
+    code, timeout_stdout, timeout_stderr = _wait_with_deadline(
+        proc,
+        deadline=math.inf if timeout is None else time.monotonic() + timeout,
+        timeout=math.inf if timeout is None else timeout,
+        callback=callback,
+        cmd=_stringify_command(normalized_args),
+    )
     if callback and callable(callback):
         callback(output="\r", timestamp=datetime.datetime.now(tz=datetime.timezone.utc))
 
@@ -321,6 +321,228 @@ def run(
     return output
 
 
+def stream(
+    args: _CMD,
+    *,
+    cwd: StrOrBytesPath | None = None,
+    env: _ENV | None = None,
+    chunk_size: int = 65536,
+    check_returncode: bool = True,
+) -> Generator[bytes, None, None]:
+    r"""Run a command and yield its stdout in chunks as it is produced.
+
+    Unlike :func:`run`, output is never buffered whole, so callers can walk
+    arbitrarily large listings in constant memory, or stop early. Closing
+    the generator before the command finishes terminates the command.
+
+    stderr is spooled to a temporary file and becomes the output of the
+    :class:`libvcs.exc.CommandError` raised when the command exits non-zero.
+
+    Parameters
+    ----------
+    args : list or str
+        The command to run.
+    cwd : str
+        Directory the command is run from.
+    env : dict, optional
+        Environment for the command, passed through to :class:`subprocess.Popen`.
+    chunk_size : int
+        Upper bound on the size of each yielded chunk.
+    check_returncode : bool
+        Raise :class:`libvcs.exc.CommandError` if the exit code is not 0.
+
+    Examples
+    --------
+    >>> b''.join(stream(['echo', 'hello']))
+    b'hello\n'
+    """
+    normalized_args = _normalize_command_args(args)
+    cmd = _stringify_command(normalized_args)
+
+    with tempfile.TemporaryFile() as stderr:
+        proc = subprocess.Popen(
+            normalized_args,
+            stdout=subprocess.PIPE,
+            stderr=stderr,
+            cwd=cwd,
+            env=env,
+        )
+        assert proc.stdout is not None
+        finished = False
+        try:
+            fd = proc.stdout.fileno()
+            while chunk := os.read(fd, chunk_size):
+                yield chunk
+            code = proc.wait()
+            finished = True
+        finally:
+            if not finished:
+                _terminate_process(proc, cmd)
+            proc.stdout.close()
+
+        if code != 0 and check_returncode:
+            stderr.seek(0)
+            raise exc.CommandError(
+                output=console_to_str(stderr.read()).rstrip(),
+                returncode=code,
+                cmd=cmd,
+            )
+
+
+def split_records(
+    chunks: Iterable[bytes],
+    sep: bytes = b"\0",
+) -> Generator[str, None, None]:
+    r"""Yield ``sep``-terminated records from a stream of byte chunks.
+
+    A trailing record without its terminator is yielded too.
+
+    Examples
+    --------
+    >>> list(split_records([b'a\0b', b'c\0', b'd']))
+    ['a', 'bc', 'd']
+    """
+    pending = b""
+    for chunk in chunks:
+        pending += chunk
+        *records, pending = pending.split(sep)
+        for record in records:
+            yield console_to_str(record)
+    if pending:
+        yield console_to_str(pending)
+
+
+class Pipe:
+    r"""A command fed through stdin and read through stdout while it runs.
+
+    For git's ``--stdin`` and ``--batch`` protocols: write requests, read
+    replies, and keep one process alive across many of them. stderr is
+    spooled to a temporary file and becomes the output of the
+    :class:`libvcs.exc.CommandError` raised when the command fails.
+
+    Examples
+    --------
+    >>> with Pipe(['cat']) as pipe:
+    ...     pipe.write(b'hello\n')
+    ...     pipe.readline()
+    b'hello\n'
+    """
+
+    def __init__(
+        self,
+        args: _CMD,
+        *,
+        cwd: StrOrBytesPath | None = None,
+        env: _ENV | None = None,
+    ) -> None:
+        normalized_args = _normalize_command_args(args)
+        self.cmd = _stringify_command(normalized_args)
+        # Outlives this call: closed with the pipes once the command is done.
+        self._stderr = tempfile.TemporaryFile()  # noqa: SIM115
+        self.proc = subprocess.Popen(
+            normalized_args,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=self._stderr,
+            cwd=cwd,
+            env=env,
+        )
+
+    def __enter__(self) -> Self:
+        """Return the running pipe."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Stop the command if it is still running."""
+        self.terminate()
+        self._close_streams()
+
+    @property
+    def alive(self) -> bool:
+        """True while the command is running."""
+        return self.proc.poll() is None
+
+    def terminate(self) -> None:
+        """Stop the command if it is still running."""
+        if self.alive:
+            _terminate_process(self.proc, self.cmd)
+
+    def write(self, data: bytes) -> None:
+        """Send ``data`` to the command and flush it."""
+        assert self.proc.stdin is not None
+        try:
+            self.proc.stdin.write(data)
+            self.proc.stdin.flush()
+        except (BrokenPipeError, ValueError):
+            raise self.error() from None
+
+    def close_input(self) -> None:
+        """Close stdin, telling the command no more requests follow."""
+        if self.proc.stdin is not None and not self.proc.stdin.closed:
+            with contextlib.suppress(BrokenPipeError):
+                self.proc.stdin.close()
+
+    def readline(self) -> bytes:
+        """Return the next line of output, raising if the command exited."""
+        assert self.proc.stdout is not None
+        line = self.proc.stdout.readline()
+        if not line:
+            raise self.error()
+        return line
+
+    def read_until(self, sep: bytes = b"\0") -> bytes:
+        """Return output up to the one-byte ``sep``, which is consumed."""
+        stdout = self.proc.stdout
+        assert stdout is not None
+        assert isinstance(stdout, io.BufferedReader)
+        chunks: list[bytes] = []
+        while buffered := stdout.peek(1):
+            end = buffered.find(sep)
+            if end >= 0:
+                chunks.append(stdout.read(end + 1)[:-1])
+                return b"".join(chunks)
+            chunks.append(stdout.read(len(buffered)))
+        raise self.error()
+
+    def iter_lines(self) -> Generator[bytes, None, None]:
+        """Yield the remaining lines of output until the command closes it."""
+        assert self.proc.stdout is not None
+        yield from self.proc.stdout
+
+    def read(self, size: int) -> bytes:
+        """Return exactly ``size`` bytes of output, raising if cut short."""
+        assert self.proc.stdout is not None
+        data = self.proc.stdout.read(size)
+        if len(data) < size:
+            raise self.error()
+        return data
+
+    def close(self, *, check_returncode: bool = True) -> int:
+        """Close stdin, wait for the command to exit and return its code."""
+        self.close_input()
+        code = self.proc.wait()
+        try:
+            if code != 0 and check_returncode:
+                raise self.error()
+        finally:
+            self._close_streams()
+        return code
+
+    def error(self) -> exc.CommandError:
+        """Return the error for a command that stopped answering."""
+        code = self.proc.wait()
+        self._stderr.seek(0)
+        output = console_to_str(self._stderr.read()).rstrip()
+        return exc.CommandError(output=output, returncode=code, cmd=self.cmd)
+
+    def _close_streams(self) -> None:
+        for pipe_stream in (self.proc.stdin, self.proc.stdout):
+            if pipe_stream is not None:
+                with contextlib.suppress(BrokenPipeError):
+                    pipe_stream.close()
+        self._stderr.close()
+
+
 #: Grace period after ``terminate()`` before escalating to ``kill()``.
 _TIMEOUT_KILL_GRACE_SECONDS = 0.5
 
@@ -361,7 +583,7 @@ def _wait_with_deadline(
     Notes
     -----
     The progress ``callback`` is invoked for ``stderr`` chunks only,
-    matching the legacy non-timeout codepath. ``stdout`` is drained into
+    as it always has been. ``stdout`` is drained into
     the returned buffer to prevent the child from blocking on a full pipe,
     but its chunks are not forwarded to the callback in real time. Callers
     that want streaming ``stdout`` should redirect it themselves
@@ -439,10 +661,11 @@ def _wait_with_deadline(
 
             wait = min(_TIMEOUT_POLL_INTERVAL_SECONDS, remaining)
             if not registered:
-                # No streams to select on (e.g. ``os.set_blocking`` failed on
-                # Windows pipes). Yield the CPU explicitly instead of busy-
-                # looping until the deadline or process exit.
-                time.sleep(wait)
+                # No streams to select on (both hit EOF, or
+                # ``os.set_blocking`` failed on Windows pipes). Block on the
+                # child instead of busy-looping until the deadline or exit.
+                with contextlib.suppress(subprocess.TimeoutExpired):
+                    proc.wait(timeout=wait)
                 continue
 
             events = sel.select(timeout=wait)
@@ -452,7 +675,9 @@ def _wait_with_deadline(
             for key, _mask in events:
                 stream = t.cast("t.IO[bytes]", key.fileobj)
                 try:
-                    chunk = stream.read(128)
+                    # Small stderr reads keep progress callbacks responsive;
+                    # stdout only needs draining, so read it in bulk.
+                    chunk = stream.read(128 if stream is proc.stderr else 65536)
                 except (BlockingIOError, OSError):
                     chunk = b""
                 if not chunk:
@@ -2,19 +2,41 @@
 
 from __future__ import annotations
 
+import concurrent.futures
+import contextvars
 import dataclasses
+import datetime
 import os
 import pathlib
+import queue
 import re
+import secrets
 import shlex
+import shutil
 import string
+import tempfile
+import threading
+import time
 import typing as t
-from collections.abc import Sequence
+from collections.abc import Generator, Sequence
 
+from libvcs import exc
+from libvcs._internal import gitfs
 from libvcs._internal.query_list import QueryList
-from libvcs._internal.run import ProgressCallbackProtocol, _normalize_command_args, run
+from libvcs._internal.run import (
+    Pipe,
+    ProgressCallbackProtocol,
+    _normalize_command_args,
+    console_to_str,
+    run,
+    split_records,
+    stream,
+)
 from libvcs._internal.types import StrOrBytesPath, StrPath
 
+if t.TYPE_CHECKING:
+    from typing_extensions import Self
+
 _CMD = StrOrBytesPath | Sequence[StrOrBytesPath]
 
 
@@ -40,6 +62,7 @@ class Git:
         *,
         path: StrPath,
         progress_callback: ProgressCallbackProtocol | None = None,
+        query_cache: GitQueryCache | None = None,
     ) -> None:
         r"""Lite, typed, pythonic wrapper for git(1).
 
@@ -47,6 +70,11 @@ class Git:
         ----------
         path :
             Operates as PATH in the corresponding git subcommand.
+        query_cache :
+            Memoize :meth:`rev_parse`, :meth:`show_ref`, :meth:`symbolic_ref`,
+            :meth:`status` and the ``branches``, ``tags`` and ``remotes``
+            listings until the repository changes. See
+            :class:`GitQueryCache`.
 
         Examples
         --------
@@ -111,6 +139,14 @@ class Git:
         self.worktrees = GitWorktreeManager(path=self.path, cmd=self)
         self.notes = GitNotesManager(path=self.path, cmd=self)
         self.reflog = GitReflogManager(path=self.path, cmd=self)
+        self.maintenance = GitMaintenanceManager(path=self.path, cmd=self)
+        self.sparse_checkout = GitSparseCheckoutManager(path=self.path, cmd=self)
+        self.bundle = GitBundleCmd(path=self.path, cmd=self)
+
+        self._config_snapshots: dict[bool, GitConfigSnapshot] = {}
+
+        #: Memoizes read-only queries, see :class:`GitQueryCache`
+        self.query_cache = query_cache
 
     def __repr__(self) -> str:
         """Representation of Git repo command object."""
@@ -202,7 +238,7 @@ class Git:
         no_pager : bool
             ``-P / --no-pager``
         config :
-            ``--config=<name>=<value>``
+            ``-c <name>=<value>``
         config_env :
             ``--config-env=<name>=<envvar>``
         timeout : float, optional
@@ -219,11 +255,87 @@ class Git:
         >>> git.run(['help'])
         "usage: git [...--version] [...--help] [-C <path>]..."
         """
-        cli_args: list[StrOrBytesPath] = ["git", *_normalize_command_args(args)]
-
         if "cwd" not in kwargs:
             kwargs["cwd"] = self.path if cwd is None else cwd
 
+        cli_args = self._cli_args(
+            args,
+            version=version,
+            _help=_help,
+            html_path=html_path,
+            man_path=man_path,
+            info_path=info_path,
+            C=C,
+            git_dir=git_dir,
+            work_tree=work_tree,
+            namespace=namespace,
+            super_prefix=super_prefix,
+            exec_path=exec_path,
+            bare=bare,
+            no_replace_objects=no_replace_objects,
+            literal_pathspecs=literal_pathspecs,
+            global_pathspecs=global_pathspecs,
+            noglob_pathspecs=noglob_pathspecs,
+            icase_pathspecs=icase_pathspecs,
+            no_optional_locks=no_optional_locks,
+            config=config,
+            config_env=config_env,
+        )
+
+        if self.progress_callback is not None:
+            kwargs["callback"] = self.progress_callback
+
+        try:
+            return run(args=cli_args, timeout=timeout, **kwargs)
+        finally:
+            self._ran(args)
+
+    def _query(self, args: Sequence[StrOrBytesPath], **kwargs: t.Any) -> str:
+        """Run a read-only command, answered by :attr:`query_cache` if set."""
+        if self.query_cache is None:
+            return self.run(args, **kwargs)
+        return self.query_cache.run(self, args, **kwargs)
+
+    def _ran(self, args: _CMD) -> None:
+        """Drop cached queries after ``args`` ran, unless it only reads."""
+        if self.query_cache is None or _in_query.get():
+            return
+        command = args if isinstance(args, (str, bytes, os.PathLike)) else args[0]
+        if command not in _READ_ONLY_COMMANDS:
+            self.query_cache.invalidate(self.path)
+
+    @staticmethod
+    def _cli_args(
+        args: _CMD,
+        *,
+        version: bool | None = None,
+        _help: bool | None = None,
+        html_path: bool | None = None,
+        man_path: bool | None = None,
+        info_path: bool | None = None,
+        C: StrOrBytesPath | list[StrOrBytesPath] | None = None,
+        git_dir: StrOrBytesPath | None = None,
+        work_tree: StrOrBytesPath | None = None,
+        namespace: StrOrBytesPath | None = None,
+        super_prefix: StrOrBytesPath | None = None,
+        exec_path: StrOrBytesPath | None = None,
+        bare: bool | None = None,
+        no_replace_objects: bool | None = None,
+        literal_pathspecs: bool | None = None,
+        global_pathspecs: bool | None = None,
+        noglob_pathspecs: bool | None = None,
+        icase_pathspecs: bool | None = None,
+        no_optional_locks: bool | None = None,
+        config: dict[str, t.Any] | None = None,
+        config_env: str | None = None,
+    ) -> list[StrOrBytesPath]:
+        """Return ``git``, its global options, then ``args``.
+
+        Shared by :meth:`run` and :meth:`stream`; see :meth:`run` for the
+        options.
+        """
+        cli_args: list[StrOrBytesPath] = ["git"]
+
         #
         # Print-and-exit
         #
@@ -257,7 +369,7 @@ class Git:
                 return v
 
             for k, v in config.items():
-                cli_args.extend(["--config", f"{k}={stringify(v)}"])
+                cli_args.extend(["-c", f"{k}={stringify(v)}"])
         if config_env is not None:
             cli_args.append(f"--config-env={config_env}")
         if git_dir is not None:
@@ -269,7 +381,7 @@ class Git:
         if super_prefix is not None:
             cli_args.extend(["--super-prefix", os.fspath(super_prefix)])
         if exec_path is not None:
-            cli_args.extend(["--exec-path", os.fspath(exec_path)])
+            cli_args.append(f"--exec-path={os.fsdecode(exec_path)}")
         if bare is True:
             cli_args.append("--bare")
         if no_replace_objects is True:
@@ -277,7 +389,7 @@ class Git:
         if literal_pathspecs is True:
             cli_args.append("--literal-pathspecs")
         if global_pathspecs is True:
-            cli_args.append("--global-pathspecs")
+            cli_args.append("--glob-pathspecs")
         if noglob_pathspecs is True:
             cli_args.append("--noglob-pathspecs")
         if icase_pathspecs is True:
@@ -285,10 +397,52 @@ class Git:
         if no_optional_locks is True:
             cli_args.append("--no-optional-locks")
 
-        if self.progress_callback is not None:
-            kwargs["callback"] = self.progress_callback
+        # Global options are only honored ahead of the subcommand.
+        cli_args.extend(_normalize_command_args(args))
+
+        return cli_args
+
+    def stream(
+        self,
+        args: _CMD,
+        *,
+        cwd: StrOrBytesPath | None = None,
+        env: dict[str, str] | None = None,
+        chunk_size: int = 65536,
+        # libvcs special behavior
+        check_returncode: bool = True,
+        **global_options: t.Any,
+    ) -> Generator[bytes, None, None]:
+        r"""Run a git command, yielding stdout in chunks as git produces it.
+
+        For listings too large to buffer, see
+        :func:`~libvcs._internal.run.stream`. Closing the iterator early stops
+        the command.
+
+        Parameters
+        ----------
+        cwd : :attr:`libvcs._internal.types.StrOrBytesPath`, optional
+            Defaults to :attr:`~.cwd`.
+        **global_options :
+            Git's global options, as accepted by :meth:`run` (``C``,
+            ``git_dir``, ``no_optional_locks``, ``config``, ...).
 
-        return run(args=cli_args, timeout=timeout, **kwargs)
+        Examples
+        --------
+        >>> git = Git(path=example_git_repo.path)
+        >>> b''.join(git.stream(['rev-parse', '--is-inside-work-tree']))
+        b'true\n'
+        >>> b''.join(git.stream(['rev-parse', '--is-inside-git-dir'], C='.git'))
+        b'true\n'
+        """
+        self._ran(args)
+        return stream(
+            self._cli_args(args, **global_options),
+            cwd=self.path if cwd is None else cwd,
+            env=env,
+            chunk_size=chunk_size,
+            check_returncode=check_returncode,
+        )
 
     def clone(
         self,
@@ -304,10 +458,13 @@ class Git:
         shallow_exclude: str | None = None,
         reference: str | None = None,
         reference_if_able: str | None = None,
+        dissociate: bool | None = None,
         server_option: str | None = None,
         jobs: str | None = None,
         force: bool | None = None,
         local: bool | None = None,
+        bare: bool | None = None,
+        mirror: bool | None = None,
         _all: bool | None = None,
         no_hardlinks: bool | None = None,
         hardlinks: bool | None = None,
@@ -317,6 +474,7 @@ class Git:
         no_reject_shallow: bool | None = None,
         reject_shallow: bool | None = None,
         sparse: bool | None = None,
+        _filter: str | None = None,
         shallow_submodules: bool | None = None,
         no_shallow_submodules: bool | None = None,
         remote_submodules: bool | None = None,
@@ -343,6 +501,23 @@ class Git:
             Separate repository (.git/ ) from working tree
         force : bool, optional
             force operation to run
+        reference_if_able : str, optional
+            ``--reference-if-able <repo>``: borrow objects from a local
+            repository when it exists, see :class:`~libvcs.sync.git.GitMirrorCache`.
+        dissociate : bool, optional
+            ``--dissociate``: copy borrowed objects so the clone no longer
+            depends on the reference repository.
+        bare : bool, optional
+            ``--bare``
+        mirror : bool, optional
+            ``--mirror``: bare clone mapping every remote ref to a local ref.
+        sparse : bool, optional
+            ``--sparse``: check out only top-level files, see
+            :class:`GitSparseCheckoutManager`.
+        _filter : str, optional
+            ``--filter=<filter-spec>``: partial clone, e.g. ``blob:none``,
+            ``tree:0`` or ``blob:limit=1m``. Omitted objects are fetched on
+            demand, and later fetches keep the filter.
         make_parents : bool, default: ``True``
             Creates checkout directory (`:attr:`self.path`) if it doesn't already exist.
 
@@ -354,6 +529,17 @@ class Git:
         ''
         >>> git.path.exists()
         True
+
+        Partial clone:
+
+        >>> git = Git(path=tmp_path / 'partial')
+        >>> git.clone(url=f'file://{git_remote_repo}', _filter='blob:none')
+        ''
+        >>> git.run(
+        ...     ['config', '-f', '.git/config', 'remote.origin.partialclonefilter'],
+        ...     trim=True,
+        ... )
+        'blob:none'
         """
         required_flags: list[str] = [url, str(self.path)]
         local_flags: list[str] = []
@@ -362,7 +548,7 @@ class Git:
             local_flags.append(f"--template={template}")
         if separate_git_dir is not None:
             local_flags.append(f"--separate-git-dir={separate_git_dir!s}")
-        if (_filter := kwargs.pop("_filter", None)) is not None:
+        if _filter is not None:
             local_flags.append(f"--filter={_filter}")
         if depth is not None:
             local_flags.extend(["--depth", str(depth)])
@@ -380,6 +566,12 @@ class Git:
             local_flags.extend(["--reference", reference])
         if reference_if_able is not None:
             local_flags.extend(["--reference-if-able", reference_if_able])
+        if dissociate is True:
+            local_flags.append("--dissociate")
+        if bare is True:
+            local_flags.append("--bare")
+        if mirror is True:
+            local_flags.append("--mirror")
         if server_option is not None:
             local_flags.append(f"--server-option={server_option}")
         if jobs is not None:
@@ -429,17 +621,20 @@ class Git:
         self,
         *,
         reftag: t.Any | None = None,
+        refspecs: Sequence[str] | None = None,
+        repositories: Sequence[str] | None = None,
         deepen: str | None = None,
         depth: str | None = None,
         upload_pack: str | None = None,
         shallow_since: str | None = None,
         shallow_exclude: str | None = None,
-        negotiation_tip: str | None = None,
-        jobs: str | None = None,
+        negotiation_tip: str | Sequence[str] | None = None,
+        jobs: int | str | None = None,
         server_option: str | None = None,
         recurse_submodules: bool | t.Literal["yes", "on-demand", "no"] | None = None,
         recurse_submodules_default: bool | t.Literal["yes", "on-demand"] | None = None,
         submodule_prefix: StrOrBytesPath | None = None,
+        _filter: str | None = None,
         _all: bool | None = None,
         force: bool | None = None,
         keep: bool | None = None,
@@ -472,12 +667,45 @@ class Git:
         show_forced_updates: bool | None = None,
         no_show_forced_updates: bool | None = None,
         negotiate_only: bool | None = None,
+        # Pass-through to run
+        config: dict[str, t.Any] | None = None,
+        log_in_real_time: bool = False,
         # libvcs special behavior
         check_returncode: bool | None = None,
         **kwargs: t.Any,
     ) -> str:
         """Download from repo. Wraps `git fetch <https://git-scm.com/docs/git-fetch>`_.
 
+        Parameters
+        ----------
+        reftag :
+            Repository (remote name or URL) to fetch from.
+        refspecs :
+            Refspecs to fetch from ``reftag`` instead of its configured ones,
+            e.g. ``['main', '+refs/tags/v1.0:refs/tags/v1.0']``.
+        repositories :
+            Remotes or remote groups to fetch, with ``multiple``.
+        multiple :
+            ``--multiple``: fetch every repository in ``repositories``,
+            concurrently with ``jobs``.
+        jobs :
+            ``--jobs=<n>``: parallel fetches for ``multiple`` and submodules.
+        negotiation_tip :
+            ``--negotiation-tip=<rev>``, repeatable: only advertise these
+            local commits as "have"s, cutting negotiation on repositories
+            with many refs.
+        no_tags :
+            ``--no-tags``: don't fetch tags pointing into fetched history.
+        prune :
+            ``--prune``: remove remote-tracking refs gone from the remote.
+        write_commit_graph :
+            ``--write-commit-graph``, like ``fetch.writeCommitGraph``.
+        _filter : str, optional
+            ``--filter=<filter-spec>``, for partial clones (see :meth:`clone`).
+        config :
+            ``-c <name>=<value>`` overrides, e.g.
+            ``{'fetch.writeCommitGraph': True}``.
+
         Examples
         --------
         >>> git = Git(path=example_git_repo.path)
@@ -490,15 +718,32 @@ class Git:
         ''
         >>> git.path.exists()
         True
+
+        Only what is needed, without tags:
+
+        >>> git.fetch(reftag='origin', refspecs=['master'], no_tags=True)
+        ''
+
+        Several remotes in parallel:
+
+        >>> git.fetch(
+        ...     repositories=['origin'], multiple=True, jobs=4, prune=True, quiet=True
+        ... )
+        ''
         """
+        if refspecs and (multiple or repositories):
+            msg = "refspecs cannot be combined with multiple repositories"
+            raise ValueError(msg)
         required_flags: list[str] = []
         if reftag:
             required_flags.insert(0, reftag)
+        required_flags.extend(refspecs or ())
+        required_flags.extend(repositories or ())
         local_flags: list[str] = []
 
         if submodule_prefix is not None:
             local_flags.append(f"--submodule-prefix={submodule_prefix!r}")
-        if (_filter := kwargs.pop("_filter", None)) is not None:
+        if _filter is not None:
             local_flags.append(f"--filter={_filter}")
         if depth is not None:
             local_flags.extend(["--depth", depth])
@@ -513,7 +758,7 @@ class Git:
         if server_option is not None:
             local_flags.append(f"--server-option={server_option}")
         if jobs is not None:
-            local_flags.extend(["--jobs", jobs])
+            local_flags.append(f"--jobs={jobs}")
         if keep:
             local_flags.append("--keep")
         if force:
@@ -577,7 +822,12 @@ class Git:
                     f"--recurse-submodules-default={recurse_submodules_default}"
                 )
         if negotiation_tip is not None:
-            local_flags.append(f"--negotiation-tip={negotiation_tip}")
+            tips = (
+                [negotiation_tip]
+                if isinstance(negotiation_tip, str)
+                else negotiation_tip
+            )
+            local_flags.extend(f"--negotiation-tip={tip}" for tip in tips)
         if set_upstream:
             local_flags.append("--set-upstream")
         if update_head_ok:
@@ -590,7 +840,9 @@ class Git:
             local_flags.append("--negotiate-only")
         return self.run(
             ["fetch", *local_flags, "--", *required_flags],
+            config=config,
             check_returncode=check_returncode,
+            log_in_real_time=log_in_real_time,
         )
 
     def rebase(
@@ -1661,6 +1913,7 @@ class Git:
         long: bool | None = None,
         short: bool | None = None,
         branch: bool | None = None,
+        show_stash: bool | None = None,
         z: bool | None = None,
         column: bool | str | None = None,
         no_column: bool | None = None,
@@ -1672,14 +1925,21 @@ class Git:
         porcelain: bool | str | None = None,
         untracked_files: t.Literal["no", "normal", "all"] | None = None,
         ignored: t.Literal["traditional", "no", "matching"] | None = None,
+        ignore_submodules: t.Literal["none", "untracked", "dirty", "all"]
+        | bool
+        | None = None,
         ignored_submodules: t.Literal["untracked", "dirty", "all"] | None = None,
         pathspec: StrOrBytesPath | list[StrOrBytesPath] | None = None,
+        # Global options and config overrides
+        no_optional_locks: bool | None = None,
+        fsmonitor: bool | None = None,
+        untracked_cache: bool | None = None,
         # libvcs special behavior
         check_returncode: bool | None = None,
         trim: bool = False,
         **kwargs: t.Any,
     ) -> str:
-        """Return status of working tree.
+        r"""Return status of working tree.
 
         Wraps `git status <https://git-scm.com/docs/git-status>`_.
 
@@ -1691,19 +1951,35 @@ class Git:
         long : bool
         short : bool
         branch : bool
+        show_stash : bool
         z : bool
+            ``-z``, terminate entries with NUL instead of LF
         column : bool
         no_column : bool
         ahead_behind : bool
         no_ahead_behind : bool
-        find_renames : bool
-        no_find_renames : bool
+            Skip the ahead/behind walk against the upstream, which can be
+            expensive on branches that diverged long ago.
+        renames : bool
+        no_renames : bool
+        find_renames : bool, str
         porcelain : str, bool
         untracked_files : "no", "normal", "all"
         ignored : "traditional", "no", "matching"
+        ignore_submodules : "none", "untracked", "dirty", "all"
         ignored_submodules : "untracked", "dirty", "all"
+            Deprecated alias of ``ignore_submodules``.
         pathspec : :attr:`libvcs._internal.types.StrOrBytesPath` or list
             :attr:`libvcs._internal.types.StrOrBytesPath`
+        no_optional_locks : bool
+            ``git --no-optional-locks``, don't refresh the index as a side
+            effect. Read-only pollers should set this so they never contend
+            with a concurrent ``git`` writer for ``index.lock``.
+        fsmonitor : bool
+            Override ``core.fsmonitor`` for this call. ``True`` uses git's
+            built-in filesystem monitor daemon.
+        untracked_cache : bool
+            Override ``core.untrackedCache`` for this call.
         trim : bool, default: False
             Strip trailing whitespace/newline from command output.
 
@@ -1730,6 +2006,18 @@ class Git:
 
         >>> git.status(porcelain=True, untracked_files="no")
         ''
+
+        >>> git.status(porcelain='2', z=True)
+        '? new_file.txt\x00'
+
+        >>> git.status(
+        ...     porcelain='2',
+        ...     no_optional_locks=True,
+        ...     untracked_cache=True,
+        ...     ignore_submodules='all',
+        ...     trim=True,
+        ... )
+        '? new_file.txt'
         """
         local_flags: list[str] = []
 
@@ -1745,20 +2033,26 @@ class Git:
         if branch is True:
             local_flags.append("--branch")
 
+        if show_stash is True:
+            local_flags.append("--show-stash")
+
         if z is True:
-            local_flags.append("--z")
+            local_flags.append("-z")
 
         if untracked_files is not None and isinstance(untracked_files, str):
             local_flags.append(f"--untracked-files={untracked_files}")
 
-        if ignored is not None and isinstance(column, str):
+        if ignored is not None and isinstance(ignored, str):
             local_flags.append(f"--ignored={ignored}")
 
-        if ignored_submodules is not None:
-            if isinstance(column, str):
-                local_flags.append(f"--ignored-submodules={ignored_submodules}")
-            else:
-                local_flags.append("--ignored-submodules")
+        if ignore_submodules is None and ignored_submodules is not None:
+            ignore_submodules = ignored_submodules
+
+        if ignore_submodules is not None:
+            if isinstance(ignore_submodules, str):
+                local_flags.append(f"--ignore-submodules={ignore_submodules}")
+            elif ignore_submodules:
+                local_flags.append("--ignore-submodules")
 
         if column is not None:
             if isinstance(column, str):
@@ -1768,16 +2062,26 @@ class Git:
         elif no_column is not None:
             local_flags.append("--no-column")
 
+        if ahead_behind is True:
+            local_flags.append("--ahead-behind")
+        elif no_ahead_behind is True:
+            local_flags.append("--no-ahead-behind")
+
+        if renames is True:
+            local_flags.append("--renames")
+        elif no_renames is True:
+            local_flags.append("--no-renames")
+
         if porcelain is not None:
             if isinstance(porcelain, str):
                 local_flags.append(f"--porcelain={porcelain}")
             else:
                 local_flags.append("--porcelain")
 
-        if find_renames is True:
+        if find_renames is not None:
             if isinstance(find_renames, str):
                 local_flags.append(f"--find-renames={find_renames}")
-            else:
+            elif find_renames:
                 local_flags.append("--find-renames")
 
         if pathspec is not None:
@@ -1786,8 +2090,16 @@ class Git:
         else:
             pathspec = []
 
-        return self.run(
+        config: dict[str, t.Any] = {}
+        if fsmonitor is not None:
+            config["core.fsmonitor"] = fsmonitor
+        if untracked_cache is not None:
+            config["core.untrackedCache"] = untracked_cache
+
+        return self._query(
             ["status", *local_flags, *(["--", *pathspec] if pathspec else [])],
+            no_optional_locks=no_optional_locks,
+            config=config or None,
             check_returncode=check_returncode,
             trim=trim,
         )
@@ -1982,6 +2294,32 @@ class Git:
             trim=trim,
         )
 
+    def config_snapshot(self, *, in_process: bool = False) -> GitConfigSnapshot:
+        """Return a cached :class:`GitConfigSnapshot` of this repository.
+
+        The snapshot is shared between calls and reloads itself when a config
+        file changes, so repeated lookups cost a few ``stat`` calls instead
+        of a ``git config`` subprocess each. With ``in_process``, the snapshot
+        parses the config files itself and never runs git for them.
+
+        Examples
+        --------
+        >>> git = Git(path=example_git_repo.path)
+        >>> git.config_snapshot().get('user.email')
+        '...@...'
+        >>> git.config_snapshot() is git.config_snapshot()
+        True
+        >>> git.config_snapshot(in_process=True).get('user.email')
+        '...@...'
+        """
+        snapshot = self._config_snapshots.get(in_process)
+        if snapshot is None:
+            snapshot = GitConfigSnapshot(
+                path=self.path, cmd=self, in_process=in_process
+            )
+            self._config_snapshots[in_process] = snapshot
+        return snapshot
+
     def version(
         self,
         *,
@@ -2063,7 +2401,7 @@ class Git:
         elif args is not None:
             local_flags.append(args)
 
-        return self.run(
+        return self._query(
             ["rev-parse", *local_flags],
             check_returncode=check_returncode,
             **kwargs,
@@ -2314,7 +2652,7 @@ class Git:
         if quiet is True:
             local_flags.append("--quiet")
 
-        return self.run(
+        return (self.run if delete is True else self._query)(
             ["symbolic-ref", *required_flags, *local_flags],
             check_returncode=check_returncode,
             trim=trim,
@@ -2389,7 +2727,7 @@ class Git:
             if flag is not None and flag:
                 local_flags.append(shell_flag)
 
-        return self.run(
+        return self._query(
             [
                 "show-ref",
                 *local_flags,
@@ -2399,609 +2737,2011 @@ class Git:
             trim=trim,
         )
 
+    def ls_remote(
+        self,
+        repository: str | None = None,
+        patterns: Sequence[str] = (),
+        *,
+        heads: bool | None = None,
+        tags: bool | None = None,
+        refs: bool | None = None,
+        symref: bool = True,
+        cache: GitLsRemoteCache | None = None,
+        # libvcs special behavior
+        check_returncode: bool | None = None,
+        **kwargs: t.Any,
+    ) -> GitRemoteRefs:
+        r"""List the refs a remote advertises, without fetching.
 
-GitSubmoduleCmdCommandLiteral = t.Literal[
-    "add",
-    "status",
-    "init",
-    "deinit",
-    "update",
-    "set-branch",
-    "set-url",
-    "summary",
-    "foreach",
-    "sync",
-    "absorbgitdirs",
-]
-
-
-class GitSubmoduleCmd:
-    """Run git submodule commands (low-level, use :class:`GitSubmoduleManager`)."""
-
-    def __init__(self, *, path: StrPath, cmd: Git | None = None) -> None:
-        """Lite, typed, pythonic wrapper for git-submodule(1).
+        Wraps `git ls-remote <https://git-scm.com/docs/git-ls-remote>`_.
 
         Parameters
         ----------
-        path :
-            Operates as PATH in the corresponding git subcommand.
+        repository :
+            Remote name or URL. Default: the current branch's remote, else
+            ``origin``.
+        patterns :
+            Only list refs matching these patterns (matched against the end
+            of the ref name, e.g. ``refs/heads/main`` or ``main``). Requires
+            ``repository``.
+        heads :
+            Only list branches (``--heads``).
+        tags :
+            Only list tags (``--tags``).
+        refs :
+            Omit peeled tags and pseudorefs such as ``HEAD`` (``--refs``).
+        symref :
+            Report what symbolic refs such as ``HEAD`` point at
+            (``--symref``, default True).
+        cache :
+            Reuse results younger than the cache's TTL for the same
+            ``repository`` and arguments instead of contacting the remote.
+            Pass a URL as ``repository`` to share entries across checkouts.
 
         Examples
         --------
-        >>> GitSubmoduleCmd(path=tmp_path)
-        <GitSubmoduleCmd path=...>
+        >>> git = Git(path=example_git_repo.path)
+        >>> remote = git.ls_remote()
+        >>> remote.head
+        'refs/heads/master'
+        >>> len(remote.refs['refs/heads/master'])
+        40
 
-        >>> GitSubmoduleCmd(path=tmp_path).run(quiet=True, trim=True)
-        'fatal: not a git repository (or any of the parent directories): .git'
+        >>> list(git.ls_remote('origin', ['master'], heads=True).refs)
+        ['refs/heads/master']
 
-        >>> GitSubmoduleCmd(path=example_git_repo.path).run(quiet=True)
-        ''
+        >>> cache = GitLsRemoteCache(ttl=60)
+        >>> git.ls_remote(cache=cache) is git.ls_remote(cache=cache)
+        True
         """
-        #: Directory to check out
-        self.path: pathlib.Path
-        if isinstance(path, pathlib.Path):
-            self.path = path
-        else:
-            self.path = pathlib.Path(path)
+        if patterns and repository is None:
+            msg = "patterns require a repository"
+            raise ValueError(msg)
 
-        self.cmd = cmd if isinstance(cmd, Git) else Git(path=self.path)
+        local_flags: list[str] = []
+        for flag, shell_flag in [
+            (heads, "--heads"),
+            (tags, "--tags"),
+            (refs, "--refs"),
+            (symref, "--symref"),
+        ]:
+            if flag is True:
+                local_flags.append(shell_flag)
+        if repository is not None:
+            local_flags.append(repository)
+        local_flags.extend(patterns)
 
-    def __repr__(self) -> str:
-        """Representation of a git submodule command object."""
-        return f"<GitSubmoduleCmd path={self.path}>"
+        if cache is not None:
+            cached = cache.get(repository or "", local_flags)
+            if cached is not None:
+                return cached
 
-    def run(
+        remote_refs = GitRemoteRefs.from_output(
+            self.run(
+                ["ls-remote", *local_flags],
+                check_returncode=check_returncode,
+            ),
+        )
+        if cache is not None:
+            cache.set(repository or "", local_flags, remote_refs)
+        return remote_refs
+
+    def ref_transaction(
         self,
-        command: GitSubmoduleCmdCommandLiteral | None = None,
-        local_flags: list[str] | None = None,
+        message: str | None = None,
         *,
-        quiet: bool | None = None,
-        cached: bool | None = None,  # Only when no command entered and status
-        # Pass-through to run()
-        log_in_real_time: bool = False,
-        check_returncode: bool | None = None,
-        **kwargs: t.Any,
-    ) -> str:
-        """Run a command against a git submodule.
+        no_deref: bool | None = None,
+    ) -> GitRefTransaction:
+        r"""Queue ref changes and apply them atomically in one process.
 
-        Wraps `git submodule <https://git-scm.com/docs/git-submodule>`_.
+        Wraps `git update-ref --stdin -z
+        <https://git-scm.com/docs/git-update-ref>`_. Used as a context
+        manager, the transaction commits on exit, or aborts if the block
+        raised.
 
         Examples
         --------
-        >>> GitSubmoduleCmd(path=example_git_repo.path).run()
-        ''
-        """
-        local_flags = local_flags if isinstance(local_flags, list) else []
-        if command is not None:
-            local_flags.insert(0, command)
-
-        if quiet is True:
-            local_flags.append("--quiet")
-        if cached is True:
-            local_flags.append("--cached")
-
-        return self.cmd.run(
-            ["submodule", *local_flags],
-            check_returncode=check_returncode,
-            log_in_real_time=log_in_real_time,
-            **kwargs,
+        >>> git = Git(path=example_git_repo.path)
+        >>> head = git.run(['rev-parse', 'HEAD'], trim=True)
+        >>> with git.ref_transaction(message='bulk tag') as tx:
+        ...     for n in range(3):
+        ...         tx.create(f'refs/tags/bulk-{n}', head)
+        >>> git.run(['tag', '--list', 'bulk-*'], trim=True)
+        'bulk-0\nbulk-1\nbulk-2'
+        """
+        return GitRefTransaction(
+            path=self.path,
+            cmd=self,
+            message=message,
+            no_deref=no_deref,
         )
 
-    def init(
+    def resolve_many(
         self,
+        revs: t.Iterable[str],
         *,
-        path: list[StrPath] | StrPath | None = None,
-        # Pass-through to run()
-        log_in_real_time: bool = False,
-        check_returncode: bool | None = None,
-    ) -> str:
-        """Git submodule init.
+        commits: bool = False,
+    ) -> GitResolvedRevs:
+        """Resolve revisions to object ids with one git process.
+
+        Runs a single :class:`GitCatFileSession` (``git cat-file
+        --batch-check``) however many revisions are given, rather than one
+        :meth:`rev_parse` each.
+
+        Parameters
+        ----------
+        revs :
+            Revisions in any form git accepts, e.g. ``HEAD``, ``v1.0``,
+            ``origin/main~2`` or an abbreviated object id.
+        commits :
+            Peel each revision to the commit it names (``<rev>^{commit}``),
+            as :meth:`rev_list` with ``max_count=1`` would. Revisions that do
+            not lead to a commit are then missing.
 
         Examples
         --------
-        >>> GitSubmoduleCmd(path=example_git_repo.path).init()
-        ''
+        >>> git = Git(path=example_git_repo.path)
+        >>> resolved = git.resolve_many(['HEAD', 'master', 'no-such-branch'])
+        >>> resolved.oids['HEAD'] == resolved.oids['master']
+        True
+        >>> resolved.oids['no-such-branch'] is None
+        True
+        >>> resolved.missing
+        ['no-such-branch']
+        """
+        names = list(dict.fromkeys(revs))
+        oids: dict[str, str | None] = {}
+        missing: list[str] = []
+        ambiguous: list[str] = []
+        if not names:
+            return GitResolvedRevs(oids=oids, missing=missing, ambiguous=ambiguous)
+
+        with GitCatFileSession(path=self.path, cmd=self) as session:
+            replies = session._ask_many(
+                (
+                    _batch_line(f"{name}^{{commit}}" if commits else name)
+                    for name in names
+                ),
+                session._read_reply,
+            )
+            for name, reply in zip(names, replies, strict=True):
+                if isinstance(reply, GitObjectInfo):
+                    oids[name] = reply.oid
+                    continue
+                oids[name] = None
+                (ambiguous if reply == "ambiguous" else missing).append(name)
+        return GitResolvedRevs(oids=oids, missing=missing, ambiguous=ambiguous)
+
+    def merge_base(
+        self,
+        *commits: str,
+        _all: bool | None = None,
+        octopus: bool | None = None,
+        independent: bool | None = None,
+        fork_point: bool | None = None,
+    ) -> list[str]:
+        """Return best common ancestors of ``commits``.
+
+        Wraps `git merge-base <https://git-scm.com/docs/git-merge-base>`_.
+        For ``--is-ancestor``, see :meth:`is_ancestor`.
+
+        Parameters
+        ----------
+        _all :
+            Every best common ancestor rather than one (``--all``).
+        octopus :
+            Common ancestors of all the commits, for an n-way merge
+            (``--octopus``).
+        independent :
+            The commits that are not reachable from any other given commit
+            (``--independent``).
+        fork_point :
+            Where the branch ``commits[1]`` (default ``HEAD``) forked from
+            ``commits[0]``, consulting its reflog (``--fork-point``).
+
+        Returns
+        -------
+        list of str
+            Object ids; empty when the commits share no history.
+
+        Examples
+        --------
+        >>> git = Git(path=example_git_repo.path)
+        >>> base = git.run(['rev-parse', 'HEAD'], trim=True)
+        >>> git.run(['commit', '--allow-empty', '-m', 'next'])
+        '...'
+        >>> git.merge_base('HEAD', base) == [base]
+        True
+        >>> head = git.run(['rev-parse', 'HEAD'], trim=True)
+        >>> git.merge_base('HEAD', base, independent=True) == [head]
+        True
         """
         local_flags: list[str] = []
-        required_flags: list[str] = []
+        for flag, shell_flag in [
+            (_all, "--all"),
+            (octopus, "--octopus"),
+            (independent, "--independent"),
+            (fork_point, "--fork-point"),
+        ]:
+            if flag is True:
+                local_flags.append(shell_flag)
+        try:
+            output = self.run(
+                ["merge-base", *local_flags, *commits],
+                check_returncode=True,
+            )
+        except exc.CommandError as e:
+            # Exit code 1 without output: no common ancestor.
+            if e.returncode == 1 and not e.output.strip():
+                return []
+            raise
+        return output.split()
 
-        if isinstance(path, list):
-            required_flags.extend(str(pathlib.Path(p).absolute()) for p in path)
-        elif isinstance(path, pathlib.Path):
-            required_flags.append(str(pathlib.Path(path).absolute()))
+    def is_ancestor(self, ancestor: str, descendant: str) -> bool:
+        """Return True if ``ancestor`` is reachable from ``descendant``.
 
-        return self.run(
-            "init",
-            local_flags=[*local_flags, "--", *required_flags],
-            check_returncode=check_returncode,
-            log_in_real_time=log_in_real_time,
-        )
-
-    def update(
-        self,
-        *,
-        path: list[StrPath] | StrPath | None = None,
-        init: bool | None = None,
-        force: bool | None = None,
-        checkout: bool | None = None,
-        rebase: bool | None = None,
-        merge: bool | None = None,
-        recursive: bool | None = None,
-        # Pass-through to run()
-        log_in_real_time: bool = False,
-        check_returncode: bool | None = None,
-        **kwargs: t.Any,
-    ) -> str:
-        """Git submodule update.
+        Wraps ``git merge-base --is-ancestor``. A commit is its own ancestor.
 
         Examples
         --------
-        >>> GitSubmoduleCmd(path=example_git_repo.path).update()
-        ''
-        >>> GitSubmoduleCmd(path=example_git_repo.path).update(init=True)
-        ''
-        >>> GitSubmoduleCmd(
-        ...     path=example_git_repo.path
-        ... ).update(init=True, recursive=True)
-        ''
-        >>> GitSubmoduleCmd(path=example_git_repo.path).update(force=True)
-        ''
-        >>> GitSubmoduleCmd(path=example_git_repo.path).update(checkout=True)
-        ''
-        >>> GitSubmoduleCmd(path=example_git_repo.path).update(rebase=True)
-        ''
-        >>> GitSubmoduleCmd(path=example_git_repo.path).update(merge=True)
-        ''
+        >>> git = Git(path=example_git_repo.path)
+        >>> git.run(['commit', '--allow-empty', '-m', 'next'])
+        '...'
+        >>> git.is_ancestor('HEAD~1', 'HEAD')
+        True
+        >>> git.is_ancestor('HEAD', 'HEAD~1')
+        False
         """
-        local_flags: list[str] = []
-        required_flags: list[str] = []
+        try:
+            self.run(
+                ["merge-base", "--is-ancestor", ancestor, descendant],
+                check_returncode=True,
+            )
+        except exc.CommandError as e:
+            if e.returncode == 1:
+                return False
+            raise
+        return True
 
-        if isinstance(path, list):
-            required_flags.extend(str(pathlib.Path(p).absolute()) for p in path)
-        elif isinstance(path, pathlib.Path):
-            required_flags.append(str(pathlib.Path(path).absolute()))
+    def is_ancestor_many(
+        self,
+        pairs: t.Iterable[tuple[str, str]],
+    ) -> dict[tuple[str, str], bool]:
+        """Answer :meth:`is_ancestor` for many ``(ancestor, descendant)`` pairs.
 
-        if init is True:
-            local_flags.append("--init")
-        if force is True:
-            local_flags.append("--force")
+        Resolves every revision in one :meth:`resolve_many` call, then runs
+        one ``git rev-list --stdin`` per distinct descendant, covering all of
+        its candidate ancestors at once. Walks use the commit-graph when the
+        repository has one (see
+        :meth:`GitMaintenanceManager.write_commit_graph`).
 
-        if checkout is True:
-            local_flags.append("--checkout")
-        elif rebase is True:
-            local_flags.append("--rebase")
-        elif merge is True:
-            local_flags.append("--merge")
-        if (_filter := kwargs.pop("_filter", None)) is not None:
-            local_flags.append(f"--filter={_filter}")
+        Raises
+        ------
+        ValueError
+            When a revision does not name a commit.
 
-        return self.run(
-            "update",
-            local_flags=[*local_flags, "--", *required_flags],
-            check_returncode=check_returncode,
-            log_in_real_time=log_in_real_time,
+        Examples
+        --------
+        >>> git = Git(path=example_git_repo.path)
+        >>> git.run(['commit', '--allow-empty', '-m', 'next'])
+        '...'
+        >>> git.is_ancestor_many(
+        ...     [('HEAD~1', 'HEAD'), ('HEAD', 'HEAD~1'), ('HEAD', 'master')]
+        ... )
+        {('HEAD~1', 'HEAD'): True, ('HEAD', 'HEAD~1'): False, ('HEAD', 'master'): True}
+        """
+        pairs = list(dict.fromkeys(pairs))
+        if not pairs:
+            return {}
+        resolved = self.resolve_many(
+            (rev for pair in pairs for rev in pair),
+            commits=True,
         )
+        if resolved.missing or resolved.ambiguous:
+            msg = f"not a commit: {', '.join(resolved.missing + resolved.ambiguous)}"
+            raise ValueError(msg)
+        oids = t.cast("dict[str, str]", resolved.oids)
+
+        candidates: dict[str, set[str]] = {}
+        for ancestor, descendant in pairs:
+            candidates.setdefault(oids[descendant], set()).add(oids[ancestor])
+        unreachable = {
+            descendant: self._unreachable_from(descendant, ancestors)
+            for descendant, ancestors in candidates.items()
+        }
+        return {
+            (ancestor, descendant): oids[ancestor] not in unreachable[oids[descendant]]
+            for ancestor, descendant in pairs
+        }
+
+    def _unreachable_from(self, descendant: str, commits: set[str]) -> set[str]:
+        """Return which of ``commits`` are not reachable from ``descendant``.
+
+        ``git rev-list <commits> ^<descendant>`` lists what the commits reach
+        that ``descendant`` does not, a commit itself included exactly when
+        it is not an ancestor.
+        """
+        commits = commits - {descendant}
+        if not commits:
+            return set()
+        with Pipe(
+            self._cli_args(["rev-list", "--stdin"]),
+            cwd=self.path,
+        ) as pipe:
+            pipe.write(
+                "".join(f"{oid}\n" for oid in [*commits, f"^{descendant}"]).encode()
+            )
+            pipe.close_input()
+            listed = {
+                oid
+                for line in pipe.iter_lines()
+                if (oid := line.decode().strip()) in commits
+            }
+            pipe.close()
+        return listed
 
+    def grep(
+        self,
+        patterns: str | Sequence[str],
+        *,
+        revs: Sequence[str] = (),
+        pathspecs: Sequence[str] = (),
+        threads: int | None = None,
+        ignore_case: bool | None = None,
+        word_regexp: bool | None = None,
+        fixed_strings: bool | None = None,
+        extended_regexp: bool | None = None,
+        perl_regexp: bool | None = None,
+        all_match: bool | None = None,
+        cached: bool | None = None,
+        untracked: bool | None = None,
+        no_index: bool | None = None,
+        text: bool | None = None,
+        recurse_submodules: bool | None = None,
+    ) -> Generator[GitGrepMatch, None, None]:
+        r"""Search file contents, yielding matches as git finds them.
 
-@dataclasses.dataclass
-class GitSubmodule:
-    """Represent a git submodule."""
-
-    name: str
-    """Submodule name (from .gitmodules)."""
-
-    path: str
-    """Path to submodule relative to repository root."""
-
-    url: str | None = None
-    """Remote URL for the submodule."""
-
-    sha: str | None = None
-    """Current commit SHA of the submodule."""
+        Wraps `git grep -z -n --column <https://git-scm.com/docs/git-grep>`_.
+        Output is streamed, so searching a large tree holds one match in
+        memory at a time, and searching ``revs`` reads the object store
+        without checking anything out.
 
-    branch: str | None = None
-    """Configured branch for the submodule."""
+        Parameters
+        ----------
+        patterns :
+            A pattern, or several. Each is passed with ``-e``, except the
+            operators ``--and``, ``--or``, ``--not``, ``(`` and ``)``, which
+            combine the patterns around them, e.g.
+            ``['TODO', '--and', '(', 'fixme', '--or', 'xxx', ')']``.
+        revs :
+            Commits or trees to search instead of the working tree.
+        pathspecs :
+            Limit the search to these paths.
+        threads :
+            Worker threads (``--threads``). Default: ``grep.threads``, else
+            the number of CPUs.
+        all_match :
+            With several patterns, only files matching all of them
+            (``--all-match``).
+        cached :
+            Search the index (``--cached``).
+        untracked :
+            Also search untracked files (``--untracked``).
+        no_index :
+            Search files in the directory without a repository
+            (``--no-index``).
+        text :
+            Search binary files as text (``--text``).
 
-    status_prefix: str = ""
-    """Status prefix: '-' not initialized, '+' differs, 'U' conflicts."""
+        Examples
+        --------
+        >>> git = Git(path=example_git_repo.path)
+        >>> (example_git_repo.path / 'notes.txt').write_text('todo: ship it\n')
+        14
+        >>> git.run(['add', 'notes.txt'])
+        ''
+        >>> match = next(git.grep('ship', cached=True))
+        >>> match.path, match.line_number, match.column, match.text
+        ('notes.txt', 1, 7, 'todo: ship it')
 
-    #: Internal: GitSubmoduleEntryCmd for operations on this submodule
-    _cmd: GitSubmoduleEntryCmd | None = dataclasses.field(default=None, repr=False)
+        >>> git.run(['commit', '-m', 'notes'])
+        '...'
+        >>> matches = git.grep(['todo', '--and', 'it'], revs=['HEAD'])
+        >>> [(match.rev, match.path) for match in matches]
+        [('HEAD', 'notes.txt')]
+        >>> list(git.grep('no such text'))
+        []
+        """
+        if isinstance(patterns, str):
+            patterns = [patterns]
+        local_flags: list[str] = ["-z", "-n", "--column", "--no-color"]
+        if threads is not None:
+            local_flags.append(f"--threads={threads}")
+        for flag, shell_flag in [
+            (ignore_case, "--ignore-case"),
+            (word_regexp, "--word-regexp"),
+            (fixed_strings, "--fixed-strings"),
+            (extended_regexp, "--extended-regexp"),
+            (perl_regexp, "--perl-regexp"),
+            (all_match, "--all-match"),
+            (cached, "--cached"),
+            (untracked, "--untracked"),
+            (no_index, "--no-index"),
+            (text, "--text"),
+            (recurse_submodules, "--recurse-submodules"),
+        ]:
+            if flag is True:
+                local_flags.append(shell_flag)
+        for pattern in patterns:
+            if pattern in _GREP_OPERATORS:
+                local_flags.append(pattern)
+            else:
+                local_flags.extend(["-e", pattern])
 
-    @property
-    def cmd(self) -> GitSubmoduleEntryCmd:
-        """Return command object for this submodule."""
-        if self._cmd is None:
-            msg = "GitSubmodule not created with cmd reference"
-            raise ValueError(msg)
-        return self._cmd
+        # Longest first, so that a tree such as ``HEAD:src`` wins over ``HEAD``
+        prefixes = sorted((f"{rev}:" for rev in revs), key=len, reverse=True)
+        records = split_records(
+            self.stream(["grep", *local_flags, *revs, "--", *pathspecs]),
+            sep=b"\n",
+        )
+        try:
+            for record in records:
+                match = GitGrepMatch.from_record(record, prefixes)
+                if match is not None:
+                    yield match
+        except exc.CommandError as e:
+            # Exit code 1 without output: nothing matched.
+            if e.returncode != 1 or e.output.strip():
+                raise
+
+    @t.overload
+    def archive(
+        self,
+        tree_ish: str = ...,
+        pathspecs: Sequence[str] = ...,
+        *,
+        output: None = ...,
+        _format: str | None = ...,
+        prefix: str | None = ...,
+        compression_level: int | None = ...,
+        worktree_attributes: bool | None = ...,
+        remote: str | None = ...,
+        chunk_size: int = ...,
+        check_returncode: bool = ...,
+    ) -> Generator[bytes, None, None]: ...
+
+    @t.overload
+    def archive(
+        self,
+        tree_ish: str = ...,
+        pathspecs: Sequence[str] = ...,
+        *,
+        output: int | t.IO[bytes],
+        _format: str | None = ...,
+        prefix: str | None = ...,
+        compression_level: int | None = ...,
+        worktree_attributes: bool | None = ...,
+        remote: str | None = ...,
+        chunk_size: int = ...,
+        check_returncode: bool = ...,
+    ) -> None: ...
+
+    def archive(
+        self,
+        tree_ish: str = "HEAD",
+        pathspecs: Sequence[str] = (),
+        *,
+        output: int | t.IO[bytes] | None = None,
+        _format: str | None = None,
+        prefix: str | None = None,
+        compression_level: int | None = None,
+        worktree_attributes: bool | None = None,
+        remote: str | None = None,
+        chunk_size: int = 65536,
+        check_returncode: bool = True,
+    ) -> Generator[bytes, None, None] | None:
+        """Export the files of a tree as a tar or zip archive, streamed.
+
+        Wraps `git archive <https://git-scm.com/docs/git-archive>`_. Without
+        ``output``, returns an iterator of byte chunks as git writes them.
+        With ``output``, git writes straight into that file descriptor or
+        binary file, so the archive never passes through Python at all.
 
-    @property
-    def initialized(self) -> bool:
-        """Check if submodule is initialized."""
-        return self.status_prefix != "-"
+        Parameters
+        ----------
+        tree_ish :
+            Commit, tag or tree to export. Default ``HEAD``.
+        pathspecs :
+            Only export these paths.
+        output :
+            File descriptor or binary file (anything with ``fileno()``) to
+            write the archive to.
+        _format :
+            ``tar``, ``zip``, ``tar.gz`` or ``tgz``. Default: guessed by git,
+            i.e. ``tar``.
+        prefix :
+            Prepended to every path, e.g. ``project-1.0/``.
+        compression_level :
+            ``0`` (store) to ``9`` (best), for ``zip`` and ``tar.gz``.
+        worktree_attributes :
+            Also honor ``export-ignore`` and ``export-subst`` from the
+            working tree's ``.gitattributes`` (``--worktree-attributes``).
+        remote :
+            Archive a remote repository (``--remote``) instead, if its server
+            allows ``upload-archive``.
+        chunk_size :
+            Upper bound on the size of each yielded chunk.
 
+        Examples
+        --------
+        >>> import io, tarfile
+        >>> git = Git(path=example_git_repo.path)
+        >>> data = b''.join(git.archive(prefix='release/'))
+        >>> with tarfile.open(fileobj=io.BytesIO(data)) as tar:
+        ...     tar.getmember('release/').isdir()
+        True
 
-class GitSubmoduleEntryCmd:
-    """Run git commands targeting a specific submodule."""
+        >>> import zipfile
+        >>> with open(tmp_path / 'release.zip', 'wb') as f:
+        ...     git.archive(output=f, _format='zip', compression_level=9)
+        >>> zipfile.is_zipfile(tmp_path / 'release.zip')
+        True
+        """
+        local_flags: list[str] = []
+        if _format is not None:
+            local_flags.append(f"--format={_format}")
+        if prefix is not None:
+            local_flags.append(f"--prefix={prefix}")
+        if compression_level is not None:
+            if not 0 <= compression_level <= 9:
+                msg = f"compression_level must be 0-9, got {compression_level}"
+                raise ValueError(msg)
+            local_flags.append(f"-{compression_level}")
+        if worktree_attributes is True:
+            local_flags.append("--worktree-attributes")
+        if remote is not None:
+            local_flags.append(f"--remote={remote}")
+        args = ["archive", *local_flags, tree_ish, "--", *pathspecs]
+
+        if output is None:
+            return self.stream(
+                args,
+                chunk_size=chunk_size,
+                check_returncode=check_returncode,
+            )
+        if not isinstance(output, int):
+            # Anything already buffered must land before git's own writes.
+            output.flush()
+        self.run(args, stdout=output, check_returncode=check_returncode)
+        return None
 
-    def __init__(
+    def merge_tree(
         self,
+        ours: str,
+        theirs: str,
         *,
-        path: StrPath,
-        submodule_path: str,
-        cmd: Git | None = None,
-    ) -> None:
-        """Wrap some of git-submodule(1) for specific submodule operations.
+        base: str | None = None,
+        allow_unrelated_histories: bool | None = None,
+        messages: bool | None = None,
+    ) -> GitMergeTreeResult:
+        """Merge two commits in memory, without touching index or worktree.
+
+        Wraps `git merge-tree --write-tree
+        <https://git-scm.com/docs/git-merge-tree>`_ (git 2.38+). The merged
+        tree, with conflict markers in conflicted files, is written to the
+        object store; nothing else changes, so checks can run concurrently,
+        including against a bare repository.
 
         Parameters
         ----------
-        path :
-            Operates as PATH in the corresponding git subcommand.
-        submodule_path :
-            Path to the submodule relative to repository root.
+        ours, theirs :
+            Commits to merge.
+        base :
+            Merge base to use instead of computing one (``--merge-base``,
+            git 2.40+), e.g. the old base of a rebased branch.
+        allow_unrelated_histories :
+            Merge commits without common history
+            (``--allow-unrelated-histories``).
+        messages :
+            ``False`` leaves out informational messages (``--no-messages``).
+            Default: messages when there are conflicts.
 
         Examples
         --------
-        >>> GitSubmoduleEntryCmd(
-        ...     path=example_git_repo.path,
-        ...     submodule_path='vendor/lib',
-        ... )
-        <GitSubmoduleEntryCmd vendor/lib>
+        >>> git = Git(path=example_git_repo.path)
+        >>> def commit_notes(text):
+        ...     _ = (example_git_repo.path / 'notes.txt').write_text(text)
+        ...     _ = git.run(['add', 'notes.txt'])
+        ...     _ = git.run(['commit', '-m', text])
+        >>> git.run(['checkout', '-q', '-b', 'topic'])
+        ''
+        >>> commit_notes('topic')
+        >>> git.merge_tree('master', 'topic').clean
+        True
+
+        >>> git.run(['checkout', '-q', 'master'])
+        ''
+        >>> commit_notes('master')
+        >>> result = git.merge_tree('master', 'topic')
+        >>> result.clean, result.conflicted_paths
+        (False, ['notes.txt'])
+        >>> [(entry.stage, entry.path) for entry in result.conflicts]
+        [(2, 'notes.txt'), (3, 'notes.txt')]
+        >>> git.run(['status', '--porcelain'])
+        ''
         """
-        #: Directory to check out
-        self.path: pathlib.Path
-        if isinstance(path, pathlib.Path):
-            self.path = path
-        else:
-            self.path = pathlib.Path(path)
+        local_flags: list[str] = ["--write-tree", "-z"]
+        if base is not None:
+            local_flags.append(f"--merge-base={base}")
+        if allow_unrelated_histories is True:
+            local_flags.append("--allow-unrelated-histories")
+        if messages is True:
+            local_flags.append("--messages")
+        elif messages is False:
+            local_flags.append("--no-messages")
 
-        self.submodule_path = submodule_path
-        self.cmd = cmd if isinstance(cmd, Git) else Git(path=self.path)
+        chunks: list[bytes] = []
+        clean = True
+        try:
+            chunks.extend(self.stream(["merge-tree", *local_flags, ours, theirs]))
+        except exc.CommandError as e:
+            # Exit code 1: the merge has conflicts.
+            if e.returncode != 1:
+                raise
+            clean = False
+        return GitMergeTreeResult.from_output(
+            console_to_str(b"".join(chunks)),
+            clean=clean,
+        )
 
-    def __repr__(self) -> str:
-        """Representation of git submodule entry cmd object."""
-        return f"<GitSubmoduleEntryCmd {self.submodule_path}>"
+    def _run_with_input(
+        self,
+        args: list[str],
+        data: bytes,
+        *,
+        env: dict[str, str] | None = None,
+    ) -> str:
+        """Run a command fed ``data`` on stdin, once, and return its stdout.
 
-    def run(
+        For commands that read all their input before writing output.
+        """
+        with Pipe(self._cli_args(args), cwd=self.path, env=env) as pipe:
+            pipe.write(data)
+            pipe.close_input()
+            output = b"".join(pipe.iter_lines())
+            pipe.close()
+        self._ran(args)
+        return console_to_str(output)
+
+    @staticmethod
+    def _index_env(index_file: StrPath | None) -> dict[str, str] | None:
+        if index_file is None:
+            return None
+        return {**os.environ, "GIT_INDEX_FILE": os.fspath(index_file)}
+
+    def hash_object(
         self,
-        command: GitSubmoduleCmdCommandLiteral | None = None,
-        local_flags: list[str] | None = None,
+        data: bytes,
         *,
-        # Pass-through to run()
-        log_in_real_time: bool = False,
-        check_returncode: bool | None = None,
-        **kwargs: t.Any,
+        object_type: str | None = None,
+        write: bool | None = None,
+        literally: bool | None = None,
     ) -> str:
-        """Run a command against a specific submodule.
+        r"""Return the object id of ``data``, optionally storing it.
 
-        Wraps `git submodule <https://git-scm.com/docs/git-submodule>`_.
+        Wraps `git hash-object --stdin
+        <https://git-scm.com/docs/git-hash-object>`_. To hash many files, see
+        :class:`GitHashObjectSession`.
 
         Parameters
         ----------
-        command :
-            Submodule command to run.
-        local_flags :
-            Additional flags to pass.
+        object_type :
+            ``blob`` (default), ``tree``, ``commit`` or ``tag`` (``-t``).
+        write :
+            Store the object in the object database (``-w``).
+        literally :
+            Skip checking that ``data`` is a valid object of its type
+            (``--literally``).
 
         Examples
         --------
-        >>> GitSubmoduleEntryCmd(
-        ...     path=example_git_repo.path,
-        ...     submodule_path='vendor/lib',
-        ... ).run('status')
-        ''
+        >>> git = Git(path=example_git_repo.path)
+        >>> git.hash_object(b'hello\n')
+        'ce013625030ba8dba906f756967f9e9ca394464a'
+        >>> oid = git.hash_object(b'stored\n', write=True)
+        >>> git.run(['cat-file', '-p', oid])
+        'stored\n'
         """
-        local_flags = local_flags if local_flags is not None else []
-        _cmd: list[str] = ["submodule"]
+        local_flags: list[str] = []
+        if object_type is not None:
+            local_flags.extend(["-t", object_type])
+        if write is True:
+            local_flags.append("-w")
+        if literally is True:
+            local_flags.append("--literally")
+        return self._run_with_input(
+            ["hash-object", *local_flags, "--stdin"],
+            data,
+        ).strip()
+
+    def mktree(
+        self,
+        entries: t.Iterable[GitTreeEntry],
+        *,
+        missing: bool | None = None,
+    ) -> str:
+        r"""Write a tree object from ``entries`` and return its id.
 
-        if command is not None:
-            _cmd.append(command)
+        Wraps `git mktree -z <https://git-scm.com/docs/git-mktree>`_. Entries
+        are one level: subdirectories are entries of type ``tree``.
 
-        _cmd.extend(local_flags)
+        Parameters
+        ----------
+        missing :
+            Allow entries whose objects are not in the repository
+            (``--missing``).
 
-        return self.cmd.run(
-            _cmd,
-            check_returncode=check_returncode,
-            log_in_real_time=log_in_real_time,
-            **kwargs,
+        Examples
+        --------
+        >>> git = Git(path=example_git_repo.path)
+        >>> blob = git.hash_object(b'hello\n', write=True)
+        >>> tree = git.mktree([GitTreeEntry('100644', 'blob', blob, 'hello.txt')])
+        >>> git.run(['ls-tree', '--name-only', tree])
+        'hello.txt\n'
+        """
+        local_flags: list[str] = ["-z"]
+        if missing is True:
+            local_flags.append("--missing")
+        data = b"".join(entry.to_record() for entry in entries)
+        return self._run_with_input(["mktree", *local_flags], data).strip()
+
+    def update_index(
+        self,
+        index_info: t.Iterable[GitTreeEntry],
+        *,
+        index_file: StrPath | None = None,
+    ) -> None:
+        r"""Stage ``index_info`` entries without reading the working tree.
+
+        Wraps `git update-index -z --index-info
+        <https://git-scm.com/docs/git-update-index>`_. An entry with mode
+        ``0`` removes its path.
+
+        Parameters
+        ----------
+        index_info :
+            Entries to stage, e.g. blobs from :meth:`hash_object`. Paths may
+            contain ``/``.
+        index_file :
+            Index to update instead of the repository's (``GIT_INDEX_FILE``).
+
+        Examples
+        --------
+        >>> git = Git(path=example_git_repo.path)
+        >>> blob = git.hash_object(b'hello\n', write=True)
+        >>> git.update_index([GitTreeEntry('100644', 'blob', blob, 'docs/hi.txt')])
+        >>> git.run(['ls-files', '--cached', 'docs'])
+        'docs/hi.txt\n'
+        """
+        data = b"".join(entry.to_record() for entry in index_info)
+        self._run_with_input(
+            ["update-index", "-z", "--index-info"],
+            data,
+            env=self._index_env(index_file),
         )
 
-    def init(
+    def write_tree(
         self,
         *,
-        # Pass-through to run()
-        log_in_real_time: bool = False,
-        check_returncode: bool | None = None,
+        index_file: StrPath | None = None,
+        prefix: str | None = None,
+        missing_ok: bool | None = None,
     ) -> str:
-        """Initialize this submodule.
+        """Write the index as a tree object and return its id.
+
+        Wraps `git write-tree <https://git-scm.com/docs/git-write-tree>`_.
+
+        Parameters
+        ----------
+        index_file :
+            Index to write instead of the repository's (``GIT_INDEX_FILE``).
+        prefix :
+            Write the subtree at this directory (``--prefix``).
+        missing_ok :
+            Allow objects missing from the repository (``--missing-ok``).
 
         Examples
         --------
-        >>> result = GitSubmoduleEntryCmd(
-        ...     path=example_git_repo.path,
-        ...     submodule_path='vendor/lib',
-        ... ).init()
-        >>> 'error' in result.lower() or result == ''
+        >>> git = Git(path=example_git_repo.path)
+        >>> git.write_tree() == git.run(['rev-parse', 'HEAD^{tree}'], trim=True)
         True
         """
+        local_flags: list[str] = []
+        if prefix is not None:
+            local_flags.append(f"--prefix={prefix}")
+        if missing_ok is True:
+            local_flags.append("--missing-ok")
         return self.run(
-            "init",
-            local_flags=["--", self.submodule_path],
-            check_returncode=check_returncode,
-            log_in_real_time=log_in_real_time,
+            ["write-tree", *local_flags],
+            env=self._index_env(index_file),
+            check_returncode=True,
+            trim=True,
         )
 
-    def update(
+    def commit_tree(
         self,
+        tree: str,
         *,
-        init: bool = False,
-        force: bool = False,
-        checkout: bool = False,
-        rebase: bool = False,
-        merge: bool = False,
-        recursive: bool = False,
-        remote: bool = False,
-        # Pass-through to run()
-        log_in_real_time: bool = False,
-        check_returncode: bool | None = None,
+        message: str,
+        parents: Sequence[str] = (),
+        env: dict[str, str] | None = None,
     ) -> str:
-        """Update this submodule.
+        r"""Create a commit object for ``tree`` and return its id.
+
+        Wraps `git commit-tree <https://git-scm.com/docs/git-commit-tree>`_.
+        No ref moves: point one at the commit, e.g. with
+        :meth:`ref_transaction`.
 
         Parameters
         ----------
-        init :
-            Initialize if not already.
-        force :
-            Discard local changes.
-        checkout :
-            Check out superproject's recorded commit.
-        rebase :
-            Rebase current branch onto commit.
-        merge :
-            Merge commit into current branch.
-        recursive :
-            Recurse into nested submodules.
-        remote :
-            Use remote tracking branch.
+        message :
+            Commit message, passed on stdin.
+        parents :
+            Parent commits (``-p``); none for a root commit.
+        env :
+            Environment for git, e.g. ``GIT_AUTHOR_NAME`` and
+            ``GIT_COMMITTER_DATE``. Default: this process's.
 
         Examples
         --------
-        >>> result = GitSubmoduleEntryCmd(
-        ...     path=example_git_repo.path,
-        ...     submodule_path='vendor/lib',
-        ... ).update()
-        >>> 'error' in result.lower() or result == ''
+        >>> git = Git(path=example_git_repo.path)
+        >>> tree = git.run(['rev-parse', 'HEAD^{tree}'], trim=True)
+        >>> commit = git.commit_tree(tree, message='rebuilt', parents=['HEAD'])
+        >>> git.run(['log', '-1', '--format=%s %P', commit]) == (
+        ...     f"rebuilt {git.run(['rev-parse', 'HEAD'], trim=True)}\n"
+        ... )
         True
         """
         local_flags: list[str] = []
+        for parent in parents:
+            local_flags.extend(["-p", parent])
+        return self._run_with_input(
+            ["commit-tree", tree, *local_flags, "-F", "-"],
+            message.encode(),
+            env=env,
+        ).strip()
 
-        if init:
-            local_flags.append("--init")
-        if force:
-            local_flags.append("--force")
-        if checkout:
-            local_flags.append("--checkout")
-        elif rebase:
-            local_flags.append("--rebase")
-        elif merge:
-            local_flags.append("--merge")
-        if recursive:
-            local_flags.append("--recursive")
-        if remote:
-            local_flags.append("--remote")
-
-        local_flags.extend(["--", self.submodule_path])
-
-        return self.run(
-            "update",
-            local_flags=local_flags,
-            check_returncode=check_returncode,
-            log_in_real_time=log_in_real_time,
-        )
-
-    def deinit(
+    def commit_files(
         self,
+        parent: str | None,
+        files: t.Mapping[str, bytes | None],
         *,
-        force: bool = False,
-        # Pass-through to run()
-        log_in_real_time: bool = False,
-        check_returncode: bool | None = None,
+        message: str,
+        ref: str | None = None,
+        env: dict[str, str] | None = None,
     ) -> str:
-        """Unregister this submodule.
+        r"""Commit new file contents on top of ``parent``, in the object store.
+
+        No working tree or repository index is read or written, so this
+        works in bare repositories and leaves any checkout alone. The tree
+        is assembled in a temporary index: ``read-tree`` of ``parent``,
+        blobs from :meth:`hash_object`, :meth:`update_index`,
+        :meth:`write_tree` and :meth:`commit_tree`.
 
         Parameters
         ----------
-        force :
-            Force removal even if has local modifications.
+        parent :
+            Commit to build on, or None for a root commit.
+        files :
+            Path to new contents; None deletes the path. Paths use ``/``.
+            Existing files keep their mode, new ones are ``100644``.
+        message :
+            Commit message.
+        ref :
+            Move this ref to the new commit, but only if it still points at
+            ``parent`` (or does not exist, for a root commit).
+        env :
+            Environment for :meth:`commit_tree`, e.g. author and dates.
+
+        Returns
+        -------
+        str
+            The new commit's id.
 
         Examples
         --------
-        >>> result = GitSubmoduleEntryCmd(
-        ...     path=example_git_repo.path,
-        ...     submodule_path='vendor/lib',
-        ... ).deinit()
-        >>> 'error' in result.lower() or result == ''
-        True
+        >>> git = Git(path=example_git_repo.path)
+        >>> head = git.run(['rev-parse', 'HEAD'], trim=True)
+        >>> commit = git.commit_files(
+        ...     head,
+        ...     {'config/app.toml': b'debug = false\n'},
+        ...     message='Generate config',
+        ...     ref='refs/heads/master',
+        ... )
+        >>> git.run(['show', 'master:config/app.toml'])
+        'debug = false\n'
         """
-        local_flags: list[str] = []
-
-        if force:
-            local_flags.append("--force")
-
-        local_flags.extend(["--", self.submodule_path])
-
-        return self.run(
-            "deinit",
-            local_flags=local_flags,
-            check_returncode=check_returncode,
-            log_in_real_time=log_in_real_time,
+        modes: dict[str, str] = {}
+        if parent is not None and files:
+            listing = self.run(
+                ["ls-tree", "-z", parent, "--", *files],
+                check_returncode=True,
+            )
+            for record in listing.split("\0"):
+                if record:
+                    entry = GitTreeEntry.from_record(record)
+                    modes[entry.path] = entry.mode
+
+        index_info: list[GitTreeEntry] = []
+        for path, data in files.items():
+            if data is None:
+                index_info.append(GitTreeEntry("0", "blob", _NULL_OID, path))
+                continue
+            mode = modes.get(path, "100644")
+            if mode not in {"100644", "100755", "120000"}:
+                mode = "100644"
+            blob = self.hash_object(data, write=True)
+            index_info.append(GitTreeEntry(mode, "blob", blob, path))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            index_file = pathlib.Path(tmp) / "index"
+            self.run(
+                ["read-tree", parent]
+                if parent is not None
+                else ["read-tree", "--empty"],
+                env=self._index_env(index_file),
+                check_returncode=True,
+            )
+            self.update_index(index_info, index_file=index_file)
+            tree = self.write_tree(index_file=index_file)
+
+        commit = self.commit_tree(
+            tree,
+            message=message,
+            parents=[parent] if parent is not None else [],
+            env=env,
         )
+        if ref is not None:
+            with self.ref_transaction(message) as transaction:
+                if parent is None:
+                    transaction.create(ref, commit)
+                else:
+                    transaction.update(ref, commit, parent)
+        return commit
 
-    def set_branch(
+    def fast_import(
         self,
-        branch: str | None = None,
+        commands: t.Iterable[GitFastCommand],
         *,
-        default: bool = False,
-        # Pass-through to run()
-        log_in_real_time: bool = False,
-        check_returncode: bool | None = None,
-    ) -> str:
-        """Set branch for this submodule.
+        import_marks: StrPath | None = None,
+        export_marks: StrPath | None = None,
+        force: bool | None = None,
+        date_format: str | None = None,
+    ) -> dict[int, str]:
+        """Stream ``commands`` into ``git fast-import``; return the marks.
+
+        Wraps `git fast-import <https://git-scm.com/docs/git-fast-import>`_.
+        Commands are serialized and written as the iterator produces them,
+        so a generator can synthesize or rewrite any amount of history in
+        constant memory. Refs are only updated once the stream completes: if
+        ``commands`` raises, fast-import is stopped and no ref moves.
 
         Parameters
         ----------
-        branch :
-            Branch to track.
-        default :
-            Reset to default (remove branch setting).
+        commands :
+            :class:`GitFastBlob`, :class:`GitFastCommit`,
+            :class:`GitFastReset` and :class:`GitFastTag` items, e.g. from
+            :meth:`fast_export`.
+        import_marks :
+            Marks file of an earlier import to refer back to
+            (``--import-marks-if-exists``).
+        export_marks :
+            Also save the marks to this file (``--export-marks``).
+        force :
+            Allow ref updates that are not fast-forwards (``--force``).
+        date_format :
+            ``raw`` (default), ``raw-permissive``, ``rfc2822`` or ``now``
+            (``--date-format``).
+
+        Returns
+        -------
+        dict
+            Mark number to object id.
 
         Examples
         --------
-        >>> result = GitSubmoduleEntryCmd(
-        ...     path=example_git_repo.path,
-        ...     submodule_path='vendor/lib',
-        ... ).set_branch('main')
-        >>> 'fatal' in result.lower() or 'error' in result.lower() or result == ''
+        >>> git = Git(path=example_git_repo.path)
+        >>> me = 'Example <example@example.com> 1700000000 +0000'
+        >>> def history(count):
+        ...     for n in range(count):
+        ...         yield GitFastCommit(
+        ...             ref='refs/heads/synthetic',
+        ...             committer=me,
+        ...             message=f'commit {n}',
+        ...             mark=n + 1,
+        ...             changes=(GitFastFileModify('counter.txt', b'%d' % n),),
+        ...         )
+        >>> marks = git.fast_import(history(100))
+        >>> git.run(['rev-list', '--count', 'synthetic'], trim=True)
+        '100'
+        >>> marks[100] == git.run(['rev-parse', 'synthetic'], trim=True)
         True
         """
-        local_flags: list[str] = []
+        with tempfile.TemporaryDirectory() as tmp:
+            marks_file = pathlib.Path(tmp) / "marks"
+            local_flags: list[str] = [
+                "--quiet",
+                "--done",
+                f"--export-marks={marks_file}",
+            ]
+            if import_marks is not None:
+                local_flags.append(f"--import-marks-if-exists={import_marks}")
+            if force is True:
+                local_flags.append("--force")
+            if date_format is not None:
+                local_flags.append(f"--date-format={date_format}")
+
+            with Pipe(
+                self._cli_args(["fast-import", *local_flags]),
+                cwd=self.path,
+            ) as pipe:
+                pending = bytearray()
+                for command in commands:
+                    pending += command.to_bytes()
+                    if len(pending) >= 65536:
+                        pipe.write(bytes(pending))
+                        pending.clear()
+                pipe.write(bytes(pending) + b"done\n")
+                pipe.close()
+            self._ran(["fast-import"])
+
+            if export_marks is not None:
+                shutil.copyfile(marks_file, export_marks)
+            marks: dict[int, str] = {}
+            for line in marks_file.read_text().splitlines():
+                mark, _, oid = line.partition(" ")
+                marks[int(mark.removeprefix(":"))] = oid
+        return marks
+
+    def fast_export(
+        self,
+        revs: Sequence[str] = ("--all",),
+        *,
+        import_marks: StrPath | None = None,
+        export_marks: StrPath | None = None,
+        show_original_ids: bool | None = None,
+        signed_tags: t.Literal["verbatim", "warn", "warn-strip", "strip", "abort"]
+        | None = None,
+        tag_of_filtered_object: t.Literal["abort", "drop", "rewrite"] | None = None,
+        no_data: bool | None = None,
+        full_tree: bool | None = None,
+        reference_excluded_parents: bool | None = None,
+        pathspecs: Sequence[str] = (),
+    ) -> Generator[GitFastCommand, None, None]:
+        r"""Yield the history of ``revs`` as fast-import commands.
+
+        Wraps `git fast-export <https://git-scm.com/docs/git-fast-export>`_,
+        parsed as git writes it. Feed the commands, filtered or rewritten,
+        to :meth:`fast_import` of another repository to migrate history.
 
-        if default:
-            local_flags.append("--default")
-        elif branch is not None:
-            local_flags.extend(["--branch", branch])
+        Parameters
+        ----------
+        revs :
+            Revisions and ranges, as for ``git rev-list``. Default: all refs.
+        import_marks, export_marks :
+            Marks files to continue an incremental export
+            (``--import-marks``, ``--export-marks``).
+        show_original_ids :
+            Include each object's id in the source (``--show-original-ids``).
+        signed_tags :
+            What to do with signed tags (``--signed-tags``).
+        tag_of_filtered_object :
+            What to do with tags of objects left out (``--tag-of-filtered-object``).
+        no_data :
+            Refer to blobs by object id instead of exporting them
+            (``--no-data``).
+        full_tree :
+            Export every file of every commit (``--full-tree``).
+        reference_excluded_parents :
+            Refer to parents outside ``revs`` by object id
+            (``--reference-excluded-parents``).
+        pathspecs :
+            Only export changes to these paths.
 
-        local_flags.extend(["--", self.submodule_path])
+        Examples
+        --------
+        >>> git = Git(path=example_git_repo.path)
+        >>> [type(command).__name__ for command in git.fast_export(['HEAD'])]
+        ['GitFastBlob', 'GitFastReset', 'GitFastCommit']
 
-        return self.run(
-            "set-branch",
-            local_flags=local_flags,
-            check_returncode=check_returncode,
-            log_in_real_time=log_in_real_time,
-        )
+        Copy a branch into another repository:
 
-    def set_url(
+        >>> copy = Git(path=tmp_path / 'copy')
+        >>> copy.init()
+        '...'
+        >>> _ = copy.fast_import(git.fast_export(['master']))
+        >>> copy.run(['rev-parse', 'master']) == git.run(['rev-parse', 'master'])
+        True
+        """
+        local_flags: list[str] = ["--reencode=yes"]
+        for flag, shell_flag in [
+            (show_original_ids, "--show-original-ids"),
+            (no_data, "--no-data"),
+            (full_tree, "--full-tree"),
+            (reference_excluded_parents, "--reference-excluded-parents"),
+        ]:
+            if flag is True:
+                local_flags.append(shell_flag)
+        if import_marks is not None:
+            local_flags.append(f"--import-marks={import_marks}")
+        if export_marks is not None:
+            local_flags.append(f"--export-marks={export_marks}")
+        if signed_tags is not None:
+            local_flags.append(f"--signed-tags={signed_tags}")
+        if tag_of_filtered_object is not None:
+            local_flags.append(f"--tag-of-filtered-object={tag_of_filtered_object}")
+
+        with Pipe(
+            self._cli_args(["fast-export", *local_flags, *revs, "--", *pathspecs]),
+            cwd=self.path,
+        ) as pipe:
+            pipe.close_input()
+            yield from _parse_fast_export(pipe.iter_lines(), pipe.read)
+            pipe.close()
+
+    def for_each_repo(
         self,
-        url: str,
+        args: _CMD,
         *,
+        config: str,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
     ) -> str:
-        """Set URL for this submodule.
+        r"""Run a git command in every repository listed in config key ``config``.
 
-        Parameters
-        ----------
-        url :
-            New URL for the submodule.
+        Wraps `git for-each-repo <https://git-scm.com/docs/git-for-each-repo>`_.
+        Outputs are concatenated; to tell them apart, see
+        :class:`GitRepoRegistry`.
 
         Examples
         --------
-        >>> result = GitSubmoduleEntryCmd(
-        ...     path=example_git_repo.path,
-        ...     submodule_path='vendor/lib',
-        ... ).set_url('https://example.com/repo.git')
-        >>> 'fatal' in result.lower() or 'error' in result.lower() or result == ''
-        True
+        >>> git = Git(path=example_git_repo.path)
+        >>> git.run(['config', '--add', 'libvcs.repo', str(example_git_repo.path)])
+        ''
+        >>> git.for_each_repo(['rev-parse', '--git-dir'], config='libvcs.repo')
+        '.git\n'
         """
+        if isinstance(args, (str, bytes, os.PathLike)):
+            args = [args]
         return self.run(
-            "set-url",
-            local_flags=["--", self.submodule_path, url],
+            ["for-each-repo", f"--config={config}", "--", *args],
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
         )
 
-    def status(
-        self,
-        *,
-        recursive: bool = False,
-        # Pass-through to run()
-        log_in_real_time: bool = False,
-        check_returncode: bool | None = None,
-    ) -> str:
-        """Get status of this submodule.
 
-        Parameters
-        ----------
-        recursive :
-            Recurse into nested submodules.
+_GREP_OPERATORS = frozenset({"--and", "--or", "--not", "(", ")"})
 
-        Examples
-        --------
-        >>> result = GitSubmoduleEntryCmd(
-        ...     path=example_git_repo.path,
-        ...     submodule_path='vendor/lib',
-        ... ).status()
-        >>> isinstance(result, str)
-        True
-        """
-        local_flags: list[str] = []
 
-        if recursive:
-            local_flags.append("--recursive")
+@dataclasses.dataclass(frozen=True, slots=True)
+class GitGrepMatch:
+    """A matching line, from ``git grep -z -n --column``."""
 
-        local_flags.extend(["--", self.submodule_path])
+    rev: str | None
+    """Commit or tree searched, or None for the working tree and index."""
 
-        return self.run(
-            "status",
-            local_flags=local_flags,
-            check_returncode=check_returncode,
-            log_in_real_time=log_in_real_time,
-        )
+    path: str
+    """Path of the file, relative to the repository (or to ``rev``)."""
 
-    def absorbgitdirs(
-        self,
-        *,
-        # Pass-through to run()
-        log_in_real_time: bool = False,
-        check_returncode: bool | None = None,
-    ) -> str:
-        """Absorb git directory for this submodule.
+    line_number: int
+    """1-based line number."""
+
+    column: int
+    """1-based byte offset of the first match in the line."""
+
+    text: str
+    """The line, without its line terminator."""
+
+    @classmethod
+    def from_record(
+        cls,
+        record: str,
+        rev_prefixes: Sequence[str] = (),
+    ) -> GitGrepMatch | None:
+        r"""Parse one output line; None for lines that are not matches.
+
+        ``rev_prefixes`` are the searched revisions with a trailing ``:``,
+        longest first.
 
         Examples
         --------
-        >>> result = GitSubmoduleEntryCmd(
-        ...     path=example_git_repo.path,
-        ...     submodule_path='vendor/lib',
-        ... ).absorbgitdirs()
-        >>> 'error' in result.lower() or result == ''
+        >>> GitGrepMatch.from_record('HEAD:src/a.py\0' '3\0' '5\0' 'x = 1', ['HEAD:'])
+        GitGrepMatch(rev='HEAD', path='src/a.py', line_number=3, column=5, text='x = 1')
+        >>> GitGrepMatch.from_record('Binary file logo.png matches') is None
         True
         """
-        return self.run(
-            "absorbgitdirs",
-            local_flags=["--", self.submodule_path],
-            check_returncode=check_returncode,
-            log_in_real_time=log_in_real_time,
+        name, *fields = record.split("\0", 3)
+        if len(fields) != 3 or not fields[0].isdigit() or not fields[1].isdigit():
+            return None
+        line_number, column, text = fields
+        rev = next((prefix for prefix in rev_prefixes if name.startswith(prefix)), None)
+        return cls(
+            rev=rev[:-1] if rev is not None else None,
+            path=name[len(rev) :] if rev is not None else name,
+            line_number=int(line_number),
+            column=int(column),
+            text=text,
         )
 
 
-class GitSubmoduleManager:
-    """Traverse git submodules with :class:`~libvcs._internal.query_list.QueryList`."""
+@dataclasses.dataclass(frozen=True, slots=True)
+class GitMergeConflictEntry:
+    """One side of a conflicted file, as staged by a merge."""
 
-    def __init__(
-        self,
-        *,
-        path: StrPath,
-        cmd: Git | None = None,
-    ) -> None:
-        """Wrap some of git-submodule(1), manager.
+    path: str
+    mode: str
+    oid: str
+    stage: int
+    """1: merge base, 2: ours, 3: theirs."""
 
-        Parameters
-        ----------
-        path :
-            Operates as PATH in the corresponding git subcommand.
 
-        Examples
-        --------
-        >>> GitSubmoduleManager(path=tmp_path)
-        <GitSubmoduleManager path=...>
+@dataclasses.dataclass(frozen=True, slots=True)
+class GitMergeMessage:
+    """An informational message from a merge, e.g. a conflict."""
 
-        >>> GitSubmoduleManager(path=tmp_path).run('status', trim=True)
-        'fatal: not a git repository (or any of the parent directories): .git'
+    paths: tuple[str, ...]
+    kind: str
+    """Machine-readable type, e.g. ``CONFLICT (contents)`` or ``Auto-merging``."""
 
-        >>> GitSubmoduleManager(path=example_git_repo.path).run('status')
-        ''
+    message: str
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class GitMergeTreeResult:
+    """Outcome of :meth:`Git.merge_tree`."""
+
+    tree: str
+    """Merged tree, with conflict markers in conflicted files."""
+
+    clean: bool
+    conflicts: tuple[GitMergeConflictEntry, ...] = ()
+    messages: tuple[GitMergeMessage, ...] = ()
+
+    @property
+    def conflicted_paths(self) -> list[str]:
+        """Paths with conflicts, in git's order."""
+        return list(dict.fromkeys(entry.path for entry in self.conflicts))
+
+    @classmethod
+    def from_output(cls, output: str, *, clean: bool) -> GitMergeTreeResult:
+        r"""Parse ``git merge-tree --write-tree -z`` output.
+
+        Examples
+        --------
+        >>> result = GitMergeTreeResult.from_output(
+        ...     'f00d\0'
+        ...     '100644 aaaa 2\tREADME\0'
+        ...     '100644 bbbb 3\tREADME\0'
+        ...     '\0'
+        ...     '1\0README\0CONFLICT (contents)\0Merge conflict in README\n\0',
+        ...     clean=False,
+        ... )
+        >>> result.tree, result.conflicted_paths
+        ('f00d', ['README'])
+        >>> result.messages[0].kind
+        'CONFLICT (contents)'
+        """
+        tree, _, rest = output.partition("\0")
+        fields = iter(rest.split("\0"))
+        conflicts: list[GitMergeConflictEntry] = []
+        for field in fields:
+            if not field:
+                break
+            info, _, path = field.partition("\t")
+            mode, oid, stage = info.split(" ")
+            conflicts.append(
+                GitMergeConflictEntry(path=path, mode=mode, oid=oid, stage=int(stage))
+            )
+
+        messages: list[GitMergeMessage] = []
+        for count in fields:
+            if not count:
+                break
+            paths = tuple(next(fields) for _ in range(int(count)))
+            messages.append(
+                GitMergeMessage(
+                    paths=paths,
+                    kind=next(fields),
+                    message=next(fields).rstrip("\n"),
+                )
+            )
+        return cls(
+            tree=tree,
+            clean=clean,
+            conflicts=tuple(conflicts),
+            messages=tuple(messages),
+        )
+
+
+#: Object id git reads as "no object", e.g. for removed index entries
+_NULL_OID = "0" * 40
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class GitTreeEntry:
+    """A tree or index entry, as in ``git ls-tree`` output."""
+
+    mode: str
+    """Octal mode, e.g. ``100644``, ``100755``, ``120000`` or ``040000``."""
+
+    type: str
+    """``blob``, ``tree`` or ``commit`` (a submodule)."""
+
+    oid: str
+    path: str
+
+    @classmethod
+    def from_record(cls, record: str) -> GitTreeEntry:
+        r"""Parse one ``git ls-tree -z`` record.
+
+        Examples
+        --------
+        >>> GitTreeEntry.from_record('100644 blob ce01362503\ta b.txt')
+        GitTreeEntry(mode='100644', type='blob', oid='ce01362503', path='a b.txt')
+        """
+        info, _, path = record.partition("\t")
+        mode, object_type, oid = info.split(" ")
+        return cls(mode=mode, type=object_type, oid=oid, path=path)
+
+    def to_record(self) -> bytes:
+        r"""Return the NUL-terminated line ``mktree -z`` and ``--index-info`` read.
+
+        Examples
+        --------
+        >>> GitTreeEntry('100644', 'blob', 'ce01362503', 'a.txt').to_record()
+        b'100644 blob ce01362503\ta.txt\x00'
+        """
+        if "\0" in self.path:
+            msg = f"path contains a NUL byte: {self.path!r}"
+            raise ValueError(msg)
+        return f"{self.mode} {self.type} {self.oid}\t{self.path}\0".encode()
+
+
+#: C-style escapes git uses when quoting paths
+_C_ESCAPES = {
+    "a": 0x07,
+    "b": 0x08,
+    "f": 0x0C,
+    "n": 0x0A,
+    "r": 0x0D,
+    "t": 0x09,
+    "v": 0x0B,
+    "\\": 0x5C,
+    '"': 0x22,
+}
+
+
+def _c_unquote(value: str) -> str:
+    r"""Undo git's C-style path quoting, if ``value`` is quoted.
+
+    Examples
+    --------
+    >>> _c_unquote('"a \\"b\\"\\tc"')
+    'a "b"\tc'
+    >>> _c_unquote('"caf\\303\\251"')
+    'café'
+    >>> _c_unquote('plain name')
+    'plain name'
+    """
+    if not (len(value) >= 2 and value[0] == value[-1] == '"'):
+        return value
+    body = value[1:-1].encode()
+    out = bytearray()
+    i = 0
+    while i < len(body):
+        char = body[i]
+        if char != 0x5C:
+            out.append(char)
+            i += 1
+        elif body[i + 1 : i + 2].isdigit():
+            out.append(int(body[i + 1 : i + 4], 8))
+            i += 4
+        else:
+            out.append(_C_ESCAPES[chr(body[i + 1])])
+            i += 2
+    return console_to_str(bytes(out))
+
+
+def _c_quote(path: str) -> bytes:
+    r"""Quote ``path`` for a fast-import command, when it needs it.
+
+    Examples
+    --------
+    >>> _c_quote('docs/a b.txt')
+    b'docs/a b.txt'
+    >>> _c_quote('"odd"\nname')
+    b'"\\"odd\\"\\nname"'
+    """
+    raw = path.encode()
+    if not (raw.startswith(b'"') or any(byte < 0x20 or byte == 0x7F for byte in raw)):
+        return raw
+    reverse = {code: name for name, code in _C_ESCAPES.items()}
+    out = bytearray(b'"')
+    for byte in raw:
+        if byte in reverse:
+            out += b"\\" + reverse[byte].encode()
+        elif byte < 0x20 or byte == 0x7F:
+            out += f"\\{byte:03o}".encode()
+        else:
+            out.append(byte)
+    return bytes(out + b'"')
+
+
+def _fast_data(data: bytes) -> bytes:
+    return b"data %d\n%s\n" % (len(data), data)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class GitFastBlob:
+    """A ``blob`` command of a fast-import stream."""
+
+    data: bytes
+    mark: int | None = None
+    original_oid: str | None = None
+
+    def to_bytes(self) -> bytes:
+        """Serialize for ``git fast-import``."""
+        out = b"blob\n"
+        if self.mark is not None:
+            out += b"mark :%d\n" % self.mark
+        if self.original_oid is not None:
+            out += f"original-oid {self.original_oid}\n".encode()
+        return out + _fast_data(self.data)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class GitFastFileModify:
+    """Set a file in a :class:`GitFastCommit` (``M``)."""
+
+    path: str
+    blob: str | bytes
+    """Mark (``:1``) or object id of the contents; bytes are sent inline."""
+
+    mode: str = "100644"
+
+    def to_bytes(self) -> bytes:
+        """Serialize for ``git fast-import``."""
+        path = _c_quote(self.path)
+        if isinstance(self.blob, bytes):
+            return b"M %s inline %s\n%s" % (
+                self.mode.encode(),
+                path,
+                _fast_data(self.blob),
+            )
+        return b"M %s %s %s\n" % (self.mode.encode(), self.blob.encode(), path)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class GitFastFileDelete:
+    """Remove a file or directory in a :class:`GitFastCommit` (``D``)."""
+
+    path: str
+
+    def to_bytes(self) -> bytes:
+        """Serialize for ``git fast-import``."""
+        return b"D %s\n" % _c_quote(self.path)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class GitFastCommit:
+    """A ``commit`` command of a fast-import stream.
+
+    Identities are git's raw form, ``Name <email> <seconds> <+zone>``.
+    """
+
+    ref: str
+    committer: str
+    message: str
+    author: str | None = None
+    mark: int | None = None
+    parent: str | None = None
+    """First parent (``from``): a mark such as ``:1``, object id or ref."""
+
+    merges: tuple[str, ...] = ()
+    changes: tuple[GitFastFileModify | GitFastFileDelete, ...] = ()
+    deleteall: bool = False
+    """Start from an empty tree instead of the parent's (``deleteall``)."""
+
+    original_oid: str | None = None
+    encoding: str | None = None
+
+    def to_bytes(self) -> bytes:
+        """Serialize for ``git fast-import``."""
+        lines = [f"commit {self.ref}"]
+        if self.mark is not None:
+            lines.append(f"mark :{self.mark}")
+        if self.original_oid is not None:
+            lines.append(f"original-oid {self.original_oid}")
+        if self.author is not None:
+            lines.append(f"author {self.author}")
+        lines.append(f"committer {self.committer}")
+        if self.encoding is not None:
+            lines.append(f"encoding {self.encoding}")
+        out = "\n".join(lines).encode() + b"\n" + _fast_data(self.message.encode())
+        if self.parent is not None:
+            out += f"from {self.parent}\n".encode()
+        for merge in self.merges:
+            out += f"merge {merge}\n".encode()
+        if self.deleteall:
+            out += b"deleteall\n"
+        return out + b"".join(change.to_bytes() for change in self.changes) + b"\n"
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class GitFastReset:
+    """A ``reset`` command: (re)create ``ref``, at ``parent`` if given."""
+
+    ref: str
+    parent: str | None = None
+
+    def to_bytes(self) -> bytes:
+        """Serialize for ``git fast-import``."""
+        out = f"reset {self.ref}\n"
+        if self.parent is not None:
+            out += f"from {self.parent}\n"
+        return out.encode() + b"\n"
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class GitFastTag:
+    """A ``tag`` command: an annotated tag ``name`` of ``parent``."""
+
+    name: str
+    parent: str
+    message: str
+    tagger: str | None = None
+    mark: int | None = None
+    original_oid: str | None = None
+
+    def to_bytes(self) -> bytes:
+        """Serialize for ``git fast-import``."""
+        lines = [f"tag {self.name}"]
+        if self.mark is not None:
+            lines.append(f"mark :{self.mark}")
+        lines.append(f"from {self.parent}")
+        if self.original_oid is not None:
+            lines.append(f"original-oid {self.original_oid}")
+        if self.tagger is not None:
+            lines.append(f"tagger {self.tagger}")
+        return "\n".join(lines).encode() + b"\n" + _fast_data(self.message.encode())
+
+
+GitFastCommand = GitFastBlob | GitFastCommit | GitFastReset | GitFastTag
+
+
+def _parse_fast_export(
+    lines: t.Iterator[bytes],
+    read: t.Callable[[int], bytes],
+) -> Generator[GitFastCommand, None, None]:
+    r"""Parse a ``git fast-export`` stream into commands.
+
+    ``lines`` and ``read`` share one buffered stream: data blocks are read
+    with ``read`` right after their ``data <n>`` line.
+
+    Examples
+    --------
+    >>> import io
+    >>> stream = io.BytesIO(
+    ...     b'blob\nmark :1\ndata 3\nhi\n\n'
+    ...     b'commit refs/heads/main\nmark :2\n'
+    ...     b'committer A <a@example.com> 0 +0000\ndata 5\nfirst'
+    ...     b'M 100644 :1 "a\\tb"\n\n'
+    ... )
+    >>> for command in _parse_fast_export(iter(stream.readline, b''), stream.read):
+    ...     print(command)
+    GitFastBlob(data=b'hi\n', mark=1, original_oid=None)
+    GitFastCommit(ref='refs/heads/main', ..., message='first', ...)
+    """
+    pushed_back: list[bytes] = []
+
+    def next_line() -> tuple[str, str]:
+        line = pushed_back.pop() if pushed_back else next(lines, b"")
+        if not line:
+            return "", ""
+        keyword, _, rest = console_to_str(line).rstrip("\n").partition(" ")
+        # An empty line ends a command; keep it distinct from the end of input.
+        return keyword or "\n", rest
+
+    def data(keyword: str, size: str) -> bytes:
+        if keyword != "data":
+            msg = f"expected data, got {keyword} {size}"
+            raise ValueError(msg)
+        return read(int(size))
+
+    while True:
+        keyword, rest = next_line()
+        if keyword == "":
+            return
+        if keyword in {"\n", "feature", "done", "progress"}:
+            continue
+        header: dict[str, t.Any] = {}
+        if keyword == "blob":
+            while (name := next_line())[0] in {"mark", "original-oid"}:
+                header[name[0]] = name[1]
+            yield GitFastBlob(data=data(*name), **_fast_header(header))
+        elif keyword == "commit":
+            while (name := next_line())[0] in {
+                "mark",
+                "original-oid",
+                "author",
+                "committer",
+                "encoding",
+            }:
+                header[name[0]] = name[1]
+            message = console_to_str(data(*name))
+            parent: str | None = None
+            merges: list[str] = []
+            changes: list[GitFastFileModify | GitFastFileDelete] = []
+            deleteall = False
+            while (name := next_line())[0] not in {"\n", ""}:
+                command, value = name
+                if command == "from":
+                    parent = value
+                elif command == "merge":
+                    merges.append(value)
+                elif command == "deleteall":
+                    deleteall = True
+                elif command == "M":
+                    mode, blob, path = value.split(" ", 2)
+                    changes.append(
+                        GitFastFileModify(
+                            path=_c_unquote(path),
+                            blob=data(*next_line()) if blob == "inline" else blob,
+                            mode=mode,
+                        )
+                    )
+                elif command == "D":
+                    changes.append(GitFastFileDelete(path=_c_unquote(value)))
+                else:
+                    msg = f"unsupported fast-export command: {command} {value}"
+                    raise ValueError(msg)
+            yield GitFastCommit(
+                ref=rest,
+                message=message,
+                parent=parent,
+                merges=tuple(merges),
+                changes=tuple(changes),
+                deleteall=deleteall,
+                **_fast_header(header),
+            )
+        elif keyword == "reset":
+            command, value = next_line()
+            if command not in {"from", "\n", ""}:
+                # fast-export follows a reset directly with the next command.
+                pushed_back.append(f"{command} {value}".rstrip().encode())
+            yield GitFastReset(ref=rest, parent=value if command == "from" else None)
+        elif keyword == "tag":
+            while (name := next_line())[0] in {
+                "mark",
+                "from",
+                "original-oid",
+                "tagger",
+            }:
+                header[name[0]] = name[1]
+            yield GitFastTag(
+                name=rest,
+                message=console_to_str(data(*name)),
+                **_fast_header(header),
+            )
+        else:
+            msg = f"unsupported fast-export command: {keyword} {rest}"
+            raise ValueError(msg)
+
+
+def _fast_header(header: dict[str, str]) -> dict[str, t.Any]:
+    """Map header lines of a fast-export command to dataclass fields."""
+    fields: dict[str, t.Any] = {}
+    for name, value in header.items():
+        if name == "mark":
+            fields["mark"] = int(value.removeprefix(":"))
+        elif name == "from":
+            fields["parent"] = value
+        else:
+            fields[name.replace("-", "_")] = value
+    return fields
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class GitRemoteRefs:
+    """Refs a remote advertises, from ``git ls-remote --symref``."""
+
+    refs: dict[str, str]
+    """Ref name to object id, including ``HEAD``. Annotated tags also list
+    the commit they point to as ``refs/tags/<name>^{}``."""
+
+    symrefs: dict[str, str]
+    """Symbolic ref to its target, e.g. ``{'HEAD': 'refs/heads/main'}``."""
+
+    @classmethod
+    def from_output(cls, output: str) -> GitRemoteRefs:
+        r"""Parse ``git ls-remote`` output.
+
+        Examples
+        --------
+        >>> remote = GitRemoteRefs.from_output(
+        ...     'ref: refs/heads/main\tHEAD\n'
+        ...     'a1b2c3\tHEAD\n'
+        ...     'a1b2c3\trefs/heads/main\n'
+        ...     'd4e5f6\trefs/tags/v1.0'
+        ... )
+        >>> remote.head
+        'refs/heads/main'
+        >>> remote.refs
+        {'HEAD': 'a1b2c3', 'refs/heads/main': 'a1b2c3', 'refs/tags/v1.0': 'd4e5f6'}
+        """
+        refs: dict[str, str] = {}
+        symrefs: dict[str, str] = {}
+        for line in output.splitlines():
+            value, sep, name = line.partition("\t")
+            if not sep:
+                continue
+            if value.startswith("ref: "):
+                symrefs[name] = value.removeprefix("ref: ")
+            else:
+                refs[name] = value
+        return cls(refs=refs, symrefs=symrefs)
+
+    @property
+    def head(self) -> str | None:
+        """Branch the remote's ``HEAD`` points at, if it was reported."""
+        return self.symrefs.get("HEAD")
+
+
+class GitLsRemoteCache:
+    """Recent :meth:`Git.ls_remote` results, kept for ``ttl`` seconds.
+
+    Entries are keyed by the repository and arguments. Safe to share between
+    threads and between :class:`Git` instances, e.g. across a fleet of
+    checkouts polled in one sync run.
+    """
+
+    def __init__(self, ttl: float = 60.0) -> None:
+        """Create an empty cache.
+
+        Parameters
+        ----------
+        ttl :
+            Seconds a result is served before the remote is asked again.
+
+        Examples
+        --------
+        >>> cache = GitLsRemoteCache(ttl=0.5)
+        >>> cache
+        <GitLsRemoteCache ttl=0.5 entries=0>
+        >>> cache.set('https://example.com/repo.git', [], GitRemoteRefs({}, {}))
+        >>> cache.get('https://example.com/repo.git', [])
+        GitRemoteRefs(refs={}, symrefs={})
+        >>> cache.invalidate('https://example.com/repo.git')
+        >>> cache.get('https://example.com/repo.git', []) is None
+        True
+        """
+        self.ttl = ttl
+        self._entries: dict[tuple[str, tuple[str, ...]], tuple[float, GitRemoteRefs]]
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """Representation of cache."""
+        return f"<GitLsRemoteCache ttl={self.ttl} entries={len(self._entries)}>"
+
+    def get(self, repository: str, args: Sequence[str]) -> GitRemoteRefs | None:
+        """Return a result younger than ``ttl``, else None."""
+        with self._lock:
+            entry = self._entries.get((repository, tuple(args)))
+            if entry is None:
+                return None
+            stored_at, remote_refs = entry
+            if time.monotonic() - stored_at >= self.ttl:
+                del self._entries[repository, tuple(args)]
+                return None
+            return remote_refs
+
+    def set(
+        self,
+        repository: str,
+        args: Sequence[str],
+        remote_refs: GitRemoteRefs,
+    ) -> None:
+        """Store a result."""
+        with self._lock:
+            self._entries[repository, tuple(args)] = (time.monotonic(), remote_refs)
+
+    def invalidate(self, repository: str | None = None) -> None:
+        """Forget results for ``repository``, or for every repository."""
+        with self._lock:
+            if repository is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[0] == repository]:
+                del self._entries[key]
+
+
+#: Subcommands that never change refs, the index or config; running them
+#: keeps :class:`GitQueryCache` entries.
+_READ_ONLY_COMMANDS = frozenset(
+    {
+        "blame",
+        "cat-file",
+        "check-attr",
+        "check-ignore",
+        "describe",
+        "diff",
+        "for-each-ref",
+        "grep",
+        "help",
+        "log",
+        "ls-files",
+        "ls-remote",
+        "ls-tree",
+        "merge-base",
+        "name-rev",
+        "rev-list",
+        "rev-parse",
+        "show",
+        "show-ref",
+        "status",
+        "version",
+    },
+)
+
+#: Set while :class:`GitQueryCache` runs a query, so it doesn't invalidate itself.
+_in_query: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "_in_query",
+    default=False,
+)
+
+
+class GitQueryCache:
+    """Results of read-only git commands, kept while the repository is unchanged.
+
+    Each result is stored with a fingerprint of the repository:
+    :func:`~libvcs._internal.gitfs.repository_fingerprint` (``HEAD``,
+    ``packed-refs``, ``refs/`` and ``config``), or for ``status``
+    :func:`~libvcs._internal.gitfs.worktree_fingerprint`, which adds the
+    ``index`` and the worktree's stat data. A lookup whose
+    fingerprint no longer matches runs git again, which catches changes
+    made by other processes. A :class:`Git` using the cache drops a
+    repository's entries after running any other command through it. Safe
+    to share between threads and between :class:`Git` instances.
+
+    Repositories :mod:`~libvcs._internal.gitfs` can't fingerprint, e.g.
+    reftable ones, are never cached.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty cache.
+
+        Examples
+        --------
+        >>> cache = GitQueryCache()
+        >>> git = Git(path=example_git_repo.path, query_cache=cache)
+        >>> git.rev_parse(args='HEAD') == git.rev_parse(args='HEAD')
+        True
+        >>> cache
+        <GitQueryCache entries=1 hits=1 misses=1>
+
+        A command that may write drops the repository's entries:
+
+        >>> git.run(['commit', '--allow-empty', '-m', 'Empty'])
+        '...'
+        >>> cache
+        <GitQueryCache entries=0 hits=1 misses=1>
+        """
+        self._entries: dict[tuple[t.Hashable, ...], tuple[tuple[object, ...], str]]
+        self._entries = {}
+        self._lock = threading.Lock()
+        #: Lookups answered from the cache
+        self.hits = 0
+        #: Lookups that ran git
+        self.misses = 0
+
+    def __repr__(self) -> str:
+        """Representation of cache."""
+        return (
+            f"<GitQueryCache entries={len(self._entries)} "
+            f"hits={self.hits} misses={self.misses}>"
+        )
+
+    def run(
+        self,
+        cmd: Git,
+        args: Sequence[StrOrBytesPath],
+        **kwargs: t.Any,
+    ) -> str:
+        """Return ``cmd.run(args, **kwargs)``, reused while nothing changed.
+
+        Errors raised by git are not cached.
+        """
+        options = tuple(
+            sorted(
+                (
+                    name,
+                    tuple(sorted(value.items())) if isinstance(value, dict) else value,
+                )
+                for name, value in kwargs.items()
+            ),
+        )
+        key = (str(cmd.path), tuple(args), options)
+        try:
+            hash(key)
+            fingerprint = (
+                gitfs.worktree_fingerprint(cmd.path)
+                if args[0] == "status"
+                else gitfs.repository_fingerprint(cmd.path)
+            )
+        except (TypeError, gitfs.GitFsUnsupported):
+            return cmd.run(args, **kwargs)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == fingerprint:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        token = _in_query.set(True)
+        try:
+            output = cmd.run(args, **kwargs)
+        finally:
+            _in_query.reset(token)
+        with self._lock:
+            self._entries[key] = (fingerprint, output)
+        return output
+
+    def invalidate(self, path: StrPath | None = None) -> None:
+        """Forget results for the repository at ``path``, or for every one."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[0] == str(path)]:
+                del self._entries[key]
+
+
+class GitRefTransaction:
+    """Ref changes applied together by one ``git update-ref --stdin -z``.
+
+    Changes are queued in memory. :meth:`prepare` starts git, sends them and
+    locks every ref; :meth:`commit` then applies all of them, or
+    :meth:`abort` none. A change whose ``old_oid`` does not match fails the
+    whole transaction.
+    """
+
+    def __init__(
+        self,
+        *,
+        path: StrPath,
+        cmd: Git | None = None,
+        message: str | None = None,
+        no_deref: bool | None = None,
+    ) -> None:
+        """Start an empty transaction; see :meth:`Git.ref_transaction`.
+
+        Parameters
+        ----------
+        path :
+            Operates as PATH in the corresponding git subcommand.
+        message :
+            Reflog message for every change (``-m``).
+        no_deref :
+            Update symbolic refs themselves rather than what they point at
+            (``--no-deref``).
+
+        Examples
+        --------
+        >>> GitRefTransaction(path=tmp_path)
+        <GitRefTransaction path=... state=open>
         """
         #: Directory to check out
         self.path: pathlib.Path
@@ -3011,640 +4751,2806 @@ class GitSubmoduleManager:
             self.path = pathlib.Path(path)
 
         self.cmd = cmd if isinstance(cmd, Git) else Git(path=self.path)
+        self.message = message
+        self.no_deref = no_deref
+        self.state: t.Literal["open", "prepared", "committed", "aborted"] = "open"
+        self._commands: list[bytes] = []
+        self._pipe: Pipe | None = None
 
     def __repr__(self) -> str:
-        """Representation of git submodule manager object."""
-        return f"<GitSubmoduleManager path={self.path}>"
+        """Representation of transaction."""
+        return f"<GitRefTransaction path={self.path} state={self.state}>"
 
-    def run(
+    def __enter__(self) -> Self:
+        """Return the transaction to queue changes on."""
+        return self
+
+    def __exit__(
         self,
-        command: GitSubmoduleCmdCommandLiteral | None = None,
-        local_flags: list[str] | None = None,
-        *,
-        quiet: bool = False,
-        # Pass-through to run()
-        log_in_real_time: bool = False,
-        check_returncode: bool | None = None,
-        **kwargs: t.Any,
-    ) -> str:
-        """Run a command against a git repository's submodules.
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: object,
+    ) -> None:
+        """Commit, or abort when the block raised."""
+        if exc_type is not None:
+            self.abort()
+        elif self.state in {"open", "prepared"}:
+            self.commit()
+
+    def _queue(self, *fields: str) -> None:
+        if self.state != "open":
+            msg = f"cannot queue changes on a {self.state} transaction"
+            raise ValueError(msg)
+        self._commands.append(b"\0".join(field.encode() for field in fields) + b"\0")
 
-        Wraps `git submodule <https://git-scm.com/docs/git-submodule>`_.
+    def create(self, ref: str, new_oid: str) -> None:
+        """Queue creating ``ref`` at ``new_oid``; fails if it exists."""
+        self._queue(f"create {ref}", new_oid)
+
+    def update(self, ref: str, new_oid: str, old_oid: str | None = None) -> None:
+        """Queue pointing ``ref`` at ``new_oid``.
+
+        With ``old_oid``, only if ``ref`` is currently there (all zeros: only
+        if ``ref`` does not exist).
+        """
+        self._queue(f"update {ref}", new_oid, old_oid or "")
+
+    def delete(self, ref: str, old_oid: str | None = None) -> None:
+        """Queue deleting ``ref``, only if at ``old_oid`` when given."""
+        self._queue(f"delete {ref}", old_oid or "")
+
+    def verify(self, ref: str, old_oid: str | None = None) -> None:
+        """Queue a check that ``ref`` is at ``old_oid`` (or does not exist)."""
+        self._queue(f"verify {ref}", old_oid or "")
+
+    def prepare(self) -> None:
+        """Send the queued changes and lock their refs.
+
+        Raises
+        ------
+        :exc:`libvcs.exc.CommandError`
+            When a ref cannot be locked or an ``old_oid`` does not match.
+            Nothing was changed.
+        """
+        if self.state != "open":
+            msg = f"cannot prepare a {self.state} transaction"
+            raise ValueError(msg)
+        local_flags: list[str] = []
+        if self.message is not None:
+            local_flags.extend(["-m", self.message])
+        if self.no_deref:
+            local_flags.append("--no-deref")
+
+        self._pipe = Pipe(
+            self.cmd._cli_args(["update-ref", *local_flags, "--stdin", "-z"]),
+            cwd=self.cmd.path,
+        )
+        try:
+            self._pipe.write(b"".join([b"start\0", *self._commands, b"prepare\0"]))
+            self._pipe.readline()
+            self._pipe.readline()
+        except exc.CommandError:
+            self._pipe.close(check_returncode=False)
+            self.state = "aborted"
+            raise
+        self._commands.clear()
+        self.state = "prepared"
+
+    def commit(self) -> None:
+        """Apply every change, preparing first if needed."""
+        if self.state == "open":
+            self.prepare()
+        if self.state != "prepared" or self._pipe is None:
+            msg = f"cannot commit a {self.state} transaction"
+            raise ValueError(msg)
+        self._finish(b"commit\0")
+        self.state = "committed"
+
+    def abort(self) -> None:
+        """Drop every change and release the locks."""
+        if self.state == "prepared" and self._pipe is not None:
+            self._finish(b"abort\0")
+        self._commands.clear()
+        self.state = "aborted"
+
+    def _finish(self, command: bytes) -> None:
+        assert self._pipe is not None
+        with self._pipe:
+            self._pipe.write(command)
+            self._pipe.readline()
+            self._pipe.close()
+        self.cmd._ran(["update-ref"])
+
+
+_T = t.TypeVar("_T")
+
+
+class GitBatchSession:
+    """One git process answering many queries over stdin.
+
+    The process starts on the first query and is started again when it has
+    exited, e.g. after a query made it fail. Each reply is paired with its
+    query; queries passed to the ``*_many`` methods are written from a
+    background thread while replies are read, so git never stalls on a full
+    pipe. Git reads some state (ignore files, attributes, refs) once per
+    process: call :meth:`restart` after changing it.
+    """
+
+    #: The session's queries are answered only once stdin is closed, so each
+    #: batch runs a process of its own.
+    _one_process_per_batch: t.ClassVar[bool] = False
+
+    def __init__(
+        self,
+        args: Sequence[str],
+        *,
+        path: StrPath,
+        cmd: Git | None = None,
+    ) -> None:
+        r"""Wrap a git command that reads queries from stdin.
 
         Parameters
         ----------
-        command :
-            Submodule command to run.
-        local_flags :
-            Additional flags to pass.
-        quiet :
-            Suppress output.
+        args :
+            Subcommand and flags, e.g. ``['cat-file', '--batch-check']``.
+        path :
+            Operates as PATH in the corresponding git subcommand.
 
         Examples
         --------
-        >>> GitSubmoduleManager(path=example_git_repo.path).run('status')
-        ''
+        >>> with GitBatchSession(
+        ...     ['rev-parse', '--stdin'], path=example_git_repo.path
+        ... ) as session:
+        ...     session
+        <GitBatchSession path=... args=rev-parse --stdin>
         """
-        local_flags = local_flags if local_flags is not None else []
-        _cmd: list[str] = ["submodule"]
-
-        if quiet:
-            _cmd.append("--quiet")
+        #: Directory to check out
+        self.path: pathlib.Path
+        if isinstance(path, pathlib.Path):
+            self.path = path
+        else:
+            self.path = pathlib.Path(path)
 
-        if command is not None:
-            _cmd.append(command)
+        self.cmd = cmd if isinstance(cmd, Git) else Git(path=self.path)
+        self.args = list(args)
+        #: Times the process was started again after exiting.
+        self.restarts = 0
+        self._pipe: Pipe | None = None
 
-        _cmd.extend(local_flags)
+    def __repr__(self) -> str:
+        """Representation of session."""
+        return (
+            f"<{self.__class__.__name__} path={self.path} args={shlex.join(self.args)}>"
+        )
 
-        return self.cmd.run(
-            _cmd,
-            check_returncode=check_returncode,
-            log_in_real_time=log_in_real_time,
-            **kwargs,
+    def __enter__(self) -> Self:
+        """Return the session."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Stop the process."""
+        self.close()
+
+    def _ensure_pipe(self) -> Pipe:
+        if self._pipe is not None:
+            if self._pipe.alive:
+                return self._pipe
+            self._pipe.close(check_returncode=False)
+            self.restarts += 1
+        self._pipe = Pipe(
+            self.cmd._cli_args(self.args),
+            cwd=self.cmd.path,
+            env={**os.environ, "GIT_FLUSH": "1"},
         )
+        return self._pipe
+
+    def restart(self) -> None:
+        """Stop the process; the next query starts a fresh one."""
+        self.close()
+
+    def close(self) -> None:
+        """Stop the process."""
+        if self._pipe is not None:
+            with self._pipe:
+                self._pipe.close(check_returncode=False)
+            self._pipe = None
+
+    def _ask(self, request: bytes, read: t.Callable[[Pipe], _T]) -> _T:
+        """Send one query and read its reply."""
+        if self._one_process_per_batch:
+            return next(self._ask_many([request], read))
+        pipe = self._ensure_pipe()
+        try:
+            pipe.write(request)
+            return read(pipe)
+        except exc.CommandError:
+            self.close()
+            raise
+
+    def _ask_many(
+        self,
+        requests: t.Iterable[bytes],
+        read: t.Callable[[Pipe], _T],
+    ) -> Generator[_T, None, None]:
+        """Stream queries to the process and yield their replies in order."""
+        pipe = self._ensure_pipe()
+        sent: queue.SimpleQueue[bool] = queue.SimpleQueue()
+
+        def write() -> None:
+            try:
+                for request in requests:
+                    pipe.write(request)
+                    sent.put(True)
+                if self._one_process_per_batch:
+                    pipe.close_input()
+            finally:
+                sent.put(False)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            writer = executor.submit(write)
+            in_sync = False
+            try:
+                while sent.get():
+                    yield read(pipe)
+                writer.result()
+                in_sync = True
+            finally:
+                if not in_sync:
+                    # Replies are unread or a query failed: the process is out
+                    # of step with its caller, so stop it and unblock writer.
+                    pipe.terminate()
+                concurrent.futures.wait([writer])
+                if not in_sync or self._one_process_per_batch:
+                    self.close()
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class GitIgnoreMatch:
+    """The exclude pattern that decides a path, from ``git check-ignore -v``."""
 
-    def add(
+    path: str
+    """Path as queried."""
+
+    source: str
+    """File holding the pattern, e.g. ``.gitignore``."""
+
+    line_number: int
+    """Line of the pattern in ``source``."""
+
+    pattern: str
+    """The pattern, ``!``-prefixed when it re-includes the path."""
+
+    @property
+    def ignored(self) -> bool:
+        """False when the deciding pattern is a negation (``!pattern``)."""
+        return not self.pattern.startswith("!")
+
+
+class GitCheckIgnoreSession(GitBatchSession):
+    """Answer "is this path ignored?" from one ``git check-ignore`` process."""
+
+    def __init__(
         self,
-        repository: str,
-        path: str | None = None,
         *,
-        branch: str | None = None,
-        force: bool = False,
-        name: str | None = None,
-        depth: int | None = None,
-        # Pass-through to run()
-        log_in_real_time: bool = False,
-        check_returncode: bool | None = None,
-    ) -> str:
-        """Add a new submodule.
+        path: StrPath,
+        cmd: Git | None = None,
+        no_index: bool = False,
+    ) -> None:
+        r"""Start a session; the process starts with the first query.
+
+        Wraps `git check-ignore --stdin -z --verbose --non-matching
+        <https://git-scm.com/docs/git-check-ignore>`_.
 
         Parameters
         ----------
-        repository :
-            URL of the repository to add as submodule.
-        path :
-            Path where submodule will be cloned.
-        branch :
-            Branch to track.
+        no_index :
+            Also match tracked paths (``--no-index``); git otherwise never
+            reports a tracked path as ignored.
+
+        Examples
+        --------
+        >>> (example_git_repo.path / '.gitignore').write_text('*.log\n')
+        6
+        >>> with GitCheckIgnoreSession(path=example_git_repo.path) as session:
+        ...     match = session.check('debug.log')
+        ...     session.check('setup.py') is None
+        True
+        >>> match.source, match.line_number, match.pattern, match.ignored
+        ('.gitignore', 1, '*.log', True)
+        """
+        super().__init__(
+            [
+                "check-ignore",
+                "--stdin",
+                "-z",
+                "--verbose",
+                "--non-matching",
+                *(["--no-index"] if no_index else []),
+            ],
+            path=path,
+            cmd=cmd,
+        )
+
+    @staticmethod
+    def _read(pipe: Pipe) -> GitIgnoreMatch | None:
+        source, line_number, pattern, path = (
+            console_to_str(pipe.read_until()) for _ in range(4)
+        )
+        if not source:
+            return None
+        return GitIgnoreMatch(
+            path=path,
+            source=source,
+            line_number=int(line_number),
+            pattern=pattern,
+        )
+
+    def check(self, path: StrPath) -> GitIgnoreMatch | None:
+        """Return the pattern deciding ``path``, or None if none matches."""
+        return self._ask(os.fsencode(path) + b"\0", self._read)
+
+    def check_many(
+        self,
+        paths: t.Iterable[StrPath],
+    ) -> Generator[GitIgnoreMatch | None, None, None]:
+        """Yield :meth:`check` for each path, in order."""
+        return self._ask_many((os.fsencode(path) + b"\0" for path in paths), self._read)
+
+
+class GitCheckAttrSession(GitBatchSession):
+    """Look up gitattributes from one ``git check-attr`` process."""
+
+    def __init__(
+        self,
+        attributes: Sequence[str],
+        *,
+        path: StrPath,
+        cmd: Git | None = None,
+        cached: bool = False,
+    ) -> None:
+        r"""Start a session; the process starts with the first query.
+
+        Wraps `git check-attr --stdin -z
+        <https://git-scm.com/docs/git-check-attr>`_.
+
+        Parameters
+        ----------
+        attributes :
+            Attributes to report for every path.
+        cached :
+            Read ``.gitattributes`` from the index only (``--cached``).
+
+        Examples
+        --------
+        >>> (example_git_repo.path / '.gitattributes').write_text(
+        ...     '*.png binary\n*.py diff=python\n'
+        ... )
+        30
+        >>> with GitCheckAttrSession(
+        ...     ['diff', 'text'], path=example_git_repo.path
+        ... ) as session:
+        ...     session.check('logo.png')
+        ...     [attrs['diff'] for attrs in session.check_many(['app.py', 'README'])]
+        {'diff': 'unset', 'text': 'unset'}
+        ['python', 'unspecified']
+        """
+        if not attributes:
+            msg = "at least one attribute is required"
+            raise ValueError(msg)
+        self.attributes = list(attributes)
+        super().__init__(
+            [
+                "check-attr",
+                "--stdin",
+                "-z",
+                *(["--cached"] if cached else []),
+                *self.attributes,
+            ],
+            path=path,
+            cmd=cmd,
+        )
+
+    def _read(self, pipe: Pipe) -> dict[str, str]:
+        values: dict[str, str] = {}
+        for _ in self.attributes:
+            _path, attribute, value = (
+                console_to_str(pipe.read_until()) for _ in range(3)
+            )
+            values[attribute] = value
+        return values
+
+    def check(self, path: StrPath) -> dict[str, str]:
+        """Return each attribute's value for ``path``.
+
+        Values are ``set``, ``unset``, ``unspecified`` or the assigned value.
+        """
+        return self._ask(os.fsencode(path) + b"\0", self._read)
+
+    def check_many(
+        self, paths: t.Iterable[StrPath]
+    ) -> Generator[dict[str, str], None, None]:
+        """Yield :meth:`check` for each path, in order."""
+        return self._ask_many((os.fsencode(path) + b"\0" for path in paths), self._read)
+
+
+def _batch_line(value: StrPath) -> bytes:
+    """Encode a newline-terminated query, rejecting embedded newlines."""
+    line = os.fsencode(value)
+    if b"\n" in line:
+        msg = f"newline in batch query: {value!r}"
+        raise ValueError(msg)
+    return line + b"\n"
+
+
+class GitHashObjectSession(GitBatchSession):
+    """Hash files from one ``git hash-object --stdin-paths`` process."""
+
+    def __init__(
+        self,
+        *,
+        path: StrPath,
+        cmd: Git | None = None,
+        write: bool = False,
+        no_filters: bool = False,
+    ) -> None:
+        r"""Start a session; the process starts with the first query.
+
+        Wraps `git hash-object --stdin-paths
+        <https://git-scm.com/docs/git-hash-object>`_.
+
+        Parameters
+        ----------
+        write :
+            Also store the blobs in the object database (``-w``).
+        no_filters :
+            Hash the bytes on disk, skipping clean filters and line ending
+            conversion (``--no-filters``).
+
+        Examples
+        --------
+        >>> (example_git_repo.path / 'hello.txt').write_text('hello\n')
+        6
+        >>> with GitHashObjectSession(path=example_git_repo.path) as session:
+        ...     session.hash_file('hello.txt')
+        'ce013625030ba8dba906f756967f9e9ca394464a'
+        """
+        super().__init__(
+            [
+                "hash-object",
+                "--stdin-paths",
+                *(["-w"] if write else []),
+                *(["--no-filters"] if no_filters else []),
+            ],
+            path=path,
+            cmd=cmd,
+        )
+
+    @staticmethod
+    def _read(pipe: Pipe) -> str:
+        return console_to_str(pipe.readline()).rstrip("\n")
+
+    def hash_file(self, path: StrPath) -> str:
+        """Return the blob id of the file at ``path``."""
+        return self._ask(_batch_line(path), self._read)
+
+    def hash_files(self, paths: t.Iterable[StrPath]) -> Generator[str, None, None]:
+        """Yield :meth:`hash_file` for each path, in order."""
+        return self._ask_many((_batch_line(path) for path in paths), self._read)
+
+
+class GitNameRevSession(GitBatchSession):
+    """Name commits after nearby refs with ``git name-rev --annotate-stdin``.
+
+    git buffers name-rev's replies until its input ends, so each call runs
+    one process for its whole batch rather than keeping one alive.
+    """
+
+    _one_process_per_batch = True
+
+    def __init__(
+        self,
+        *,
+        path: StrPath,
+        cmd: Git | None = None,
+        tags: bool = False,
+        refs: Sequence[str] = (),
+    ) -> None:
+        """Start a session; each batch runs its own process.
+
+        Wraps `git name-rev --annotate-stdin
+        <https://git-scm.com/docs/git-name-rev>`_.
+
+        Parameters
+        ----------
+        tags :
+            Only name commits after tags (``--tags``).
+        refs :
+            Only use refs matching these patterns (``--refs``).
+
+        Examples
+        --------
+        >>> git = Git(path=example_git_repo.path)
+        >>> head = git.run(['rev-parse', 'HEAD'], trim=True)
+        >>> GitNameRevSession(path=example_git_repo.path).name(head)
+        'master'
+        >>> session = GitNameRevSession(path=example_git_repo.path)
+        >>> list(session.name_many([head, '0' * 40]))
+        ['master', None]
+        """
+        super().__init__(
+            [
+                "name-rev",
+                "--annotate-stdin",
+                *(["--tags"] if tags else []),
+                *(f"--refs={pattern}" for pattern in refs),
+            ],
+            path=path,
+            cmd=cmd,
+        )
+
+    @staticmethod
+    def _read(pipe: Pipe) -> str | None:
+        line = console_to_str(pipe.readline()).rstrip("\n")
+        _oid, sep, name = line.partition(" (")
+        return name.removesuffix(")") if sep else None
+
+    def name(self, oid: str) -> str | None:
+        """Return a name for the commit ``oid`` (a full object id), if any."""
+        return self._ask(_batch_line(oid), self._read)
+
+    def name_many(self, oids: t.Iterable[str]) -> Generator[str | None, None, None]:
+        """Yield :meth:`name` for each object id, in order."""
+        return self._ask_many((_batch_line(oid) for oid in oids), self._read)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class GitObjectInfo:
+    """An object's id, type and size, from ``git cat-file --batch-check``."""
+
+    oid: str
+    """Full object id."""
+
+    type: str
+    """``commit``, ``tree``, ``blob`` or ``tag``."""
+
+    size: int
+    """Size of the object's content in bytes."""
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class GitResolvedRevs:
+    """Revisions resolved by :meth:`Git.resolve_many`."""
+
+    oids: dict[str, str | None]
+    """Each revision, in the order given, to its object id, or None."""
+
+    missing: list[str]
+    """Revisions that name no object."""
+
+    ambiguous: list[str]
+    """Abbreviated object ids matching more than one object."""
+
+
+class GitCatFileSession(GitBatchSession):
+    """Look up objects from one ``git cat-file --batch-check`` process."""
+
+    def __init__(
+        self,
+        *,
+        path: StrPath,
+        cmd: Git | None = None,
+    ) -> None:
+        """Start a session; the process starts with the first query.
+
+        Wraps `git cat-file --batch-check
+        <https://git-scm.com/docs/git-cat-file>`_.
+
+        Examples
+        --------
+        >>> with GitCatFileSession(path=example_git_repo.path) as session:
+        ...     session.info('HEAD')
+        ...     session.info('no-such-ref') is None
+        GitObjectInfo(oid='...', type='commit', size=...)
+        True
+        """
+        super().__init__(["cat-file", "--batch-check"], path=path, cmd=cmd)
+
+    @staticmethod
+    def _read_reply(pipe: Pipe) -> GitObjectInfo | str:
+        """Return the object, or git's status word (``missing``, ...)."""
+        line = console_to_str(pipe.readline()).rstrip("\n")
+        oid, _, rest = line.partition(" ")
+        object_type, _, size = rest.partition(" ")
+        if not size.isdigit() or " " in size:
+            return line.rpartition(" ")[2]
+        return GitObjectInfo(oid=oid, type=object_type, size=int(size))
+
+    @classmethod
+    def _read(cls, pipe: Pipe) -> GitObjectInfo | None:
+        reply = cls._read_reply(pipe)
+        return reply if isinstance(reply, GitObjectInfo) else None
+
+    def info(self, rev: str) -> GitObjectInfo | None:
+        """Return what ``rev`` names, or None if it is missing or ambiguous."""
+        return self._ask(_batch_line(rev), self._read)
+
+    def info_many(
+        self, revs: t.Iterable[str]
+    ) -> Generator[GitObjectInfo | None, None, None]:
+        """Yield :meth:`info` for each revision, in order."""
+        return self._ask_many((_batch_line(rev) for rev in revs), self._read)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class GitConfigEntry:
+    """A single ``key=value`` pair from ``git config --list``."""
+
+    key: str
+    """Normalized key: section and variable lowercased, subsection verbatim."""
+
+    value: str | None
+    """Raw value. ``None`` for a bare ``key`` line, which git reads as true."""
+
+    origin: str | None = None
+    """Where git read the value from, e.g. ``file:.git/config``."""
+
+    scope: str | None = None
+    """``system``, ``global``, ``local``, ``worktree`` or ``command``."""
+
+
+def _normalize_config_key(key: str) -> str:
+    """Return config key as ``git config --list`` prints it.
+
+    Examples
+    --------
+    >>> _normalize_config_key('Remote.Origin.URL')
+    'remote.Origin.url'
+    >>> _normalize_config_key('Core.Bare')
+    'core.bare'
+    """
+    section, _, rest = key.partition(".")
+    subsection, dot, name = rest.rpartition(".")
+    if not dot:
+        return f"{section.lower()}.{rest.lower()}"
+    return f"{section.lower()}.{subsection}.{name.lower()}"
+
+
+_CONFIG_TRUE = frozenset(("true", "yes", "on"))
+_CONFIG_FALSE = frozenset(("false", "no", "off", ""))
+_CONFIG_INT_UNITS = {"k": 1024, "m": 1024**2, "g": 1024**3}
+
+
+class GitConfigSnapshot:
+    """Every config value git sees, loaded by one ``git config --list -z``.
+
+    Lookups are answered from memory. Before each one the snapshot stats the
+    config files it was read from, plus the global and system files that
+    could start shadowing them, and reloads when any of them changed.
+
+    Examples
+    --------
+    >>> snapshot = GitConfigSnapshot(path=example_git_repo.path)
+    >>> snapshot
+    <GitConfigSnapshot path=...>
+
+    >>> snapshot.get('color.diff')
+    'auto'
+
+    >>> snapshot.get_bool('core.bare')
+    False
+
+    >>> snapshot.get('does.not.exist', 'fallback')
+    'fallback'
+
+    Writes to any config file show up on the next lookup:
+
+    >>> git = Git(path=example_git_repo.path)
+    >>> git.run(['config', '-f', '.git/config', 'pack.windowMemory', '10m'])
+    ''
+    >>> snapshot.get_int('pack.windowmemory')
+    10485760
+
+    With ``in_process``, the files are parsed without running git:
+
+    >>> GitConfigSnapshot(path=example_git_repo.path, in_process=True).get(
+    ...     'pack.windowmemory'
+    ... )
+    '10m'
+    """
+
+    def __init__(
+        self,
+        *,
+        path: StrPath,
+        cmd: Git | None = None,
+        file: StrPath | None = None,
+        show_scope: bool = False,
+        in_process: bool = False,
+    ) -> None:
+        """Create a lazily loaded config snapshot.
+
+        Parameters
+        ----------
+        path :
+            Repository (or any directory) to read config for.
+        file :
+            Read only this file, like ``git config --file``.
+        show_scope :
+            Record each entry's scope, ``git config --show-scope``.
+        in_process :
+            Parse the config files in Python
+            (:func:`libvcs._internal.gitfs.load_config`) instead of running
+            ``git config``. Origins are then absolute paths. Falls back to
+            git for setups the parser does not cover, like
+            ``includeIf "hasconfig:..."``.
+        """
+        #: Directory to read config for
+        self.path: pathlib.Path
+        if isinstance(path, pathlib.Path):
+            self.path = path
+        else:
+            self.path = pathlib.Path(path)
+
+        self.cmd = cmd if isinstance(cmd, Git) else Git(path=self.path)
+        self.file = pathlib.Path(file) if file is not None else None
+        self.show_scope = show_scope
+        self.in_process = in_process
+
+        self._entries: list[GitConfigEntry] | None = None
+        self._values: dict[str, list[str | None]] = {}
+        self._fingerprint: dict[pathlib.Path, tuple[int, int] | None] = {}
+
+    def __repr__(self) -> str:
+        """Representation of config snapshot object."""
+        return f"<GitConfigSnapshot path={self.path}>"
+
+    def refresh(self) -> None:
+        """Reload config with one ``git config --list -z`` call.
+
+        A missing or unparsable ``file``, or a directory outside any
+        repository, loads as empty rather than raising.
+        """
+        loaded = self._load_in_process() if self.in_process else None
+        entries, sources = loaded if loaded is not None else self._load_with_git()
+
+        values: dict[str, list[str | None]] = {}
+        for entry in entries:
+            values.setdefault(entry.key, []).append(entry.value)
+
+        self._entries = entries
+        self._values = values
+        self._fingerprint = {source: self._stat(source) for source in sources}
+
+    def _load_in_process(
+        self,
+    ) -> tuple[list[GitConfigEntry], set[pathlib.Path]] | None:
+        """Parse the config files directly, None when git must do it."""
+        try:
+            items, sources = gitfs.load_config(self.path, file=self.file)
+        except gitfs.GitFsUnsupported:
+            return None
+        entries = [
+            GitConfigEntry(
+                key=key,
+                value=value,
+                origin=origin,
+                scope=scope if self.show_scope else None,
+            )
+            for key, value, origin, scope in items
+        ]
+        if self.file is None:
+            sources.update(self._default_sources())
+        return entries, sources
+
+    def _load_with_git(self) -> tuple[list[GitConfigEntry], set[pathlib.Path]]:
+        """Run ``git config --list -z`` and parse its output."""
+        local_flags = ["--list", "-z", "--show-origin"]
+        if self.show_scope:
+            local_flags.append("--show-scope")
+        if self.file is not None:
+            local_flags.extend(["--file", str(self.file)])
+
+        # GIT_CONFIG redirects only the git-config command to a single file;
+        # other git commands never read it, so neither should the snapshot.
+        env: dict[str, str] | None = None
+        if self.file is None and "GIT_CONFIG" in os.environ:
+            env = {k: v for k, v in os.environ.items() if k != "GIT_CONFIG"}
+
+        output = ""
+        if self.file is None or (self.path / self.file).exists():
+            try:
+                output = self.cmd.run(
+                    ["config", *local_flags],
+                    check_returncode=True,
+                    env=env,
+                )
+            except exc.CommandError:
+                output = ""
+
+        records = iter(output.split("\0"))
+        entries: list[GitConfigEntry] = []
+        sources: set[pathlib.Path] = set()
+        for record in records:
+            if not record:
+                continue
+            scope: str | None = None
+            if self.show_scope:
+                scope, record = record, next(records, "")
+            origin, pair = record, next(records, "")
+            key, newline, value = pair.partition("\n")
+            entries.append(
+                GitConfigEntry(
+                    key=key,
+                    value=value if newline else None,
+                    origin=origin,
+                    scope=scope,
+                ),
+            )
+            if origin.startswith("file:"):
+                sources.add(self.path / origin[len("file:") :])
+
+        if self.file is not None:
+            sources = {self.path / self.file}
+        else:
+            sources.update(self._default_sources())
+        return entries, sources
+
+    def invalidate(self) -> None:
+        """Drop the loaded values; the next lookup reloads them."""
+        self._entries = None
+
+    @property
+    def is_stale(self) -> bool:
+        """Whether a config file changed since the last load.
+
+        Examples
+        --------
+        >>> snapshot = GitConfigSnapshot(path=example_git_repo.path)
+        >>> snapshot.is_stale
+        True
+        >>> snapshot.refresh()
+        >>> snapshot.is_stale
+        False
+        """
+        if self._entries is None:
+            return True
+        return any(
+            self._stat(source) != stat for source, stat in self._fingerprint.items()
+        )
+
+    @property
+    def entries(self) -> list[GitConfigEntry]:
+        """All entries in the order git read them, reloading if stale."""
+        if self.is_stale:
+            self.refresh()
+        assert self._entries is not None
+        return self._entries
+
+    def get_all(self, key: str) -> list[str | None]:
+        """Return every value of a multi-valued key, ``[]`` when unset.
+
+        Examples
+        --------
+        >>> git = Git(path=example_git_repo.path)
+        >>> git.run(['config', '-f', '.git/config', '--add', 'libvcs.multi', 'a'])
+        ''
+        >>> git.run(['config', '-f', '.git/config', '--add', 'libvcs.multi', 'b'])
+        ''
+        >>> GitConfigSnapshot(path=example_git_repo.path).get_all('libvcs.multi')
+        ['a', 'b']
+        """
+        if self.is_stale:
+            self.refresh()
+        return list(self._values.get(_normalize_config_key(key), []))
+
+    def get(self, key: str, default: str | None = None) -> str | None:
+        """Return the last value of ``key``, as ``git config --get`` does.
+
+        A bare ``key`` line with no ``=`` returns ``""``.
+        """
+        values = self.get_all(key)
+        if not values:
+            return default
+        value = values[-1]
+        return "" if value is None else value
+
+    def __contains__(self, key: object) -> bool:
+        """Whether ``key`` is set in any scope."""
+        return isinstance(key, str) and bool(self.get_all(key))
+
+    def get_bool(self, key: str, default: bool | None = None) -> bool | None:
+        """Return ``key`` interpreted like ``git config --type=bool``.
+
+        Raises
+        ------
+        ValueError
+            When the value is not a boolean git recognizes.
+        """
+        values = self.get_all(key)
+        if not values:
+            return default
+        value = values[-1]
+        if value is None:
+            return True
+        lowered = value.lower()
+        if lowered in _CONFIG_TRUE:
+            return True
+        if lowered in _CONFIG_FALSE:
+            return False
+        try:
+            return self._parse_int(value) != 0
+        except ValueError:
+            msg = f"bad boolean config value '{value}' for '{key}'"
+            raise ValueError(msg) from None
+
+    def get_int(self, key: str, default: int | None = None) -> int | None:
+        """Return ``key`` interpreted like ``git config --type=int``.
+
+        ``k``, ``m`` and ``g`` suffixes scale by 1024, 1024² and 1024³.
+
+        Raises
+        ------
+        ValueError
+            When the value is not an integer.
+        """
+        value = self.get(key)
+        if value is None:
+            return default
+        try:
+            return self._parse_int(value)
+        except ValueError:
+            msg = f"bad numeric config value '{value}' for '{key}'"
+            raise ValueError(msg) from None
+
+    def get_path(
+        self,
+        key: str,
+        default: pathlib.Path | None = None,
+    ) -> pathlib.Path | None:
+        """Return ``key`` interpreted like ``git config --type=path``.
+
+        A leading ``~`` expands to the home directory.
+        """
+        value = self.get(key)
+        if value is None:
+            return default
+        return pathlib.Path(value).expanduser()
+
+    def subsections(self, section: str) -> list[str]:
+        """Return subsection names of ``section`` in first-seen order.
+
+        Examples
+        --------
+        >>> GitConfigSnapshot(path=example_git_repo.path).subsections('remote')
+        ['origin']
+        """
+        prefix = f"{section.lower()}."
+        names: dict[str, None] = {}
+        for entry in self.entries:
+            if entry.key.startswith(prefix):
+                subsection, dot, _name = entry.key[len(prefix) :].rpartition(".")
+                if dot:
+                    names[subsection] = None
+        return list(names)
+
+    @staticmethod
+    def _parse_int(value: str) -> int:
+        value = value.strip()
+        unit = _CONFIG_INT_UNITS.get(value[-1:].lower(), 1)
+        if unit != 1:
+            value = value[:-1]
+        try:
+            number = int(value, 0)
+        except ValueError:
+            number = int(value, 10)
+        return number * unit
+
+    @staticmethod
+    def _stat(source: pathlib.Path) -> tuple[int, int] | None:
+        try:
+            stat = source.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    @staticmethod
+    def _default_sources() -> set[pathlib.Path]:
+        """Global and system config files, whether or not they exist yet."""
+        home = pathlib.Path("~").expanduser()
+        xdg = os.environ.get("XDG_CONFIG_HOME") or str(home / ".config")
+        sources = {
+            pathlib.Path(os.environ.get("GIT_CONFIG_SYSTEM", "/etc/gitconfig")),
+            pathlib.Path(xdg) / "git" / "config",
+        }
+        if os.environ.get("GIT_CONFIG_GLOBAL"):
+            sources.add(pathlib.Path(os.environ["GIT_CONFIG_GLOBAL"]))
+        else:
+            sources.add(home / ".gitconfig")
+        return sources
+
+
+GitSubmoduleCmdCommandLiteral = t.Literal[
+    "add",
+    "status",
+    "init",
+    "deinit",
+    "update",
+    "set-branch",
+    "set-url",
+    "summary",
+    "foreach",
+    "sync",
+    "absorbgitdirs",
+]
+
+
+class GitSubmoduleCmd:
+    """Run git submodule commands (low-level, use :class:`GitSubmoduleManager`)."""
+
+    def __init__(self, *, path: StrPath, cmd: Git | None = None) -> None:
+        """Lite, typed, pythonic wrapper for git-submodule(1).
+
+        Parameters
+        ----------
+        path :
+            Operates as PATH in the corresponding git subcommand.
+
+        Examples
+        --------
+        >>> GitSubmoduleCmd(path=tmp_path)
+        <GitSubmoduleCmd path=...>
+
+        >>> GitSubmoduleCmd(path=tmp_path).run(quiet=True, trim=True)
+        'fatal: not a git repository (or any of the parent directories): .git'
+
+        >>> GitSubmoduleCmd(path=example_git_repo.path).run(quiet=True)
+        ''
+        """
+        #: Directory to check out
+        self.path: pathlib.Path
+        if isinstance(path, pathlib.Path):
+            self.path = path
+        else:
+            self.path = pathlib.Path(path)
+
+        self.cmd = cmd if isinstance(cmd, Git) else Git(path=self.path)
+
+    def __repr__(self) -> str:
+        """Representation of a git submodule command object."""
+        return f"<GitSubmoduleCmd path={self.path}>"
+
+    def run(
+        self,
+        command: GitSubmoduleCmdCommandLiteral | None = None,
+        local_flags: list[str] | None = None,
+        *,
+        quiet: bool | None = None,
+        cached: bool | None = None,  # Only when no command entered and status
+        # Pass-through to run()
+        log_in_real_time: bool = False,
+        check_returncode: bool | None = None,
+        **kwargs: t.Any,
+    ) -> str:
+        """Run a command against a git submodule.
+
+        Wraps `git submodule <https://git-scm.com/docs/git-submodule>`_.
+
+        Examples
+        --------
+        >>> GitSubmoduleCmd(path=example_git_repo.path).run()
+        ''
+        """
+        local_flags = local_flags if isinstance(local_flags, list) else []
+        if command is not None:
+            local_flags.insert(0, command)
+
+        if quiet is True:
+            local_flags.append("--quiet")
+        if cached is True:
+            local_flags.append("--cached")
+
+        return self.cmd.run(
+            ["submodule", *local_flags],
+            check_returncode=check_returncode,
+            log_in_real_time=log_in_real_time,
+            **kwargs,
+        )
+
+    def init(
+        self,
+        *,
+        path: list[StrPath] | StrPath | None = None,
+        # Pass-through to run()
+        log_in_real_time: bool = False,
+        check_returncode: bool | None = None,
+    ) -> str:
+        """Git submodule init.
+
+        Examples
+        --------
+        >>> GitSubmoduleCmd(path=example_git_repo.path).init()
+        ''
+        """
+        local_flags: list[str] = []
+        required_flags: list[str] = []
+
+        if isinstance(path, list):
+            required_flags.extend(str(pathlib.Path(p).absolute()) for p in path)
+        elif isinstance(path, pathlib.Path):
+            required_flags.append(str(pathlib.Path(path).absolute()))
+
+        return self.run(
+            "init",
+            local_flags=[*local_flags, "--", *required_flags],
+            check_returncode=check_returncode,
+            log_in_real_time=log_in_real_time,
+        )
+
+    def update(
+        self,
+        *,
+        path: list[StrPath] | StrPath | None = None,
+        init: bool | None = None,
+        force: bool | None = None,
+        checkout: bool | None = None,
+        rebase: bool | None = None,
+        merge: bool | None = None,
+        recursive: bool | None = None,
+        # Pass-through to run()
+        log_in_real_time: bool = False,
+        check_returncode: bool | None = None,
+        **kwargs: t.Any,
+    ) -> str:
+        """Git submodule update.
+
+        Examples
+        --------
+        >>> GitSubmoduleCmd(path=example_git_repo.path).update()
+        ''
+        >>> GitSubmoduleCmd(path=example_git_repo.path).update(init=True)
+        ''
+        >>> GitSubmoduleCmd(
+        ...     path=example_git_repo.path
+        ... ).update(init=True, recursive=True)
+        ''
+        >>> GitSubmoduleCmd(path=example_git_repo.path).update(force=True)
+        ''
+        >>> GitSubmoduleCmd(path=example_git_repo.path).update(checkout=True)
+        ''
+        >>> GitSubmoduleCmd(path=example_git_repo.path).update(rebase=True)
+        ''
+        >>> GitSubmoduleCmd(path=example_git_repo.path).update(merge=True)
+        ''
+        """
+        local_flags: list[str] = []
+        required_flags: list[str] = []
+
+        if isinstance(path, list):
+            required_flags.extend(str(pathlib.Path(p).absolute()) for p in path)
+        elif isinstance(path, pathlib.Path):
+            required_flags.append(str(pathlib.Path(path).absolute()))
+
+        if init is True:
+            local_flags.append("--init")
+        if force is True:
+            local_flags.append("--force")
+
+        if checkout is True:
+            local_flags.append("--checkout")
+        elif rebase is True:
+            local_flags.append("--rebase")
+        elif merge is True:
+            local_flags.append("--merge")
+        if (_filter := kwargs.pop("_filter", None)) is not None:
+            local_flags.append(f"--filter={_filter}")
+
+        return self.run(
+            "update",
+            local_flags=[*local_flags, "--", *required_flags],
+            check_returncode=check_returncode,
+            log_in_real_time=log_in_real_time,
+        )
+
+
+@dataclasses.dataclass
+class GitSubmodule:
+    """Represent a git submodule."""
+
+    name: str
+    """Submodule name (from .gitmodules)."""
+
+    path: str
+    """Path to submodule relative to repository root."""
+
+    url: str | None = None
+    """Remote URL for the submodule."""
+
+    sha: str | None = None
+    """Current commit SHA of the submodule."""
+
+    branch: str | None = None
+    """Configured branch for the submodule."""
+
+    status_prefix: str = ""
+    """Status prefix: '-' not initialized, '+' differs, 'U' conflicts."""
+
+    #: Internal: GitSubmoduleEntryCmd for operations on this submodule
+    _cmd: GitSubmoduleEntryCmd | None = dataclasses.field(default=None, repr=False)
+
+    @property
+    def cmd(self) -> GitSubmoduleEntryCmd:
+        """Return command object for this submodule."""
+        if self._cmd is None:
+            msg = "GitSubmodule not created with cmd reference"
+            raise ValueError(msg)
+        return self._cmd
+
+    @property
+    def initialized(self) -> bool:
+        """Check if submodule is initialized."""
+        return self.status_prefix != "-"
+
+
+class GitSubmoduleEntryCmd:
+    """Run git commands targeting a specific submodule."""
+
+    def __init__(
+        self,
+        *,
+        path: StrPath,
+        submodule_path: str,
+        cmd: Git | None = None,
+    ) -> None:
+        """Wrap some of git-submodule(1) for specific submodule operations.
+
+        Parameters
+        ----------
+        path :
+            Operates as PATH in the corresponding git subcommand.
+        submodule_path :
+            Path to the submodule relative to repository root.
+
+        Examples
+        --------
+        >>> GitSubmoduleEntryCmd(
+        ...     path=example_git_repo.path,
+        ...     submodule_path='vendor/lib',
+        ... )
+        <GitSubmoduleEntryCmd vendor/lib>
+        """
+        #: Directory to check out
+        self.path: pathlib.Path
+        if isinstance(path, pathlib.Path):
+            self.path = path
+        else:
+            self.path = pathlib.Path(path)
+
+        self.submodule_path = submodule_path
+        self.cmd = cmd if isinstance(cmd, Git) else Git(path=self.path)
+
+    def __repr__(self) -> str:
+        """Representation of git submodule entry cmd object."""
+        return f"<GitSubmoduleEntryCmd {self.submodule_path}>"
+
+    def run(
+        self,
+        command: GitSubmoduleCmdCommandLiteral | None = None,
+        local_flags: list[str] | None = None,
+        *,
+        # Pass-through to run()
+        log_in_real_time: bool = False,
+        check_returncode: bool | None = None,
+        **kwargs: t.Any,
+    ) -> str:
+        """Run a command against a specific submodule.
+
+        Wraps `git submodule <https://git-scm.com/docs/git-submodule>`_.
+
+        Parameters
+        ----------
+        command :
+            Submodule command to run.
+        local_flags :
+            Additional flags to pass.
+
+        Examples
+        --------
+        >>> GitSubmoduleEntryCmd(
+        ...     path=example_git_repo.path,
+        ...     submodule_path='vendor/lib',
+        ... ).run('status')
+        ''
+        """
+        local_flags = local_flags if local_flags is not None else []
+        _cmd: list[str] = ["submodule"]
+
+        if command is not None:
+            _cmd.append(command)
+
+        _cmd.extend(local_flags)
+
+        return self.cmd.run(
+            _cmd,
+            check_returncode=check_returncode,
+            log_in_real_time=log_in_real_time,
+            **kwargs,
+        )
+
+    def init(
+        self,
+        *,
+        # Pass-through to run()
+        log_in_real_time: bool = False,
+        check_returncode: bool | None = None,
+    ) -> str:
+        """Initialize this submodule.
+
+        Examples
+        --------
+        >>> result = GitSubmoduleEntryCmd(
+        ...     path=example_git_repo.path,
+        ...     submodule_path='vendor/lib',
+        ... ).init()
+        >>> 'error' in result.lower() or result == ''
+        True
+        """
+        return self.run(
+            "init",
+            local_flags=["--", self.submodule_path],
+            check_returncode=check_returncode,
+            log_in_real_time=log_in_real_time,
+        )
+
+    def update(
+        self,
+        *,
+        init: bool = False,
+        force: bool = False,
+        checkout: bool = False,
+        rebase: bool = False,
+        merge: bool = False,
+        recursive: bool = False,
+        remote: bool = False,
+        # Pass-through to run()
+        log_in_real_time: bool = False,
+        check_returncode: bool | None = None,
+    ) -> str:
+        """Update this submodule.
+
+        Parameters
+        ----------
+        init :
+            Initialize if not already.
+        force :
+            Discard local changes.
+        checkout :
+            Check out superproject's recorded commit.
+        rebase :
+            Rebase current branch onto commit.
+        merge :
+            Merge commit into current branch.
+        recursive :
+            Recurse into nested submodules.
+        remote :
+            Use remote tracking branch.
+
+        Examples
+        --------
+        >>> result = GitSubmoduleEntryCmd(
+        ...     path=example_git_repo.path,
+        ...     submodule_path='vendor/lib',
+        ... ).update()
+        >>> 'error' in result.lower() or result == ''
+        True
+        """
+        local_flags: list[str] = []
+
+        if init:
+            local_flags.append("--init")
+        if force:
+            local_flags.append("--force")
+        if checkout:
+            local_flags.append("--checkout")
+        elif rebase:
+            local_flags.append("--rebase")
+        elif merge:
+            local_flags.append("--merge")
+        if recursive:
+            local_flags.append("--recursive")
+        if remote:
+            local_flags.append("--remote")
+
+        local_flags.extend(["--", self.submodule_path])
+
+        return self.run(
+            "update",
+            local_flags=local_flags,
+            check_returncode=check_returncode,
+            log_in_real_time=log_in_real_time,
+        )
+
+    def deinit(
+        self,
+        *,
+        force: bool = False,
+        # Pass-through to run()
+        log_in_real_time: bool = False,
+        check_returncode: bool | None = None,
+    ) -> str:
+        """Unregister this submodule.
+
+        Parameters
+        ----------
+        force :
+            Force removal even if has local modifications.
+
+        Examples
+        --------
+        >>> result = GitSubmoduleEntryCmd(
+        ...     path=example_git_repo.path,
+        ...     submodule_path='vendor/lib',
+        ... ).deinit()
+        >>> 'error' in result.lower() or result == ''
+        True
+        """
+        local_flags: list[str] = []
+
+        if force:
+            local_flags.append("--force")
+
+        local_flags.extend(["--", self.submodule_path])
+
+        return self.run(
+            "deinit",
+            local_flags=local_flags,
+            check_returncode=check_returncode,
+            log_in_real_time=log_in_real_time,
+        )
+
+    def set_branch(
+        self,
+        branch: str | None = None,
+        *,
+        default: bool = False,
+        # Pass-through to run()
+        log_in_real_time: bool = False,
+        check_returncode: bool | None = None,
+    ) -> str:
+        """Set branch for this submodule.
+
+        Parameters
+        ----------
+        branch :
+            Branch to track.
+        default :
+            Reset to default (remove branch setting).
+
+        Examples
+        --------
+        >>> result = GitSubmoduleEntryCmd(
+        ...     path=example_git_repo.path,
+        ...     submodule_path='vendor/lib',
+        ... ).set_branch('main')
+        >>> 'fatal' in result.lower() or 'error' in result.lower() or result == ''
+        True
+        """
+        local_flags: list[str] = []
+
+        if default:
+            local_flags.append("--default")
+        elif branch is not None:
+            local_flags.extend(["--branch", branch])
+
+        local_flags.extend(["--", self.submodule_path])
+
+        return self.run(
+            "set-branch",
+            local_flags=local_flags,
+            check_returncode=check_returncode,
+            log_in_real_time=log_in_real_time,
+        )
+
+    def set_url(
+        self,
+        url: str,
+        *,
+        # Pass-through to run()
+        log_in_real_time: bool = False,
+        check_returncode: bool | None = None,
+    ) -> str:
+        """Set URL for this submodule.
+
+        Parameters
+        ----------
+        url :
+            New URL for the submodule.
+
+        Examples
+        --------
+        >>> result = GitSubmoduleEntryCmd(
+        ...     path=example_git_repo.path,
+        ...     submodule_path='vendor/lib',
+        ... ).set_url('https://example.com/repo.git')
+        >>> 'fatal' in result.lower() or 'error' in result.lower() or result == ''
+        True
+        """
+        return self.run(
+            "set-url",
+            local_flags=["--", self.submodule_path, url],
+            check_returncode=check_returncode,
+            log_in_real_time=log_in_real_time,
+        )
+
+    def status(
+        self,
+        *,
+        recursive: bool = False,
+        # Pass-through to run()
+        log_in_real_time: bool = False,
+        check_returncode: bool | None = None,
+    ) -> str:
+        """Get status of this submodule.
+
+        Parameters
+        ----------
+        recursive :
+            Recurse into nested submodules.
+
+        Examples
+        --------
+        >>> result = GitSubmoduleEntryCmd(
+        ...     path=example_git_repo.path,
+        ...     submodule_path='vendor/lib',
+        ... ).status()
+        >>> isinstance(result, str)
+        True
+        """
+        local_flags: list[str] = []
+
+        if recursive:
+            local_flags.append("--recursive")
+
+        local_flags.extend(["--", self.submodule_path])
+
+        return self.run(
+            "status",
+            local_flags=local_flags,
+            check_returncode=check_returncode,
+            log_in_real_time=log_in_real_time,
+        )
+
+    def absorbgitdirs(
+        self,
+        *,
+        # Pass-through to run()
+        log_in_real_time: bool = False,
+        check_returncode: bool | None = None,
+    ) -> str:
+        """Absorb git directory for this submodule.
+
+        Examples
+        --------
+        >>> result = GitSubmoduleEntryCmd(
+        ...     path=example_git_repo.path,
+        ...     submodule_path='vendor/lib',
+        ... ).absorbgitdirs()
+        >>> 'error' in result.lower() or result == ''
+        True
+        """
+        return self.run(
+            "absorbgitdirs",
+            local_flags=["--", self.submodule_path],
+            check_returncode=check_returncode,
+            log_in_real_time=log_in_real_time,
+        )
+
+
+class GitSubmoduleManager:
+    """Traverse git submodules with :class:`~libvcs._internal.query_list.QueryList`."""
+
+    def __init__(
+        self,
+        *,
+        path: StrPath,
+        cmd: Git | None = None,
+    ) -> None:
+        """Wrap some of git-submodule(1), manager.
+
+        Parameters
+        ----------
+        path :
+            Operates as PATH in the corresponding git subcommand.
+
+        Examples
+        --------
+        >>> GitSubmoduleManager(path=tmp_path)
+        <GitSubmoduleManager path=...>
+
+        >>> GitSubmoduleManager(path=tmp_path).run('status', trim=True)
+        'fatal: not a git repository (or any of the parent directories): .git'
+
+        >>> GitSubmoduleManager(path=example_git_repo.path).run('status')
+        ''
+        """
+        #: Directory to check out
+        self.path: pathlib.Path
+        if isinstance(path, pathlib.Path):
+            self.path = path
+        else:
+            self.path = pathlib.Path(path)
+
+        self.cmd = cmd if isinstance(cmd, Git) else Git(path=self.path)
+
+    def __repr__(self) -> str:
+        """Representation of git submodule manager object."""
+        return f"<GitSubmoduleManager path={self.path}>"
+
+    def run(
+        self,
+        command: GitSubmoduleCmdCommandLiteral | None = None,
+        local_flags: list[str] | None = None,
+        *,
+        quiet: bool = False,
+        # Pass-through to run()
+        log_in_real_time: bool = False,
+        check_returncode: bool | None = None,
+        **kwargs: t.Any,
+    ) -> str:
+        """Run a command against a git repository's submodules.
+
+        Wraps `git submodule <https://git-scm.com/docs/git-submodule>`_.
+
+        Parameters
+        ----------
+        command :
+            Submodule command to run.
+        local_flags :
+            Additional flags to pass.
+        quiet :
+            Suppress output.
+
+        Examples
+        --------
+        >>> GitSubmoduleManager(path=example_git_repo.path).run('status')
+        ''
+        """
+        local_flags = local_flags if local_flags is not None else []
+        _cmd: list[str] = ["submodule"]
+
+        if quiet:
+            _cmd.append("--quiet")
+
+        if command is not None:
+            _cmd.append(command)
+
+        _cmd.extend(local_flags)
+
+        return self.cmd.run(
+            _cmd,
+            check_returncode=check_returncode,
+            log_in_real_time=log_in_real_time,
+            **kwargs,
+        )
+
+    def add(
+        self,
+        repository: str,
+        path: str | None = None,
+        *,
+        branch: str | None = None,
+        force: bool = False,
+        name: str | None = None,
+        depth: int | None = None,
+        # Pass-through to run()
+        log_in_real_time: bool = False,
+        check_returncode: bool | None = None,
+    ) -> str:
+        """Add a new submodule.
+
+        Parameters
+        ----------
+        repository :
+            URL of the repository to add as submodule.
+        path :
+            Path where submodule will be cloned.
+        branch :
+            Branch to track.
+        force :
+            Force add.
+        name :
+            Logical name for the submodule.
+        depth :
+            Shallow clone depth.
+
+        Examples
+        --------
+        >>> git_remote_repo = create_git_remote_repo()
+        >>> result = GitSubmoduleManager(path=example_git_repo.path).add(
+        ...     f'file://{git_remote_repo}',
+        ...     'vendor/example'
+        ... )
+        >>> 'error' in result.lower() or 'fatal' in result.lower() or result == ''
+        True
+        """
+        local_flags: list[str] = []
+
+        if branch is not None:
+            local_flags.extend(["-b", branch])
+        if force:
+            local_flags.append("--force")
+        if name is not None:
+            local_flags.extend(["--name", name])
+        if depth is not None:
+            local_flags.extend(["--depth", str(depth)])
+
+        local_flags.extend(["--", repository])
+        if path is not None:
+            local_flags.append(path)
+
+        return self.run(
+            "add",
+            local_flags=local_flags,
+            check_returncode=check_returncode,
+            log_in_real_time=log_in_real_time,
+        )
+
+    def init(
+        self,
+        *,
+        path: list[str] | str | None = None,
+        # Pass-through to run()
+        log_in_real_time: bool = False,
+        check_returncode: bool | None = None,
+    ) -> str:
+        """Initialize submodules.
+
+        Parameters
+        ----------
+        path :
+            Specific submodule path(s) to initialize.
+
+        Examples
+        --------
+        >>> GitSubmoduleManager(path=example_git_repo.path).init()
+        ''
+        """
+        local_flags: list[str] = ["--"]
+
+        if isinstance(path, list):
+            local_flags.extend(path)
+        elif path is not None:
+            local_flags.append(path)
+
+        return self.run(
+            "init",
+            local_flags=local_flags,
+            check_returncode=check_returncode,
+            log_in_real_time=log_in_real_time,
+        )
+
+    def update(
+        self,
+        *,
+        path: list[str] | str | None = None,
+        init: bool = False,
+        force: bool = False,
+        checkout: bool = False,
+        rebase: bool = False,
+        merge: bool = False,
+        recursive: bool = False,
+        remote: bool = False,
+        # Pass-through to run()
+        log_in_real_time: bool = False,
+        check_returncode: bool | None = None,
+    ) -> str:
+        """Update submodules.
+
+        Parameters
+        ----------
+        path :
+            Specific submodule path(s) to update.
+        init :
+            Initialize if not already.
         force :
-            Force add.
+            Discard local changes.
+        checkout :
+            Check out superproject's recorded commit.
+        rebase :
+            Rebase current branch onto commit.
+        merge :
+            Merge commit into current branch.
+        recursive :
+            Recurse into nested submodules.
+        remote :
+            Use remote tracking branch.
+
+        Examples
+        --------
+        >>> GitSubmoduleManager(path=example_git_repo.path).update()
+        ''
+
+        >>> GitSubmoduleManager(path=example_git_repo.path).update(init=True)
+        ''
+        """
+        local_flags: list[str] = []
+
+        if init:
+            local_flags.append("--init")
+        if force:
+            local_flags.append("--force")
+        if checkout:
+            local_flags.append("--checkout")
+        elif rebase:
+            local_flags.append("--rebase")
+        elif merge:
+            local_flags.append("--merge")
+        if recursive:
+            local_flags.append("--recursive")
+        if remote:
+            local_flags.append("--remote")
+
+        local_flags.append("--")
+
+        if isinstance(path, list):
+            local_flags.extend(path)
+        elif path is not None:
+            local_flags.append(path)
+
+        return self.run(
+            "update",
+            local_flags=local_flags,
+            check_returncode=check_returncode,
+            log_in_real_time=log_in_real_time,
+        )
+
+    def foreach(
+        self,
+        command: str,
+        *,
+        recursive: bool = False,
+        # Pass-through to run()
+        log_in_real_time: bool = False,
+        check_returncode: bool | None = None,
+    ) -> str:
+        """Run command in each submodule.
+
+        Parameters
+        ----------
+        command :
+            Shell command to run.
+        recursive :
+            Recurse into nested submodules.
+
+        Examples
+        --------
+        >>> result = GitSubmoduleManager(path=example_git_repo.path).foreach(
+        ...     'git status'
+        ... )
+        >>> isinstance(result, str)
+        True
+        """
+        local_flags: list[str] = []
+
+        if recursive:
+            local_flags.append("--recursive")
+
+        local_flags.append(command)
+
+        return self.run(
+            "foreach",
+            local_flags=local_flags,
+            check_returncode=check_returncode,
+            log_in_real_time=log_in_real_time,
+        )
+
+    def sync(
+        self,
+        *,
+        path: list[str] | str | None = None,
+        recursive: bool = False,
+        # Pass-through to run()
+        log_in_real_time: bool = False,
+        check_returncode: bool | None = None,
+    ) -> str:
+        """Sync submodule URLs.
+
+        Parameters
+        ----------
+        path :
+            Specific submodule path(s) to sync.
+        recursive :
+            Recurse into nested submodules.
+
+        Examples
+        --------
+        >>> GitSubmoduleManager(path=example_git_repo.path).sync()
+        ''
+        """
+        local_flags: list[str] = []
+
+        if recursive:
+            local_flags.append("--recursive")
+
+        local_flags.append("--")
+
+        if isinstance(path, list):
+            local_flags.extend(path)
+        elif path is not None:
+            local_flags.append(path)
+
+        return self.run(
+            "sync",
+            local_flags=local_flags,
+            check_returncode=check_returncode,
+            log_in_real_time=log_in_real_time,
+        )
+
+    def summary(
+        self,
+        *,
+        cached: bool = False,
+        files: bool = False,
+        summary_limit: int | None = None,
+        commit: str | None = None,
+        path: list[str] | str | None = None,
+        # Pass-through to run()
+        log_in_real_time: bool = False,
+        check_returncode: bool | None = None,
+    ) -> str:
+        """Show commit summary for submodules.
+
+        Parameters
+        ----------
+        cached :
+            Use cached info.
+        files :
+            Compare to working tree.
+        summary_limit :
+            Limit number of commits shown.
+        commit :
+            Commit to compare against.
+        path :
+            Specific submodule path(s).
+
+        Examples
+        --------
+        >>> result = GitSubmoduleManager(path=example_git_repo.path).summary()
+        >>> isinstance(result, str)
+        True
+        """
+        local_flags: list[str] = []
+
+        if cached:
+            local_flags.append("--cached")
+        if files:
+            local_flags.append("--files")
+        if summary_limit is not None:
+            local_flags.append(f"--summary-limit={summary_limit}")
+
+        if commit is not None:
+            local_flags.append(commit)
+
+        local_flags.append("--")
+
+        if isinstance(path, list):
+            local_flags.extend(path)
+        elif path is not None:
+            local_flags.append(path)
+
+        return self.run(
+            "summary",
+            local_flags=local_flags,
+            check_returncode=check_returncode,
+            log_in_real_time=log_in_real_time,
+        )
+
+    def absorbgitdirs(
+        self,
+        *,
+        path: list[str] | str | None = None,
+        # Pass-through to run()
+        log_in_real_time: bool = False,
+        check_returncode: bool | None = None,
+    ) -> str:
+        """Absorb git directories into superproject.
+
+        Parameters
+        ----------
+        path :
+            Specific submodule path(s).
+
+        Examples
+        --------
+        >>> result = GitSubmoduleManager(path=example_git_repo.path).absorbgitdirs()
+        >>> isinstance(result, str)
+        True
+        """
+        local_flags: list[str] = ["--"]
+
+        if isinstance(path, list):
+            local_flags.extend(path)
+        elif path is not None:
+            local_flags.append(path)
+
+        return self.run(
+            "absorbgitdirs",
+            local_flags=local_flags,
+            check_returncode=check_returncode,
+            log_in_real_time=log_in_real_time,
+        )
+
+    def _ls(
+        self,
+        *,
+        recursive: bool = False,
+        cached: bool = False,
+        # Pass-through to run()
+        log_in_real_time: bool = False,
+        check_returncode: bool | None = None,
+    ) -> list[dict[str, t.Any]]:
+        """Parse submodule status output into structured data.
+
+        Parameters
+        ----------
+        recursive :
+            Include nested submodules.
+        cached :
+            Use cached info.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            List of parsed submodule data.
+
+        Examples
+        --------
+        >>> submodules = GitSubmoduleManager(path=example_git_repo.path)._ls()
+        >>> isinstance(submodules, list)
+        True
+        """
+        local_flags: list[str] = []
+
+        if recursive:
+            local_flags.append("--recursive")
+        if cached:
+            local_flags.append("--cached")
+
+        result = self.run(
+            "status",
+            local_flags=local_flags,
+            check_returncode=check_returncode,
+            log_in_real_time=log_in_real_time,
+        )
+
+        submodules: list[dict[str, t.Any]] = []
+
+        # One read of .gitmodules serves every submodule below.
+        gitmodules = GitConfigSnapshot(
+            path=self.path,
+            cmd=self.cmd,
+            file=".gitmodules",
+            in_process=True,
+        )
+        names_by_path = {
+            gitmodules.get(f"submodule.{name}.path"): name
+            for name in gitmodules.subsections("submodule")
+        }
+
+        for line in result.strip().split("\n"):
+            if not line:
+                continue
+
+            # Format: <prefix><sha> <path> (<description>)
+            # Example: -abc1234 vendor/lib (heads/main)
+            # Prefix: - (not init), + (differs), U (conflicts), space (ok)
+            status_prefix = ""
+            if line and line[0] in "-+U ":
+                status_prefix = line[0] if line[0] != " " else ""
+                line = line[1:]
+
+            parts = line.strip().split(" ", 2)
+            if len(parts) >= 2:
+                sha = parts[0]
+                path = parts[1]
+                description = ""
+                if len(parts) > 2:
+                    # Remove parentheses from description
+                    description = parts[2].strip("()")
+
+                # Get additional info from .gitmodules if available
+                submodule_name = names_by_path.get(path, path)
+                url = gitmodules.get(f"submodule.{submodule_name}.url")
+                branch = gitmodules.get(f"submodule.{submodule_name}.branch")
+
+                submodules.append(
+                    {
+                        "name": submodule_name,
+                        "path": path,
+                        "sha": sha,
+                        "url": url,
+                        "branch": branch,
+                        "status_prefix": status_prefix,
+                        "description": description,
+                    }
+                )
+
+        return submodules
+
+    def ls(
+        self,
+        *,
+        recursive: bool = False,
+        cached: bool = False,
+    ) -> QueryList[GitSubmodule]:
+        """List submodules as :class:`~libvcs.cmd.git.GitSubmodule` objects.
+
+        Parameters
+        ----------
+        recursive :
+            Include nested submodules.
+        cached :
+            Use cached info.
+
+        Returns
+        -------
+        QueryList[GitSubmodule]
+            List of submodules with ORM-like filtering.
+
+        Examples
+        --------
+        >>> submodules = GitSubmoduleManager(path=example_git_repo.path).ls()
+        >>> isinstance(submodules, QueryList)
+        True
+        """
+        submodules_data = self._ls(recursive=recursive, cached=cached)
+        submodules: list[GitSubmodule] = []
+
+        for data in submodules_data:
+            entry_cmd = GitSubmoduleEntryCmd(
+                path=self.path,
+                submodule_path=data["path"],
+                cmd=self.cmd,
+            )
+            submodule = GitSubmodule(
+                name=data["name"],
+                path=data["path"],
+                sha=data["sha"],
+                url=data["url"],
+                branch=data["branch"],
+                status_prefix=data["status_prefix"],
+                _cmd=entry_cmd,
+            )
+            submodules.append(submodule)
+
+        return QueryList(submodules)
+
+    def get(
+        self,
+        path: str | None = None,
+        name: str | None = None,
+        **kwargs: t.Any,
+    ) -> GitSubmodule:
+        """Get a specific submodule.
+
+        Parameters
+        ----------
+        path :
+            Submodule path to find.
         name :
-            Logical name for the submodule.
-        depth :
-            Shallow clone depth.
+            Submodule name to find.
+        **kwargs :
+            Additional filter criteria.
+
+        Returns
+        -------
+        GitSubmodule
+            The matching submodule.
+
+        Raises
+        ------
+        :exc:`~libvcs._internal.query_list.ObjectDoesNotExist`
+            If no matching submodule found.
+        :exc:`~libvcs._internal.query_list.MultipleObjectsReturned`
+            If multiple submodules match.
+
+        Examples
+        --------
+        >>> from libvcs._internal.query_list import ObjectDoesNotExist
+        >>> submodules = GitSubmoduleManager(path=example_git_repo.path)
+        >>> try:
+        ...     submodules.get(path='vendor/lib')
+        ... except ObjectDoesNotExist:
+        ...     True
+        True
+        """
+        filters: dict[str, t.Any] = {}
+        if path is not None:
+            filters["path"] = path
+        if name is not None:
+            filters["name"] = name
+        filters.update(kwargs)
+
+        result = self.ls().get(**filters)
+        assert result is not None  # get() raises ObjectDoesNotExist, never returns None
+        return result
+
+    def filter(
+        self,
+        *args: t.Any,
+        **kwargs: t.Any,
+    ) -> QueryList[GitSubmodule]:
+        """Filter submodules.
+
+        Parameters
+        ----------
+        *args :
+            Positional arguments for
+            :meth:`~libvcs._internal.query_list.QueryList.filter`.
+        **kwargs :
+            Keyword arguments for filtering (supports Django-style lookups).
+
+        Returns
+        -------
+        QueryList[GitSubmodule]
+            Filtered list of submodules.
+
+        Examples
+        --------
+        >>> submodules = GitSubmoduleManager(path=example_git_repo.path).filter()
+        >>> isinstance(submodules, QueryList)
+        True
+        """
+        return self.ls().filter(*args, **kwargs)
+
+
+GitRemoteCommandLiteral = t.Literal[
+    "add",
+    "rename",
+    "remove",
+    "set-branches",
+    "set-head",
+    "set-branch",
+    "get-url",
+    "set-url",
+    "set-url --add",
+    "set-url --delete",
+    "prune",
+    "show",
+    "update",
+]
+
+
+class GitRemoteCmd:
+    """Run git commands targeting a specific remote."""
+
+    remote_name: str
+    fetch_url: str | None
+    push_url: str | None
+
+    def __init__(
+        self,
+        *,
+        path: StrPath,
+        remote_name: str,
+        fetch_url: str | None = None,
+        push_url: str | None = None,
+        cmd: Git | None = None,
+    ) -> None:
+        r"""Lite, typed, pythonic wrapper for git-remote(1).
+
+        Parameters
+        ----------
+        path :
+            Operates as PATH in the corresponding git subcommand.
+        remote_name :
+            Name of remote
 
         Examples
         --------
-        >>> git_remote_repo = create_git_remote_repo()
-        >>> result = GitSubmoduleManager(path=example_git_repo.path).add(
-        ...     f'file://{git_remote_repo}',
-        ...     'vendor/example'
+        >>> GitRemoteCmd(
+        ...     path=example_git_repo.path,
+        ...     remote_name='origin',
         ... )
-        >>> 'error' in result.lower() or 'fatal' in result.lower() or result == ''
-        True
+        <GitRemoteCmd path=... remote_name=...>
+
+        >>> GitRemoteCmd(
+        ...     path=tmp_path,
+        ...     remote_name='origin',
+        ... ).run(verbose=True, trim=True)
+        'fatal: not a git repository (or any of the parent directories): .git'
+
+        >>> GitRemoteCmd(
+        ...     path=example_git_repo.path,
+        ...     remote_name='origin',
+        ... ).run(verbose=True)
+        'origin\tfile:///...'
         """
-        local_flags: list[str] = []
+        #: Directory to check out
+        self.path: pathlib.Path
+        if isinstance(path, pathlib.Path):
+            self.path = path
+        else:
+            self.path = pathlib.Path(path)
 
-        if branch is not None:
-            local_flags.extend(["-b", branch])
-        if force:
-            local_flags.append("--force")
-        if name is not None:
-            local_flags.extend(["--name", name])
-        if depth is not None:
-            local_flags.extend(["--depth", str(depth)])
+        self.cmd = cmd if isinstance(cmd, Git) else Git(path=self.path)
 
-        local_flags.extend(["--", repository])
-        if path is not None:
-            local_flags.append(path)
+        self.remote_name = remote_name
+        self.fetch_url = fetch_url
+        self.push_url = push_url
 
-        return self.run(
-            "add",
-            local_flags=local_flags,
-            check_returncode=check_returncode,
-            log_in_real_time=log_in_real_time,
-        )
+    def __repr__(self) -> str:
+        """Representation of a git remote for a git repository."""
+        return f"<GitRemoteCmd path={self.path} remote_name={self.remote_name}>"
 
-    def init(
+    def run(
         self,
+        command: GitRemoteCommandLiteral | None = None,
+        local_flags: list[str] | None = None,
         *,
-        path: list[str] | str | None = None,
+        verbose: bool | None = None,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
+        **kwargs: t.Any,
     ) -> str:
-        """Initialize submodules.
+        r"""Run command against a git remote.
 
-        Parameters
-        ----------
-        path :
-            Specific submodule path(s) to initialize.
+        Wraps `git remote <https://git-scm.com/docs/git-remote>`_.
 
         Examples
         --------
-        >>> GitSubmoduleManager(path=example_git_repo.path).init()
-        ''
+        >>> GitRemoteCmd(
+        ...     path=example_git_repo.path,
+        ...     remote_name='master',
+        ... ).run(trim=True)
+        'origin'
+        >>> GitRemoteCmd(
+        ...     path=example_git_repo.path,
+        ...     remote_name='master',
+        ... ).run(verbose=True)
+        'origin\tfile:///...'
         """
-        local_flags: list[str] = ["--"]
+        local_flags = local_flags if isinstance(local_flags, list) else []
+        if command is not None:
+            local_flags.insert(0, command)
 
-        if isinstance(path, list):
-            local_flags.extend(path)
-        elif path is not None:
-            local_flags.append(path)
+        if verbose is True:
+            local_flags.append("--verbose")
 
-        return self.run(
-            "init",
-            local_flags=local_flags,
+        return self.cmd.run(
+            ["remote", *local_flags],
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
+            **kwargs,
         )
 
-    def update(
+    def rename(
         self,
         *,
-        path: list[str] | str | None = None,
-        init: bool = False,
-        force: bool = False,
-        checkout: bool = False,
-        rebase: bool = False,
-        merge: bool = False,
-        recursive: bool = False,
-        remote: bool = False,
+        old: str,
+        new: str,
+        progress: bool | None = None,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
     ) -> str:
-        """Update submodules.
-
-        Parameters
-        ----------
-        path :
-            Specific submodule path(s) to update.
-        init :
-            Initialize if not already.
-        force :
-            Discard local changes.
-        checkout :
-            Check out superproject's recorded commit.
-        rebase :
-            Rebase current branch onto commit.
-        merge :
-            Merge commit into current branch.
-        recursive :
-            Recurse into nested submodules.
-        remote :
-            Use remote tracking branch.
+        """Git remote rename.
 
         Examples
         --------
-        >>> GitSubmoduleManager(path=example_git_repo.path).update()
-        ''
-
-        >>> GitSubmoduleManager(path=example_git_repo.path).update(init=True)
+        >>> git_remote_repo = create_git_remote_repo()
+        >>> GitRemoteCmd(
+        ...     path=example_git_repo.path,
+        ...     remote_name='origin',
+        ... ).rename(old='origin', new='new_name')
         ''
+        >>> GitRemoteCmd(
+        ...     path=example_git_repo.path,
+        ...     remote_name='origin',
+        ... ).run(trim=True)
+        'new_name'
         """
         local_flags: list[str] = []
+        required_flags: list[str] = [old, new]
 
-        if init:
-            local_flags.append("--init")
-        if force:
-            local_flags.append("--force")
-        if checkout:
-            local_flags.append("--checkout")
-        elif rebase:
-            local_flags.append("--rebase")
-        elif merge:
-            local_flags.append("--merge")
-        if recursive:
-            local_flags.append("--recursive")
-        if remote:
-            local_flags.append("--remote")
-
-        local_flags.append("--")
-
-        if isinstance(path, list):
-            local_flags.extend(path)
-        elif path is not None:
-            local_flags.append(path)
-
+        if progress is not None:
+            if progress:
+                local_flags.append("--progress")
+            else:
+                local_flags.append("--no-progress")
         return self.run(
-            "update",
-            local_flags=local_flags,
+            "rename",
+            local_flags=local_flags + required_flags,
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
         )
 
-    def foreach(
+    def remove(
         self,
-        command: str,
         *,
-        recursive: bool = False,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
     ) -> str:
-        """Run command in each submodule.
-
-        Parameters
-        ----------
-        command :
-            Shell command to run.
-        recursive :
-            Recurse into nested submodules.
+        """Git remote remove.
 
         Examples
         --------
-        >>> result = GitSubmoduleManager(path=example_git_repo.path).foreach(
-        ...     'git status'
-        ... )
-        >>> isinstance(result, str)
-        True
+        >>> GitRemoteCmd(
+        ...     path=example_git_repo.path,
+        ...     remote_name='origin',
+        ... ).remove()
+        ''
+        >>> GitRemoteCmd(
+        ...     path=example_git_repo.path,
+        ...     remote_name='origin',
+        ... ).run()
+        ''
         """
         local_flags: list[str] = []
-
-        if recursive:
-            local_flags.append("--recursive")
-
-        local_flags.append(command)
+        required_flags: list[str] = [self.remote_name]
 
         return self.run(
-            "foreach",
-            local_flags=local_flags,
+            "remove",
+            local_flags=local_flags + required_flags,
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
         )
 
-    def sync(
+    def show(
         self,
         *,
-        path: list[str] | str | None = None,
-        recursive: bool = False,
+        verbose: bool | None = None,
+        no_query_remotes: bool | None = None,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
     ) -> str:
-        """Sync submodule URLs.
-
-        Parameters
-        ----------
-        path :
-            Specific submodule path(s) to sync.
-        recursive :
-            Recurse into nested submodules.
+        """Git remote show.
 
         Examples
         --------
-        >>> GitSubmoduleManager(path=example_git_repo.path).sync()
-        ''
-        """
-        local_flags: list[str] = []
-
-        if recursive:
-            local_flags.append("--recursive")
+        >>> print(
+        ...     GitRemoteCmd(
+        ...         path=example_git_repo.path,
+        ...         remote_name='origin',
+        ...     ).show()
+        ... )
+        * remote origin
+        Fetch URL: ...
+        Push  URL: ...
+        HEAD branch: master
+        Remote branch:
+        master tracked...
+        """
+        local_flags: list[str] = []
+        required_flags: list[str] = [self.remote_name]
 
-        local_flags.append("--")
+        if verbose is True:
+            local_flags.append("--verbose")
 
-        if isinstance(path, list):
-            local_flags.extend(path)
-        elif path is not None:
-            local_flags.append(path)
+        if no_query_remotes:
+            local_flags.append("-n")
 
         return self.run(
-            "sync",
-            local_flags=local_flags,
+            "show",
+            local_flags=[*local_flags, "--", *required_flags],
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
         )
 
-    def summary(
+    def prune(
         self,
         *,
-        cached: bool = False,
-        files: bool = False,
-        summary_limit: int | None = None,
-        commit: str | None = None,
-        path: list[str] | str | None = None,
+        dry_run: bool | None = None,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
     ) -> str:
-        """Show commit summary for submodules.
-
-        Parameters
-        ----------
-        cached :
-            Use cached info.
-        files :
-            Compare to working tree.
-        summary_limit :
-            Limit number of commits shown.
-        commit :
-            Commit to compare against.
-        path :
-            Specific submodule path(s).
+        """Git remote prune.
 
         Examples
         --------
-        >>> result = GitSubmoduleManager(path=example_git_repo.path).summary()
-        >>> isinstance(result, str)
-        True
+        >>> git_remote_repo = create_git_remote_repo()
+        >>> GitRemoteCmd(
+        ...     path=example_git_repo.path,
+        ...     remote_name='origin'
+        ... ).prune()
+        ''
+
+        >>> GitRemoteCmd(
+        ...     path=example_git_repo.path,
+        ...     remote_name='origin'
+        ... ).prune(dry_run=True)
+        ''
         """
         local_flags: list[str] = []
+        required_flags: list[str] = [self.remote_name]
 
-        if cached:
-            local_flags.append("--cached")
-        if files:
-            local_flags.append("--files")
-        if summary_limit is not None:
-            local_flags.append(f"--summary-limit={summary_limit}")
-
-        if commit is not None:
-            local_flags.append(commit)
-
-        local_flags.append("--")
-
-        if isinstance(path, list):
-            local_flags.extend(path)
-        elif path is not None:
-            local_flags.append(path)
+        if dry_run:
+            local_flags.append("--dry-run")
 
         return self.run(
-            "summary",
-            local_flags=local_flags,
+            "prune",
+            local_flags=[*local_flags, "--", *required_flags],
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
         )
 
-    def absorbgitdirs(
+    def get_url(
         self,
         *,
-        path: list[str] | str | None = None,
+        push: bool | None = None,
+        _all: bool | None = None,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
     ) -> str:
-        """Absorb git directories into superproject.
-
-        Parameters
-        ----------
-        path :
-            Specific submodule path(s).
+        """Git remote get-url.
 
         Examples
         --------
-        >>> result = GitSubmoduleManager(path=example_git_repo.path).absorbgitdirs()
-        >>> isinstance(result, str)
-        True
+        >>> git_remote_repo = create_git_remote_repo()
+        >>> GitRemoteCmd(
+        ...     path=example_git_repo.path,
+        ...     remote_name='origin'
+        ... ).get_url()
+        'file:///...'
+
+        >>> GitRemoteCmd(
+        ...     path=example_git_repo.path,
+        ...     remote_name='origin'
+        ... ).get_url(push=True)
+        'file:///...'
+
+        >>> GitRemoteCmd(
+        ...     path=example_git_repo.path,
+        ...     remote_name='origin'
+        ... ).get_url(_all=True)
+        'file:///...'
         """
-        local_flags: list[str] = ["--"]
+        local_flags: list[str] = []
+        required_flags: list[str] = [self.remote_name]
 
-        if isinstance(path, list):
-            local_flags.extend(path)
-        elif path is not None:
-            local_flags.append(path)
+        if push:
+            local_flags.append("--push")
+        if _all:
+            local_flags.append("--all")
 
         return self.run(
-            "absorbgitdirs",
-            local_flags=local_flags,
+            "get-url",
+            local_flags=[*local_flags, "--", *required_flags],
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
         )
 
-    def _ls(
+    def set_url(
         self,
         *,
-        recursive: bool = False,
-        cached: bool = False,
+        url: str,
+        old_url: str | None = None,
+        push: bool | None = None,
+        add: bool | None = None,
+        delete: bool | None = None,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
-    ) -> list[dict[str, t.Any]]:
-        """Parse submodule status output into structured data.
-
-        Parameters
-        ----------
-        recursive :
-            Include nested submodules.
-        cached :
-            Use cached info.
-
-        Returns
-        -------
-        list[dict[str, Any]]
-            List of parsed submodule data.
+    ) -> str:
+        r"""Git remote set-url.
 
         Examples
         --------
-        >>> submodules = GitSubmoduleManager(path=example_git_repo.path)._ls()
-        >>> isinstance(submodules, list)
+        >>> git_remote_repo = create_git_remote_repo()
+        >>> GitRemoteCmd(
+        ...     path=example_git_repo.path,
+        ...     remote_name='origin'
+        ... ).set_url(
+        ...     url='http://localhost'
+        ... )
+        ''
+
+        >>> GitRemoteCmd(
+        ...     path=example_git_repo.path,
+        ...     remote_name='origin'
+        ... ).set_url(
+        ...     url='http://localhost',
+        ...     push=True
+        ... )
+        ''
+
+        >>> GitRemoteCmd(
+        ...     path=example_git_repo.path,
+        ...     remote_name='origin'
+        ... ).set_url(
+        ...     url='http://localhost',
+        ...     add=True
+        ... )
+        ''
+
+        >>> current_url = GitRemoteCmd(
+        ...     path=example_git_repo.path,
+        ...     remote_name='origin'
+        ... ).get_url()
+        >>> 'fatal' in GitRemoteCmd(
+        ...     path=example_git_repo.path,
+        ...     remote_name='origin'
+        ... ).set_url(
+        ...     url=current_url,
+        ...     delete=True
+        ... )
         True
+
         """
         local_flags: list[str] = []
+        required_flags: list[str] = [self.remote_name, url]
+        if old_url is not None:
+            required_flags.append(old_url)
 
-        if recursive:
-            local_flags.append("--recursive")
-        if cached:
-            local_flags.append("--cached")
+        if push:
+            local_flags.append("--push")
+        if add:
+            local_flags.append("--add")
+        if delete:
+            local_flags.append("--delete")
 
-        result = self.run(
-            "status",
-            local_flags=local_flags,
+        return self.run(
+            "set-url",
+            local_flags=[*local_flags, "--", *required_flags],
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
         )
 
-        submodules: list[dict[str, t.Any]] = []
-
-        for line in result.strip().split("\n"):
-            if not line:
-                continue
-
-            # Format: <prefix><sha> <path> (<description>)
-            # Example: -abc1234 vendor/lib (heads/main)
-            # Prefix: - (not init), + (differs), U (conflicts), space (ok)
-            status_prefix = ""
-            if line and line[0] in "-+U ":
-                status_prefix = line[0] if line[0] != " " else ""
-                line = line[1:]
-
-            parts = line.strip().split(" ", 2)
-            if len(parts) >= 2:
-                sha = parts[0]
-                path = parts[1]
-                description = ""
-                if len(parts) > 2:
-                    # Remove parentheses from description
-                    description = parts[2].strip("()")
-
-                # Get additional info from .gitmodules if available
-                submodule_name = path  # Default to path
-                url = None
-                branch = None
-
-                # Try to get name and URL from git config
-                name_result = self.cmd.run(
-                    ["config", "-f", ".gitmodules", f"submodule.{path}.name"],
-                    check_returncode=False,
-                )
-                if name_result and "error" not in name_result.lower():
-                    submodule_name = name_result.strip()
-
-                url_result = self.cmd.run(
-                    ["config", "-f", ".gitmodules", f"submodule.{path}.url"],
-                    check_returncode=False,
-                )
-                if url_result and "error" not in url_result.lower():
-                    url = url_result.strip()
-
-                branch_result = self.cmd.run(
-                    ["config", "-f", ".gitmodules", f"submodule.{path}.branch"],
-                    check_returncode=False,
-                )
-                if branch_result and "error" not in branch_result.lower():
-                    branch = branch_result.strip()
-
-                submodules.append(
-                    {
-                        "name": submodule_name,
-                        "path": path,
-                        "sha": sha,
-                        "url": url,
-                        "branch": branch,
-                        "status_prefix": status_prefix,
-                        "description": description,
-                    }
-                )
-
-        return submodules
-
-    def ls(
+    def set_branches(
         self,
-        *,
-        recursive: bool = False,
-        cached: bool = False,
-    ) -> QueryList[GitSubmodule]:
-        """List submodules as :class:`~libvcs.cmd.git.GitSubmodule` objects.
+        *branches: str,
+        add: bool = False,
+        # Pass-through to run()
+        log_in_real_time: bool = False,
+        check_returncode: bool | None = None,
+    ) -> str:
+        """Git remote set-branches.
+
+        Configure remote tracking branches for the remote.
 
         Parameters
         ----------
-        recursive :
-            Include nested submodules.
-        cached :
-            Use cached info.
-
-        Returns
-        -------
-        QueryList[GitSubmodule]
-            List of submodules with ORM-like filtering.
+        *branches :
+            Branch names to track.
+        add :
+            Add to existing tracked branches instead of replacing.
 
         Examples
         --------
-        >>> submodules = GitSubmoduleManager(path=example_git_repo.path).ls()
-        >>> isinstance(submodules, QueryList)
-        True
+        >>> GitRemoteCmd(
+        ...     path=example_git_repo.path,
+        ...     remote_name='origin'
+        ... ).set_branches('master')
+        ''
+
+        >>> GitRemoteCmd(
+        ...     path=example_git_repo.path,
+        ...     remote_name='origin'
+        ... ).set_branches('master', 'develop', add=True)
+        ''
         """
-        submodules_data = self._ls(recursive=recursive, cached=cached)
-        submodules: list[GitSubmodule] = []
+        local_flags: list[str] = []
 
-        for data in submodules_data:
-            entry_cmd = GitSubmoduleEntryCmd(
-                path=self.path,
-                submodule_path=data["path"],
-                cmd=self.cmd,
-            )
-            submodule = GitSubmodule(
-                name=data["name"],
-                path=data["path"],
-                sha=data["sha"],
-                url=data["url"],
-                branch=data["branch"],
-                status_prefix=data["status_prefix"],
-                _cmd=entry_cmd,
-            )
-            submodules.append(submodule)
+        if add:
+            local_flags.append("--add")
 
-        return QueryList(submodules)
+        local_flags.append(self.remote_name)
+        local_flags.extend(branches)
 
-    def get(
+        return self.run(
+            "set-branches",
+            local_flags=local_flags,
+            check_returncode=check_returncode,
+            log_in_real_time=log_in_real_time,
+        )
+
+    def set_head(
         self,
-        path: str | None = None,
-        name: str | None = None,
-        **kwargs: t.Any,
-    ) -> GitSubmodule:
-        """Get a specific submodule.
+        branch: str | None = None,
+        *,
+        auto: bool = False,
+        delete: bool = False,
+        # Pass-through to run()
+        log_in_real_time: bool = False,
+        check_returncode: bool | None = None,
+    ) -> str:
+        """Git remote set-head.
+
+        Set or delete the default branch (HEAD) for the remote.
 
         Parameters
         ----------
-        path :
-            Submodule path to find.
-        name :
-            Submodule name to find.
-        **kwargs :
-            Additional filter criteria.
-
-        Returns
-        -------
-        GitSubmodule
-            The matching submodule.
-
-        Raises
-        ------
-        :exc:`~libvcs._internal.query_list.ObjectDoesNotExist`
-            If no matching submodule found.
-        :exc:`~libvcs._internal.query_list.MultipleObjectsReturned`
-            If multiple submodules match.
+        branch :
+            Branch name to set as HEAD. Required unless auto or delete is True.
+        auto :
+            Query the remote to determine HEAD automatically.
+        delete :
+            Delete the remote HEAD reference.
 
         Examples
         --------
-        >>> from libvcs._internal.query_list import ObjectDoesNotExist
-        >>> submodules = GitSubmoduleManager(path=example_git_repo.path)
-        >>> try:
-        ...     submodules.get(path='vendor/lib')
-        ... except ObjectDoesNotExist:
-        ...     True
+        >>> remote = GitRemoteCmd(
+        ...     path=example_git_repo.path,
+        ...     remote_name='origin'
+        ... )
+
+        The exact message wording varies across git versions (git 2.54+ reports
+        "is unchanged" when HEAD already points at the branch), so assert on the
+        stable parts rather than the literal string:
+
+        >>> 'master' in remote.set_head(auto=True)
+        True
+        >>> isinstance(remote.set_head('master'), str)
         True
         """
-        filters: dict[str, t.Any] = {}
-        if path is not None:
-            filters["path"] = path
-        if name is not None:
-            filters["name"] = name
-        filters.update(kwargs)
+        local_flags: list[str] = [self.remote_name]
 
-        result = self.ls().get(**filters)
-        assert result is not None  # get() raises ObjectDoesNotExist, never returns None
-        return result
+        if auto:
+            local_flags.append("-a")
+        elif delete:
+            local_flags.append("-d")
+        elif branch is not None:
+            local_flags.append(branch)
 
-    def filter(
+        return self.run(
+            "set-head",
+            local_flags=local_flags,
+            check_returncode=check_returncode,
+            log_in_real_time=log_in_real_time,
+        )
+
+    def update(
         self,
-        *args: t.Any,
-        **kwargs: t.Any,
-    ) -> QueryList[GitSubmodule]:
-        """Filter submodules.
+        *,
+        prune: bool = False,
+        # Pass-through to run()
+        log_in_real_time: bool = False,
+        check_returncode: bool | None = None,
+    ) -> str:
+        """Git remote update.
+
+        Fetch updates for the remote.
 
         Parameters
         ----------
-        *args :
-            Positional arguments for
-            :meth:`~libvcs._internal.query_list.QueryList.filter`.
-        **kwargs :
-            Keyword arguments for filtering (supports Django-style lookups).
-
-        Returns
-        -------
-        QueryList[GitSubmodule]
-            Filtered list of submodules.
+        prune :
+            Prune remote-tracking branches no longer on remote.
 
         Examples
         --------
-        >>> submodules = GitSubmoduleManager(path=example_git_repo.path).filter()
-        >>> isinstance(submodules, QueryList)
-        True
+        >>> GitRemoteCmd(
+        ...     path=example_git_repo.path,
+        ...     remote_name='origin'
+        ... ).update()
+        'Fetching origin...'
+
+        >>> GitRemoteCmd(
+        ...     path=example_git_repo.path,
+        ...     remote_name='origin'
+        ... ).update(prune=True)
+        'Fetching origin...'
         """
-        return self.ls().filter(*args, **kwargs)
+        local_flags: list[str] = []
+
+        if prune:
+            local_flags.append("-p")
 
+        local_flags.append(self.remote_name)
 
-GitRemoteCommandLiteral = t.Literal[
+        return self.run(
+            "update",
+            local_flags=local_flags,
+            check_returncode=check_returncode,
+            log_in_real_time=log_in_real_time,
+        )
+
+
+GitRemoteManagerLiteral = t.Literal[
+    "--verbose",
     "add",
     "rename",
     "remove",
@@ -3661,50 +7567,36 @@ GitRemoteCommandLiteral = t.Literal[
 ]
 
 
-class GitRemoteCmd:
-    """Run git commands targeting a specific remote."""
+class GitRemoteManager:
+    """Traverse git remotes with :class:`~libvcs._internal.query_list.QueryList`."""
 
     remote_name: str
-    fetch_url: str | None
-    push_url: str | None
 
     def __init__(
         self,
         *,
         path: StrPath,
-        remote_name: str,
-        fetch_url: str | None = None,
-        push_url: str | None = None,
         cmd: Git | None = None,
     ) -> None:
-        r"""Lite, typed, pythonic wrapper for git-remote(1).
+        """Wrap some of git-remote(1), git-checkout(1), manager.
 
         Parameters
         ----------
         path :
             Operates as PATH in the corresponding git subcommand.
-        remote_name :
-            Name of remote
 
         Examples
         --------
-        >>> GitRemoteCmd(
-        ...     path=example_git_repo.path,
-        ...     remote_name='origin',
-        ... )
-        <GitRemoteCmd path=... remote_name=...>
+        >>> GitRemoteManager(path=tmp_path)
+        <GitRemoteManager path=...>
 
-        >>> GitRemoteCmd(
-        ...     path=tmp_path,
-        ...     remote_name='origin',
-        ... ).run(verbose=True, trim=True)
+        >>> GitRemoteManager(path=tmp_path).run(check_returncode=False, trim=True)
         'fatal: not a git repository (or any of the parent directories): .git'
 
-        >>> GitRemoteCmd(
-        ...     path=example_git_repo.path,
-        ...     remote_name='origin',
-        ... ).run(verbose=True)
-        'origin\tfile:///...'
+        >>> GitRemoteManager(
+        ...     path=example_git_repo.path
+        ... ).run(trim=True)
+        'origin'
         """
         #: Directory to check out
         self.path: pathlib.Path
@@ -3715,49 +7607,33 @@ class GitRemoteCmd:
 
         self.cmd = cmd if isinstance(cmd, Git) else Git(path=self.path)
 
-        self.remote_name = remote_name
-        self.fetch_url = fetch_url
-        self.push_url = push_url
-
     def __repr__(self) -> str:
-        """Representation of a git remote for a git repository."""
-        return f"<GitRemoteCmd path={self.path} remote_name={self.remote_name}>"
+        """Representation of git remote manager object."""
+        return f"<GitRemoteManager path={self.path}>"
 
     def run(
         self,
-        command: GitRemoteCommandLiteral | None = None,
+        command: GitRemoteManagerLiteral | None = None,
         local_flags: list[str] | None = None,
         *,
-        verbose: bool | None = None,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
         **kwargs: t.Any,
     ) -> str:
-        r"""Run command against a git remote.
+        """Run a command against a git repository's remotes.
 
         Wraps `git remote <https://git-scm.com/docs/git-remote>`_.
 
         Examples
         --------
-        >>> GitRemoteCmd(
-        ...     path=example_git_repo.path,
-        ...     remote_name='master',
-        ... ).run(trim=True)
+        >>> GitRemoteManager(path=example_git_repo.path).run(trim=True)
         'origin'
-        >>> GitRemoteCmd(
-        ...     path=example_git_repo.path,
-        ...     remote_name='master',
-        ... ).run(verbose=True)
-        'origin\tfile:///...'
         """
         local_flags = local_flags if isinstance(local_flags, list) else []
         if command is not None:
             local_flags.insert(0, command)
 
-        if verbose is True:
-            local_flags.append("--verbose")
-
         return self.cmd.run(
             ["remote", *local_flags],
             check_returncode=check_returncode,
@@ -3765,461 +7641,666 @@ class GitRemoteCmd:
             **kwargs,
         )
 
-    def rename(
+    def add(
         self,
         *,
-        old: str,
-        new: str,
-        progress: bool | None = None,
+        name: str,
+        url: str,
+        fetch: bool | None = None,
+        track: str | None = None,
+        master: str | None = None,
+        mirror: t.Literal["push", "fetch"] | bool | None = None,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
     ) -> str:
-        """Git remote rename.
+        """Git remote add.
 
         Examples
         --------
         >>> git_remote_repo = create_git_remote_repo()
-        >>> GitRemoteCmd(
-        ...     path=example_git_repo.path,
-        ...     remote_name='origin',
-        ... ).rename(old='origin', new='new_name')
+        >>> GitRemoteManager(path=example_git_repo.path).add(
+        ...     name='my_remote',
+        ...     url=f'file://{git_remote_repo}'
+        ... )
         ''
-        >>> GitRemoteCmd(
-        ...     path=example_git_repo.path,
-        ...     remote_name='origin',
-        ... ).run(trim=True)
-        'new_name'
         """
         local_flags: list[str] = []
-        required_flags: list[str] = [old, new]
+        required_flags: list[str] = [name, url]
 
-        if progress is not None:
-            if progress:
-                local_flags.append("--progress")
-            else:
-                local_flags.append("--no-progress")
+        if fetch is True:
+            local_flags.append("-f")
+        if track is not None:
+            local_flags.extend(["-t", track])
+        if master is not None:
+            local_flags.extend(["-m", master])
+        if mirror is not None:
+            if isinstance(mirror, str):
+                if mirror not in ("push", "fetch"):
+                    msg = "mirror must be 'push' or 'fetch'"
+                    raise ValueError(msg)
+                local_flags.append(f"--mirror={mirror}")
+            elif mirror is True:
+                local_flags.append("--mirror")
         return self.run(
-            "rename",
-            local_flags=local_flags + required_flags,
+            "add",
+            local_flags=[*local_flags, "--", *required_flags],
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
         )
 
-    def remove(
+    def show(
         self,
         *,
+        name: str | None = None,
+        verbose: bool | None = None,
+        no_query_remotes: bool | None = None,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
+        trim: bool = False,
     ) -> str:
-        """Git remote remove.
+        """Git remote show.
 
         Examples
         --------
-        >>> GitRemoteCmd(
-        ...     path=example_git_repo.path,
-        ...     remote_name='origin',
-        ... ).remove()
-        ''
-        >>> GitRemoteCmd(
-        ...     path=example_git_repo.path,
-        ...     remote_name='origin',
-        ... ).run()
+        >>> GitRemoteManager(path=example_git_repo.path).show(trim=True)
+        'origin'
+
+        For the example below, add a remote:
+        >>> GitRemoteManager(path=example_git_repo.path).add(
+        ...     name='my_remote', url=f'file:///dev/null'
+        ... )
         ''
+
+        Retrieve a list of remote names:
+        >>> GitRemoteManager(path=example_git_repo.path).show().splitlines()
+        ['my_remote', 'origin']
         """
         local_flags: list[str] = []
-        required_flags: list[str] = [self.remote_name]
+        required_flags: list[str] = []
+
+        if name is not None:
+            required_flags.append(name)
+
+        if verbose is True:
+            local_flags.append("--verbose")
+
+        if no_query_remotes:
+            local_flags.append("-n")
+
+        return self.run(
+            "show",
+            local_flags=[*local_flags, "--", *required_flags],
+            check_returncode=check_returncode,
+            log_in_real_time=log_in_real_time,
+            trim=trim,
+        )
+
+    def _ls(self, trim: bool = False) -> str:
+        r"""List remotes (raw output).
+
+        Examples
+        --------
+        >>> GitRemoteManager(path=example_git_repo.path)._ls(trim=True)
+        'origin\tfile:///... (fetch)\norigin\tfile:///... (push)'
+        """
+        return self.cmd._query(["remote", "--verbose"], trim=trim)
+
+    def _urls_in_process(self) -> dict[str, tuple[str | None, str | None]] | None:
+        """Resolve remote URLs from config like ``git remote --verbose``.
+
+        Returns None when git has to answer: outside a repository root,
+        with legacy ``.git/remotes/`` or ``.git/branches/`` remotes, or for
+        an empty ``url`` whose meaning depends on the git version.
+        """
+        try:
+            dirs = gitfs.GitDir.discover(self.path)
+        except gitfs.GitFsUnsupported:
+            return None
+        for legacy in ("remotes", "branches"):
+            legacy_dir = dirs.common_dir / legacy
+            if legacy_dir.is_dir() and any(legacy_dir.iterdir()):
+                return None
+
+        urls: dict[str, list[str]] = {}
+        push_urls: dict[str, list[str]] = {}
+        rewrites: dict[str, str] = {}
+        push_rewrites: dict[str, str] = {}
+        for entry in self.cmd.config_snapshot(in_process=True).entries:
+            section, _, rest = entry.key.partition(".")
+            subsection, dot, name = rest.rpartition(".")
+            if not dot or section not in ("remote", "url"):
+                continue
+            if section == "url":
+                if entry.value is not None and name == "insteadof":
+                    rewrites[entry.value] = subsection
+                elif entry.value is not None and name == "pushinsteadof":
+                    push_rewrites[entry.value] = subsection
+                continue
+            if name not in ("url", "pushurl"):
+                continue
+            if not entry.value:
+                return None
+            (urls if name == "url" else push_urls).setdefault(subsection, []).append(
+                entry.value,
+            )
+
+        def rewrite(url: str, table: dict[str, str]) -> str | None:
+            prefixes = [prefix for prefix in table if url.startswith(prefix)]
+            if not prefixes:
+                return None
+            prefix = max(prefixes, key=len)
+            return table[prefix] + url[len(prefix) :]
+
+        remotes: dict[str, tuple[str | None, str | None]] = {}
+        for name in sorted(urls.keys() | push_urls.keys()):
+            fetch = [rewrite(url, rewrites) or url for url in urls.get(name, [])]
+            push = [rewrite(url, rewrites) or url for url in push_urls.get(name, [])]
+            if not push:
+                push = [
+                    alias
+                    for url in urls.get(name, [])
+                    if (alias := rewrite(url, push_rewrites)) is not None
+                ]
+            push = push or fetch
+            if fetch or push:
+                remotes[name] = (
+                    fetch[0] if fetch else None,
+                    push[-1] if push else None,
+                )
+        return remotes
+
+    def ls(self, *, in_process: bool = False) -> QueryList[GitRemoteCmd]:
+        """List remotes.
+
+        Parameters
+        ----------
+        in_process :
+            Read remotes from the parsed config files
+            (:meth:`Git.config_snapshot`) instead of running
+            ``git remote --verbose``, applying ``url.<base>.insteadOf`` and
+            ``pushInsteadOf`` the way git does.
+
+        Examples
+        --------
+        >>> GitRemoteManager(path=example_git_repo.path).ls()
+        [<GitRemoteCmd path=... remote_name=origin>]
+
+        For the example below, add a remote:
+        >>> GitRemoteManager(path=example_git_repo.path).add(
+        ...     name='my_remote', url=f'file:///dev/null'
+        ... )
+        ''
+
+        >>> GitRemoteManager(path=example_git_repo.path).ls()
+        [<GitRemoteCmd path=... remote_name=my_remote>,
+         <GitRemoteCmd path=... remote_name=origin>]
+
+        >>> GitRemoteManager(path=example_git_repo.path).ls(in_process=True)
+        [<GitRemoteCmd path=... remote_name=my_remote>,
+         <GitRemoteCmd path=... remote_name=origin>]
+        """
+        resolved = self._urls_in_process() if in_process else None
+        if resolved is not None:
+            return QueryList(
+                [
+                    GitRemoteCmd(
+                        path=self.path,
+                        remote_name=name,
+                        fetch_url=fetch_url,
+                        push_url=push_url,
+                    )
+                    for name, (fetch_url, push_url) in resolved.items()
+                ],
+            )
+
+        remote_str = self._ls()
+        remote_pattern = re.compile(
+            r"""
+            ^                       # Start of line
+            (?P<name>\S+)           # Remote name: one or more non-whitespace characters
+            \s+                     # One or more whitespace characters (tab separator)
+            (?P<url>.+?)            # URL: any characters (non-greedy) - supports spaces
+            \s+                     # One or more whitespace characters
+            \((?P<cmd_type>fetch|push)\)  # 'fetch' or 'push' in parentheses
+            (?:\s+\[[^\]]*\])?        # Partial clone filter, e.g. [blob:none]
+            $                       # End of line
+        """,
+            re.VERBOSE | re.MULTILINE,
+        )
+
+        remotes: dict[str, dict[str, str | None]] = {}
+
+        for match_obj in remote_pattern.finditer(remote_str):
+            name = match_obj.group("name")
+            url = match_obj.group("url")
+            cmd_type = match_obj.group("cmd_type")
+
+            if name not in remotes:
+                remotes[name] = {}
+
+            remotes[name][cmd_type] = url
+
+        remote_cmds: list[GitRemoteCmd] = []
+        for name, urls in remotes.items():
+            fetch_url = urls.get("fetch")
+            push_url = urls.get("push")
+            remote_cmds.append(
+                GitRemoteCmd(
+                    path=self.path,
+                    remote_name=name,
+                    fetch_url=fetch_url,
+                    push_url=push_url,
+                ),
+            )
+
+        return QueryList(remote_cmds)
+
+    def get(
+        self,
+        *args: t.Any,
+        in_process: bool = False,
+        **kwargs: t.Any,
+    ) -> GitRemoteCmd | None:
+        """Get remote via filter lookup, ``in_process`` as in :meth:`ls`.
+
+        Examples
+        --------
+        >>> GitRemoteManager(
+        ...     path=example_git_repo.path
+        ... ).get(remote_name='origin')
+        <GitRemoteCmd path=... remote_name=origin>
+
+        >>> GitRemoteManager(
+        ...     path=example_git_repo.path
+        ... ).get(remote_name='unknown')
+        Traceback (most recent call last):
+            exec(compile(example.source, filename, "single",
+            ...
+            return self.ls(in_process=in_process).get(*args, **kwargs)
+                   ^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+          File "..._internal/query_list.py", line ..., in get
+            raise ObjectDoesNotExist
+        libvcs._internal.query_list.ObjectDoesNotExist
+        """
+        return self.ls(in_process=in_process).get(*args, **kwargs)
+
+    def filter(
+        self,
+        *args: t.Any,
+        in_process: bool = False,
+        **kwargs: t.Any,
+    ) -> list[GitRemoteCmd]:
+        """Get remotes via filter lookup, ``in_process`` as in :meth:`ls`.
+
+        Examples
+        --------
+        >>> GitRemoteManager(
+        ...     path=example_git_repo.path
+        ... ).filter(remote_name__contains='origin')
+        [<GitRemoteCmd path=... remote_name=origin>]
+
+        >>> GitRemoteManager(
+        ...     path=example_git_repo.path
+        ... ).filter(remote_name__contains='unknown')
+        []
+        """
+        return self.ls(in_process=in_process).filter(*args, **kwargs)
+
+
+GitStashCommandLiteral = t.Literal[
+    "list",
+    "show",
+    "save",
+    "drop",
+    "branch",
+    "pop",
+    "apply",
+    "push",
+    "clear",
+    "create",
+    "store",
+]
 
-        return self.run(
-            "remove",
-            local_flags=local_flags + required_flags,
-            check_returncode=check_returncode,
-            log_in_real_time=log_in_real_time,
-        )
 
-    def show(
+class GitStashEntryCmd:
+    """Run git commands targeting a specific stash entry."""
+
+    index: int
+    branch: str | None
+    message: str
+    oid: str | None
+    parents: tuple[str, ...]
+    timestamp: datetime.datetime | None
+
+    def __init__(
         self,
         *,
-        verbose: bool | None = None,
-        no_query_remotes: bool | None = None,
-        # Pass-through to run()
-        log_in_real_time: bool = False,
-        check_returncode: bool | None = None,
-    ) -> str:
-        """Git remote show.
+        path: StrPath,
+        index: int,
+        branch: str | None = None,
+        message: str = "",
+        oid: str | None = None,
+        parents: tuple[str, ...] = (),
+        timestamp: datetime.datetime | None = None,
+        cmd: Git | None = None,
+    ) -> None:
+        r"""Lite, typed, pythonic wrapper for git-stash(1) per-entry operations.
+
+        Parameters
+        ----------
+        path :
+            Operates as PATH in the corresponding git subcommand.
+        index :
+            Stash index (0 = most recent)
+        branch :
+            Branch the stash was created on
+        message :
+            Stash message
+        oid :
+            Object name of the stash commit
+        parents :
+            Parents of the stash commit: ``HEAD`` at stash time, the index
+            commit and, with ``--include-untracked``, the untracked files
+            commit
+        timestamp :
+            When the stash was created (UTC)
 
         Examples
         --------
-        >>> print(
-        ...     GitRemoteCmd(
-        ...         path=example_git_repo.path,
-        ...         remote_name='origin',
-        ...     ).show()
+        >>> GitStashEntryCmd(
+        ...     path=example_git_repo.path,
+        ...     index=0,
+        ...     branch='master',
+        ...     message='WIP',
         ... )
-        * remote origin
-        Fetch URL: ...
-        Push  URL: ...
-        HEAD branch: master
-        Remote branch:
-        master tracked...
+        <GitStashEntryCmd path=... index=0>
         """
-        local_flags: list[str] = []
-        required_flags: list[str] = [self.remote_name]
+        #: Directory to check out
+        self.path: pathlib.Path
+        if isinstance(path, pathlib.Path):
+            self.path = path
+        else:
+            self.path = pathlib.Path(path)
 
-        if verbose is True:
-            local_flags.append("--verbose")
+        self.cmd = cmd if isinstance(cmd, Git) else Git(path=self.path)
 
-        if no_query_remotes:
-            local_flags.append("-n")
+        self.index = index
+        self.branch = branch
+        self.message = message
+        self.oid = oid
+        self.parents = parents
+        self.timestamp = timestamp
 
-        return self.run(
-            "show",
-            local_flags=[*local_flags, "--", *required_flags],
-            check_returncode=check_returncode,
-            log_in_real_time=log_in_real_time,
-        )
+    def __repr__(self) -> str:
+        """Representation of a git stash entry."""
+        return f"<GitStashEntryCmd path={self.path} index={self.index}>"
 
-    def prune(
+    @property
+    def stash_ref(self) -> str:
+        """Return the stash reference string."""
+        return f"stash@{{{self.index}}}"
+
+    def run(
         self,
+        command: GitStashCommandLiteral | None = None,
+        local_flags: list[str] | None = None,
         *,
-        dry_run: bool | None = None,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
+        **kwargs: t.Any,
     ) -> str:
-        """Git remote prune.
-
-        Examples
-        --------
-        >>> git_remote_repo = create_git_remote_repo()
-        >>> GitRemoteCmd(
-        ...     path=example_git_repo.path,
-        ...     remote_name='origin'
-        ... ).prune()
-        ''
+        r"""Run command against a git stash entry.
 
-        >>> GitRemoteCmd(
-        ...     path=example_git_repo.path,
-        ...     remote_name='origin'
-        ... ).prune(dry_run=True)
-        ''
+        Wraps `git stash <https://git-scm.com/docs/git-stash>`_.
         """
-        local_flags: list[str] = []
-        required_flags: list[str] = [self.remote_name]
-
-        if dry_run:
-            local_flags.append("--dry-run")
+        local_flags = local_flags if isinstance(local_flags, list) else []
+        if command is not None:
+            local_flags.insert(0, command)
 
-        return self.run(
-            "prune",
-            local_flags=[*local_flags, "--", *required_flags],
+        return self.cmd.run(
+            ["stash", *local_flags],
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
+            **kwargs,
         )
 
-    def get_url(
+    def show(
         self,
         *,
-        push: bool | None = None,
-        _all: bool | None = None,
+        stat: bool | None = None,
+        patch: bool | None = None,
+        include_untracked: bool | None = None,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
+        trim: bool = False,
     ) -> str:
-        """Git remote get-url.
+        """Git stash show for this stash entry.
+
+        Parameters
+        ----------
+        stat :
+            Show diffstat (--stat)
+        patch :
+            Show patch (-p)
+        include_untracked :
+            Include untracked files (-u)
+        trim : bool, default: False
+            Strip trailing whitespace/newline from command output.
 
         Examples
         --------
-        >>> git_remote_repo = create_git_remote_repo()
-        >>> GitRemoteCmd(
-        ...     path=example_git_repo.path,
-        ...     remote_name='origin'
-        ... ).get_url()
-        'file:///...'
-
-        >>> GitRemoteCmd(
-        ...     path=example_git_repo.path,
-        ...     remote_name='origin'
-        ... ).get_url(push=True)
-        'file:///...'
-
-        >>> GitRemoteCmd(
+        >>> GitStashEntryCmd(
         ...     path=example_git_repo.path,
-        ...     remote_name='origin'
-        ... ).get_url(_all=True)
-        'file:///...'
+        ...     index=0,
+        ... ).show(trim=True)
+        'error: stash@{0} is not a valid reference'
         """
         local_flags: list[str] = []
-        required_flags: list[str] = [self.remote_name]
 
-        if push:
-            local_flags.append("--push")
-        if _all:
-            local_flags.append("--all")
+        if stat is True:
+            local_flags.append("--stat")
+        if patch is True:
+            local_flags.append("-p")
+        if include_untracked is True:
+            local_flags.append("-u")
+
+        local_flags.append(self.stash_ref)
 
         return self.run(
-            "get-url",
-            local_flags=[*local_flags, "--", *required_flags],
+            "show",
+            local_flags=local_flags,
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
+            trim=trim,
         )
 
-    def set_url(
+    def apply(
         self,
         *,
-        url: str,
-        old_url: str | None = None,
-        push: bool | None = None,
-        add: bool | None = None,
-        delete: bool | None = None,
+        index: bool | None = None,
+        quiet: bool | None = None,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
+        trim: bool = False,
     ) -> str:
-        r"""Git remote set-url.
-
-        Examples
-        --------
-        >>> git_remote_repo = create_git_remote_repo()
-        >>> GitRemoteCmd(
-        ...     path=example_git_repo.path,
-        ...     remote_name='origin'
-        ... ).set_url(
-        ...     url='http://localhost'
-        ... )
-        ''
+        """Git stash apply for this stash entry.
 
-        >>> GitRemoteCmd(
-        ...     path=example_git_repo.path,
-        ...     remote_name='origin'
-        ... ).set_url(
-        ...     url='http://localhost',
-        ...     push=True
-        ... )
-        ''
+        Apply the stash without removing it from the stash list.
 
-        >>> GitRemoteCmd(
-        ...     path=example_git_repo.path,
-        ...     remote_name='origin'
-        ... ).set_url(
-        ...     url='http://localhost',
-        ...     add=True
-        ... )
-        ''
+        Parameters
+        ----------
+        index :
+            Try to reinstate not only the working tree but also the index (--index)
+        quiet :
+            Suppress output (-q)
+        trim : bool, default: False
+            Strip trailing whitespace/newline from command output.
 
-        >>> current_url = GitRemoteCmd(
-        ...     path=example_git_repo.path,
-        ...     remote_name='origin'
-        ... ).get_url()
-        >>> 'fatal' in GitRemoteCmd(
+        Examples
+        --------
+        >>> GitStashEntryCmd(
         ...     path=example_git_repo.path,
-        ...     remote_name='origin'
-        ... ).set_url(
-        ...     url=current_url,
-        ...     delete=True
-        ... )
-        True
-
+        ...     index=0,
+        ... ).apply(trim=True)
+        'error: stash@{0} is not a valid reference'
         """
         local_flags: list[str] = []
-        required_flags: list[str] = [self.remote_name, url]
-        if old_url is not None:
-            required_flags.append(old_url)
 
-        if push:
-            local_flags.append("--push")
-        if add:
-            local_flags.append("--add")
-        if delete:
-            local_flags.append("--delete")
+        if index is True:
+            local_flags.append("--index")
+        if quiet is True:
+            local_flags.append("-q")
+
+        local_flags.append(self.stash_ref)
 
         return self.run(
-            "set-url",
-            local_flags=[*local_flags, "--", *required_flags],
+            "apply",
+            local_flags=local_flags,
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
+            trim=trim,
         )
 
-    def set_branches(
+    def pop(
         self,
-        *branches: str,
-        add: bool = False,
+        *,
+        index: bool | None = None,
+        quiet: bool | None = None,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
+        trim: bool = False,
     ) -> str:
-        """Git remote set-branches.
+        """Git stash pop for this stash entry.
 
-        Configure remote tracking branches for the remote.
+        Apply the stash and remove it from the stash list.
 
         Parameters
         ----------
-        *branches :
-            Branch names to track.
-        add :
-            Add to existing tracked branches instead of replacing.
+        index :
+            Try to reinstate not only the working tree but also the index (--index)
+        quiet :
+            Suppress output (-q)
+        trim : bool, default: False
+            Strip trailing whitespace/newline from command output.
 
         Examples
         --------
-        >>> GitRemoteCmd(
-        ...     path=example_git_repo.path,
-        ...     remote_name='origin'
-        ... ).set_branches('master')
-        ''
-
-        >>> GitRemoteCmd(
+        >>> GitStashEntryCmd(
         ...     path=example_git_repo.path,
-        ...     remote_name='origin'
-        ... ).set_branches('master', 'develop', add=True)
-        ''
+        ...     index=0,
+        ... ).pop(trim=True)
+        'error: stash@{0} is not a valid reference'
         """
         local_flags: list[str] = []
 
-        if add:
-            local_flags.append("--add")
+        if index is True:
+            local_flags.append("--index")
+        if quiet is True:
+            local_flags.append("-q")
 
-        local_flags.append(self.remote_name)
-        local_flags.extend(branches)
+        local_flags.append(self.stash_ref)
 
         return self.run(
-            "set-branches",
+            "pop",
             local_flags=local_flags,
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
+            trim=trim,
         )
 
-    def set_head(
+    def drop(
         self,
-        branch: str | None = None,
         *,
-        auto: bool = False,
-        delete: bool = False,
+        quiet: bool | None = None,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
+        trim: bool = False,
     ) -> str:
-        """Git remote set-head.
+        """Git stash drop for this stash entry.
 
-        Set or delete the default branch (HEAD) for the remote.
+        Remove this stash from the stash list.
 
         Parameters
         ----------
-        branch :
-            Branch name to set as HEAD. Required unless auto or delete is True.
-        auto :
-            Query the remote to determine HEAD automatically.
-        delete :
-            Delete the remote HEAD reference.
+        quiet :
+            Suppress output (-q)
+        trim : bool, default: False
+            Strip trailing whitespace/newline from command output.
 
         Examples
         --------
-        >>> remote = GitRemoteCmd(
+        >>> GitStashEntryCmd(
         ...     path=example_git_repo.path,
-        ...     remote_name='origin'
-        ... )
-
-        The exact message wording varies across git versions (git 2.54+ reports
-        "is unchanged" when HEAD already points at the branch), so assert on the
-        stable parts rather than the literal string:
-
-        >>> 'master' in remote.set_head(auto=True)
-        True
-        >>> isinstance(remote.set_head('master'), str)
-        True
+        ...     index=0,
+        ... ).drop(trim=True)
+        'error: stash@{0} is not a valid reference'
         """
-        local_flags: list[str] = [self.remote_name]
+        local_flags: list[str] = []
 
-        if auto:
-            local_flags.append("-a")
-        elif delete:
-            local_flags.append("-d")
-        elif branch is not None:
-            local_flags.append(branch)
+        if quiet is True:
+            local_flags.append("-q")
+
+        local_flags.append(self.stash_ref)
 
         return self.run(
-            "set-head",
+            "drop",
             local_flags=local_flags,
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
+            trim=trim,
         )
 
-    def update(
+    def create_branch(
         self,
+        branch_name: str,
         *,
-        prune: bool = False,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
+        trim: bool = False,
     ) -> str:
-        """Git remote update.
+        """Git stash branch for this stash entry.
 
-        Fetch updates for the remote.
+        Create a new branch from this stash entry and apply the stash.
 
         Parameters
         ----------
-        prune :
-            Prune remote-tracking branches no longer on remote.
+        branch_name :
+            Name of the branch to create
+        trim : bool, default: False
+            Strip trailing whitespace/newline from command output.
 
         Examples
         --------
-        >>> GitRemoteCmd(
-        ...     path=example_git_repo.path,
-        ...     remote_name='origin'
-        ... ).update()
-        'Fetching origin...'
-
-        >>> GitRemoteCmd(
+        >>> GitStashEntryCmd(
         ...     path=example_git_repo.path,
-        ...     remote_name='origin'
-        ... ).update(prune=True)
-        'Fetching origin...'
+        ...     index=0,
+        ... ).create_branch('new-branch', trim=True)
+        'error: stash@{0} is not a valid reference'
         """
-        local_flags: list[str] = []
-
-        if prune:
-            local_flags.append("-p")
-
-        local_flags.append(self.remote_name)
+        local_flags: list[str] = [branch_name, self.stash_ref]
 
         return self.run(
-            "update",
+            "branch",
             local_flags=local_flags,
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
+            trim=trim,
         )
 
 
-GitRemoteManagerLiteral = t.Literal[
-    "--verbose",
-    "add",
-    "rename",
-    "remove",
-    "set-branches",
-    "set-head",
-    "set-branch",
-    "get-url",
-    "set-url",
-    "set-url --add",
-    "set-url --delete",
-    "prune",
-    "show",
-    "update",
-]
-
-
-class GitRemoteManager:
-    """Traverse git remotes with :class:`~libvcs._internal.query_list.QueryList`."""
-
-    remote_name: str
+class GitStashCmd:
+    """Run git stash commands (low-level, use :class:`GitStashManager`)."""
 
-    def __init__(
-        self,
-        *,
-        path: StrPath,
-        cmd: Git | None = None,
-    ) -> None:
-        """Wrap some of git-remote(1), git-checkout(1), manager.
+    def __init__(self, *, path: StrPath, cmd: Git | None = None) -> None:
+        """Lite, typed, pythonic wrapper for git-stash(1).
 
         Parameters
         ----------
@@ -4228,16 +8309,14 @@ class GitRemoteManager:
 
         Examples
         --------
-        >>> GitRemoteManager(path=tmp_path)
-        <GitRemoteManager path=...>
+        >>> GitStashCmd(path=tmp_path)
+        <GitStashCmd path=...>
 
-        >>> GitRemoteManager(path=tmp_path).run(check_returncode=False, trim=True)
+        >>> GitStashCmd(path=tmp_path).run(quiet=True, trim=True)
         'fatal: not a git repository (or any of the parent directories): .git'
 
-        >>> GitRemoteManager(
-        ...     path=example_git_repo.path
-        ... ).run(trim=True)
-        'origin'
+        >>> GitStashCmd(path=example_git_repo.path).run(quiet=True)
+        ''
         """
         #: Directory to check out
         self.path: pathlib.Path
@@ -4249,302 +8328,249 @@ class GitRemoteManager:
         self.cmd = cmd if isinstance(cmd, Git) else Git(path=self.path)
 
     def __repr__(self) -> str:
-        """Representation of git remote manager object."""
-        return f"<GitRemoteManager path={self.path}>"
+        """Representation of git stash storage command object."""
+        return f"<GitStashCmd path={self.path}>"
 
     def run(
         self,
-        command: GitRemoteManagerLiteral | None = None,
+        command: GitStashCommandLiteral | None = None,
         local_flags: list[str] | None = None,
         *,
+        quiet: bool | None = None,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
         **kwargs: t.Any,
     ) -> str:
-        """Run a command against a git repository's remotes.
+        """Run a command against a git repository's stash storage.
 
-        Wraps `git remote <https://git-scm.com/docs/git-remote>`_.
+        Wraps `git stash <https://git-scm.com/docs/git-stash>`_.
 
         Examples
         --------
-        >>> GitRemoteManager(path=example_git_repo.path).run(trim=True)
-        'origin'
+        >>> GitStashCmd(path=example_git_repo.path).run(trim=True)
+        'No local changes to save'
         """
         local_flags = local_flags if isinstance(local_flags, list) else []
         if command is not None:
             local_flags.insert(0, command)
 
+        if quiet is True:
+            local_flags.append("--quiet")
+
         return self.cmd.run(
-            ["remote", *local_flags],
+            ["stash", *local_flags],
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
             **kwargs,
         )
 
-    def add(
+    def ls(
         self,
         *,
-        name: str,
-        url: str,
-        fetch: bool | None = None,
-        track: str | None = None,
-        master: str | None = None,
-        mirror: t.Literal["push", "fetch"] | bool | None = None,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
     ) -> str:
-        """Git remote add.
-
-        Examples
-        --------
-        >>> git_remote_repo = create_git_remote_repo()
-        >>> GitRemoteManager(path=example_git_repo.path).add(
-        ...     name='my_remote',
-        ...     url=f'file://{git_remote_repo}'
-        ... )
-        ''
-        """
-        local_flags: list[str] = []
-        required_flags: list[str] = [name, url]
-
-        if fetch is True:
-            local_flags.append("-f")
-        if track is not None:
-            local_flags.extend(["-t", track])
-        if master is not None:
-            local_flags.extend(["-m", master])
-        if mirror is not None:
-            if isinstance(mirror, str):
-                if mirror not in ("push", "fetch"):
-                    msg = "mirror must be 'push' or 'fetch'"
-                    raise ValueError(msg)
-                local_flags.append(f"--mirror={mirror}")
-            elif mirror is True:
-                local_flags.append("--mirror")
+        """Git stash list.
+
+        Examples
+        --------
+        >>> GitStashCmd(path=example_git_repo.path).ls()
+        ''
+        """
         return self.run(
-            "add",
-            local_flags=[*local_flags, "--", *required_flags],
+            "list",
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
         )
 
-    def show(
+    def push(
         self,
         *,
-        name: str | None = None,
-        verbose: bool | None = None,
-        no_query_remotes: bool | None = None,
+        path: list[StrPath] | StrPath | None = None,
+        patch: bool | None = None,
+        staged: bool | None = None,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
         trim: bool = False,
+        **kwargs: t.Any,
     ) -> str:
-        """Git remote show.
+        """Push changes to the stash.
+
+        Wraps `git stash push <https://git-scm.com/docs/git-stash>`_.
+
+        Parameters
+        ----------
+        path :
+            Limit stash to specific path(s).
+        patch :
+            Interactively select hunks to stash.
+        staged :
+            Stash only staged changes.
+        trim : bool, default: False
+            Strip trailing whitespace/newline from command output.
 
         Examples
         --------
-        >>> GitRemoteManager(path=example_git_repo.path).show(trim=True)
-        'origin'
-
-        For the example below, add a remote:
-        >>> GitRemoteManager(path=example_git_repo.path).add(
-        ...     name='my_remote', url=f'file:///dev/null'
-        ... )
-        ''
+        >>> GitStashCmd(path=example_git_repo.path).push(trim=True)
+        'No local changes to save'
 
-        Retrieve a list of remote names:
-        >>> GitRemoteManager(path=example_git_repo.path).show().splitlines()
-        ['my_remote', 'origin']
+        >>> GitStashCmd(path=example_git_repo.path).push(path='.', trim=True)
+        'No local changes to save'
         """
         local_flags: list[str] = []
         required_flags: list[str] = []
 
-        if name is not None:
-            required_flags.append(name)
-
-        if verbose is True:
-            local_flags.append("--verbose")
+        if isinstance(path, list):
+            required_flags.extend(str(p) for p in path)
+        elif path is not None:
+            required_flags.append(str(path))
 
-        if no_query_remotes:
-            local_flags.append("-n")
+        if patch is True:
+            local_flags.append("--patch")
+        if staged is True:
+            local_flags.append("--staged")
 
         return self.run(
-            "show",
+            "push",
             local_flags=[*local_flags, "--", *required_flags],
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
             trim=trim,
         )
 
-    def _ls(self, trim: bool = False) -> str:
-        r"""List remotes (raw output).
+    def pop(
+        self,
+        *,
+        stash: int | None = None,
+        index: bool | None = None,
+        quiet: bool | None = None,
+        # Pass-through to run()
+        log_in_real_time: bool = False,
+        check_returncode: bool | None = None,
+        trim: bool = False,
+        **kwargs: t.Any,
+    ) -> str:
+        """Git stash pop.
 
         Examples
         --------
-        >>> GitRemoteManager(path=example_git_repo.path)._ls(trim=True)
-        'origin\tfile:///... (fetch)\norigin\tfile:///... (push)'
-        """
-        return self.run(
-            "--verbose",
-            trim=trim,
-        )
+        >>> GitStashCmd(path=example_git_repo.path).pop(trim=True)
+        'No stash entries found.'
 
-    def ls(self) -> QueryList[GitRemoteCmd]:
-        """List remotes.
+        >>> GitStashCmd(path=example_git_repo.path).pop(stash=0, trim=True)
+        'error: stash@{0} is not a valid reference'
 
-        Examples
-        --------
-        >>> GitRemoteManager(path=example_git_repo.path).ls()
-        [<GitRemoteCmd path=... remote_name=origin>]
+        >>> GitStashCmd(path=example_git_repo.path).pop(stash=1, index=True, trim=True)
+        'error: stash@{1} is not a valid reference'
 
-        For the example below, add a remote:
-        >>> GitRemoteManager(path=example_git_repo.path).add(
-        ...     name='my_remote', url=f'file:///dev/null'
-        ... )
-        ''
+        >>> GitStashCmd(path=example_git_repo.path).pop(stash=1, quiet=True, trim=True)
+        'error: stash@{1} is not a valid reference'
 
-        >>> GitRemoteManager(path=example_git_repo.path).ls()
-        [<GitRemoteCmd path=... remote_name=my_remote>,
-         <GitRemoteCmd path=... remote_name=origin>]
+        >>> GitStashCmd(path=example_git_repo.path).push(path='.', trim=True)
+        'No local changes to save'
         """
-        remote_str = self._ls()
-        remote_pattern = re.compile(
-            r"""
-            ^                       # Start of line
-            (?P<name>\S+)           # Remote name: one or more non-whitespace characters
-            \s+                     # One or more whitespace characters (tab separator)
-            (?P<url>.+?)            # URL: any characters (non-greedy) - supports spaces
-            \s+                     # One or more whitespace characters
-            \((?P<cmd_type>fetch|push)\)  # 'fetch' or 'push' in parentheses
-            $                       # End of line
-        """,
-            re.VERBOSE | re.MULTILINE,
-        )
-
-        remotes: dict[str, dict[str, str | None]] = {}
-
-        for match_obj in remote_pattern.finditer(remote_str):
-            name = match_obj.group("name")
-            url = match_obj.group("url")
-            cmd_type = match_obj.group("cmd_type")
-
-            if name not in remotes:
-                remotes[name] = {}
-
-            remotes[name][cmd_type] = url
-
-        remote_cmds: list[GitRemoteCmd] = []
-        for name, urls in remotes.items():
-            fetch_url = urls.get("fetch")
-            push_url = urls.get("push")
-            remote_cmds.append(
-                GitRemoteCmd(
-                    path=self.path,
-                    remote_name=name,
-                    fetch_url=fetch_url,
-                    push_url=push_url,
-                ),
-            )
-
-        return QueryList(remote_cmds)
-
-    def get(self, *args: t.Any, **kwargs: t.Any) -> GitRemoteCmd | None:
-        """Get remote via filter lookup.
+        local_flags: list[str] = []
 
-        Examples
-        --------
-        >>> GitRemoteManager(
-        ...     path=example_git_repo.path
-        ... ).get(remote_name='origin')
-        <GitRemoteCmd path=... remote_name=origin>
+        if index is True:
+            local_flags.append("--index")
+        if quiet is True:
+            local_flags.append("--quiet")
+        if stash is not None:
+            local_flags.append(f"stash@{{{stash}}}")
 
-        >>> GitRemoteManager(
-        ...     path=example_git_repo.path
-        ... ).get(remote_name='unknown')
-        Traceback (most recent call last):
-            exec(compile(example.source, filename, "single",
-            ...
-            return self.ls().get(*args, **kwargs)
-                   ^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
-          File "..._internal/query_list.py", line ..., in get
-            raise ObjectDoesNotExist
-        libvcs._internal.query_list.ObjectDoesNotExist
-        """
-        return self.ls().get(*args, **kwargs)
+        return self.run(
+            "pop",
+            local_flags=local_flags,
+            check_returncode=check_returncode,
+            log_in_real_time=log_in_real_time,
+            trim=trim,
+        )
 
-    def filter(self, *args: t.Any, **kwargs: t.Any) -> list[GitRemoteCmd]:
-        """Get remotes via filter lookup.
+    def save(
+        self,
+        *,
+        message: str | None = None,
+        staged: int | None = None,
+        keep_index: int | None = None,
+        patch: bool | None = None,
+        include_untracked: bool | None = None,
+        _all: bool | None = None,
+        quiet: bool | None = None,
+        # Pass-through to run()
+        log_in_real_time: bool = False,
+        check_returncode: bool | None = None,
+        trim: bool = False,
+        **kwargs: t.Any,
+    ) -> str:
+        """Git stash save.
 
         Examples
         --------
-        >>> GitRemoteManager(
-        ...     path=example_git_repo.path
-        ... ).filter(remote_name__contains='origin')
-        [<GitRemoteCmd path=... remote_name=origin>]
+        >>> GitStashCmd(path=example_git_repo.path).save(trim=True)
+        'No local changes to save'
 
-        >>> GitRemoteManager(
-        ...     path=example_git_repo.path
-        ... ).filter(remote_name__contains='unknown')
-        []
+        >>> GitStashCmd(path=example_git_repo.path).save(message="Message", trim=True)
+        'No local changes to save'
         """
-        return self.ls().filter(*args, **kwargs)
-
+        local_flags: list[str] = []
+        stash_flags: list[str] = []
 
-GitStashCommandLiteral = t.Literal[
-    "list",
-    "show",
-    "save",
-    "drop",
-    "branch",
-    "pop",
-    "apply",
-    "push",
-    "clear",
-    "create",
-    "store",
-]
+        if _all is True:
+            local_flags.append("--all")
+        if staged is True:
+            local_flags.append("--staged")
+        if patch is True:
+            local_flags.append("--patch")
+        if include_untracked is True:
+            local_flags.append("--include-untracked")
+        if keep_index is True:
+            local_flags.append("--keep-index")
+        if quiet is True:
+            local_flags.append("--quiet")
 
+        if message is not None:
+            local_flags.extend(["--message", message])
 
-class GitStashEntryCmd:
-    """Run git commands targeting a specific stash entry."""
+        return self.run(
+            "save",
+            local_flags=local_flags + stash_flags,
+            check_returncode=check_returncode,
+            log_in_real_time=log_in_real_time,
+            trim=trim,
+        )
 
-    index: int
-    branch: str | None
-    message: str
+
+class GitStashManager:
+    """Traverse git stashes with :class:`~libvcs._internal.query_list.QueryList`."""
 
     def __init__(
         self,
         *,
         path: StrPath,
-        index: int,
-        branch: str | None = None,
-        message: str = "",
         cmd: Git | None = None,
     ) -> None:
-        r"""Lite, typed, pythonic wrapper for git-stash(1) per-entry operations.
+        """Wrap some of git-stash(1), manager.
 
         Parameters
         ----------
         path :
             Operates as PATH in the corresponding git subcommand.
-        index :
-            Stash index (0 = most recent)
-        branch :
-            Branch the stash was created on
-        message :
-            Stash message
 
         Examples
         --------
-        >>> GitStashEntryCmd(
-        ...     path=example_git_repo.path,
-        ...     index=0,
-        ...     branch='master',
-        ...     message='WIP',
-        ... )
-        <GitStashEntryCmd path=... index=0>
+        >>> GitStashManager(path=tmp_path)
+        <GitStashManager path=...>
+
+        >>> GitStashManager(path=tmp_path).run(trim=True)
+        'fatal: not a git repository (or any of the parent directories): .git'
+
+        >>> GitStashManager(
+        ...     path=example_git_repo.path
+        ... ).run(trim=True)
+        'No local changes to save'
         """
         #: Directory to check out
         self.path: pathlib.Path
@@ -4555,37 +8581,37 @@ class GitStashEntryCmd:
 
         self.cmd = cmd if isinstance(cmd, Git) else Git(path=self.path)
 
-        self.index = index
-        self.branch = branch
-        self.message = message
-
     def __repr__(self) -> str:
-        """Representation of a git stash entry."""
-        return f"<GitStashEntryCmd path={self.path} index={self.index}>"
-
-    @property
-    def stash_ref(self) -> str:
-        """Return the stash reference string."""
-        return f"stash@{{{self.index}}}"
+        """Representation of git stash manager object."""
+        return f"<GitStashManager path={self.path}>"
 
     def run(
         self,
         command: GitStashCommandLiteral | None = None,
         local_flags: list[str] | None = None,
         *,
+        quiet: bool | None = None,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
         **kwargs: t.Any,
     ) -> str:
-        r"""Run command against a git stash entry.
+        """Run a command against a git repository's stash storage.
 
         Wraps `git stash <https://git-scm.com/docs/git-stash>`_.
+
+        Examples
+        --------
+        >>> GitStashManager(path=example_git_repo.path).run(trim=True)
+        'No local changes to save'
         """
         local_flags = local_flags if isinstance(local_flags, list) else []
         if command is not None:
             local_flags.insert(0, command)
 
+        if quiet is True:
+            local_flags.append("--quiet")
+
         return self.cmd.run(
             ["stash", *local_flags],
             check_returncode=check_returncode,
@@ -4593,484 +8619,573 @@ class GitStashEntryCmd:
             **kwargs,
         )
 
-    def show(
+    def push(
         self,
         *,
-        stat: bool | None = None,
+        message: str | None = None,
+        path: list[StrPath] | StrPath | None = None,
         patch: bool | None = None,
+        staged: bool | None = None,
+        keep_index: bool | None = None,
         include_untracked: bool | None = None,
+        _all: bool | None = None,
+        quiet: bool | None = None,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
         trim: bool = False,
     ) -> str:
-        """Git stash show for this stash entry.
+        """Git stash push.
+
+        Save local modifications to a new stash entry.
 
         Parameters
         ----------
-        stat :
-            Show diffstat (--stat)
+        message :
+            Stash message
+        path :
+            Limit stash to specific paths
         patch :
-            Show patch (-p)
+            Interactive patch selection (-p)
+        staged :
+            Stash only staged changes (-S)
+        keep_index :
+            Keep index intact (-k)
         include_untracked :
             Include untracked files (-u)
+        _all :
+            Include ignored files (-a)
+        quiet :
+            Suppress output (-q)
         trim : bool, default: False
             Strip trailing whitespace/newline from command output.
 
         Examples
         --------
-        >>> GitStashEntryCmd(
-        ...     path=example_git_repo.path,
-        ...     index=0,
-        ... ).show(trim=True)
-        'error: stash@{0} is not a valid reference'
+        >>> GitStashManager(path=example_git_repo.path).push(trim=True)
+        'No local changes to save'
+
+        >>> GitStashManager(path=example_git_repo.path).push(message='WIP', trim=True)
+        'No local changes to save'
         """
         local_flags: list[str] = []
+        path_flags: list[str] = []
 
-        if stat is True:
-            local_flags.append("--stat")
+        if message is not None:
+            local_flags.extend(["-m", message])
         if patch is True:
             local_flags.append("-p")
+        if staged is True:
+            local_flags.append("-S")
+        if keep_index is True:
+            local_flags.append("-k")
         if include_untracked is True:
             local_flags.append("-u")
+        if _all is True:
+            local_flags.append("-a")
+        if quiet is True:
+            local_flags.append("-q")
+
+        if path is not None:
+            if isinstance(path, list):
+                path_flags.extend(str(pathlib.Path(p).absolute()) for p in path)
+            else:
+                path_flags.append(str(pathlib.Path(path).absolute()))
+
+        if path_flags:
+            local_flags.extend(["--", *path_flags])
+
+        return self.run(
+            "push",
+            local_flags=local_flags,
+            check_returncode=check_returncode,
+            log_in_real_time=log_in_real_time,
+            trim=trim,
+        )
+
+    def clear(
+        self,
+        *,
+        # Pass-through to run()
+        log_in_real_time: bool = False,
+        check_returncode: bool | None = None,
+    ) -> str:
+        """Git stash clear.
+
+        Remove all stash entries.
+
+        Examples
+        --------
+        >>> GitStashManager(path=example_git_repo.path).clear()
+        ''
+        """
+        return self.run(
+            "clear",
+            check_returncode=check_returncode,
+            log_in_real_time=log_in_real_time,
+        )
+
+    def _ls(self) -> list[dict[str, t.Any]]:
+        r"""Parse stash list into structured data with one ``git stash list``.
+
+        Uses ``-z`` and a NUL-separated ``--format``, so messages containing
+        colons or newlines parse intact. Output is parsed as git streams it,
+        so long stash lists are never buffered whole.
+
+        Examples
+        --------
+        >>> GitStashManager(path=example_git_repo.path)._ls()
+        []
+        """
+        records = split_records(
+            self.cmd.stream(
+                [
+                    "stash",
+                    "list",
+                    "-z",
+                    "--format=%gd%x00%H%x00%P%x00%ct%x00%gs",
+                ],
+            ),
+        )
+
+        stashes: list[dict[str, t.Any]] = []
+        for selector in records:
+            if not selector:
+                continue
+            oid = next(records, "")
+            parents = next(records, "")
+            committer_time = next(records, "")
+            subject = next(records, "")
+
+            # Subject: "On <branch>: <message>" or "WIP on <branch>: <message>"
+            branch: str | None = None
+            message = subject
+            head, sep, rest = subject.partition(": ")
+            for prefix in ("On ", "WIP on "):
+                if sep and head.startswith(prefix):
+                    branch = head[len(prefix) :]
+                    message = rest
+
+            stashes.append(
+                {
+                    "index": int(selector[len("stash@{") : -1]),
+                    "oid": oid,
+                    "parents": tuple(parents.split()),
+                    "timestamp": datetime.datetime.fromtimestamp(
+                        int(committer_time),
+                        tz=datetime.timezone.utc,
+                    )
+                    if committer_time
+                    else None,
+                    "branch": branch,
+                    "message": message,
+                },
+            )
+        return stashes
+
+    def ls(self) -> QueryList[GitStashEntryCmd]:
+        """List stashes.
+
+        Returns a :class:`~libvcs._internal.query_list.QueryList` of
+        :class:`~libvcs.cmd.git.GitStashEntryCmd` objects.
+
+        Examples
+        --------
+        >>> GitStashManager(path=example_git_repo.path).ls()
+        []
+
+        >>> pathlib.Path(example_git_repo.path / 'file.txt').write_text('x')
+        1
+        >>> GitStashManager(path=example_git_repo.path).push(
+        ...     message='wip: parser', include_untracked=True
+        ... )
+        'Saved working directory and index state On master: wip: parser...'
+        >>> stash = GitStashManager(path=example_git_repo.path).ls()[0]
+        >>> stash.branch, stash.message, len(stash.parents)
+        ('master', 'wip: parser', 3)
+        """
+        return QueryList(
+            [
+                GitStashEntryCmd(path=self.path, cmd=self.cmd, **data)
+                for data in self._ls()
+            ],
+        )
+
+    def get(self, *args: t.Any, **kwargs: t.Any) -> GitStashEntryCmd | None:
+        """Get stash entry via filter lookup.
+
+        Examples
+        --------
+        >>> GitStashManager(
+        ...     path=example_git_repo.path
+        ... ).get(index=0)
+        Traceback (most recent call last):
+            exec(compile(example.source, filename, "single",
+            ...
+            return self.ls().get(*args, **kwargs)
+                   ^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+          File "..._internal/query_list.py", line ..., in get
+            raise ObjectDoesNotExist
+        libvcs._internal.query_list.ObjectDoesNotExist
+        """
+        return self.ls().get(*args, **kwargs)
+
+    def filter(self, *args: t.Any, **kwargs: t.Any) -> list[GitStashEntryCmd]:
+        """Get stash entries via filter lookup.
+
+        Examples
+        --------
+        >>> GitStashManager(
+        ...     path=example_git_repo.path
+        ... ).filter(branch__contains='master')
+        []
+        """
+        return self.ls().filter(*args, **kwargs)
+
+
+class GitBranchCmd:
+    """Run git commands targeting a specific branch."""
+
+    branch_name: str
+
+    def __init__(
+        self,
+        *,
+        path: StrPath,
+        branch_name: str,
+        cmd: Git | None = None,
+    ) -> None:
+        """Lite, typed, pythonic wrapper for git-branch(1).
+
+        Parameters
+        ----------
+        path :
+            Operates as PATH in the corresponding git subcommand.
+        branch_name:
+            Name of branch.
+
+        Examples
+        --------
+        >>> GitBranchCmd(
+        ...     path=tmp_path,
+        ...     branch_name='master'
+        ... )
+        <GitBranchCmd path=... branch_name=master>
+
+        >>> GitBranchCmd(
+        ...     path=tmp_path,
+        ...     branch_name='master'
+        ... ).run(quiet=True, trim=True)
+        'fatal: not a git repository (or any of the parent directories): .git'
+
+        >>> GitBranchCmd(
+        ...     path=example_git_repo.path,
+        ...     branch_name='master'
+        ... ).run(quiet=True, trim=True)
+        '* master'
+        """
+        #: Directory to check out
+        self.path: pathlib.Path
+        if isinstance(path, pathlib.Path):
+            self.path = path
+        else:
+            self.path = pathlib.Path(path)
 
-        local_flags.append(self.stash_ref)
+        self.cmd = cmd if isinstance(cmd, Git) else Git(path=self.path)
 
-        return self.run(
-            "show",
-            local_flags=local_flags,
-            check_returncode=check_returncode,
-            log_in_real_time=log_in_real_time,
-            trim=trim,
-        )
+        self.branch_name = branch_name
 
-    def apply(
+    def __repr__(self) -> str:
+        """Representation of git branch command object."""
+        return f"<GitBranchCmd path={self.path} branch_name={self.branch_name}>"
+
+    def run(
         self,
+        local_flags: list[str] | None = None,
         *,
-        index: bool | None = None,
         quiet: bool | None = None,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
-        trim: bool = False,
+        **kwargs: t.Any,
     ) -> str:
-        """Git stash apply for this stash entry.
-
-        Apply the stash without removing it from the stash list.
+        """Run a command against a git repository's branch.
 
-        Parameters
-        ----------
-        index :
-            Try to reinstate not only the working tree but also the index (--index)
-        quiet :
-            Suppress output (-q)
-        trim : bool, default: False
-            Strip trailing whitespace/newline from command output.
+        Wraps `git branch <https://git-scm.com/docs/git-branch>`_.
 
         Examples
         --------
-        >>> GitStashEntryCmd(
+        >>> GitBranchCmd(
         ...     path=example_git_repo.path,
-        ...     index=0,
-        ... ).apply(trim=True)
-        'error: stash@{0} is not a valid reference'
+        ...     branch_name='master'
+        ... ).run(trim=True)
+        '* master'
         """
-        local_flags: list[str] = []
+        local_flags = local_flags if isinstance(local_flags, list) else []
 
-        if index is True:
-            local_flags.append("--index")
         if quiet is True:
-            local_flags.append("-q")
-
-        local_flags.append(self.stash_ref)
+            local_flags.append("--quiet")
 
-        return self.run(
-            "apply",
-            local_flags=local_flags,
+        return self.cmd.run(
+            ["branch", *local_flags],
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
-            trim=trim,
+            **kwargs,
         )
 
-    def pop(
-        self,
-        *,
-        index: bool | None = None,
-        quiet: bool | None = None,
-        # Pass-through to run()
-        log_in_real_time: bool = False,
-        check_returncode: bool | None = None,
-        trim: bool = False,
-    ) -> str:
-        """Git stash pop for this stash entry.
-
-        Apply the stash and remove it from the stash list.
-
-        Parameters
-        ----------
-        index :
-            Try to reinstate not only the working tree but also the index (--index)
-        quiet :
-            Suppress output (-q)
-        trim : bool, default: False
-            Strip trailing whitespace/newline from command output.
+    def checkout(self, trim: bool = False) -> str:
+        """Git branch checkout.
 
         Examples
         --------
-        >>> GitStashEntryCmd(
+        >>> GitBranchCmd(
         ...     path=example_git_repo.path,
-        ...     index=0,
-        ... ).pop(trim=True)
-        'error: stash@{0} is not a valid reference'
+        ...     branch_name='master'
+        ... ).checkout(trim=True)
+        "Your branch is up to date with 'origin/master'."
         """
-        local_flags: list[str] = []
-
-        if index is True:
-            local_flags.append("--index")
-        if quiet is True:
-            local_flags.append("-q")
-
-        local_flags.append(self.stash_ref)
-
-        return self.run(
-            "pop",
-            local_flags=local_flags,
-            check_returncode=check_returncode,
-            log_in_real_time=log_in_real_time,
+        return self.cmd.run(
+            [
+                "checkout",
+                *[self.branch_name],
+            ],
             trim=trim,
         )
 
-    def drop(
+    def create(
         self,
         *,
-        quiet: bool | None = None,
-        # Pass-through to run()
-        log_in_real_time: bool = False,
-        check_returncode: bool | None = None,
+        checkout: bool = False,
         trim: bool = False,
     ) -> str:
-        """Git stash drop for this stash entry.
-
-        Remove this stash from the stash list.
+        """Create a git branch.
 
         Parameters
         ----------
-        quiet :
-            Suppress output (-q)
+        checkout :
+            If True, also checkout the newly created branch.
+            Defaults to False (create only, don't switch HEAD).
         trim : bool, default: False
             Strip trailing whitespace/newline from command output.
 
         Examples
         --------
-        >>> GitStashEntryCmd(
+        >>> GitBranchCmd(
         ...     path=example_git_repo.path,
-        ...     index=0,
-        ... ).drop(trim=True)
-        'error: stash@{0} is not a valid reference'
+        ...     branch_name='master'
+        ... ).create(trim=True)
+        "fatal: a branch named 'master' already exists"
         """
-        local_flags: list[str] = []
-
-        if quiet is True:
-            local_flags.append("-q")
-
-        local_flags.append(self.stash_ref)
-
-        return self.run(
-            "drop",
-            local_flags=local_flags,
-            check_returncode=check_returncode,
-            log_in_real_time=log_in_real_time,
+        result = self.cmd.run(
+            ["branch", self.branch_name],
+            check_returncode=False,
             trim=trim,
         )
+        if checkout and "fatal" not in result.lower():
+            self.cmd.run(["checkout", self.branch_name])
+        return result
 
-    def create_branch(
+    def delete(
         self,
-        branch_name: str,
         *,
+        force: bool = False,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
         trim: bool = False,
     ) -> str:
-        """Git stash branch for this stash entry.
-
-        Create a new branch from this stash entry and apply the stash.
+        """Delete this git branch.
 
         Parameters
         ----------
-        branch_name :
-            Name of the branch to create
+        force :
+            Use ``-D`` instead of ``-d`` to force deletion.
         trim : bool, default: False
             Strip trailing whitespace/newline from command output.
 
         Examples
         --------
-        >>> GitStashEntryCmd(
+        >>> GitBranchCmd(
         ...     path=example_git_repo.path,
-        ...     index=0,
-        ... ).create_branch('new-branch', trim=True)
-        'error: stash@{0} is not a valid reference'
+        ...     branch_name='nonexistent'
+        ... ).delete(trim=True)
+        "error: branch 'nonexistent' not found"
         """
-        local_flags: list[str] = [branch_name, self.stash_ref]
-
-        return self.run(
-            "branch",
-            local_flags=local_flags,
+        flag = "-D" if force else "-d"
+        return self.cmd.run(
+            ["branch", flag, self.branch_name],
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
             trim=trim,
         )
 
-
-class GitStashCmd:
-    """Run git stash commands (low-level, use :class:`GitStashManager`)."""
-
-    def __init__(self, *, path: StrPath, cmd: Git | None = None) -> None:
-        """Lite, typed, pythonic wrapper for git-stash(1).
-
-        Parameters
-        ----------
-        path :
-            Operates as PATH in the corresponding git subcommand.
-
-        Examples
-        --------
-        >>> GitStashCmd(path=tmp_path)
-        <GitStashCmd path=...>
-
-        >>> GitStashCmd(path=tmp_path).run(quiet=True, trim=True)
-        'fatal: not a git repository (or any of the parent directories): .git'
-
-        >>> GitStashCmd(path=example_git_repo.path).run(quiet=True)
-        ''
-        """
-        #: Directory to check out
-        self.path: pathlib.Path
-        if isinstance(path, pathlib.Path):
-            self.path = path
-        else:
-            self.path = pathlib.Path(path)
-
-        self.cmd = cmd if isinstance(cmd, Git) else Git(path=self.path)
-
-    def __repr__(self) -> str:
-        """Representation of git stash storage command object."""
-        return f"<GitStashCmd path={self.path}>"
-
-    def run(
+    def rename(
         self,
-        command: GitStashCommandLiteral | None = None,
-        local_flags: list[str] | None = None,
+        new_name: str,
         *,
-        quiet: bool | None = None,
+        force: bool = False,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
-        **kwargs: t.Any,
     ) -> str:
-        """Run a command against a git repository's stash storage.
+        """Rename this git branch.
 
-        Wraps `git stash <https://git-scm.com/docs/git-stash>`_.
+        Parameters
+        ----------
+        new_name :
+            New name for the branch.
+        force :
+            Use ``-M`` instead of ``-m`` to force rename.
 
         Examples
         --------
-        >>> GitStashCmd(path=example_git_repo.path).run(trim=True)
-        'No local changes to save'
+        >>> GitBranchCmd(
+        ...     path=example_git_repo.path,
+        ...     branch_name='master'
+        ... ).rename('main')
+        ''
         """
-        local_flags = local_flags if isinstance(local_flags, list) else []
-        if command is not None:
-            local_flags.insert(0, command)
-
-        if quiet is True:
-            local_flags.append("--quiet")
-
+        flag = "-M" if force else "-m"
         return self.cmd.run(
-            ["stash", *local_flags],
+            ["branch", flag, self.branch_name, new_name],
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
-            **kwargs,
         )
 
-    def ls(
+    def copy(
         self,
+        new_name: str,
         *,
+        force: bool = False,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
     ) -> str:
-        """Git stash list.
+        """Copy this git branch.
+
+        Parameters
+        ----------
+        new_name :
+            Name for the copied branch.
+        force :
+            Use ``-C`` instead of ``-c`` to force copy.
 
         Examples
         --------
-        >>> GitStashCmd(path=example_git_repo.path).ls()
+        >>> GitBranchCmd(
+        ...     path=example_git_repo.path,
+        ...     branch_name='master'
+        ... ).copy('master-copy')
         ''
         """
-        return self.run(
-            "list",
+        flag = "-C" if force else "-c"
+        return self.cmd.run(
+            ["branch", flag, self.branch_name, new_name],
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
         )
 
-    def push(
+    def set_upstream(
         self,
+        upstream: str,
         *,
-        path: list[StrPath] | StrPath | None = None,
-        patch: bool | None = None,
-        staged: bool | None = None,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
         trim: bool = False,
-        **kwargs: t.Any,
     ) -> str:
-        """Push changes to the stash.
-
-        Wraps `git stash push <https://git-scm.com/docs/git-stash>`_.
+        """Set the upstream (tracking) branch.
 
         Parameters
         ----------
-        path :
-            Limit stash to specific path(s).
-        patch :
-            Interactively select hunks to stash.
-        staged :
-            Stash only staged changes.
+        upstream :
+            The upstream branch in format ``remote/branch`` (e.g., ``origin/main``).
         trim : bool, default: False
             Strip trailing whitespace/newline from command output.
 
         Examples
         --------
-        >>> GitStashCmd(path=example_git_repo.path).push(trim=True)
-        'No local changes to save'
-
-        >>> GitStashCmd(path=example_git_repo.path).push(path='.', trim=True)
-        'No local changes to save'
+        >>> GitBranchCmd(
+        ...     path=example_git_repo.path,
+        ...     branch_name='master'
+        ... ).set_upstream('origin/master', trim=True)
+        "branch 'master' set up to track 'origin/master'."
         """
-        local_flags: list[str] = []
-        required_flags: list[str] = []
-
-        if isinstance(path, list):
-            required_flags.extend(str(p) for p in path)
-        elif path is not None:
-            required_flags.append(str(path))
-
-        if patch is True:
-            local_flags.append("--patch")
-        if staged is True:
-            local_flags.append("--staged")
-
-        return self.run(
-            "push",
-            local_flags=[*local_flags, "--", *required_flags],
+        return self.cmd.run(
+            ["branch", f"--set-upstream-to={upstream}", self.branch_name],
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
             trim=trim,
         )
 
-    def pop(
+    def unset_upstream(
         self,
         *,
-        stash: int | None = None,
-        index: bool | None = None,
-        quiet: bool | None = None,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
-        trim: bool = False,
-        **kwargs: t.Any,
     ) -> str:
-        """Git stash pop.
+        """Remove the upstream (tracking) information.
 
         Examples
         --------
-        >>> GitStashCmd(path=example_git_repo.path).pop(trim=True)
-        'No stash entries found.'
-
-        >>> GitStashCmd(path=example_git_repo.path).pop(stash=0, trim=True)
-        'error: stash@{0} is not a valid reference'
-
-        >>> GitStashCmd(path=example_git_repo.path).pop(stash=1, index=True, trim=True)
-        'error: stash@{1} is not a valid reference'
-
-        >>> GitStashCmd(path=example_git_repo.path).pop(stash=1, quiet=True, trim=True)
-        'error: stash@{1} is not a valid reference'
-
-        >>> GitStashCmd(path=example_git_repo.path).push(path='.', trim=True)
-        'No local changes to save'
+        >>> GitBranchCmd(
+        ...     path=example_git_repo.path,
+        ...     branch_name='master'
+        ... ).unset_upstream()
+        ''
         """
-        local_flags: list[str] = []
-
-        if index is True:
-            local_flags.append("--index")
-        if quiet is True:
-            local_flags.append("--quiet")
-        if stash is not None:
-            local_flags.append(f"stash@{{{stash}}}")
-
-        return self.run(
-            "pop",
-            local_flags=local_flags,
+        return self.cmd.run(
+            ["branch", "--unset-upstream", self.branch_name],
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
-            trim=trim,
         )
 
-    def save(
+    def track(
         self,
+        remote_branch: str,
         *,
-        message: str | None = None,
-        staged: int | None = None,
-        keep_index: int | None = None,
-        patch: bool | None = None,
-        include_untracked: bool | None = None,
-        _all: bool | None = None,
-        quiet: bool | None = None,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
         trim: bool = False,
-        **kwargs: t.Any,
     ) -> str:
-        """Git stash save.
+        """Create branch tracking a remote branch.
+
+        Wraps `git branch -t <https://git-scm.com/docs/git-branch>`_.
+
+        Parameters
+        ----------
+        remote_branch :
+            Remote branch to track (e.g., 'origin/main').
+        trim : bool, default: False
+            Strip trailing whitespace/newline from command output.
 
         Examples
         --------
-        >>> GitStashCmd(path=example_git_repo.path).save(trim=True)
-        'No local changes to save'
+        For existing branches, use
+        :meth:`~libvcs.cmd.git.GitBranchCmd.set_upstream` instead.
+        :meth:`~libvcs.cmd.git.GitBranchCmd.track` is for creating new
+        branches that track a remote:
 
-        >>> GitStashCmd(path=example_git_repo.path).save(message="Message", trim=True)
-        'No local changes to save'
+        >>> GitBranchCmd(
+        ...     path=example_git_repo.path,
+        ...     branch_name='tracking-branch'
+        ... ).track('origin/master', trim=True)
+        "branch 'tracking-branch' set up to track 'origin/master'."
         """
-        local_flags: list[str] = []
-        stash_flags: list[str] = []
-
-        if _all is True:
-            local_flags.append("--all")
-        if staged is True:
-            local_flags.append("--staged")
-        if patch is True:
-            local_flags.append("--patch")
-        if include_untracked is True:
-            local_flags.append("--include-untracked")
-        if keep_index is True:
-            local_flags.append("--keep-index")
-        if quiet is True:
-            local_flags.append("--quiet")
-
-        if message is not None:
-            local_flags.extend(["--message", message])
-
-        return self.run(
-            "save",
-            local_flags=local_flags + stash_flags,
+        return self.cmd.run(
+            ["branch", "-t", self.branch_name, remote_branch],
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
             trim=trim,
         )
 
 
-class GitStashManager:
-    """Traverse git stashes with :class:`~libvcs._internal.query_list.QueryList`."""
+class GitBranchManager:
+    """Traverse git branches with :class:`~libvcs._internal.query_list.QueryList`."""
+
+    branch_name: str
 
     def __init__(
         self,
@@ -5078,7 +9193,7 @@ class GitStashManager:
         path: StrPath,
         cmd: Git | None = None,
     ) -> None:
-        """Wrap some of git-stash(1), manager.
+        """Wrap some of git-branch(1), git-checkout(1), manager.
 
         Parameters
         ----------
@@ -5087,16 +9202,15 @@ class GitStashManager:
 
         Examples
         --------
-        >>> GitStashManager(path=tmp_path)
-        <GitStashManager path=...>
+        >>> GitBranchManager(path=tmp_path)
+        <GitBranchManager path=...>
 
-        >>> GitStashManager(path=tmp_path).run(trim=True)
+        >>> GitBranchManager(path=tmp_path).run(quiet=True, trim=True)
         'fatal: not a git repository (or any of the parent directories): .git'
 
-        >>> GitStashManager(
-        ...     path=example_git_repo.path
-        ... ).run(trim=True)
-        'No local changes to save'
+        >>> GitBranchManager(
+        ...     path=example_git_repo.path).run(quiet=True, trim=True)
+        '* master'
         """
         #: Directory to check out
         self.path: pathlib.Path
@@ -5108,231 +9222,195 @@ class GitStashManager:
         self.cmd = cmd if isinstance(cmd, Git) else Git(path=self.path)
 
     def __repr__(self) -> str:
-        """Representation of git stash manager object."""
-        return f"<GitStashManager path={self.path}>"
+        """Representation of git branch manager object."""
+        return f"<GitBranchManager path={self.path}>"
 
     def run(
         self,
-        command: GitStashCommandLiteral | None = None,
         local_flags: list[str] | None = None,
         *,
         quiet: bool | None = None,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
-        **kwargs: t.Any,
-    ) -> str:
-        """Run a command against a git repository's stash storage.
-
-        Wraps `git stash <https://git-scm.com/docs/git-stash>`_.
-
-        Examples
-        --------
-        >>> GitStashManager(path=example_git_repo.path).run(trim=True)
-        'No local changes to save'
-        """
-        local_flags = local_flags if isinstance(local_flags, list) else []
-        if command is not None:
-            local_flags.insert(0, command)
-
-        if quiet is True:
-            local_flags.append("--quiet")
-
-        return self.cmd.run(
-            ["stash", *local_flags],
-            check_returncode=check_returncode,
-            log_in_real_time=log_in_real_time,
-            **kwargs,
-        )
-
-    def push(
-        self,
-        *,
-        message: str | None = None,
-        path: list[StrPath] | StrPath | None = None,
-        patch: bool | None = None,
-        staged: bool | None = None,
-        keep_index: bool | None = None,
-        include_untracked: bool | None = None,
-        _all: bool | None = None,
-        quiet: bool | None = None,
-        # Pass-through to run()
-        log_in_real_time: bool = False,
-        check_returncode: bool | None = None,
-        trim: bool = False,
-    ) -> str:
-        """Git stash push.
-
-        Save local modifications to a new stash entry.
-
-        Parameters
-        ----------
-        message :
-            Stash message
-        path :
-            Limit stash to specific paths
-        patch :
-            Interactive patch selection (-p)
-        staged :
-            Stash only staged changes (-S)
-        keep_index :
-            Keep index intact (-k)
-        include_untracked :
-            Include untracked files (-u)
-        _all :
-            Include ignored files (-a)
-        quiet :
-            Suppress output (-q)
-        trim : bool, default: False
-            Strip trailing whitespace/newline from command output.
+        **kwargs: t.Any,
+    ) -> str:
+        """Run a command against a git repository's branches.
+
+        Wraps `git branch <https://git-scm.com/docs/git-branch>`_.
 
         Examples
         --------
-        >>> GitStashManager(path=example_git_repo.path).push(trim=True)
-        'No local changes to save'
-
-        >>> GitStashManager(path=example_git_repo.path).push(message='WIP', trim=True)
-        'No local changes to save'
+        >>> GitBranchManager(path=example_git_repo.path).run(trim=True)
+        '* master'
         """
-        local_flags: list[str] = []
-        path_flags: list[str] = []
+        local_flags = local_flags if isinstance(local_flags, list) else []
 
-        if message is not None:
-            local_flags.extend(["-m", message])
-        if patch is True:
-            local_flags.append("-p")
-        if staged is True:
-            local_flags.append("-S")
-        if keep_index is True:
-            local_flags.append("-k")
-        if include_untracked is True:
-            local_flags.append("-u")
-        if _all is True:
-            local_flags.append("-a")
         if quiet is True:
-            local_flags.append("-q")
-
-        if path is not None:
-            if isinstance(path, list):
-                path_flags.extend(str(pathlib.Path(p).absolute()) for p in path)
-            else:
-                path_flags.append(str(pathlib.Path(path).absolute()))
-
-        if path_flags:
-            local_flags.extend(["--", *path_flags])
+            local_flags.append("--quiet")
 
-        return self.run(
-            "push",
-            local_flags=local_flags,
+        return self.cmd.run(
+            ["branch", *local_flags],
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
+            **kwargs,
+        )
+
+    def checkout(self, *, branch: str, trim: bool = False) -> str:
+        """Git branch checkout.
+
+        Examples
+        --------
+        >>> branch_mgr = GitBranchManager(path=example_git_repo.path)
+        >>> branch_mgr.checkout(branch='master', trim=True)
+        "Your branch is up to date with 'origin/master'."
+        """
+        return self.cmd.run(
+            [
+                "checkout",
+                *[branch],
+            ],
             trim=trim,
         )
 
-    def clear(
+    def create(
         self,
         *,
-        # Pass-through to run()
-        log_in_real_time: bool = False,
-        check_returncode: bool | None = None,
+        branch: str,
+        checkout: bool = False,
+        trim: bool = False,
     ) -> str:
-        """Git stash clear.
+        """Create a git branch.
 
-        Remove all stash entries.
+        Parameters
+        ----------
+        branch :
+            Name of the branch to create.
+        checkout :
+            If True, also checkout the newly created branch.
+            Defaults to False (create only, don't switch HEAD).
+        trim : bool, default: False
+            Strip trailing whitespace/newline from command output.
 
         Examples
         --------
-        >>> GitStashManager(path=example_git_repo.path).clear()
-        ''
+        >>> branch_mgr = GitBranchManager(path=example_git_repo.path)
+        >>> branch_mgr.create(branch='master', trim=True)
+        "fatal: a branch named 'master' already exists"
         """
-        return self.run(
-            "clear",
-            check_returncode=check_returncode,
-            log_in_real_time=log_in_real_time,
+        result = self.cmd.run(
+            ["branch", branch],
+            check_returncode=False,
+            trim=trim,
         )
+        if checkout and "fatal" not in result.lower():
+            self.cmd.run(["checkout", branch])
+        return result
 
-    def _ls(self) -> list[str]:
-        r"""List stashes (raw output).
+    def _ls(
+        self,
+        *,
+        local_flags: list[str] | None = None,
+    ) -> list[str]:
+        """List branches (raw output).
+
+        Parameters
+        ----------
+        local_flags :
+            Additional flags to pass to git branch.
 
         Examples
         --------
-        >>> GitStashManager(path=example_git_repo.path)._ls()
-        []
+        >>> branches = GitBranchManager(path=example_git_repo.path)._ls()
+        >>> '* master' in branches or 'master' in str(branches)
+        True
         """
-        result = self.run("list")
-        if not result:
-            return []
-        return result.splitlines()
-
-    def ls(self) -> QueryList[GitStashEntryCmd]:
-        """List stashes.
+        flags = ["--list"]
+        if local_flags:
+            flags.extend(local_flags)
+        return self.cmd._query(["branch", *flags]).splitlines()
 
-        Returns a :class:`~libvcs._internal.query_list.QueryList` of
-        :class:`~libvcs.cmd.git.GitStashEntryCmd` objects.
+    def ls(
+        self,
+        *,
+        _all: bool = False,
+        remotes: bool = False,
+        merged: str | None = None,
+        no_merged: str | None = None,
+        contains: str | None = None,
+        sort: str | None = None,
+        verbose: bool = False,
+    ) -> QueryList[GitBranchCmd]:
+        """List branches.
 
-        Parses stash list format:
-        - ``stash@{0}: On master: message``
-        - ``stash@{0}: WIP on master: commit``
+        Parameters
+        ----------
+        _all :
+            List all branches (local + remote). Maps to --all.
+        remotes :
+            List remote branches only. Maps to --remotes.
+        merged :
+            Only list branches merged into specified commit.
+        no_merged :
+            Only list branches NOT merged into specified commit.
+        contains :
+            Only list branches containing specified commit.
+        sort :
+            Sort key (e.g., '-committerdate', 'refname').
+        verbose :
+            Show sha1 and commit subject line for each head. Maps to --verbose.
 
         Examples
         --------
-        >>> GitStashManager(path=example_git_repo.path).ls()
-        []
+        >>> branches = GitBranchManager(path=example_git_repo.path).ls()
+        >>> any(b.branch_name == 'master' for b in branches)
+        True
         """
-        stash_lines = self._ls()
+        local_flags: list[str] = []
+        if _all:
+            local_flags.append("--all")
+        if remotes:
+            local_flags.append("--remotes")
+        if merged is not None:
+            local_flags.extend(["--merged", merged])
+        if no_merged is not None:
+            local_flags.extend(["--no-merged", no_merged])
+        if contains is not None:
+            local_flags.extend(["--contains", contains])
+        if sort is not None:
+            local_flags.extend(["--sort", sort])
+        if verbose:
+            local_flags.append("--verbose")
 
-        # Parse stash list output
-        # Format: stash@{N}: On <branch>: <message>
-        # Or: stash@{N}: WIP on <branch>: <commit_msg>
-        stash_pattern = re.compile(
-            r"""
-            stash@\{(?P<index>\d+)\}:\s+
-            (?:
-                On\s+(?P<branch1>[^:]+):\s+(?P<message1>.+)
-                |
-                WIP\s+on\s+(?P<branch2>[^:]+):\s+(?P<message2>.+)
-            )
-        """,
-            re.VERBOSE,
-        )
-
-        stash_entries: list[GitStashEntryCmd] = []
-        for line in stash_lines:
-            match = stash_pattern.match(line)
-            if match:
-                index = int(match.group("index"))
-                branch = match.group("branch1") or match.group("branch2")
-                message = match.group("message1") or match.group("message2") or ""
-                stash_entries.append(
-                    GitStashEntryCmd(
-                        path=self.path,
-                        index=index,
-                        branch=branch,
-                        message=message,
-                    ),
-                )
-            else:
-                # Fallback: try to parse index at minimum
-                index_match = re.match(r"stash@\{(\d+)\}", line)
-                if index_match:
-                    stash_entries.append(
-                        GitStashEntryCmd(
-                            path=self.path,
-                            index=int(index_match.group(1)),
-                            message=line,
-                        ),
-                    )
+        def extract_branch_name(line: str) -> str:
+            """Extract branch name from output line (handles verbose output)."""
+            # Strip leading "* " or "  " marker
+            name = line.lstrip("* ")
+            # With --verbose, format is: "name  sha1 message" - take first token
+            if verbose:
+                name = name.split()[0] if name.split() else name
+            return name
 
-        return QueryList(stash_entries)
+        return QueryList(
+            [
+                GitBranchCmd(path=self.path, branch_name=extract_branch_name(line))
+                for line in self._ls(local_flags=local_flags or None)
+            ],
+        )
 
-    def get(self, *args: t.Any, **kwargs: t.Any) -> GitStashEntryCmd | None:
-        """Get stash entry via filter lookup.
+    def get(self, *args: t.Any, **kwargs: t.Any) -> GitBranchCmd | None:
+        """Get branch via filter lookup.
 
         Examples
         --------
-        >>> GitStashManager(
+        >>> GitBranchManager(
         ...     path=example_git_repo.path
-        ... ).get(index=0)
+        ... ).get(branch_name='master')
+        <GitBranchCmd path=... branch_name=master>
+
+        >>> GitBranchManager(
+        ...     path=example_git_repo.path
+        ... ).get(branch_name='unknown')
         Traceback (most recent call last):
             exec(compile(example.source, filename, "single",
             ...
@@ -5344,59 +9422,60 @@ class GitStashManager:
         """
         return self.ls().get(*args, **kwargs)
 
-    def filter(self, *args: t.Any, **kwargs: t.Any) -> list[GitStashEntryCmd]:
-        """Get stash entries via filter lookup.
+    def filter(self, *args: t.Any, **kwargs: t.Any) -> list[GitBranchCmd]:
+        """Get branches via filter lookup.
 
         Examples
         --------
-        >>> GitStashManager(
+        >>> GitBranchManager(
         ...     path=example_git_repo.path
-        ... ).filter(branch__contains='master')
+        ... ).filter(branch_name__contains='master')
+        [<GitBranchCmd path=... branch_name=master>]
+
+        >>> GitBranchManager(
+        ...     path=example_git_repo.path
+        ... ).filter(branch_name__contains='unknown')
         []
         """
         return self.ls().filter(*args, **kwargs)
 
 
-class GitBranchCmd:
-    """Run git commands targeting a specific branch."""
+GitTagCommandLiteral = t.Literal[
+    "list",
+    "create",
+    "delete",
+    "verify",
+]
 
-    branch_name: str
+
+class GitTagCmd:
+    """Run git commands targeting a specific tag."""
+
+    tag_name: str
 
     def __init__(
         self,
         *,
         path: StrPath,
-        branch_name: str,
+        tag_name: str,
         cmd: Git | None = None,
     ) -> None:
-        """Lite, typed, pythonic wrapper for git-branch(1).
+        r"""Lite, typed, pythonic wrapper for git-tag(1).
 
         Parameters
         ----------
         path :
             Operates as PATH in the corresponding git subcommand.
-        branch_name:
-            Name of branch.
+        tag_name :
+            Name of tag
 
         Examples
         --------
-        >>> GitBranchCmd(
-        ...     path=tmp_path,
-        ...     branch_name='master'
-        ... )
-        <GitBranchCmd path=... branch_name=master>
-
-        >>> GitBranchCmd(
-        ...     path=tmp_path,
-        ...     branch_name='master'
-        ... ).run(quiet=True, trim=True)
-        'fatal: not a git repository (or any of the parent directories): .git'
-
-        >>> GitBranchCmd(
+        >>> GitTagCmd(
         ...     path=example_git_repo.path,
-        ...     branch_name='master'
-        ... ).run(quiet=True, trim=True)
-        '* master'
+        ...     tag_name='v1.0.0',
+        ... )
+        <GitTagCmd path=... tag_name=v1.0.0>
         """
         #: Directory to check out
         self.path: pathlib.Path
@@ -5407,299 +9486,156 @@ class GitBranchCmd:
 
         self.cmd = cmd if isinstance(cmd, Git) else Git(path=self.path)
 
-        self.branch_name = branch_name
+        self.tag_name = tag_name
 
     def __repr__(self) -> str:
-        """Representation of git branch command object."""
-        return f"<GitBranchCmd path={self.path} branch_name={self.branch_name}>"
+        """Representation of a git tag for a git repository."""
+        return f"<GitTagCmd path={self.path} tag_name={self.tag_name}>"
 
     def run(
         self,
+        command: GitTagCommandLiteral | None = None,
         local_flags: list[str] | None = None,
         *,
-        quiet: bool | None = None,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
         **kwargs: t.Any,
     ) -> str:
-        """Run a command against a git repository's branch.
+        r"""Run command against a git tag.
 
-        Wraps `git branch <https://git-scm.com/docs/git-branch>`_.
+        Wraps `git tag <https://git-scm.com/docs/git-tag>`_.
 
         Examples
         --------
-        >>> GitBranchCmd(
+        >>> GitTagManager(path=example_git_repo.path).create(
+        ...     name='test-tag', message='Test tag'
+        ... )
+        ''
+        >>> GitTagCmd(
         ...     path=example_git_repo.path,
-        ...     branch_name='master'
-        ... ).run(trim=True)
-        '* master'
+        ...     tag_name='test-tag',
+        ... ).run()
+        '...test-tag...'
         """
         local_flags = local_flags if isinstance(local_flags, list) else []
-
-        if quiet is True:
-            local_flags.append("--quiet")
+        if command is not None:
+            local_flags.insert(0, command)
 
         return self.cmd.run(
-            ["branch", *local_flags],
+            ["tag", *local_flags],
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
             **kwargs,
         )
 
-    def checkout(self, trim: bool = False) -> str:
-        """Git branch checkout.
-
-        Examples
-        --------
-        >>> GitBranchCmd(
-        ...     path=example_git_repo.path,
-        ...     branch_name='master'
-        ... ).checkout(trim=True)
-        "Your branch is up to date with 'origin/master'."
-        """
-        return self.cmd.run(
-            [
-                "checkout",
-                *[self.branch_name],
-            ],
-            trim=trim,
-        )
-
-    def create(
-        self,
-        *,
-        checkout: bool = False,
-        trim: bool = False,
-    ) -> str:
-        """Create a git branch.
-
-        Parameters
-        ----------
-        checkout :
-            If True, also checkout the newly created branch.
-            Defaults to False (create only, don't switch HEAD).
-        trim : bool, default: False
-            Strip trailing whitespace/newline from command output.
-
-        Examples
-        --------
-        >>> GitBranchCmd(
-        ...     path=example_git_repo.path,
-        ...     branch_name='master'
-        ... ).create(trim=True)
-        "fatal: a branch named 'master' already exists"
-        """
-        result = self.cmd.run(
-            ["branch", self.branch_name],
-            check_returncode=False,
-            trim=trim,
-        )
-        if checkout and "fatal" not in result.lower():
-            self.cmd.run(["checkout", self.branch_name])
-        return result
-
     def delete(
         self,
         *,
-        force: bool = False,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
-        trim: bool = False,
     ) -> str:
-        """Delete this git branch.
-
-        Parameters
-        ----------
-        force :
-            Use ``-D`` instead of ``-d`` to force deletion.
-        trim : bool, default: False
-            Strip trailing whitespace/newline from command output.
+        """Git tag delete.
 
         Examples
         --------
-        >>> GitBranchCmd(
-        ...     path=example_git_repo.path,
-        ...     branch_name='nonexistent'
-        ... ).delete(trim=True)
-        "error: branch 'nonexistent' not found"
-        """
-        flag = "-D" if force else "-d"
-        return self.cmd.run(
-            ["branch", flag, self.branch_name],
-            check_returncode=check_returncode,
-            log_in_real_time=log_in_real_time,
-            trim=trim,
-        )
+        Create a tag first:
 
-    def rename(
-        self,
-        new_name: str,
-        *,
-        force: bool = False,
-        # Pass-through to run()
-        log_in_real_time: bool = False,
-        check_returncode: bool | None = None,
-    ) -> str:
-        """Rename this git branch.
+        >>> GitTagManager(path=example_git_repo.path).create(
+        ...     name='delete-me', message='Tag to delete'
+        ... )
+        ''
 
-        Parameters
-        ----------
-        new_name :
-            New name for the branch.
-        force :
-            Use ``-M`` instead of ``-m`` to force rename.
+        Now delete it:
 
-        Examples
-        --------
-        >>> GitBranchCmd(
+        >>> GitTagCmd(
         ...     path=example_git_repo.path,
-        ...     branch_name='master'
-        ... ).rename('main')
-        ''
+        ...     tag_name='delete-me',
+        ... ).delete()
+        "Deleted tag 'delete-me'..."
         """
-        flag = "-M" if force else "-m"
-        return self.cmd.run(
-            ["branch", flag, self.branch_name, new_name],
+        local_flags: list[str] = ["-d", self.tag_name]
+
+        return self.run(
+            local_flags=local_flags,
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
         )
 
-    def copy(
+    def verify(
         self,
-        new_name: str,
         *,
-        force: bool = False,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
     ) -> str:
-        """Copy this git branch.
+        """Git tag verify.
 
-        Parameters
-        ----------
-        new_name :
-            Name for the copied branch.
-        force :
-            Use ``-C`` instead of ``-c`` to force copy.
+        Verify a GPG-signed tag.
 
         Examples
         --------
-        >>> GitBranchCmd(
-        ...     path=example_git_repo.path,
-        ...     branch_name='master'
-        ... ).copy('master-copy')
-        ''
-        """
-        flag = "-C" if force else "-c"
-        return self.cmd.run(
-            ["branch", flag, self.branch_name, new_name],
-            check_returncode=check_returncode,
-            log_in_real_time=log_in_real_time,
-        )
+        First create a lightweight tag:
 
-    def set_upstream(
-        self,
-        upstream: str,
-        *,
-        # Pass-through to run()
-        log_in_real_time: bool = False,
-        check_returncode: bool | None = None,
-        trim: bool = False,
-    ) -> str:
-        """Set the upstream (tracking) branch.
+        >>> GitTagManager(path=example_git_repo.path).create(name='verify-tag')
+        ''
 
-        Parameters
-        ----------
-        upstream :
-            The upstream branch in format ``remote/branch`` (e.g., ``origin/main``).
-        trim : bool, default: False
-            Strip trailing whitespace/newline from command output.
+        Try to verify it (lightweight tags can't be verified):
 
-        Examples
-        --------
-        >>> GitBranchCmd(
+        >>> GitTagCmd(
         ...     path=example_git_repo.path,
-        ...     branch_name='master'
-        ... ).set_upstream('origin/master', trim=True)
-        "branch 'master' set up to track 'origin/master'."
+        ...     tag_name='verify-tag',
+        ... ).verify()
+        'error: verify-tag: cannot verify a non-tag object...'
         """
-        return self.cmd.run(
-            ["branch", f"--set-upstream-to={upstream}", self.branch_name],
-            check_returncode=check_returncode,
-            log_in_real_time=log_in_real_time,
-            trim=trim,
-        )
-
-    def unset_upstream(
-        self,
-        *,
-        # Pass-through to run()
-        log_in_real_time: bool = False,
-        check_returncode: bool | None = None,
-    ) -> str:
-        """Remove the upstream (tracking) information.
+        local_flags: list[str] = ["-v", self.tag_name]
 
-        Examples
-        --------
-        >>> GitBranchCmd(
-        ...     path=example_git_repo.path,
-        ...     branch_name='master'
-        ... ).unset_upstream()
-        ''
-        """
-        return self.cmd.run(
-            ["branch", "--unset-upstream", self.branch_name],
+        return self.run(
+            local_flags=local_flags,
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
         )
 
-    def track(
+    def show(
         self,
-        remote_branch: str,
         *,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
-        trim: bool = False,
     ) -> str:
-        """Create branch tracking a remote branch.
-
-        Wraps `git branch -t <https://git-scm.com/docs/git-branch>`_.
-
-        Parameters
-        ----------
-        remote_branch :
-            Remote branch to track (e.g., 'origin/main').
-        trim : bool, default: False
-            Strip trailing whitespace/newline from command output.
+        """Show tag details using git show.
 
         Examples
         --------
-        For existing branches, use
-        :meth:`~libvcs.cmd.git.GitBranchCmd.set_upstream` instead.
-        :meth:`~libvcs.cmd.git.GitBranchCmd.track` is for creating new
-        branches that track a remote:
+        Create an annotated tag first:
+
+        >>> GitTagManager(path=example_git_repo.path).create(
+        ...     name='show-tag', message='Show this tag'
+        ... )
+        ''
 
-        >>> GitBranchCmd(
+        Show the tag:
+
+        >>> print(GitTagCmd(
         ...     path=example_git_repo.path,
-        ...     branch_name='tracking-branch'
-        ... ).track('origin/master', trim=True)
-        "branch 'tracking-branch' set up to track 'origin/master'."
+        ...     tag_name='show-tag',
+        ... ).show())
+        tag show-tag
+        Tagger: ...
+        <BLANKLINE>
+        Show this tag
+        ...
         """
         return self.cmd.run(
-            ["branch", "-t", self.branch_name, remote_branch],
+            ["show", self.tag_name],
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
-            trim=trim,
         )
 
 
-class GitBranchManager:
-    """Traverse git branches with :class:`~libvcs._internal.query_list.QueryList`."""
-
-    branch_name: str
+class GitTagManager:
+    """Traverse git tags with :class:`~libvcs._internal.query_list.QueryList`."""
 
     def __init__(
         self,
@@ -5707,7 +9643,7 @@ class GitBranchManager:
         path: StrPath,
         cmd: Git | None = None,
     ) -> None:
-        """Wrap some of git-branch(1), git-checkout(1), manager.
+        """Wrap some of git-tag(1), manager.
 
         Parameters
         ----------
@@ -5716,15 +9652,17 @@ class GitBranchManager:
 
         Examples
         --------
-        >>> GitBranchManager(path=tmp_path)
-        <GitBranchManager path=...>
+        >>> GitTagManager(path=tmp_path)
+        <GitTagManager path=...>
 
-        >>> GitBranchManager(path=tmp_path).run(quiet=True, trim=True)
+        >>> GitTagManager(path=tmp_path).run(trim=True)
         'fatal: not a git repository (or any of the parent directories): .git'
 
-        >>> GitBranchManager(
-        ...     path=example_git_repo.path).run(quiet=True, trim=True)
-        '* master'
+        >>> mgr = GitTagManager(path=example_git_repo.path)
+        >>> mgr.create(name='init-doctest-tag', message='For doctest')
+        ''
+        >>> mgr.run()
+        '...init-doctest-tag...'
         """
         #: Directory to check out
         self.path: pathlib.Path
@@ -5736,195 +9674,243 @@ class GitBranchManager:
         self.cmd = cmd if isinstance(cmd, Git) else Git(path=self.path)
 
     def __repr__(self) -> str:
-        """Representation of git branch manager object."""
-        return f"<GitBranchManager path={self.path}>"
+        """Representation of git tag manager object."""
+        return f"<GitTagManager path={self.path}>"
 
     def run(
         self,
+        command: GitTagCommandLiteral | None = None,
         local_flags: list[str] | None = None,
         *,
-        quiet: bool | None = None,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
         **kwargs: t.Any,
     ) -> str:
-        """Run a command against a git repository's branches.
+        """Run a command against a git repository's tags.
 
-        Wraps `git branch <https://git-scm.com/docs/git-branch>`_.
+        Wraps `git tag <https://git-scm.com/docs/git-tag>`_.
 
         Examples
         --------
-        >>> GitBranchManager(path=example_git_repo.path).run(trim=True)
-        '* master'
+        >>> mgr = GitTagManager(path=example_git_repo.path)
+        >>> mgr.create(name='run-doctest-tag', message='For doctest')
+        ''
+        >>> mgr.run()
+        '...run-doctest-tag...'
         """
         local_flags = local_flags if isinstance(local_flags, list) else []
-
-        if quiet is True:
-            local_flags.append("--quiet")
+        if command is not None:
+            local_flags.insert(0, command)
 
         return self.cmd.run(
-            ["branch", *local_flags],
+            ["tag", *local_flags],
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
             **kwargs,
         )
 
-    def checkout(self, *, branch: str, trim: bool = False) -> str:
-        """Git branch checkout.
-
-        Examples
-        --------
-        >>> branch_mgr = GitBranchManager(path=example_git_repo.path)
-        >>> branch_mgr.checkout(branch='master', trim=True)
-        "Your branch is up to date with 'origin/master'."
-        """
-        return self.cmd.run(
-            [
-                "checkout",
-                *[branch],
-            ],
-            trim=trim,
-        )
-
     def create(
         self,
         *,
-        branch: str,
-        checkout: bool = False,
-        trim: bool = False,
+        name: str,
+        ref: str | None = None,
+        message: str | None = None,
+        annotate: bool | None = None,
+        sign: bool | None = None,
+        local_user: str | None = None,
+        force: bool | None = None,
+        file: StrPath | None = None,
+        # Pass-through to run()
+        log_in_real_time: bool = False,
+        check_returncode: bool | None = None,
     ) -> str:
-        """Create a git branch.
+        """Git tag create.
 
         Parameters
         ----------
-        branch :
-            Name of the branch to create.
-        checkout :
-            If True, also checkout the newly created branch.
-            Defaults to False (create only, don't switch HEAD).
-        trim : bool, default: False
-            Strip trailing whitespace/newline from command output.
+        name :
+            Name of the tag to create
+        ref :
+            Git reference (commit, branch) to tag. Defaults to HEAD.
+        message :
+            Tag message (implies annotated tag)
+        annotate :
+            Create an annotated tag
+        sign :
+            Create a GPG-signed tag
+        local_user :
+            Use specific GPG key for signing
+        force :
+            Replace existing tag
+        file :
+            Read message from file
 
         Examples
         --------
-        >>> branch_mgr = GitBranchManager(path=example_git_repo.path)
-        >>> branch_mgr.create(branch='master', trim=True)
-        "fatal: a branch named 'master' already exists"
+        Create a lightweight tag:
+
+        >>> GitTagManager(path=example_git_repo.path).create(name='lightweight-tag')
+        ''
+
+        Create an annotated tag:
+
+        >>> GitTagManager(path=example_git_repo.path).create(
+        ...     name='annotated-tag', message='This is an annotated tag'
+        ... )
+        ''
+
+        Create a tag on a specific commit:
+
+        >>> GitTagManager(path=example_git_repo.path).create(
+        ...     name='ref-tag', ref='HEAD', message='Tag at HEAD'
+        ... )
+        ''
         """
-        result = self.cmd.run(
-            ["branch", branch],
-            check_returncode=False,
-            trim=trim,
+        local_flags: list[str] = []
+
+        if annotate is True:
+            local_flags.append("-a")
+        if sign is True:
+            local_flags.append("-s")
+        if local_user is not None:
+            local_flags.extend(["-u", local_user])
+        if force is True:
+            local_flags.append("-f")
+        if message is not None:
+            local_flags.extend(["-m", message])
+        if file is not None:
+            local_flags.extend(["-F", str(file)])
+
+        local_flags.append(name)
+
+        if ref is not None:
+            local_flags.append(ref)
+
+        return self.run(
+            local_flags=local_flags,
+            check_returncode=check_returncode,
+            log_in_real_time=log_in_real_time,
         )
-        if checkout and "fatal" not in result.lower():
-            self.cmd.run(["checkout", branch])
-        return result
 
     def _ls(
         self,
         *,
-        local_flags: list[str] | None = None,
+        pattern: str | None = None,
+        sort: str | None = None,
+        contains: str | None = None,
+        no_contains: str | None = None,
+        merged: str | None = None,
+        no_merged: str | None = None,
+        lines: int | None = None,
     ) -> list[str]:
-        """List branches (raw output).
-
-        Parameters
-        ----------
-        local_flags :
-            Additional flags to pass to git branch.
+        r"""List tags (raw output).
 
         Examples
         --------
-        >>> branches = GitBranchManager(path=example_git_repo.path)._ls()
-        >>> '* master' in branches or 'master' in str(branches)
+        >>> GitTagManager(path=example_git_repo.path).create(
+        ...     name='list-tag-1', message='First tag'
+        ... )
+        ''
+        >>> GitTagManager(path=example_git_repo.path).create(
+        ...     name='list-tag-2', message='Second tag'
+        ... )
+        ''
+        >>> 'list-tag-1' in GitTagManager(path=example_git_repo.path)._ls()
         True
         """
-        flags = ["--list"]
-        if local_flags:
-            flags.extend(local_flags)
-        return self.run(local_flags=flags).splitlines()
+        local_flags: list[str] = ["-l"]
+
+        if sort is not None:
+            local_flags.append(f"--sort={sort}")
+        if contains is not None:
+            local_flags.extend(["--contains", contains])
+        if no_contains is not None:
+            local_flags.extend(["--no-contains", no_contains])
+        if merged is not None:
+            local_flags.extend(["--merged", merged])
+        if no_merged is not None:
+            local_flags.extend(["--no-merged", no_merged])
+        if lines is not None:
+            local_flags.append(f"-n{lines}")
+        if pattern is not None:
+            local_flags.append(pattern)
+
+        result = self.cmd._query(["tag", *local_flags])
+        if not result:
+            return []
+        return result.splitlines()
 
     def ls(
         self,
         *,
-        _all: bool = False,
-        remotes: bool = False,
+        pattern: str | None = None,
+        sort: str | None = None,
+        contains: str | None = None,
+        no_contains: str | None = None,
         merged: str | None = None,
         no_merged: str | None = None,
-        contains: str | None = None,
-        sort: str | None = None,
-        verbose: bool = False,
-    ) -> QueryList[GitBranchCmd]:
-        """List branches.
+    ) -> QueryList[GitTagCmd]:
+        """List tags.
 
         Parameters
         ----------
-        _all :
-            List all branches (local + remote). Maps to --all.
-        remotes :
-            List remote branches only. Maps to --remotes.
-        merged :
-            Only list branches merged into specified commit.
-        no_merged :
-            Only list branches NOT merged into specified commit.
-        contains :
-            Only list branches containing specified commit.
+        pattern :
+            List tags matching pattern (shell wildcard)
         sort :
-            Sort key (e.g., '-committerdate', 'refname').
-        verbose :
-            Show sha1 and commit subject line for each head. Maps to --verbose.
+            Sort by key (e.g., 'version:refname', '-creatordate')
+        contains :
+            Only tags containing the specified commit
+        no_contains :
+            Only tags not containing the specified commit
+        merged :
+            Only tags merged into the specified commit
+        no_merged :
+            Only tags not merged into the specified commit
 
         Examples
         --------
-        >>> branches = GitBranchManager(path=example_git_repo.path).ls()
-        >>> any(b.branch_name == 'master' for b in branches)
+        >>> GitTagManager(path=example_git_repo.path).create(
+        ...     name='ls-tag', message='Listing tag'
+        ... )
+        ''
+        >>> tags = GitTagManager(path=example_git_repo.path).ls()
+        >>> any(t.tag_name == 'ls-tag' for t in tags)
         True
         """
-        local_flags: list[str] = []
-        if _all:
-            local_flags.append("--all")
-        if remotes:
-            local_flags.append("--remotes")
-        if merged is not None:
-            local_flags.extend(["--merged", merged])
-        if no_merged is not None:
-            local_flags.extend(["--no-merged", no_merged])
-        if contains is not None:
-            local_flags.extend(["--contains", contains])
-        if sort is not None:
-            local_flags.extend(["--sort", sort])
-        if verbose:
-            local_flags.append("--verbose")
-
-        def extract_branch_name(line: str) -> str:
-            """Extract branch name from output line (handles verbose output)."""
-            # Strip leading "* " or "  " marker
-            name = line.lstrip("* ")
-            # With --verbose, format is: "name  sha1 message" - take first token
-            if verbose:
-                name = name.split()[0] if name.split() else name
-            return name
+        tag_names = self._ls(
+            pattern=pattern,
+            sort=sort,
+            contains=contains,
+            no_contains=no_contains,
+            merged=merged,
+            no_merged=no_merged,
+        )
 
         return QueryList(
-            [
-                GitBranchCmd(path=self.path, branch_name=extract_branch_name(line))
-                for line in self._ls(local_flags=local_flags or None)
-            ],
+            [GitTagCmd(path=self.path, tag_name=tag_name) for tag_name in tag_names],
         )
 
-    def get(self, *args: t.Any, **kwargs: t.Any) -> GitBranchCmd | None:
-        """Get branch via filter lookup.
+    def get(self, *args: t.Any, **kwargs: t.Any) -> GitTagCmd | None:
+        """Get tag via filter lookup.
 
         Examples
         --------
-        >>> GitBranchManager(
+        Create a tag first:
+
+        >>> GitTagManager(path=example_git_repo.path).create(
+        ...     name='get-tag', message='Get this tag'
+        ... )
+        ''
+
+        >>> GitTagManager(
         ...     path=example_git_repo.path
-        ... ).get(branch_name='master')
-        <GitBranchCmd path=... branch_name=master>
+        ... ).get(tag_name='get-tag')
+        <GitTagCmd path=... tag_name=get-tag>
 
-        >>> GitBranchManager(
+        >>> GitTagManager(
         ...     path=example_git_repo.path
-        ... ).get(branch_name='unknown')
+        ... ).get(tag_name='unknown')
         Traceback (most recent call last):
             exec(compile(example.source, filename, "single",
             ...
@@ -5936,60 +9922,99 @@ class GitBranchManager:
         """
         return self.ls().get(*args, **kwargs)
 
-    def filter(self, *args: t.Any, **kwargs: t.Any) -> list[GitBranchCmd]:
-        """Get branches via filter lookup.
+    def filter(self, *args: t.Any, **kwargs: t.Any) -> list[GitTagCmd]:
+        """Get tags via filter lookup.
 
         Examples
         --------
-        >>> GitBranchManager(
+        >>> GitTagManager(path=example_git_repo.path).create(
+        ...     name='filter-tag-a', message='Filter tag A'
+        ... )
+        ''
+        >>> GitTagManager(path=example_git_repo.path).create(
+        ...     name='filter-tag-b', message='Filter tag B'
+        ... )
+        ''
+
+        >>> len(GitTagManager(
         ...     path=example_git_repo.path
-        ... ).filter(branch_name__contains='master')
-        [<GitBranchCmd path=... branch_name=master>]
+        ... ).filter(tag_name__contains='filter-tag')) >= 2
+        True
 
-        >>> GitBranchManager(
+        >>> GitTagManager(
         ...     path=example_git_repo.path
-        ... ).filter(branch_name__contains='unknown')
+        ... ).filter(tag_name__contains='unknown')
         []
         """
         return self.ls().filter(*args, **kwargs)
 
 
-GitTagCommandLiteral = t.Literal[
+# =============================================================================
+# Git Worktree Commands
+# =============================================================================
+
+GitWorktreeCommandLiteral = t.Literal[
+    "add",
     "list",
-    "create",
-    "delete",
-    "verify",
+    "lock",
+    "move",
+    "prune",
+    "remove",
+    "repair",
+    "unlock",
 ]
 
 
-class GitTagCmd:
-    """Run git commands targeting a specific tag."""
-
-    tag_name: str
+class GitWorktreeCmd:
+    """Run git commands targeting a specific worktree."""
 
     def __init__(
         self,
         *,
         path: StrPath,
-        tag_name: str,
         cmd: Git | None = None,
+        worktree_path: str,
+        head: str | None = None,
+        branch: str | None = None,
+        locked: bool = False,
+        prunable: bool = False,
+        bare: bool = False,
+        detached: bool = False,
+        locked_reason: str | None = None,
+        prunable_reason: str | None = None,
     ) -> None:
-        r"""Lite, typed, pythonic wrapper for git-tag(1).
+        """Lite, typed, pythonic wrapper for a git-worktree(1) entry.
 
         Parameters
         ----------
         path :
-            Operates as PATH in the corresponding git subcommand.
-        tag_name :
-            Name of tag
+            Path to the main git repository.
+        worktree_path :
+            Path to this worktree.
+        head :
+            HEAD commit SHA for this worktree.
+        branch :
+            Branch checked out in this worktree.
+        locked :
+            Whether this worktree is locked.
+        prunable :
+            Whether this worktree is prunable.
+        bare :
+            Whether this is a bare repository.
+        detached :
+            Whether ``HEAD`` is detached.
+        locked_reason :
+            Reason given to ``git worktree lock --reason``, if any.
+        prunable_reason :
+            Why ``git worktree prune`` would remove this worktree.
 
         Examples
         --------
-        >>> GitTagCmd(
+        >>> GitWorktreeCmd(
         ...     path=example_git_repo.path,
-        ...     tag_name='v1.0.0',
+        ...     worktree_path='/tmp/example-worktree',
         ... )
-        <GitTagCmd path=... tag_name=v1.0.0>
+        <GitWorktreeCmd path=... worktree_path=/tmp/example-worktree>
         """
         #: Directory to check out
         self.path: pathlib.Path
@@ -6000,15 +10025,23 @@ class GitTagCmd:
 
         self.cmd = cmd if isinstance(cmd, Git) else Git(path=self.path)
 
-        self.tag_name = tag_name
+        self.worktree_path = worktree_path
+        self.head = head
+        self.branch = branch
+        self.locked = locked
+        self.prunable = prunable
+        self.bare = bare
+        self.detached = detached
+        self.locked_reason = locked_reason
+        self.prunable_reason = prunable_reason
 
     def __repr__(self) -> str:
-        """Representation of a git tag for a git repository."""
-        return f"<GitTagCmd path={self.path} tag_name={self.tag_name}>"
+        """Representation of a git worktree entry."""
+        return f"<GitWorktreeCmd path={self.path} worktree_path={self.worktree_path}>"
 
     def run(
         self,
-        command: GitTagCommandLiteral | None = None,
+        command: GitWorktreeCommandLiteral | None = None,
         local_flags: list[str] | None = None,
         *,
         # Pass-through to run()
@@ -6016,140 +10049,205 @@ class GitTagCmd:
         check_returncode: bool | None = None,
         **kwargs: t.Any,
     ) -> str:
-        r"""Run command against a git tag.
-
-        Wraps `git tag <https://git-scm.com/docs/git-tag>`_.
+        r"""Run command against a git worktree.
 
-        Examples
-        --------
-        >>> GitTagManager(path=example_git_repo.path).create(
-        ...     name='test-tag', message='Test tag'
-        ... )
-        ''
-        >>> GitTagCmd(
-        ...     path=example_git_repo.path,
-        ...     tag_name='test-tag',
-        ... ).run()
-        '...test-tag...'
+        Wraps `git worktree <https://git-scm.com/docs/git-worktree>`_.
         """
         local_flags = local_flags if isinstance(local_flags, list) else []
         if command is not None:
             local_flags.insert(0, command)
 
         return self.cmd.run(
-            ["tag", *local_flags],
+            ["worktree", *local_flags],
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
             **kwargs,
         )
 
-    def delete(
+    def remove(
         self,
         *,
+        force: bool = False,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
+        trim: bool = False,
     ) -> str:
-        """Git tag delete.
+        """Remove this worktree.
+
+        Parameters
+        ----------
+        force :
+            Force removal even if worktree is dirty or locked.
+        trim : bool, default: False
+            Strip trailing whitespace/newline from command output.
 
         Examples
         --------
-        Create a tag first:
+        >>> GitWorktreeCmd(
+        ...     path=example_git_repo.path,
+        ...     worktree_path='/tmp/nonexistent-worktree',
+        ... ).remove(trim=True)
+        "fatal: '/tmp/nonexistent-worktree' is not a working tree"
+        """
+        local_flags: list[str] = []
 
-        >>> GitTagManager(path=example_git_repo.path).create(
-        ...     name='delete-me', message='Tag to delete'
-        ... )
-        ''
+        if force:
+            local_flags.append("-f")
 
-        Now delete it:
+        local_flags.append(self.worktree_path)
+
+        return self.run(
+            "remove",
+            local_flags=local_flags,
+            check_returncode=check_returncode,
+            log_in_real_time=log_in_real_time,
+            trim=trim,
+        )
+
+    def lock(
+        self,
+        *,
+        reason: str | None = None,
+        # Pass-through to run()
+        log_in_real_time: bool = False,
+        check_returncode: bool | None = None,
+        trim: bool = False,
+    ) -> str:
+        """Lock this worktree.
+
+        Parameters
+        ----------
+        reason :
+            Reason for locking the worktree.
+        trim : bool, default: False
+            Strip trailing whitespace/newline from command output.
+
+        Examples
+        --------
+        >>> GitWorktreeCmd(
+        ...     path=example_git_repo.path,
+        ...     worktree_path='/tmp/nonexistent-worktree',
+        ... ).lock(trim=True)
+        "fatal: '/tmp/nonexistent-worktree' is not a working tree"
+        """
+        local_flags: list[str] = []
+
+        if reason is not None:
+            local_flags.extend(["--reason", reason])
+
+        local_flags.append(self.worktree_path)
+
+        return self.run(
+            "lock",
+            local_flags=local_flags,
+            check_returncode=check_returncode,
+            log_in_real_time=log_in_real_time,
+            trim=trim,
+        )
+
+    def unlock(
+        self,
+        *,
+        # Pass-through to run()
+        log_in_real_time: bool = False,
+        check_returncode: bool | None = None,
+        trim: bool = False,
+    ) -> str:
+        """Unlock this worktree.
 
-        >>> GitTagCmd(
+        Examples
+        --------
+        >>> GitWorktreeCmd(
         ...     path=example_git_repo.path,
-        ...     tag_name='delete-me',
-        ... ).delete()
-        "Deleted tag 'delete-me'..."
+        ...     worktree_path='/tmp/nonexistent-worktree',
+        ... ).unlock(trim=True)
+        "fatal: '/tmp/nonexistent-worktree' is not a working tree"
         """
-        local_flags: list[str] = ["-d", self.tag_name]
+        local_flags: list[str] = [self.worktree_path]
 
         return self.run(
+            "unlock",
             local_flags=local_flags,
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
+            trim=trim,
         )
 
-    def verify(
+    def move(
         self,
+        new_path: StrPath,
         *,
+        force: bool = False,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
+        trim: bool = False,
     ) -> str:
-        """Git tag verify.
+        """Move this worktree to a new location.
 
-        Verify a GPG-signed tag.
+        Parameters
+        ----------
+        new_path :
+            New path for the worktree.
+        force :
+            Force move even if worktree is dirty or locked.
+        trim : bool, default: False
+            Strip trailing whitespace/newline from command output.
 
         Examples
         --------
-        First create a lightweight tag:
-
-        >>> GitTagManager(path=example_git_repo.path).create(name='verify-tag')
-        ''
-
-        Try to verify it (lightweight tags can't be verified):
-
-        >>> GitTagCmd(
+        >>> GitWorktreeCmd(
         ...     path=example_git_repo.path,
-        ...     tag_name='verify-tag',
-        ... ).verify()
-        'error: verify-tag: cannot verify a non-tag object...'
+        ...     worktree_path='/tmp/nonexistent-worktree',
+        ... ).move('/tmp/new-worktree', trim=True)
+        "fatal: '/tmp/nonexistent-worktree' is not a working tree"
         """
-        local_flags: list[str] = ["-v", self.tag_name]
+        local_flags: list[str] = []
+
+        if force:
+            local_flags.append("-f")
+
+        local_flags.extend([self.worktree_path, str(new_path)])
 
         return self.run(
+            "move",
             local_flags=local_flags,
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
+            trim=trim,
         )
 
-    def show(
+    def repair(
         self,
         *,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
     ) -> str:
-        """Show tag details using git show.
+        """Repair this worktree.
 
         Examples
         --------
-        Create an annotated tag first:
-
-        >>> GitTagManager(path=example_git_repo.path).create(
-        ...     name='show-tag', message='Show this tag'
-        ... )
-        ''
-
-        Show the tag:
-
-        >>> print(GitTagCmd(
+        >>> result = GitWorktreeCmd(
         ...     path=example_git_repo.path,
-        ...     tag_name='show-tag',
-        ... ).show())
-        tag show-tag
-        Tagger: ...
-        <BLANKLINE>
-        Show this tag
-        ...
+        ...     worktree_path='/tmp/nonexistent-worktree',
+        ... ).repair()
+        >>> result == '' or 'error' in result
+        True
         """
-        return self.cmd.run(
-            ["show", self.tag_name],
+        local_flags: list[str] = [self.worktree_path]
+
+        return self.run(
+            "repair",
+            local_flags=local_flags,
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
         )
 
 
-class GitTagManager:
-    """Traverse git tags with :class:`~libvcs._internal.query_list.QueryList`."""
+class GitWorktreeManager:
+    """Traverse git worktrees with :class:`~libvcs._internal.query_list.QueryList`."""
 
     def __init__(
         self,
@@ -6157,7 +10255,7 @@ class GitTagManager:
         path: StrPath,
         cmd: Git | None = None,
     ) -> None:
-        """Wrap some of git-tag(1), manager.
+        """Wrap some of git-worktree(1), manager.
 
         Parameters
         ----------
@@ -6166,17 +10264,14 @@ class GitTagManager:
 
         Examples
         --------
-        >>> GitTagManager(path=tmp_path)
-        <GitTagManager path=...>
+        >>> GitWorktreeManager(path=tmp_path)
+        <GitWorktreeManager path=...>
 
-        >>> GitTagManager(path=tmp_path).run(trim=True)
+        >>> GitWorktreeManager(path=tmp_path).run('list', trim=True)
         'fatal: not a git repository (or any of the parent directories): .git'
 
-        >>> mgr = GitTagManager(path=example_git_repo.path)
-        >>> mgr.create(name='init-doctest-tag', message='For doctest')
-        ''
-        >>> mgr.run()
-        '...init-doctest-tag...'
+        >>> len(GitWorktreeManager(path=example_git_repo.path).run('list')) > 0
+        True
         """
         #: Directory to check out
         self.path: pathlib.Path
@@ -6188,12 +10283,12 @@ class GitTagManager:
         self.cmd = cmd if isinstance(cmd, Git) else Git(path=self.path)
 
     def __repr__(self) -> str:
-        """Representation of git tag manager object."""
-        return f"<GitTagManager path={self.path}>"
+        """Representation of git worktree manager object."""
+        return f"<GitWorktreeManager path={self.path}>"
 
     def run(
         self,
-        command: GitTagCommandLiteral | None = None,
+        command: GitWorktreeCommandLiteral | None = None,
         local_flags: list[str] | None = None,
         *,
         # Pass-through to run()
@@ -6201,107 +10296,162 @@ class GitTagManager:
         check_returncode: bool | None = None,
         **kwargs: t.Any,
     ) -> str:
-        """Run a command against a git repository's tags.
+        """Run a command against a git repository's worktrees.
 
-        Wraps `git tag <https://git-scm.com/docs/git-tag>`_.
+        Wraps `git worktree <https://git-scm.com/docs/git-worktree>`_.
 
         Examples
         --------
-        >>> mgr = GitTagManager(path=example_git_repo.path)
-        >>> mgr.create(name='run-doctest-tag', message='For doctest')
-        ''
-        >>> mgr.run()
-        '...run-doctest-tag...'
+        >>> len(GitWorktreeManager(path=example_git_repo.path).run('list')) > 0
+        True
         """
         local_flags = local_flags if isinstance(local_flags, list) else []
         if command is not None:
             local_flags.insert(0, command)
 
         return self.cmd.run(
-            ["tag", *local_flags],
+            ["worktree", *local_flags],
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
             **kwargs,
         )
 
-    def create(
+    def add(
         self,
+        path: StrPath,
         *,
-        name: str,
-        ref: str | None = None,
-        message: str | None = None,
-        annotate: bool | None = None,
-        sign: bool | None = None,
-        local_user: str | None = None,
+        commit_ish: str | None = None,
         force: bool | None = None,
-        file: StrPath | None = None,
+        detach: bool | None = None,
+        checkout: bool | None = None,
+        lock: bool | None = None,
+        reason: str | None = None,
+        new_branch: str | None = None,
+        new_branch_force: str | None = None,
+        orphan: bool | None = None,
+        track: bool | None = None,
+        guess_remote: bool | None = None,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
     ) -> str:
-        """Git tag create.
+        """Add a new worktree.
 
         Parameters
         ----------
-        name :
-            Name of the tag to create
-        ref :
-            Git reference (commit, branch) to tag. Defaults to HEAD.
-        message :
-            Tag message (implies annotated tag)
-        annotate :
-            Create an annotated tag
-        sign :
-            Create a GPG-signed tag
-        local_user :
-            Use specific GPG key for signing
+        path :
+            Path for the new worktree.
+        commit_ish :
+            Commit/branch to checkout in the new worktree.
         force :
-            Replace existing tag
-        file :
-            Read message from file
+            Force creation even if path already exists.
+        detach :
+            Detach HEAD in the new worktree.
+        checkout :
+            Checkout commit after creating worktree.
+        lock :
+            Lock the worktree after creation.
+        reason :
+            Reason for locking (requires lock=True).
+        new_branch :
+            Create a new branch (-b).
+        new_branch_force :
+            Force create a new branch (-B).
+        orphan :
+            Create a new orphan branch.
+        track :
+            Set up tracking for the new branch.
+        guess_remote :
+            Guess remote tracking branch.
 
         Examples
         --------
-        Create a lightweight tag:
+        >>> GitWorktreeManager(path=example_git_repo.path).add(
+        ...     path='/tmp/test-worktree-add', commit_ish='HEAD'
+        ... )
+        "Preparing worktree (detached HEAD ...)..."
+        """
+        local_flags: list[str] = []
 
-        >>> GitTagManager(path=example_git_repo.path).create(name='lightweight-tag')
-        ''
+        if force is True:
+            local_flags.append("-f")
+        if detach is True:
+            local_flags.append("--detach")
+        if checkout is True:
+            local_flags.append("--checkout")
+        if checkout is False:
+            local_flags.append("--no-checkout")
+        if lock is True:
+            local_flags.append("--lock")
+        if reason is not None:
+            local_flags.extend(["--reason", reason])
+        if new_branch is not None:
+            local_flags.extend(["-b", new_branch])
+        if new_branch_force is not None:
+            local_flags.extend(["-B", new_branch_force])
+        if orphan is True:
+            local_flags.append("--orphan")
+        if track is True:
+            local_flags.append("--track")
+        if track is False:
+            local_flags.append("--no-track")
+        if guess_remote is True:
+            local_flags.append("--guess-remote")
+        if guess_remote is False:
+            local_flags.append("--no-guess-remote")
 
-        Create an annotated tag:
+        local_flags.append(str(path))
+
+        if commit_ish is not None:
+            local_flags.append(commit_ish)
+
+        return self.run(
+            "add",
+            local_flags=local_flags,
+            check_returncode=check_returncode,
+            log_in_real_time=log_in_real_time,
+        )
+
+    def prune(
+        self,
+        *,
+        dry_run: bool | None = None,
+        verbose: bool | None = None,
+        expire: str | None = None,
+        # Pass-through to run()
+        log_in_real_time: bool = False,
+        check_returncode: bool | None = None,
+    ) -> str:
+        """Prune worktree information.
+
+        Parameters
+        ----------
+        dry_run :
+            Do not remove anything, just report what would be done.
+        verbose :
+            Report all removals.
+        expire :
+            Only expire unused worktrees older than the given time.
 
-        >>> GitTagManager(path=example_git_repo.path).create(
-        ...     name='annotated-tag', message='This is an annotated tag'
-        ... )
+        Examples
+        --------
+        >>> GitWorktreeManager(path=example_git_repo.path).prune()
         ''
 
-        Create a tag on a specific commit:
-
-        >>> GitTagManager(path=example_git_repo.path).create(
-        ...     name='ref-tag', ref='HEAD', message='Tag at HEAD'
-        ... )
+        >>> GitWorktreeManager(path=example_git_repo.path).prune(dry_run=True)
         ''
         """
         local_flags: list[str] = []
 
-        if annotate is True:
-            local_flags.append("-a")
-        if sign is True:
-            local_flags.append("-s")
-        if local_user is not None:
-            local_flags.extend(["-u", local_user])
-        if force is True:
-            local_flags.append("-f")
-        if message is not None:
-            local_flags.extend(["-m", message])
-        if file is not None:
-            local_flags.extend(["-F", str(file)])
-
-        local_flags.append(name)
-
-        if ref is not None:
-            local_flags.append(ref)
+        if dry_run is True:
+            local_flags.append("-n")
+        if verbose is True:
+            local_flags.append("-v")
+        if expire is not None:
+            local_flags.extend(["--expire", expire])
 
         return self.run(
+            "prune",
             local_flags=local_flags,
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
@@ -6310,236 +10460,180 @@ class GitTagManager:
     def _ls(
         self,
         *,
-        pattern: str | None = None,
-        sort: str | None = None,
-        contains: str | None = None,
-        no_contains: str | None = None,
-        merged: str | None = None,
-        no_merged: str | None = None,
-        lines: int | None = None,
-    ) -> list[str]:
-        r"""List tags (raw output).
+        verbose: bool | None = None,
+    ) -> list[dict[str, t.Any]]:
+        """Parse ``git worktree list --porcelain -z`` into structured data.
+
+        Attribute lines are NUL-terminated and entries end with an empty
+        one, so worktree paths and lock reasons containing newlines survive.
+        Output is parsed as git streams it.
 
         Examples
         --------
-        >>> GitTagManager(path=example_git_repo.path).create(
-        ...     name='list-tag-1', message='First tag'
-        ... )
-        ''
-        >>> GitTagManager(path=example_git_repo.path).create(
-        ...     name='list-tag-2', message='Second tag'
-        ... )
-        ''
-        >>> 'list-tag-1' in GitTagManager(path=example_git_repo.path)._ls()
-        True
+        >>> worktrees = GitWorktreeManager(path=example_git_repo.path)._ls()
+        >>> worktrees[0]['branch']
+        'refs/heads/master'
         """
-        local_flags: list[str] = ["-l"]
+        local_flags: list[str] = ["--porcelain", "-z"]
 
-        if sort is not None:
-            local_flags.append(f"--sort={sort}")
-        if contains is not None:
-            local_flags.extend(["--contains", contains])
-        if no_contains is not None:
-            local_flags.extend(["--no-contains", no_contains])
-        if merged is not None:
-            local_flags.extend(["--merged", merged])
-        if no_merged is not None:
-            local_flags.extend(["--no-merged", no_merged])
-        if lines is not None:
-            local_flags.append(f"-n{lines}")
-        if pattern is not None:
-            local_flags.append(pattern)
+        if verbose is True:
+            local_flags.append("-v")
 
-        result = self.run(local_flags=local_flags)
-        if not result:
-            return []
-        return result.splitlines()
+        records = split_records(
+            self.cmd.stream(["worktree", "list", *local_flags]),
+        )
+
+        worktrees: list[dict[str, t.Any]] = []
+        current: dict[str, t.Any] = {}
+        for line in records:
+            if not line:
+                if "worktree_path" in current:
+                    worktrees.append(current)
+                current = {}
+                continue
+            attribute, _, value = line.partition(" ")
+            if attribute == "worktree":
+                current["worktree_path"] = value
+            elif attribute == "HEAD":
+                current["head"] = value
+            elif attribute == "branch":
+                current["branch"] = value
+            elif attribute in {"bare", "detached"}:
+                current[attribute] = True
+            elif attribute in {"locked", "prunable"}:
+                current[attribute] = True
+                current[f"{attribute}_reason"] = value or None
+        if "worktree_path" in current:
+            worktrees.append(current)
+        return worktrees
 
     def ls(
         self,
         *,
-        pattern: str | None = None,
-        sort: str | None = None,
-        contains: str | None = None,
-        no_contains: str | None = None,
-        merged: str | None = None,
-        no_merged: str | None = None,
-    ) -> QueryList[GitTagCmd]:
-        """List tags.
+        verbose: bool | None = None,
+    ) -> QueryList[GitWorktreeCmd]:
+        """List worktrees.
+
+        Returns a :class:`~libvcs._internal.query_list.QueryList` of
+        :class:`~libvcs.cmd.git.GitWorktreeCmd` objects.
 
         Parameters
         ----------
-        pattern :
-            List tags matching pattern (shell wildcard)
-        sort :
-            Sort by key (e.g., 'version:refname', '-creatordate')
-        contains :
-            Only tags containing the specified commit
-        no_contains :
-            Only tags not containing the specified commit
-        merged :
-            Only tags merged into the specified commit
-        no_merged :
-            Only tags not merged into the specified commit
+        verbose :
+            Include additional information.
 
         Examples
         --------
-        >>> GitTagManager(path=example_git_repo.path).create(
-        ...     name='ls-tag', message='Listing tag'
-        ... )
-        ''
-        >>> tags = GitTagManager(path=example_git_repo.path).ls()
-        >>> any(t.tag_name == 'ls-tag' for t in tags)
+        >>> worktrees = GitWorktreeManager(path=example_git_repo.path).ls()
+        >>> len(worktrees) >= 1
         True
         """
-        tag_names = self._ls(
-            pattern=pattern,
-            sort=sort,
-            contains=contains,
-            no_contains=no_contains,
-            merged=merged,
-            no_merged=no_merged,
-        )
-
         return QueryList(
-            [GitTagCmd(path=self.path, tag_name=tag_name) for tag_name in tag_names],
+            [
+                GitWorktreeCmd(path=self.path, cmd=self.cmd, **data)
+                for data in self._ls(verbose=verbose)
+            ],
         )
 
-    def get(self, *args: t.Any, **kwargs: t.Any) -> GitTagCmd | None:
-        """Get tag via filter lookup.
+    def get(self, *args: t.Any, **kwargs: t.Any) -> GitWorktreeCmd | None:
+        """Get worktree via filter lookup.
 
         Examples
         --------
-        Create a tag first:
-
-        >>> GitTagManager(path=example_git_repo.path).create(
-        ...     name='get-tag', message='Get this tag'
-        ... )
-        ''
-
-        >>> GitTagManager(
-        ...     path=example_git_repo.path
-        ... ).get(tag_name='get-tag')
-        <GitTagCmd path=... tag_name=get-tag>
-
-        >>> GitTagManager(
-        ...     path=example_git_repo.path
-        ... ).get(tag_name='unknown')
-        Traceback (most recent call last):
-            exec(compile(example.source, filename, "single",
-            ...
-            return self.ls().get(*args, **kwargs)
-                   ^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
-          File "..._internal/query_list.py", line ..., in get
-            raise ObjectDoesNotExist
-        libvcs._internal.query_list.ObjectDoesNotExist
+        >>> worktrees = GitWorktreeManager(path=example_git_repo.path).ls()
+        >>> if len(worktrees) > 0:
+        ...     wt = GitWorktreeManager(path=example_git_repo.path).get(
+        ...         worktree_path=worktrees[0].worktree_path
+        ...     )
+        ...     wt is not None
+        ... else:
+        ...     True
+        True
         """
         return self.ls().get(*args, **kwargs)
 
-    def filter(self, *args: t.Any, **kwargs: t.Any) -> list[GitTagCmd]:
-        """Get tags via filter lookup.
+    def filter(self, *args: t.Any, **kwargs: t.Any) -> list[GitWorktreeCmd]:
+        """Get worktrees via filter lookup.
 
         Examples
         --------
-        >>> GitTagManager(path=example_git_repo.path).create(
-        ...     name='filter-tag-a', message='Filter tag A'
-        ... )
-        ''
-        >>> GitTagManager(path=example_git_repo.path).create(
-        ...     name='filter-tag-b', message='Filter tag B'
-        ... )
-        ''
-
-        >>> len(GitTagManager(
-        ...     path=example_git_repo.path
-        ... ).filter(tag_name__contains='filter-tag')) >= 2
+        >>> len(GitWorktreeManager(path=example_git_repo.path).filter()) >= 0
         True
-
-        >>> GitTagManager(
-        ...     path=example_git_repo.path
-        ... ).filter(tag_name__contains='unknown')
-        []
         """
         return self.ls().filter(*args, **kwargs)
 
 
 # =============================================================================
-# Git Worktree Commands
+# Git Notes Commands
 # =============================================================================
 
-GitWorktreeCommandLiteral = t.Literal[
-    "add",
+GitNotesCommandLiteral = t.Literal[
     "list",
-    "lock",
-    "move",
-    "prune",
+    "add",
+    "copy",
+    "append",
+    "edit",
+    "show",
+    "merge",
     "remove",
-    "repair",
-    "unlock",
+    "prune",
+    "get-ref",
 ]
 
 
-class GitWorktreeCmd:
-    """Run git commands targeting a specific worktree."""
+class GitNoteCmd:
+    """Run git commands targeting a specific note."""
 
     def __init__(
         self,
         *,
         path: StrPath,
         cmd: Git | None = None,
-        worktree_path: str,
-        head: str | None = None,
-        branch: str | None = None,
-        locked: bool = False,
-        prunable: bool = False,
+        object_sha: str,
+        note_sha: str | None = None,
+        ref: str | None = None,
     ) -> None:
-        """Lite, typed, pythonic wrapper for a git-worktree(1) entry.
+        """Lite, typed, pythonic wrapper for a git-notes(1) entry.
 
         Parameters
         ----------
         path :
-            Path to the main git repository.
-        worktree_path :
-            Path to this worktree.
-        head :
-            HEAD commit SHA for this worktree.
-        branch :
-            Branch checked out in this worktree.
-        locked :
-            Whether this worktree is locked.
-        prunable :
-            Whether this worktree is prunable.
+            Path to the git repository.
+        object_sha :
+            SHA of the object this note is attached to.
+        note_sha :
+            SHA of the note blob itself.
+        ref :
+            Notes ref to use (default: refs/notes/commits).
 
         Examples
         --------
-        >>> GitWorktreeCmd(
+        >>> GitNoteCmd(
         ...     path=example_git_repo.path,
-        ...     worktree_path='/tmp/example-worktree',
+        ...     object_sha='HEAD',
         ... )
-        <GitWorktreeCmd path=... worktree_path=/tmp/example-worktree>
+        <GitNoteCmd path=... object_sha=HEAD>
         """
         #: Directory to check out
         self.path: pathlib.Path
         if isinstance(path, pathlib.Path):
             self.path = path
         else:
-            self.path = pathlib.Path(path)
-
-        self.cmd = cmd if isinstance(cmd, Git) else Git(path=self.path)
-
-        self.worktree_path = worktree_path
-        self.head = head
-        self.branch = branch
-        self.locked = locked
-        self.prunable = prunable
+            self.path = pathlib.Path(path)
+
+        self.cmd = cmd if isinstance(cmd, Git) else Git(path=self.path)
+
+        self.object_sha = object_sha
+        self.note_sha = note_sha
+        self.ref = ref
 
     def __repr__(self) -> str:
-        """Representation of a git worktree entry."""
-        return f"<GitWorktreeCmd path={self.path} worktree_path={self.worktree_path}>"
+        """Representation of a git note."""
+        return f"<GitNoteCmd path={self.path} object_sha={self.object_sha}>"
 
     def run(
         self,
-        command: GitWorktreeCommandLiteral | None = None,
+        command: GitNotesCommandLiteral | None = None,
         local_flags: list[str] | None = None,
         *,
         # Pass-through to run()
@@ -6547,229 +10641,253 @@ class GitWorktreeCmd:
         check_returncode: bool | None = None,
         **kwargs: t.Any,
     ) -> str:
-        r"""Run command against a git worktree.
+        r"""Run command against git notes.
 
-        Wraps `git worktree <https://git-scm.com/docs/git-worktree>`_.
+        Wraps `git notes <https://git-scm.com/docs/git-notes>`_.
         """
         local_flags = local_flags if isinstance(local_flags, list) else []
+
+        # Add ref option if specified
+        ref_flags: list[str] = []
+        if self.ref is not None:
+            ref_flags.extend(["--ref", self.ref])
+
         if command is not None:
             local_flags.insert(0, command)
 
         return self.cmd.run(
-            ["worktree", *local_flags],
+            ["notes", *ref_flags, *local_flags],
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
             **kwargs,
         )
 
-    def remove(
+    def show(
         self,
         *,
-        force: bool = False,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
-        trim: bool = False,
     ) -> str:
-        """Remove this worktree.
-
-        Parameters
-        ----------
-        force :
-            Force removal even if worktree is dirty or locked.
-        trim : bool, default: False
-            Strip trailing whitespace/newline from command output.
+        """Show the note for this object.
 
         Examples
         --------
-        >>> GitWorktreeCmd(
+        >>> GitNoteCmd(
         ...     path=example_git_repo.path,
-        ...     worktree_path='/tmp/nonexistent-worktree',
-        ... ).remove(trim=True)
-        "fatal: '/tmp/nonexistent-worktree' is not a working tree"
+        ...     object_sha='HEAD',
+        ... ).show()
+        'error: no note found for object...'
         """
-        local_flags: list[str] = []
-
-        if force:
-            local_flags.append("-f")
-
-        local_flags.append(self.worktree_path)
+        local_flags: list[str] = [self.object_sha]
 
         return self.run(
-            "remove",
+            "show",
             local_flags=local_flags,
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
-            trim=trim,
         )
 
-    def lock(
+    def remove(
         self,
         *,
-        reason: str | None = None,
+        ignore_missing: bool = False,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
-        trim: bool = False,
     ) -> str:
-        """Lock this worktree.
+        """Remove the note for this object.
 
         Parameters
         ----------
-        reason :
-            Reason for locking the worktree.
-        trim : bool, default: False
-            Strip trailing whitespace/newline from command output.
+        ignore_missing :
+            Don't error if no note exists.
 
         Examples
         --------
-        >>> GitWorktreeCmd(
+        >>> GitNoteCmd(
         ...     path=example_git_repo.path,
-        ...     worktree_path='/tmp/nonexistent-worktree',
-        ... ).lock(trim=True)
-        "fatal: '/tmp/nonexistent-worktree' is not a working tree"
+        ...     object_sha='HEAD',
+        ... ).remove(ignore_missing=True)
+        ''
         """
         local_flags: list[str] = []
 
-        if reason is not None:
-            local_flags.extend(["--reason", reason])
+        if ignore_missing:
+            local_flags.append("--ignore-missing")
 
-        local_flags.append(self.worktree_path)
+        local_flags.append(self.object_sha)
 
         return self.run(
-            "lock",
+            "remove",
             local_flags=local_flags,
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
-            trim=trim,
         )
 
-    def unlock(
+    def append(
         self,
         *,
+        message: str | None = None,
+        file: StrPath | None = None,
+        allow_empty: bool = False,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
-        trim: bool = False,
     ) -> str:
-        """Unlock this worktree.
+        """Append to the note for this object.
+
+        Parameters
+        ----------
+        message :
+            Note message to append.
+        file :
+            Read message from file.
+        allow_empty :
+            Allow empty note.
 
         Examples
         --------
-        >>> GitWorktreeCmd(
+        >>> GitNoteCmd(
         ...     path=example_git_repo.path,
-        ...     worktree_path='/tmp/nonexistent-worktree',
-        ... ).unlock(trim=True)
-        "fatal: '/tmp/nonexistent-worktree' is not a working tree"
+        ...     object_sha='HEAD',
+        ... ).append(message='Additional note')
+        ''
         """
-        local_flags: list[str] = [self.worktree_path]
+        local_flags: list[str] = []
+
+        if message is not None:
+            local_flags.extend(["-m", message])
+        if file is not None:
+            local_flags.extend(["-F", str(file)])
+        if allow_empty:
+            local_flags.append("--allow-empty")
+
+        local_flags.append(self.object_sha)
 
         return self.run(
-            "unlock",
+            "append",
             local_flags=local_flags,
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
-            trim=trim,
         )
 
-    def move(
+    def edit(
         self,
-        new_path: StrPath,
         *,
-        force: bool = False,
+        allow_empty: bool = False,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
-        trim: bool = False,
+        **kwargs: t.Any,
     ) -> str:
-        """Move this worktree to a new location.
+        """Edit the note for this object.
+
+        Note: This typically opens an editor, so it's mostly useful
+        in non-interactive contexts with GIT_EDITOR set.
 
         Parameters
         ----------
-        new_path :
-            New path for the worktree.
-        force :
-            Force move even if worktree is dirty or locked.
-        trim : bool, default: False
-            Strip trailing whitespace/newline from command output.
+        allow_empty :
+            Allow empty note.
 
         Examples
         --------
-        >>> GitWorktreeCmd(
+        Use config to override editor (avoids interactive editor):
+
+        >>> result = GitNoteCmd(
         ...     path=example_git_repo.path,
-        ...     worktree_path='/tmp/nonexistent-worktree',
-        ... ).move('/tmp/new-worktree', trim=True)
-        "fatal: '/tmp/nonexistent-worktree' is not a working tree"
+        ...     object_sha='HEAD',
+        ... ).edit(allow_empty=True, config={'core.editor': 'true'})
+        >>> 'error' in result.lower() or result == ''
+        True
         """
         local_flags: list[str] = []
 
-        if force:
-            local_flags.append("-f")
+        if allow_empty:
+            local_flags.append("--allow-empty")
 
-        local_flags.extend([self.worktree_path, str(new_path)])
+        local_flags.append(self.object_sha)
 
         return self.run(
-            "move",
+            "edit",
             local_flags=local_flags,
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
-            trim=trim,
+            **kwargs,
         )
 
-    def repair(
+    def copy(
         self,
+        to_object: str,
         *,
+        force: bool = False,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
     ) -> str:
-        """Repair this worktree.
+        """Copy this note to another object.
+
+        Parameters
+        ----------
+        to_object :
+            Object to copy the note to.
+        force :
+            Overwrite existing note on target.
 
         Examples
         --------
-        >>> result = GitWorktreeCmd(
+        >>> result = GitNoteCmd(
         ...     path=example_git_repo.path,
-        ...     worktree_path='/tmp/nonexistent-worktree',
-        ... ).repair()
-        >>> result == '' or 'error' in result
+        ...     object_sha='HEAD',
+        ... ).copy('HEAD', force=True)
+        >>> 'error' in result.lower() or result == ''
         True
         """
-        local_flags: list[str] = [self.worktree_path]
+        local_flags: list[str] = []
+
+        if force:
+            local_flags.append("-f")
+
+        local_flags.extend([self.object_sha, to_object])
 
         return self.run(
-            "repair",
+            "copy",
             local_flags=local_flags,
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
         )
 
 
-class GitWorktreeManager:
-    """Traverse git worktrees with :class:`~libvcs._internal.query_list.QueryList`."""
+class GitNotesManager:
+    """Traverse git notes with :class:`~libvcs._internal.query_list.QueryList`."""
 
     def __init__(
         self,
         *,
         path: StrPath,
         cmd: Git | None = None,
+        ref: str | None = None,
     ) -> None:
-        """Wrap some of git-worktree(1), manager.
+        """Wrap some of git-notes(1), manager.
 
         Parameters
         ----------
         path :
             Operates as PATH in the corresponding git subcommand.
+        ref :
+            Notes ref to use (default: refs/notes/commits).
 
         Examples
         --------
-        >>> GitWorktreeManager(path=tmp_path)
-        <GitWorktreeManager path=...>
+        >>> GitNotesManager(path=tmp_path)
+        <GitNotesManager path=...>
 
-        >>> GitWorktreeManager(path=tmp_path).run('list', trim=True)
+        >>> GitNotesManager(path=tmp_path).run('list', trim=True)
         'fatal: not a git repository (or any of the parent directories): .git'
 
-        >>> len(GitWorktreeManager(path=example_git_repo.path).run('list')) > 0
-        True
+        >>> GitNotesManager(path=example_git_repo.path).run('list')
+        ''
         """
         #: Directory to check out
         self.path: pathlib.Path
@@ -6779,14 +10897,15 @@ class GitWorktreeManager:
             self.path = pathlib.Path(path)
 
         self.cmd = cmd if isinstance(cmd, Git) else Git(path=self.path)
+        self.ref = ref
 
     def __repr__(self) -> str:
-        """Representation of git worktree manager object."""
-        return f"<GitWorktreeManager path={self.path}>"
+        """Representation of git notes manager object."""
+        return f"<GitNotesManager path={self.path}>"
 
     def run(
         self,
-        command: GitWorktreeCommandLiteral | None = None,
+        command: GitNotesCommandLiteral | None = None,
         local_flags: list[str] | None = None,
         *,
         # Pass-through to run()
@@ -6794,114 +10913,79 @@ class GitWorktreeManager:
         check_returncode: bool | None = None,
         **kwargs: t.Any,
     ) -> str:
-        """Run a command against a git repository's worktrees.
+        """Run a command against a git repository's notes.
 
-        Wraps `git worktree <https://git-scm.com/docs/git-worktree>`_.
+        Wraps `git notes <https://git-scm.com/docs/git-notes>`_.
 
         Examples
         --------
-        >>> len(GitWorktreeManager(path=example_git_repo.path).run('list')) > 0
-        True
+        >>> GitNotesManager(path=example_git_repo.path).run('list')
+        ''
         """
         local_flags = local_flags if isinstance(local_flags, list) else []
+
+        # Add ref option if specified
+        ref_flags: list[str] = []
+        if self.ref is not None:
+            ref_flags.extend(["--ref", self.ref])
+
         if command is not None:
             local_flags.insert(0, command)
 
         return self.cmd.run(
-            ["worktree", *local_flags],
+            ["notes", *ref_flags, *local_flags],
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
-            **kwargs,
-        )
-
-    def add(
-        self,
-        path: StrPath,
-        *,
-        commit_ish: str | None = None,
-        force: bool | None = None,
-        detach: bool | None = None,
-        checkout: bool | None = None,
-        lock: bool | None = None,
-        reason: str | None = None,
-        new_branch: str | None = None,
-        new_branch_force: str | None = None,
-        orphan: bool | None = None,
-        track: bool | None = None,
-        guess_remote: bool | None = None,
+            **kwargs,
+        )
+
+    def add(
+        self,
+        object_sha: str = "HEAD",
+        *,
+        message: str | None = None,
+        file: StrPath | None = None,
+        force: bool = False,
+        allow_empty: bool = False,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
     ) -> str:
-        """Add a new worktree.
+        """Add a note to an object.
 
         Parameters
         ----------
-        path :
-            Path for the new worktree.
-        commit_ish :
-            Commit/branch to checkout in the new worktree.
+        object_sha :
+            Object to add note to (default: HEAD).
+        message :
+            Note message.
+        file :
+            Read message from file.
         force :
-            Force creation even if path already exists.
-        detach :
-            Detach HEAD in the new worktree.
-        checkout :
-            Checkout commit after creating worktree.
-        lock :
-            Lock the worktree after creation.
-        reason :
-            Reason for locking (requires lock=True).
-        new_branch :
-            Create a new branch (-b).
-        new_branch_force :
-            Force create a new branch (-B).
-        orphan :
-            Create a new orphan branch.
-        track :
-            Set up tracking for the new branch.
-        guess_remote :
-            Guess remote tracking branch.
+            Overwrite existing note.
+        allow_empty :
+            Allow empty note.
 
         Examples
         --------
-        >>> GitWorktreeManager(path=example_git_repo.path).add(
-        ...     path='/tmp/test-worktree-add', commit_ish='HEAD'
+        >>> result = GitNotesManager(path=example_git_repo.path).add(
+        ...     message='Test note', force=True
         ... )
-        "Preparing worktree (detached HEAD ...)..."
+        >>> 'error' in result.lower() or 'Overwriting' in result or result == ''
+        True
         """
         local_flags: list[str] = []
 
-        if force is True:
+        if message is not None:
+            local_flags.extend(["-m", message])
+        if file is not None:
+            local_flags.extend(["-F", str(file)])
+        if force:
             local_flags.append("-f")
-        if detach is True:
-            local_flags.append("--detach")
-        if checkout is True:
-            local_flags.append("--checkout")
-        if checkout is False:
-            local_flags.append("--no-checkout")
-        if lock is True:
-            local_flags.append("--lock")
-        if reason is not None:
-            local_flags.extend(["--reason", reason])
-        if new_branch is not None:
-            local_flags.extend(["-b", new_branch])
-        if new_branch_force is not None:
-            local_flags.extend(["-B", new_branch_force])
-        if orphan is True:
-            local_flags.append("--orphan")
-        if track is True:
-            local_flags.append("--track")
-        if track is False:
-            local_flags.append("--no-track")
-        if guess_remote is True:
-            local_flags.append("--guess-remote")
-        if guess_remote is False:
-            local_flags.append("--no-guess-remote")
-
-        local_flags.append(str(path))
+        if allow_empty:
+            local_flags.append("--allow-empty")
 
-        if commit_ish is not None:
-            local_flags.append(commit_ish)
+        local_flags.append(object_sha)
 
         return self.run(
             "add",
@@ -6913,40 +10997,35 @@ class GitWorktreeManager:
     def prune(
         self,
         *,
-        dry_run: bool | None = None,
-        verbose: bool | None = None,
-        expire: str | None = None,
+        dry_run: bool = False,
+        verbose: bool = False,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
     ) -> str:
-        """Prune worktree information.
+        """Prune notes for non-existing objects.
 
         Parameters
         ----------
         dry_run :
-            Do not remove anything, just report what would be done.
+            Don't remove, just report.
         verbose :
-            Report all removals.
-        expire :
-            Only expire unused worktrees older than the given time.
+            Report all removed notes.
 
         Examples
         --------
-        >>> GitWorktreeManager(path=example_git_repo.path).prune()
+        >>> GitNotesManager(path=example_git_repo.path).prune()
         ''
 
-        >>> GitWorktreeManager(path=example_git_repo.path).prune(dry_run=True)
+        >>> GitNotesManager(path=example_git_repo.path).prune(dry_run=True)
         ''
         """
         local_flags: list[str] = []
 
-        if dry_run is True:
+        if dry_run:
             local_flags.append("-n")
-        if verbose is True:
+        if verbose:
             local_flags.append("-v")
-        if expire is not None:
-            local_flags.extend(["--expire", expire])
 
         return self.run(
             "prune",
@@ -6955,166 +11034,252 @@ class GitWorktreeManager:
             log_in_real_time=log_in_real_time,
         )
 
-    def _ls(
+    def merge(
         self,
+        notes_ref: str | None = None,
         *,
-        verbose: bool | None = None,
-    ) -> list[str]:
-        """List worktrees (raw output).
+        strategy: str | None = None,
+        commit: bool = False,
+        abort: bool = False,
+        quiet: bool = False,
+        verbose: bool = False,
+        # Pass-through to run()
+        log_in_real_time: bool = False,
+        check_returncode: bool | None = None,
+    ) -> str:
+        """Merge notes from another ref.
+
+        Git notes merge has three mutually exclusive forms:
+
+        1. ``git notes merge [-s <strategy>] <notes-ref>`` - Start a merge
+        2. ``git notes merge --commit`` - Finalize in-progress merge
+        3. ``git notes merge --abort`` - Abort in-progress merge
+
+        Parameters
+        ----------
+        notes_ref :
+            Notes ref to merge from. Required for starting a merge,
+            must be None when using commit or abort.
+        strategy :
+            Merge strategy (manual, ours, theirs, union, cat_sort_uniq).
+            Only valid when starting a merge with notes_ref.
+        commit :
+            Finalize in-progress merge. Cannot be combined with abort or notes_ref.
+        abort :
+            Abort in-progress merge. Cannot be combined with commit or notes_ref.
+        quiet :
+            Suppress output.
+        verbose :
+            Verbose output.
 
         Examples
         --------
-        >>> len(GitWorktreeManager(path=example_git_repo.path)._ls()) >= 1
+        >>> result = GitNotesManager(path=example_git_repo.path).merge(
+        ...     'refs/notes/other'
+        ... )
+        >>> 'error' in result.lower() or 'fatal' in result.lower() or result == ''
         True
         """
-        local_flags: list[str] = ["--porcelain"]
+        # Validate mutual exclusivity
+        if commit and abort:
+            msg = "Cannot specify both commit and abort"
+            raise ValueError(msg)
 
-        if verbose is True:
+        if commit or abort:
+            if notes_ref is not None:
+                msg = "Cannot specify notes_ref with --commit or --abort"
+                raise ValueError(msg)
+            if strategy is not None:
+                msg = "Cannot specify strategy with --commit or --abort"
+                raise ValueError(msg)
+        elif notes_ref is None:
+            msg = "notes_ref is required when not using --commit or --abort"
+            raise ValueError(msg)
+
+        local_flags: list[str] = []
+
+        if strategy is not None:
+            local_flags.extend(["-s", strategy])
+        if commit:
+            local_flags.append("--commit")
+        if abort:
+            local_flags.append("--abort")
+        if quiet:
+            local_flags.append("-q")
+        if verbose:
             local_flags.append("-v")
 
-        result = self.run("list", local_flags=local_flags)
-        return result.strip().split("\n\n") if result.strip() else []
+        if notes_ref is not None:
+            local_flags.append(notes_ref)
 
-    def ls(
+        return self.run(
+            "merge",
+            local_flags=local_flags,
+            check_returncode=check_returncode,
+            log_in_real_time=log_in_real_time,
+        )
+
+    def get_ref(
         self,
         *,
-        verbose: bool | None = None,
-    ) -> QueryList[GitWorktreeCmd]:
-        """List worktrees.
+        # Pass-through to run()
+        log_in_real_time: bool = False,
+        check_returncode: bool | None = None,
+        trim: bool = False,
+    ) -> str:
+        """Get the current notes ref.
 
-        Returns a :class:`~libvcs._internal.query_list.QueryList` of
-        :class:`~libvcs.cmd.git.GitWorktreeCmd` objects.
+        Examples
+        --------
+        >>> GitNotesManager(path=example_git_repo.path).get_ref(trim=True)
+        'refs/notes/commits'
+        """
+        return self.run(
+            "get-ref",
+            check_returncode=check_returncode,
+            log_in_real_time=log_in_real_time,
+            trim=trim,
+        )
 
-        Parameters
-        ----------
-        verbose :
-            Include additional information.
+    def _ls(self) -> list[tuple[str, str]]:
+        """List notes (raw output).
+
+        Returns list of (note_sha, object_sha) tuples.
 
         Examples
         --------
-        >>> worktrees = GitWorktreeManager(path=example_git_repo.path).ls()
-        >>> len(worktrees) >= 1
-        True
+        >>> GitNotesManager(path=example_git_repo.path)._ls()
+        [...]
         """
-        raw_entries = self._ls(verbose=verbose)
+        result = self.run("list")
+        if not result.strip():
+            return []
 
-        worktrees: list[GitWorktreeCmd] = []
-        for entry in raw_entries:
-            if not entry:
-                continue
+        notes = []
+        for line in result.strip().splitlines():
+            parts = line.split()
+            if len(parts) >= 2:
+                notes.append((parts[0], parts[1]))
+        return notes
 
-            # Parse porcelain format
-            worktree_path = None
-            head = None
-            branch = None
-            locked = False
-            prunable = False
-
-            for line in entry.split("\n"):
-                if line.startswith("worktree "):
-                    worktree_path = line[9:]
-                elif line.startswith("HEAD "):
-                    head = line[5:]
-                elif line.startswith("branch "):
-                    branch = line[7:]
-                elif line == "locked" or line.startswith("locked "):
-                    locked = True
-                elif line == "prunable" or line.startswith("prunable "):
-                    prunable = True
-
-            if worktree_path is not None:
-                worktrees.append(
-                    GitWorktreeCmd(
-                        path=self.path,
-                        cmd=self.cmd,
-                        worktree_path=worktree_path,
-                        head=head,
-                        branch=branch,
-                        locked=locked,
-                        prunable=prunable,
-                    ),
+    def ls(self) -> QueryList[GitNoteCmd]:
+        """List notes.
+
+        Returns a :class:`~libvcs._internal.query_list.QueryList` of
+        :class:`~libvcs.cmd.git.GitNoteCmd` objects.
+
+        Examples
+        --------
+        >>> notes = GitNotesManager(path=example_git_repo.path).ls()
+        >>> isinstance(notes, list)
+        True
+        """
+        raw_notes = self._ls()
+
+        return QueryList(
+            [
+                GitNoteCmd(
+                    path=self.path,
+                    cmd=self.cmd,
+                    object_sha=object_sha,
+                    note_sha=note_sha,
+                    ref=self.ref,
                 )
+                for note_sha, object_sha in raw_notes
+            ],
+        )
 
-        return QueryList(worktrees)
-
-    def get(self, *args: t.Any, **kwargs: t.Any) -> GitWorktreeCmd | None:
-        """Get worktree via filter lookup.
+    def get(self, *args: t.Any, **kwargs: t.Any) -> GitNoteCmd | None:
+        """Get note via filter lookup.
 
         Examples
         --------
-        >>> worktrees = GitWorktreeManager(path=example_git_repo.path).ls()
-        >>> if len(worktrees) > 0:
-        ...     wt = GitWorktreeManager(path=example_git_repo.path).get(
-        ...         worktree_path=worktrees[0].worktree_path
-        ...     )
-        ...     wt is not None
-        ... else:
-        ...     True
-        True
+        >>> GitNotesManager(path=example_git_repo.path).get(object_sha='HEAD')
+        Traceback (most recent call last):
+            ...
+        libvcs._internal.query_list.ObjectDoesNotExist
         """
         return self.ls().get(*args, **kwargs)
 
-    def filter(self, *args: t.Any, **kwargs: t.Any) -> list[GitWorktreeCmd]:
-        """Get worktrees via filter lookup.
+    def filter(self, *args: t.Any, **kwargs: t.Any) -> list[GitNoteCmd]:
+        """Get notes via filter lookup.
 
         Examples
         --------
-        >>> len(GitWorktreeManager(path=example_git_repo.path).filter()) >= 0
-        True
+        >>> GitNotesManager(path=example_git_repo.path).filter()
+        [...]
         """
         return self.ls().filter(*args, **kwargs)
 
 
-# =============================================================================
-# Git Notes Commands
-# =============================================================================
-
-GitNotesCommandLiteral = t.Literal[
-    "list",
-    "add",
-    "copy",
-    "append",
-    "edit",
+GitReflogCommandLiteral = t.Literal[
     "show",
-    "merge",
-    "remove",
-    "prune",
-    "get-ref",
+    "expire",
+    "delete",
+    "exists",
 ]
 
 
-class GitNoteCmd:
-    """Run git commands targeting a specific note."""
+@dataclasses.dataclass(slots=True)
+class GitReflogEntry:
+    """Represent a git reflog entry."""
+
+    sha: str
+    """Commit SHA."""
+
+    refspec: str
+    """Reference specification (e.g., HEAD@{0})."""
+
+    action: str
+    """Action performed (e.g., commit, checkout, merge)."""
+
+    message: str
+    """Commit/action message."""
+
+    timestamp: datetime.datetime | None = None
+    """When the ref was updated (UTC), not the commit date."""
+
+    identity: str | None = None
+    """Who updated the ref, as ``Name <email>``."""
+
+    #: Internal: GitReflogEntryCmd for operations on this entry
+    _cmd: GitReflogEntryCmd | None = dataclasses.field(default=None, repr=False)
+
+    @property
+    def cmd(self) -> GitReflogEntryCmd:
+        """Return command object for this reflog entry."""
+        if self._cmd is None:
+            msg = "GitReflogEntry not created with cmd reference"
+            raise ValueError(msg)
+        return self._cmd
+
+
+class GitReflogEntryCmd:
+    """Run git commands targeting a specific reflog entry."""
 
     def __init__(
         self,
         *,
         path: StrPath,
+        refspec: str,
         cmd: Git | None = None,
-        object_sha: str,
-        note_sha: str | None = None,
-        ref: str | None = None,
     ) -> None:
-        """Lite, typed, pythonic wrapper for a git-notes(1) entry.
+        """Wrap some of git-reflog(1) for specific entry operations.
 
         Parameters
         ----------
         path :
-            Path to the git repository.
-        object_sha :
-            SHA of the object this note is attached to.
-        note_sha :
-            SHA of the note blob itself.
-        ref :
-            Notes ref to use (default: refs/notes/commits).
+            Operates as PATH in the corresponding git subcommand.
+        refspec :
+            Reference specification (e.g., HEAD@{0}, master@{2}).
 
         Examples
         --------
-        >>> GitNoteCmd(
+        >>> GitReflogEntryCmd(
         ...     path=example_git_repo.path,
-        ...     object_sha='HEAD',
+        ...     refspec='HEAD@{0}',
         ... )
-        <GitNoteCmd path=... object_sha=HEAD>
+        <GitReflogEntryCmd HEAD@{0}>
         """
         #: Directory to check out
         self.path: pathlib.Path
@@ -7123,19 +11288,16 @@ class GitNoteCmd:
         else:
             self.path = pathlib.Path(path)
 
+        self.refspec = refspec
         self.cmd = cmd if isinstance(cmd, Git) else Git(path=self.path)
 
-        self.object_sha = object_sha
-        self.note_sha = note_sha
-        self.ref = ref
-
     def __repr__(self) -> str:
-        """Representation of a git note."""
-        return f"<GitNoteCmd path={self.path} object_sha={self.object_sha}>"
+        """Representation of git reflog entry cmd object."""
+        return f"<GitReflogEntryCmd {self.refspec}>"
 
     def run(
         self,
-        command: GitNotesCommandLiteral | None = None,
+        command: GitReflogCommandLiteral | None = None,
         local_flags: list[str] | None = None,
         *,
         # Pass-through to run()
@@ -7143,253 +11305,145 @@ class GitNoteCmd:
         check_returncode: bool | None = None,
         **kwargs: t.Any,
     ) -> str:
-        r"""Run command against git notes.
-
-        Wraps `git notes <https://git-scm.com/docs/git-notes>`_.
-        """
-        local_flags = local_flags if isinstance(local_flags, list) else []
-
-        # Add ref option if specified
-        ref_flags: list[str] = []
-        if self.ref is not None:
-            ref_flags.extend(["--ref", self.ref])
-
-        if command is not None:
-            local_flags.insert(0, command)
-
-        return self.cmd.run(
-            ["notes", *ref_flags, *local_flags],
-            check_returncode=check_returncode,
-            log_in_real_time=log_in_real_time,
-            **kwargs,
-        )
-
-    def show(
-        self,
-        *,
-        # Pass-through to run()
-        log_in_real_time: bool = False,
-        check_returncode: bool | None = None,
-    ) -> str:
-        """Show the note for this object.
-
-        Examples
-        --------
-        >>> GitNoteCmd(
-        ...     path=example_git_repo.path,
-        ...     object_sha='HEAD',
-        ... ).show()
-        'error: no note found for object...'
-        """
-        local_flags: list[str] = [self.object_sha]
-
-        return self.run(
-            "show",
-            local_flags=local_flags,
-            check_returncode=check_returncode,
-            log_in_real_time=log_in_real_time,
-        )
-
-    def remove(
-        self,
-        *,
-        ignore_missing: bool = False,
-        # Pass-through to run()
-        log_in_real_time: bool = False,
-        check_returncode: bool | None = None,
-    ) -> str:
-        """Remove the note for this object.
-
-        Parameters
-        ----------
-        ignore_missing :
-            Don't error if no note exists.
-
-        Examples
-        --------
-        >>> GitNoteCmd(
-        ...     path=example_git_repo.path,
-        ...     object_sha='HEAD',
-        ... ).remove(ignore_missing=True)
-        ''
-        """
-        local_flags: list[str] = []
-
-        if ignore_missing:
-            local_flags.append("--ignore-missing")
-
-        local_flags.append(self.object_sha)
-
-        return self.run(
-            "remove",
-            local_flags=local_flags,
-            check_returncode=check_returncode,
-            log_in_real_time=log_in_real_time,
-        )
+        """Run a command against a specific reflog entry.
 
-    def append(
-        self,
-        *,
-        message: str | None = None,
-        file: StrPath | None = None,
-        allow_empty: bool = False,
-        # Pass-through to run()
-        log_in_real_time: bool = False,
-        check_returncode: bool | None = None,
-    ) -> str:
-        """Append to the note for this object.
+        Wraps `git reflog <https://git-scm.com/docs/git-reflog>`_.
 
         Parameters
         ----------
-        message :
-            Note message to append.
-        file :
-            Read message from file.
-        allow_empty :
-            Allow empty note.
+        command :
+            Reflog command to run.
+        local_flags :
+            Additional flags to pass.
 
         Examples
         --------
-        >>> GitNoteCmd(
+        >>> GitReflogEntryCmd(
         ...     path=example_git_repo.path,
-        ...     object_sha='HEAD',
-        ... ).append(message='Additional note')
-        ''
+        ...     refspec='HEAD@{0}',
+        ... ).run('show')
+        '...'
         """
-        local_flags: list[str] = []
+        local_flags = local_flags if local_flags is not None else []
+        _cmd: list[str] = ["reflog"]
 
-        if message is not None:
-            local_flags.extend(["-m", message])
-        if file is not None:
-            local_flags.extend(["-F", str(file)])
-        if allow_empty:
-            local_flags.append("--allow-empty")
+        if command is not None:
+            _cmd.append(command)
 
-        local_flags.append(self.object_sha)
+        _cmd.extend(local_flags)
 
-        return self.run(
-            "append",
-            local_flags=local_flags,
+        return self.cmd.run(
+            _cmd,
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
+            **kwargs,
         )
 
-    def edit(
+    def show(
         self,
         *,
-        allow_empty: bool = False,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
-        **kwargs: t.Any,
     ) -> str:
-        """Edit the note for this object.
-
-        Note: This typically opens an editor, so it's mostly useful
-        in non-interactive contexts with GIT_EDITOR set.
-
-        Parameters
-        ----------
-        allow_empty :
-            Allow empty note.
+        """Show this reflog entry.
 
         Examples
         --------
-        Use config to override editor (avoids interactive editor):
-
-        >>> result = GitNoteCmd(
+        >>> result = GitReflogEntryCmd(
         ...     path=example_git_repo.path,
-        ...     object_sha='HEAD',
-        ... ).edit(allow_empty=True, config={'core.editor': 'true'})
-        >>> 'error' in result.lower() or result == ''
+        ...     refspec='HEAD@{0}',
+        ... ).show()
+        >>> len(result) > 0
         True
         """
-        local_flags: list[str] = []
-
-        if allow_empty:
-            local_flags.append("--allow-empty")
-
-        local_flags.append(self.object_sha)
-
         return self.run(
-            "edit",
-            local_flags=local_flags,
+            "show",
+            local_flags=["-1", self.refspec],
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
-            **kwargs,
         )
 
-    def copy(
+    def delete(
         self,
-        to_object: str,
         *,
-        force: bool = False,
+        rewrite: bool = False,
+        updateref: bool = False,
+        dry_run: bool = False,
+        verbose: bool = False,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
     ) -> str:
-        """Copy this note to another object.
+        """Delete this reflog entry.
 
         Parameters
         ----------
-        to_object :
-            Object to copy the note to.
-        force :
-            Overwrite existing note on target.
+        rewrite :
+            Adjust subsequent entries to compensate.
+        updateref :
+            Update the ref to the value of the prior entry.
+        dry_run :
+            Don't actually delete, just show what would be deleted.
+        verbose :
+            Print extra information.
 
         Examples
         --------
-        >>> result = GitNoteCmd(
+        >>> result = GitReflogEntryCmd(
         ...     path=example_git_repo.path,
-        ...     object_sha='HEAD',
-        ... ).copy('HEAD', force=True)
+        ...     refspec='HEAD@{0}',
+        ... ).delete(dry_run=True)
         >>> 'error' in result.lower() or result == ''
         True
         """
         local_flags: list[str] = []
 
-        if force:
-            local_flags.append("-f")
+        if rewrite:
+            local_flags.append("--rewrite")
+        if updateref:
+            local_flags.append("--updateref")
+        if dry_run:
+            local_flags.append("-n")
+        if verbose:
+            local_flags.append("--verbose")
 
-        local_flags.extend([self.object_sha, to_object])
+        local_flags.append(self.refspec)
 
         return self.run(
-            "copy",
+            "delete",
             local_flags=local_flags,
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
         )
 
 
-class GitNotesManager:
-    """Traverse git notes with :class:`~libvcs._internal.query_list.QueryList`."""
+class GitReflogManager:
+    """Traverse reflog entries with :class:`~libvcs._internal.query_list.QueryList`."""
 
     def __init__(
         self,
         *,
         path: StrPath,
         cmd: Git | None = None,
-        ref: str | None = None,
     ) -> None:
-        """Wrap some of git-notes(1), manager.
+        """Wrap some of git-reflog(1), manager.
 
         Parameters
         ----------
         path :
             Operates as PATH in the corresponding git subcommand.
-        ref :
-            Notes ref to use (default: refs/notes/commits).
 
         Examples
         --------
-        >>> GitNotesManager(path=tmp_path)
-        <GitNotesManager path=...>
+        >>> GitReflogManager(path=tmp_path)
+        <GitReflogManager path=...>
 
-        >>> GitNotesManager(path=tmp_path).run('list', trim=True)
+        >>> GitReflogManager(path=tmp_path).run('show', trim=True)
         'fatal: not a git repository (or any of the parent directories): .git'
 
-        >>> GitNotesManager(path=example_git_repo.path).run('list')
-        ''
+        >>> len(GitReflogManager(path=example_git_repo.path).run('show')) > 0
+        True
         """
         #: Directory to check out
         self.path: pathlib.Path
@@ -7399,15 +11453,14 @@ class GitNotesManager:
             self.path = pathlib.Path(path)
 
         self.cmd = cmd if isinstance(cmd, Git) else Git(path=self.path)
-        self.ref = ref
 
     def __repr__(self) -> str:
-        """Representation of git notes manager object."""
-        return f"<GitNotesManager path={self.path}>"
+        """Representation of git reflog manager object."""
+        return f"<GitReflogManager path={self.path}>"
 
     def run(
         self,
-        command: GitNotesCommandLiteral | None = None,
+        command: GitReflogCommandLiteral | None = None,
         local_flags: list[str] | None = None,
         *,
         # Pass-through to run()
@@ -7415,367 +11468,587 @@ class GitNotesManager:
         check_returncode: bool | None = None,
         **kwargs: t.Any,
     ) -> str:
-        """Run a command against a git repository's notes.
+        """Run a command against a git repository's reflog.
 
-        Wraps `git notes <https://git-scm.com/docs/git-notes>`_.
+        Wraps `git reflog <https://git-scm.com/docs/git-reflog>`_.
+
+        Parameters
+        ----------
+        command :
+            Reflog command to run.
+        local_flags :
+            Additional flags to pass.
 
         Examples
         --------
-        >>> GitNotesManager(path=example_git_repo.path).run('list')
-        ''
+        >>> len(GitReflogManager(path=example_git_repo.path).run('show')) > 0
+        True
         """
-        local_flags = local_flags if isinstance(local_flags, list) else []
-
-        # Add ref option if specified
-        ref_flags: list[str] = []
-        if self.ref is not None:
-            ref_flags.extend(["--ref", self.ref])
+        local_flags = local_flags if local_flags is not None else []
+        _cmd: list[str] = ["reflog"]
 
         if command is not None:
-            local_flags.insert(0, command)
+            _cmd.append(command)
+
+        _cmd.extend(local_flags)
 
         return self.cmd.run(
-            ["notes", *ref_flags, *local_flags],
+            _cmd,
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
             **kwargs,
         )
 
-    def add(
+    def show(
         self,
-        object_sha: str = "HEAD",
+        ref: str = "HEAD",
         *,
-        message: str | None = None,
-        file: StrPath | None = None,
-        force: bool = False,
-        allow_empty: bool = False,
+        number: int | None = None,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
     ) -> str:
-        """Add a note to an object.
+        """Show reflog for a ref.
 
         Parameters
         ----------
-        object_sha :
-            Object to add note to (default: HEAD).
-        message :
-            Note message.
-        file :
-            Read message from file.
-        force :
-            Overwrite existing note.
-        allow_empty :
-            Allow empty note.
+        ref :
+            Reference to show reflog for (default: HEAD).
+        number :
+            Limit number of entries to show.
 
         Examples
         --------
-        >>> result = GitNotesManager(path=example_git_repo.path).add(
-        ...     message='Test note', force=True
-        ... )
-        >>> 'error' in result.lower() or 'Overwriting' in result or result == ''
+        >>> result = GitReflogManager(path=example_git_repo.path).show()
+        >>> len(result) > 0
+        True
+
+        >>> result = GitReflogManager(path=example_git_repo.path).show(number=5)
+        >>> len(result) > 0
         True
         """
         local_flags: list[str] = []
 
-        if message is not None:
-            local_flags.extend(["-m", message])
-        if file is not None:
-            local_flags.extend(["-F", str(file)])
-        if force:
-            local_flags.append("-f")
-        if allow_empty:
-            local_flags.append("--allow-empty")
+        if number is not None:
+            local_flags.extend(["-n", str(number)])
 
-        local_flags.append(object_sha)
+        local_flags.append(ref)
+
+        return self.run(
+            "show",
+            local_flags=local_flags,
+            check_returncode=check_returncode,
+            log_in_real_time=log_in_real_time,
+        )
+
+    def expire(
+        self,
+        *,
+        expire: str | None = None,
+        expire_unreachable: str | None = None,
+        rewrite: bool = False,
+        updateref: bool = False,
+        stale_fix: bool = False,
+        dry_run: bool = False,
+        verbose: bool = False,
+        all_refs: bool = False,
+        single_worktree: bool = False,
+        refs: list[str] | None = None,
+        # Pass-through to run()
+        log_in_real_time: bool = False,
+        check_returncode: bool | None = None,
+    ) -> str:
+        """Expire old reflog entries.
+
+        Parameters
+        ----------
+        expire :
+            Expire entries older than this time.
+        expire_unreachable :
+            Expire unreachable entries older than this time.
+        rewrite :
+            Adjust reflog entries as old entries are pruned.
+        updateref :
+            Update ref to pruned value.
+        stale_fix :
+            Prune stale git-hierarchies too.
+        dry_run :
+            Don't actually prune, just report.
+        verbose :
+            Print extra information.
+        all_refs :
+            Process reflogs of all refs.
+        single_worktree :
+            Only process reflogs for current worktree.
+        refs :
+            Specific refs to expire.
+
+        Examples
+        --------
+        >>> result = GitReflogManager(path=example_git_repo.path).expire(
+        ...     dry_run=True
+        ... )
+        >>> 'error' in result.lower() or result == ''
+        True
+        """
+        local_flags: list[str] = []
+
+        if expire is not None:
+            local_flags.append(f"--expire={expire}")
+        if expire_unreachable is not None:
+            local_flags.append(f"--expire-unreachable={expire_unreachable}")
+        if rewrite:
+            local_flags.append("--rewrite")
+        if updateref:
+            local_flags.append("--updateref")
+        if stale_fix:
+            local_flags.append("--stale-fix")
+        if dry_run:
+            local_flags.append("--dry-run")
+        if verbose:
+            local_flags.append("--verbose")
+        if all_refs:
+            local_flags.append("--all")
+            if single_worktree:
+                local_flags.append("--single-worktree")
+        if refs is not None:
+            local_flags.extend(refs)
 
         return self.run(
-            "add",
+            "expire",
             local_flags=local_flags,
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
         )
 
-    def prune(
+    def exists(
         self,
+        ref: str,
         *,
-        dry_run: bool = False,
-        verbose: bool = False,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
-    ) -> str:
-        """Prune notes for non-existing objects.
+    ) -> bool:
+        """Check if a reflog exists for a ref.
 
         Parameters
         ----------
-        dry_run :
-            Don't remove, just report.
-        verbose :
-            Report all removed notes.
+        ref :
+            Reference to check.
+
+        Returns
+        -------
+        bool
+            True if reflog exists, False otherwise.
 
         Examples
         --------
-        >>> GitNotesManager(path=example_git_repo.path).prune()
-        ''
+        >>> GitReflogManager(path=example_git_repo.path).exists('HEAD')
+        True
 
-        >>> GitNotesManager(path=example_git_repo.path).prune(dry_run=True)
-        ''
+        >>> GitReflogManager(path=example_git_repo.path).exists(
+        ...     'refs/heads/nonexistent-branch-xyz123456'
+        ... )
+        False
         """
-        local_flags: list[str] = []
-
-        if dry_run:
-            local_flags.append("-n")
-        if verbose:
-            local_flags.append("-v")
+        from libvcs.exc import CommandError
 
-        return self.run(
-            "prune",
-            local_flags=local_flags,
-            check_returncode=check_returncode,
-            log_in_real_time=log_in_real_time,
-        )
+        try:
+            self.run(
+                "exists",
+                local_flags=[ref],
+                check_returncode=True,
+                log_in_real_time=log_in_real_time,
+            )
+        except CommandError:
+            return False
+        else:
+            return True
 
-    def merge(
+    def iter_entries(
         self,
-        notes_ref: str | None = None,
+        ref: str = "HEAD",
         *,
-        strategy: str | None = None,
-        commit: bool = False,
-        abort: bool = False,
-        quiet: bool = False,
-        verbose: bool = False,
-        # Pass-through to run()
-        log_in_real_time: bool = False,
-        check_returncode: bool | None = None,
-    ) -> str:
-        """Merge notes from another ref.
-
-        Git notes merge has three mutually exclusive forms:
+        skip: int | None = None,
+        number: int | None = None,
+        since: datetime.datetime | None = None,
+        until: datetime.datetime | None = None,
+    ) -> Generator[GitReflogEntry, None, None]:
+        """Stream reflog entries, newest first.
 
-        1. ``git notes merge [-s <strategy>] <notes-ref>`` - Start a merge
-        2. ``git notes merge --commit`` - Finalize in-progress merge
-        3. ``git notes merge --abort`` - Abort in-progress merge
+        Wraps ``git reflog show -z --format=...``; fields are NUL-separated so
+        messages containing colons or unusual characters parse intact, and
+        entries are yielded as git prints them rather than buffered.
 
         Parameters
         ----------
-        notes_ref :
-            Notes ref to merge from. Required for starting a merge,
-            must be None when using commit or abort.
-        strategy :
-            Merge strategy (manual, ours, theirs, union, cat_sort_uniq).
-            Only valid when starting a merge with notes_ref.
-        commit :
-            Finalize in-progress merge. Cannot be combined with abort or notes_ref.
-        abort :
-            Abort in-progress merge. Cannot be combined with commit or notes_ref.
-        quiet :
-            Suppress output.
-        verbose :
-            Verbose output.
+        ref :
+            Reference to walk the reflog of.
+        skip :
+            Cursor: skip this many of the newest entries, ``--skip``.
+        number :
+            Page size: stop after this many entries, ``-n``.
+        since :
+            Only entries made at or after this time.
+        until :
+            Only entries made at or before this time.
+
+        Notes
+        -----
+        Reflog timestamps are not guaranteed to be monotonic (clock skew,
+        ``git reflog expire``, imported history), so ``since`` and ``until``
+        filter every entry rather than ending the walk early. Combine them
+        with ``number`` to bound the work.
 
         Examples
         --------
-        >>> result = GitNotesManager(path=example_git_repo.path).merge(
-        ...     'refs/notes/other'
-        ... )
-        >>> 'error' in result.lower() or 'fatal' in result.lower() or result == ''
-        True
+        >>> reflog = GitReflogManager(path=example_git_repo.path)
+        >>> entry = next(reflog.iter_entries())
+        >>> entry.refspec
+        'HEAD@{0}'
+        >>> entry.timestamp.tzinfo
+        datetime.timezone.utc
+
+        Page through with ``skip``/``number``; selectors keep their position:
+
+        >>> [e.refspec for e in reflog.iter_entries(skip=0, number=1)]
+        ['HEAD@{0}']
+        >>> list(reflog.iter_entries(skip=1_000, number=1))
+        []
         """
-        # Validate mutual exclusivity
-        if commit and abort:
-            msg = "Cannot specify both commit and abort"
-            raise ValueError(msg)
+        local_flags = [
+            "-z",
+            "--date=unix",
+            "--format=%gd%x00%H%x00%gn <%ge>%x00%gs",
+        ]
+        if skip is not None:
+            local_flags.append(f"--skip={skip}")
+        if number is not None:
+            local_flags.extend(["-n", str(number)])
 
-        if commit or abort:
-            if notes_ref is not None:
-                msg = "Cannot specify notes_ref with --commit or --abort"
-                raise ValueError(msg)
-            if strategy is not None:
-                msg = "Cannot specify strategy with --commit or --abort"
-                raise ValueError(msg)
-        elif notes_ref is None:
-            msg = "notes_ref is required when not using --commit or --abort"
-            raise ValueError(msg)
+        records = split_records(
+            self.cmd.stream(["reflog", "show", *local_flags, ref, "--"]),
+        )
+        try:
+            for index, selector in enumerate(records, start=skip or 0):
+                sha = next(records, "")
+                identity = next(records, "")
+                subject = next(records, "")
+
+                name, _, unix_time = selector.rpartition("@{")
+                timestamp = datetime.datetime.fromtimestamp(
+                    int(unix_time.rstrip("}")),
+                    tz=datetime.timezone.utc,
+                )
+                if until is not None and timestamp > until:
+                    continue
+                if since is not None and timestamp < since:
+                    continue
+
+                action, sep, message = subject.partition(": ")
+                yield GitReflogEntry(
+                    sha=sha,
+                    refspec=f"{name}@{{{index}}}",
+                    action=action,
+                    message=message if sep else "",
+                    timestamp=timestamp,
+                    identity=identity,
+                    _cmd=GitReflogEntryCmd(
+                        path=self.path,
+                        refspec=f"{name}@{{{index}}}",
+                        cmd=self.cmd,
+                    ),
+                )
+        finally:
+            records.close()
 
-        local_flags: list[str] = []
+    def _ls(
+        self,
+        ref: str = "HEAD",
+        *,
+        number: int | None = None,
+        check_returncode: bool | None = None,
+    ) -> list[dict[str, t.Any]]:
+        """Parse reflog output into structured data.
 
-        if strategy is not None:
-            local_flags.extend(["-s", strategy])
-        if commit:
-            local_flags.append("--commit")
-        if abort:
-            local_flags.append("--abort")
-        if quiet:
-            local_flags.append("-q")
-        if verbose:
-            local_flags.append("-v")
+        Parameters
+        ----------
+        ref :
+            Reference to list reflog for.
+        number :
+            Limit number of entries.
 
-        if notes_ref is not None:
-            local_flags.append(notes_ref)
+        Returns
+        -------
+        list[dict[str, Any]]
+            List of parsed reflog entries.
 
-        return self.run(
-            "merge",
-            local_flags=local_flags,
-            check_returncode=check_returncode,
-            log_in_real_time=log_in_real_time,
-        )
+        Examples
+        --------
+        >>> entries = GitReflogManager(path=example_git_repo.path)._ls()
+        >>> len(entries) > 0
+        True
+        """
+        try:
+            return [
+                {
+                    "sha": entry.sha,
+                    "refspec": entry.refspec,
+                    "action": entry.action,
+                    "message": entry.message,
+                    "timestamp": entry.timestamp,
+                    "identity": entry.identity,
+                }
+                for entry in self.iter_entries(ref=ref, number=number)
+            ]
+        except exc.CommandError:
+            if check_returncode:
+                raise
+            return []
 
-    def get_ref(
+    def ls(
         self,
+        ref: str = "HEAD",
         *,
-        # Pass-through to run()
-        log_in_real_time: bool = False,
-        check_returncode: bool | None = None,
-        trim: bool = False,
-    ) -> str:
-        """Get the current notes ref.
+        number: int | None = None,
+        skip: int | None = None,
+        since: datetime.datetime | None = None,
+        until: datetime.datetime | None = None,
+    ) -> QueryList[GitReflogEntry]:
+        """List reflog entries as :class:`~libvcs.cmd.git.GitReflogEntry` objects.
+
+        Parameters
+        ----------
+        ref :
+            Reference to list reflog for.
+        number :
+            Limit number of entries.
+        skip :
+            Skip this many of the newest entries.
+        since :
+            Only entries made at or after this time.
+        until :
+            Only entries made at or before this time.
+
+        Returns
+        -------
+        QueryList[GitReflogEntry]
+            List of reflog entries with ORM-like filtering.
 
         Examples
         --------
-        >>> GitNotesManager(path=example_git_repo.path).get_ref(trim=True)
-        'refs/notes/commits'
+        >>> entries = GitReflogManager(path=example_git_repo.path).ls()
+        >>> isinstance(entries, QueryList)
+        True
+        >>> len(entries) > 0
+        True
         """
-        return self.run(
-            "get-ref",
-            check_returncode=check_returncode,
-            log_in_real_time=log_in_real_time,
-            trim=trim,
+        return QueryList(
+            self.iter_entries(
+                ref=ref,
+                skip=skip,
+                number=number,
+                since=since,
+                until=until,
+            ),
         )
 
-    def _ls(self) -> list[tuple[str, str]]:
-        """List notes (raw output).
+    def get(
+        self,
+        refspec: str | None = None,
+        sha: str | None = None,
+        **kwargs: t.Any,
+    ) -> GitReflogEntry:
+        """Get a specific reflog entry.
 
-        Returns list of (note_sha, object_sha) tuples.
+        Parameters
+        ----------
+        refspec :
+            Reference specification to find.
+        sha :
+            SHA to find.
+        **kwargs :
+            Additional filter criteria.
+
+        Returns
+        -------
+        GitReflogEntry
+            The matching reflog entry.
+
+        Raises
+        ------
+        :exc:`~libvcs._internal.query_list.ObjectDoesNotExist`
+            If no matching entry found.
+        :exc:`~libvcs._internal.query_list.MultipleObjectsReturned`
+            If multiple entries match.
 
         Examples
         --------
-        >>> GitNotesManager(path=example_git_repo.path)._ls()
-        [...]
+        >>> entry = GitReflogManager(path=example_git_repo.path).get(
+        ...     refspec='HEAD@{0}'
+        ... )
+        >>> entry.refspec
+        'HEAD@{0}'
         """
-        result = self.run("list")
-        if not result.strip():
-            return []
+        filters: dict[str, t.Any] = {}
+        if refspec is not None:
+            filters["refspec"] = refspec
+        if sha is not None:
+            filters["sha"] = sha
+        filters.update(kwargs)
+
+        result = self.ls().get(**filters)
+        assert result is not None  # get() raises ObjectDoesNotExist, never returns None
+        return result
 
-        notes = []
-        for line in result.strip().splitlines():
-            parts = line.split()
-            if len(parts) >= 2:
-                notes.append((parts[0], parts[1]))
-        return notes
+    def filter(
+        self,
+        *args: t.Any,
+        **kwargs: t.Any,
+    ) -> QueryList[GitReflogEntry]:
+        """Filter reflog entries.
 
-    def ls(self) -> QueryList[GitNoteCmd]:
-        """List notes.
+        Parameters
+        ----------
+        *args :
+            Positional arguments for
+            :meth:`~libvcs._internal.query_list.QueryList.filter`.
+        **kwargs :
+            Keyword arguments for filtering (supports Django-style lookups).
 
-        Returns a :class:`~libvcs._internal.query_list.QueryList` of
-        :class:`~libvcs.cmd.git.GitNoteCmd` objects.
+        Returns
+        -------
+        QueryList[GitReflogEntry]
+            Filtered list of reflog entries.
 
         Examples
         --------
-        >>> notes = GitNotesManager(path=example_git_repo.path).ls()
-        >>> isinstance(notes, list)
+        >>> entries = GitReflogManager(path=example_git_repo.path).filter(
+        ...     action='commit'
+        ... )
+        >>> isinstance(entries, QueryList)
         True
         """
-        raw_notes = self._ls()
+        return self.ls().filter(*args, **kwargs)
 
-        return QueryList(
-            [
-                GitNoteCmd(
-                    path=self.path,
-                    cmd=self.cmd,
-                    object_sha=object_sha,
-                    note_sha=note_sha,
-                    ref=self.ref,
-                )
-                for note_sha, object_sha in raw_notes
-            ],
-        )
 
-    def get(self, *args: t.Any, **kwargs: t.Any) -> GitNoteCmd | None:
-        """Get note via filter lookup.
+GitMaintenanceTaskLiteral = t.Literal[
+    "commit-graph",
+    "prefetch",
+    "gc",
+    "loose-objects",
+    "incremental-repack",
+    "pack-refs",
+]
 
-        Examples
-        --------
-        >>> GitNotesManager(path=example_git_repo.path).get(object_sha='HEAD')
-        Traceback (most recent call last):
-            ...
-        libvcs._internal.query_list.ObjectDoesNotExist
-        """
-        return self.ls().get(*args, **kwargs)
 
-    def filter(self, *args: t.Any, **kwargs: t.Any) -> list[GitNoteCmd]:
-        """Get notes via filter lookup.
+@dataclasses.dataclass(frozen=True, slots=True)
+class GitObjectCounts:
+    """Object store health, from ``git count-objects -v``.
 
-        Examples
-        --------
-        >>> GitNotesManager(path=example_git_repo.path).filter()
-        [...]
-        """
-        return self.ls().filter(*args, **kwargs)
+    Sizes are in bytes (git reports KiB).
+    """
 
+    loose_objects: int
+    """Number of loose objects."""
 
-GitReflogCommandLiteral = t.Literal[
-    "show",
-    "expire",
-    "delete",
-    "exists",
-]
+    loose_size: int
+    """Disk space consumed by loose objects."""
 
+    packed_objects: int
+    """Number of in-pack objects."""
 
-@dataclasses.dataclass
-class GitReflogEntry:
-    """Represent a git reflog entry."""
+    packs: int
+    """Number of packs."""
 
-    sha: str
-    """Commit SHA."""
+    pack_size: int
+    """Disk space consumed by packs."""
 
-    refspec: str
-    """Reference specification (e.g., HEAD@{0})."""
+    prunable_objects: int
+    """Loose objects that are also present in packs."""
 
-    action: str
-    """Action performed (e.g., commit, checkout, merge)."""
+    garbage_files: int
+    """Files in the object database that are neither objects nor packs."""
 
-    message: str
-    """Commit/action message."""
+    garbage_size: int
+    """Disk space consumed by garbage files."""
 
-    #: Internal: GitReflogEntryCmd for operations on this entry
-    _cmd: GitReflogEntryCmd | None = dataclasses.field(default=None, repr=False)
+    @classmethod
+    def from_output(cls, output: str) -> GitObjectCounts:
+        r"""Parse ``git count-objects -v`` output.
 
-    @property
-    def cmd(self) -> GitReflogEntryCmd:
-        """Return command object for this reflog entry."""
-        if self._cmd is None:
-            msg = "GitReflogEntry not created with cmd reference"
-            raise ValueError(msg)
-        return self._cmd
+        Examples
+        --------
+        >>> counts = GitObjectCounts.from_output(
+        ...     'count: 12\nsize: 48\nin-pack: 300\npacks: 2\n'
+        ...     'size-pack: 1024\nprune-packable: 1\ngarbage: 0\n'
+        ...     'size-garbage: 0'
+        ... )
+        >>> counts.loose_objects, counts.packs, counts.pack_size
+        (12, 2, 1048576)
+        """
+        values: dict[str, int] = {}
+        for line in output.splitlines():
+            key, sep, value = line.partition(": ")
+            if sep:
+                values[key.strip()] = int(value)
+        return cls(
+            loose_objects=values.get("count", 0),
+            loose_size=values.get("size", 0) * 1024,
+            packed_objects=values.get("in-pack", 0),
+            packs=values.get("packs", 0),
+            pack_size=values.get("size-pack", 0) * 1024,
+            prunable_objects=values.get("prune-packable", 0),
+            garbage_files=values.get("garbage", 0),
+            garbage_size=values.get("size-garbage", 0) * 1024,
+        )
 
+    def needs_repack(
+        self,
+        *,
+        loose_objects_limit: int = 6700,
+        packs_limit: int = 50,
+    ) -> bool:
+        r"""Return True when git's ``gc --auto`` heuristics would repack.
+
+        The defaults mirror ``gc.auto`` and ``gc.autoPackLimit``.
+
+        Examples
+        --------
+        >>> counts = GitObjectCounts.from_output('count: 7000\npacks: 3')
+        >>> counts.needs_repack()
+        True
+        >>> counts.needs_repack(loose_objects_limit=10_000)
+        False
+        """
+        return (
+            self.loose_objects > loose_objects_limit > 0 or self.packs > packs_limit > 0
+        )
 
-class GitReflogEntryCmd:
-    """Run git commands targeting a specific reflog entry."""
+
+class GitMaintenanceManager:
+    """Keep a repository's object store and refs fast to query."""
 
     def __init__(
         self,
         *,
         path: StrPath,
-        refspec: str,
         cmd: Git | None = None,
     ) -> None:
-        """Wrap some of git-reflog(1) for specific entry operations.
+        """Wrap git-maintenance(1) and the commands its tasks are built on.
 
         Parameters
         ----------
         path :
             Operates as PATH in the corresponding git subcommand.
-        refspec :
-            Reference specification (e.g., HEAD@{0}, master@{2}).
 
         Examples
         --------
-        >>> GitReflogEntryCmd(
-        ...     path=example_git_repo.path,
-        ...     refspec='HEAD@{0}',
-        ... )
-        <GitReflogEntryCmd HEAD@{0}>
+        >>> GitMaintenanceManager(path=tmp_path)
+        <GitMaintenanceManager path=...>
+
+        >>> GitMaintenanceManager(path=example_git_repo.path).count_objects()
+        GitObjectCounts(loose_objects=..., ...)
         """
         #: Directory to check out
         self.path: pathlib.Path
@@ -7784,16 +12057,16 @@ class GitReflogEntryCmd:
         else:
             self.path = pathlib.Path(path)
 
-        self.refspec = refspec
         self.cmd = cmd if isinstance(cmd, Git) else Git(path=self.path)
 
     def __repr__(self) -> str:
-        """Representation of git reflog entry cmd object."""
-        return f"<GitReflogEntryCmd {self.refspec}>"
+        """Representation of git maintenance manager object."""
+        return f"<GitMaintenanceManager path={self.path}>"
 
     def run(
         self,
-        command: GitReflogCommandLiteral | None = None,
+        command: t.Literal["run", "start", "stop", "register", "unregister"]
+        | None = None,
         local_flags: list[str] | None = None,
         *,
         # Pass-through to run()
@@ -7801,121 +12074,471 @@ class GitReflogEntryCmd:
         check_returncode: bool | None = None,
         **kwargs: t.Any,
     ) -> str:
-        """Run a command against a specific reflog entry.
+        """Run a command against a git repository's maintenance.
 
-        Wraps `git reflog <https://git-scm.com/docs/git-reflog>`_.
+        Wraps `git maintenance <https://git-scm.com/docs/git-maintenance>`_.
 
         Parameters
         ----------
         command :
-            Reflog command to run.
+            Maintenance command to run.
         local_flags :
             Additional flags to pass.
 
         Examples
         --------
-        >>> GitReflogEntryCmd(
-        ...     path=example_git_repo.path,
-        ...     refspec='HEAD@{0}',
-        ... ).run('show')
-        '...'
+        >>> GitMaintenanceManager(path=example_git_repo.path).run(
+        ...     'run', ['--task=loose-objects', '--quiet']
+        ... )
+        ''
         """
         local_flags = local_flags if local_flags is not None else []
-        _cmd: list[str] = ["reflog"]
+        _cmd: list[str] = ["maintenance"]
+
+        if command is not None:
+            _cmd.append(command)
+
+        _cmd.extend(local_flags)
+
+        return self.cmd.run(
+            _cmd,
+            check_returncode=check_returncode,
+            log_in_real_time=log_in_real_time,
+            **kwargs,
+        )
+
+    def run_tasks(
+        self,
+        tasks: Sequence[GitMaintenanceTaskLiteral] | None = None,
+        *,
+        auto: bool | None = None,
+        schedule: t.Literal["hourly", "daily", "weekly"] | None = None,
+        quiet: bool | None = True,
+        # Pass-through to run()
+        log_in_real_time: bool = False,
+        check_returncode: bool | None = None,
+    ) -> str:
+        """Run maintenance tasks, ``git maintenance run``.
+
+        Parameters
+        ----------
+        tasks :
+            Tasks to run, in order (``--task=<task>``). Without tasks, git
+            runs those enabled by ``maintenance.<task>.enabled`` (``gc`` by
+            default).
+        auto :
+            ``--auto``: only run tasks whose thresholds are exceeded.
+        schedule :
+            ``--schedule=<frequency>``: run tasks due at that frequency.
+        quiet :
+            ``--quiet``
+
+        Examples
+        --------
+        >>> maintenance = GitMaintenanceManager(path=example_git_repo.path)
+        >>> maintenance.run_tasks(['commit-graph', 'loose-objects'])
+        ''
+        """
+        local_flags: list[str] = [f"--task={task}" for task in tasks or ()]
+
+        if auto is True:
+            local_flags.append("--auto")
+        if schedule is not None:
+            local_flags.append(f"--schedule={schedule}")
+        if quiet is True:
+            local_flags.append("--quiet")
+
+        return self.run(
+            "run",
+            local_flags=local_flags,
+            check_returncode=check_returncode,
+            log_in_real_time=log_in_real_time,
+        )
+
+    def write_commit_graph(
+        self,
+        *,
+        reachable: bool | None = True,
+        changed_paths: bool | None = True,
+        split: bool | t.Literal["no-merge", "replace"] | None = None,
+        # Pass-through to run()
+        log_in_real_time: bool = False,
+        check_returncode: bool | None = None,
+    ) -> str:
+        """Write the commit-graph file, ``git commit-graph write``.
+
+        The commit-graph speeds up history walks (``rev-list``,
+        ``merge-base``, ``log``); changed-path Bloom filters speed up
+        ``log -- <path>``.
+
+        Parameters
+        ----------
+        reachable :
+            ``--reachable``: walk from every ref.
+        changed_paths :
+            ``--changed-paths``: compute Bloom filters for changed paths.
+        split :
+            ``--split[=<strategy>]``: write an incremental commit-graph.
+
+        Examples
+        --------
+        >>> maintenance = GitMaintenanceManager(path=example_git_repo.path)
+        >>> maintenance.write_commit_graph()
+        ''
+        """
+        local_flags: list[str] = ["write"]
+
+        if reachable is True:
+            local_flags.append("--reachable")
+        if changed_paths is True:
+            local_flags.append("--changed-paths")
+        elif changed_paths is False:
+            local_flags.append("--no-changed-paths")
+        if split is True:
+            local_flags.append("--split")
+        elif isinstance(split, str):
+            local_flags.append(f"--split={split}")
+
+        return self.cmd.run(
+            ["commit-graph", *local_flags],
+            check_returncode=check_returncode,
+            log_in_real_time=log_in_real_time,
+        )
+
+    def write_multi_pack_index(
+        self,
+        *,
+        bitmap: bool | None = None,
+        # Pass-through to run()
+        log_in_real_time: bool = False,
+        check_returncode: bool | None = None,
+    ) -> str:
+        """Index every pack in one file, ``git multi-pack-index write``.
+
+        Parameters
+        ----------
+        bitmap :
+            ``--bitmap``: also write a reachability bitmap.
+
+        Examples
+        --------
+        >>> maintenance = GitMaintenanceManager(path=example_git_repo.path)
+        >>> maintenance.write_multi_pack_index()
+        ''
+        """
+        local_flags: list[str] = ["write"]
+
+        if bitmap is True:
+            local_flags.append("--bitmap")
+
+        return self.cmd.run(
+            ["multi-pack-index", *local_flags],
+            check_returncode=check_returncode,
+            log_in_real_time=log_in_real_time,
+        )
+
+    def repack_multi_pack_index(
+        self,
+        *,
+        batch_size: int | str | None = None,
+        # Pass-through to run()
+        log_in_real_time: bool = False,
+        check_returncode: bool | None = None,
+    ) -> str:
+        """Combine small packs listed in the multi-pack-index.
+
+        Wraps ``git multi-pack-index repack``.
+
+        Parameters
+        ----------
+        batch_size :
+            ``--batch-size=<size>``: gather packs smaller than this into one.
+            ``0`` repacks every pack.
+
+        Examples
+        --------
+        >>> maintenance = GitMaintenanceManager(path=example_git_repo.path)
+        >>> maintenance.write_multi_pack_index()
+        ''
+        >>> maintenance.repack_multi_pack_index(batch_size=0)
+        ''
+        """
+        local_flags: list[str] = ["repack"]
+
+        if batch_size is not None:
+            local_flags.append(f"--batch-size={batch_size}")
+
+        return self.cmd.run(
+            ["multi-pack-index", *local_flags],
+            check_returncode=check_returncode,
+            log_in_real_time=log_in_real_time,
+        )
+
+    def pack_refs(
+        self,
+        *,
+        _all: bool | None = True,
+        prune: bool | None = None,
+        # Pass-through to run()
+        log_in_real_time: bool = False,
+        check_returncode: bool | None = None,
+    ) -> str:
+        """Move loose refs into ``packed-refs``, ``git pack-refs``.
+
+        Parameters
+        ----------
+        _all :
+            ``--all``: pack every ref, not only tags and already-packed refs.
+        prune :
+            ``--prune`` / ``--no-prune``: remove the loose refs afterwards
+            (git's default).
 
-        if command is not None:
-            _cmd.append(command)
+        Examples
+        --------
+        >>> maintenance = GitMaintenanceManager(path=example_git_repo.path)
+        >>> maintenance.pack_refs()
+        ''
+        """
+        local_flags: list[str] = []
 
-        _cmd.extend(local_flags)
+        if _all is True:
+            local_flags.append("--all")
+        if prune is True:
+            local_flags.append("--prune")
+        elif prune is False:
+            local_flags.append("--no-prune")
 
         return self.cmd.run(
-            _cmd,
+            ["pack-refs", *local_flags],
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
-            **kwargs,
         )
 
-    def show(
-        self,
-        *,
-        # Pass-through to run()
-        log_in_real_time: bool = False,
-        check_returncode: bool | None = None,
-    ) -> str:
-        """Show this reflog entry.
+    def count_objects(self) -> GitObjectCounts:
+        """Return object store health, ``git count-objects -v``.
 
         Examples
         --------
-        >>> result = GitReflogEntryCmd(
-        ...     path=example_git_repo.path,
-        ...     refspec='HEAD@{0}',
-        ... ).show()
-        >>> len(result) > 0
+        >>> maintenance = GitMaintenanceManager(path=example_git_repo.path)
+        >>> counts = maintenance.count_objects()
+        >>> counts.packed_objects + counts.loose_objects > 0
         True
+        >>> counts.needs_repack()
+        False
         """
-        return self.run(
-            "show",
-            local_flags=["-1", self.refspec],
-            check_returncode=check_returncode,
-            log_in_real_time=log_in_real_time,
+        return GitObjectCounts.from_output(
+            self.cmd.run(["count-objects", "-v"], check_returncode=True),
         )
 
-    def delete(
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class GitRepoRunResult:
+    """What a command did in one repository of a :class:`GitRepoRegistry`."""
+
+    path: str
+    """The repository, as registered."""
+
+    returncode: int
+    output: str
+    """stdout and stderr, interleaved."""
+
+    @property
+    def ok(self) -> bool:
+        """True if the command succeeded."""
+        return self.returncode == 0
+
+
+def _config_value(value: str) -> str:
+    """Quote ``value`` for a git config file."""
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return f'"{escaped}"'
+
+
+class GitRepoRegistry:
+    """Repositories listed in a multi-valued config key, run as one batch.
+
+    The key defaults to ``maintenance.repo``, the list ``git maintenance
+    register`` keeps and ``git maintenance run --schedule`` walks.
+    """
+
+    #: Key :meth:`run` hands ``git for-each-repo`` in its snapshot file
+    snapshot_key = "libvcs.forEachRepo"
+
+    def __init__(
         self,
+        key: str = "maintenance.repo",
         *,
-        rewrite: bool = False,
-        updateref: bool = False,
-        dry_run: bool = False,
-        verbose: bool = False,
-        # Pass-through to run()
-        log_in_real_time: bool = False,
-        check_returncode: bool | None = None,
-    ) -> str:
-        """Delete this reflog entry.
+        config_file: StrPath | None = None,
+        cmd: Git | None = None,
+    ) -> None:
+        r"""Manage the repositories listed in ``key``.
 
         Parameters
         ----------
-        rewrite :
-            Adjust subsequent entries to compensate.
-        updateref :
-            Update the ref to the value of the prior entry.
-        dry_run :
-            Don't actually delete, just show what would be deleted.
-        verbose :
-            Print extra information.
+        key :
+            Multi-valued config key holding repository paths.
+        config_file :
+            Config file holding the list. Default: the user's global config
+            (``--global``).
+        cmd :
+            Git used to run commands. Default: one in the current directory.
 
         Examples
         --------
-        >>> result = GitReflogEntryCmd(
-        ...     path=example_git_repo.path,
-        ...     refspec='HEAD@{0}',
-        ... ).delete(dry_run=True)
-        >>> 'error' in result.lower() or result == ''
+        >>> registry = GitRepoRegistry('libvcs.repo', config_file=tmp_path / 'repos')
+        >>> registry.register(example_git_repo.path)
+        >>> registry.paths() == [str(example_git_repo.path)]
         True
+        >>> for result in registry.run(['rev-parse', '--is-inside-work-tree']):
+        ...     print(result.ok, result.output)
+        True true
+        <BLANKLINE>
         """
-        local_flags: list[str] = []
+        self.key = key
+        self.config_file = (
+            pathlib.Path(config_file) if config_file is not None else None
+        )
+        self.cmd = cmd if isinstance(cmd, Git) else Git(path=pathlib.Path.cwd())
 
-        if rewrite:
-            local_flags.append("--rewrite")
-        if updateref:
-            local_flags.append("--updateref")
-        if dry_run:
-            local_flags.append("-n")
-        if verbose:
-            local_flags.append("--verbose")
+    def __repr__(self) -> str:
+        """Representation of a repository registry."""
+        return f"<GitRepoRegistry key={self.key}>"
 
-        local_flags.append(self.refspec)
+    def _config(self, args: list[str]) -> str:
+        if self.config_file is not None:
+            return self.cmd.run(
+                ["config", "--file", os.fspath(self.config_file), *args],
+                check_returncode=True,
+            )
+        # GIT_CONFIG would send git-config to its one file, and --global
+        # refuses to be combined with it.
+        env = {k: v for k, v in os.environ.items() if k != "GIT_CONFIG"}
+        return self.cmd.run(
+            ["config", "--global", *args],
+            check_returncode=True,
+            env=env,
+        )
 
-        return self.run(
-            "delete",
-            local_flags=local_flags,
-            check_returncode=check_returncode,
-            log_in_real_time=log_in_real_time,
+    def paths(self) -> list[str]:
+        """Return the registered repositories, in order."""
+        try:
+            output = self._config(["--null", "--get-all", self.key])
+        except exc.CommandError as e:
+            # Exit code 1: nothing registered yet.
+            if e.returncode == 1:
+                return []
+            raise
+        return [path for path in output.split("\0") if path]
+
+    def register(self, path: StrPath) -> None:
+        """Add the repository at ``path``, unless it is already listed."""
+        value = os.fspath(pathlib.Path(path).absolute())
+        if value not in self.paths():
+            self._config(["--add", self.key, value])
+
+    def unregister(self, path: StrPath) -> None:
+        """Remove the repository at ``path``, if it is listed."""
+        value = os.fspath(pathlib.Path(path).absolute())
+        try:
+            self._config(["--fixed-value", "--unset-all", self.key, value])
+        except exc.CommandError as e:
+            # Exit code 5: not listed.
+            if e.returncode != 5:
+                raise
+
+    def run(self, args: Sequence[str]) -> Generator[GitRepoRunResult, None, None]:
+        r"""Run ``git <args>`` in every registered repository, in one batch.
+
+        A single ``git for-each-repo`` drives all the repositories. This
+        replaces one Python-driven fork per repository. Each repository's
+        output is framed with markers, so it comes back separately, as each
+        repository finishes.
+
+        ``git for-each-repo`` walks a snapshot of the list, minus
+        directories that no longer exist. git would stop at the first
+        missing one; here a missing directory is reported as a result with
+        code 128 and the walk continues.
+
+        Examples
+        --------
+        >>> registry = GitRepoRegistry('libvcs.repo', config_file=tmp_path / 'repos')
+        >>> registry.register(example_git_repo.path)
+        >>> registry.register(tmp_path / 'deleted')
+        >>> for result in registry.run(['maintenance', 'run', '--task=commit-graph']):
+        ...     print(pathlib.Path(result.path).name, result.returncode)
+        deleted 128
+        ... 0
+        """
+        paths = self.paths()
+        present: dict[str, str] = {}
+        for path in paths:
+            if pathlib.Path(path).is_dir():
+                present[os.fspath(pathlib.Path(path).resolve())] = path
+            else:
+                yield GitRepoRunResult(
+                    path=path,
+                    returncode=128,
+                    output=f"cannot change to '{path}': No such directory",
+                )
+        if not present:
+            return
+
+        token = f"libvcs-{secrets.token_hex(8)}"
+        script = (
+            f'!f() {{ printf "\\000{token} %s\\000" "$PWD/$GIT_PREFIX"; '
+            f'git "$@" 2>&1; printf "\\000{token}-exit %d\\000" $?; }}; f'
         )
+        with tempfile.TemporaryDirectory() as tmp:
+            snapshot = pathlib.Path(tmp) / "repos"
+            section, _, name = self.snapshot_key.rpartition(".")
+            snapshot.write_text(
+                f"[{section}]\n"
+                + "".join(
+                    f"\t{name} = {_config_value(path)}\n" for path in present.values()
+                )
+            )
+            chunks = self.cmd.stream(
+                [
+                    "for-each-repo",
+                    f"--config={self.snapshot_key}",
+                    "--",
+                    token,
+                    *args,
+                ],
+                config={"include.path": os.fspath(snapshot), f"alias.{token}": script},
+            )
+            current: str | None = None
+            output: list[str] = []
+            for record in split_records(chunks):
+                if record.startswith(f"{token} "):
+                    location = os.fspath(
+                        pathlib.Path(record.removeprefix(f"{token} ")).resolve()
+                    )
+                    current = present.get(location, location)
+                    output = []
+                elif record.startswith(f"{token}-exit ") and current is not None:
+                    yield GitRepoRunResult(
+                        path=current,
+                        returncode=int(record.rpartition(" ")[2]),
+                        output="\0".join(output),
+                    )
+                    current = None
+                elif current is not None:
+                    output.append(record)
 
 
-class GitReflogManager:
-    """Traverse reflog entries with :class:`~libvcs._internal.query_list.QueryList`."""
+GitSparseCheckoutCommandLiteral = t.Literal[
+    "init",
+    "set",
+    "add",
+    "list",
+    "reapply",
+    "disable",
+]
+
+
+class GitSparseCheckoutManager:
+    """Check out only part of a working tree."""
 
     def __init__(
         self,
@@ -7923,7 +12546,7 @@ class GitReflogManager:
         path: StrPath,
         cmd: Git | None = None,
     ) -> None:
-        """Wrap some of git-reflog(1), manager.
+        """Wrap git-sparse-checkout(1), manager.
 
         Parameters
         ----------
@@ -7932,14 +12555,11 @@ class GitReflogManager:
 
         Examples
         --------
-        >>> GitReflogManager(path=tmp_path)
-        <GitReflogManager path=...>
-
-        >>> GitReflogManager(path=tmp_path).run('show', trim=True)
-        'fatal: not a git repository (or any of the parent directories): .git'
+        >>> GitSparseCheckoutManager(path=tmp_path)
+        <GitSparseCheckoutManager path=...>
 
-        >>> len(GitReflogManager(path=example_git_repo.path).run('show')) > 0
-        True
+        >>> GitSparseCheckoutManager(path=example_git_repo.path).ls()
+        []
         """
         #: Directory to check out
         self.path: pathlib.Path
@@ -7951,12 +12571,12 @@ class GitReflogManager:
         self.cmd = cmd if isinstance(cmd, Git) else Git(path=self.path)
 
     def __repr__(self) -> str:
-        """Representation of git reflog manager object."""
-        return f"<GitReflogManager path={self.path}>"
+        """Representation of git sparse-checkout manager object."""
+        return f"<GitSparseCheckoutManager path={self.path}>"
 
     def run(
         self,
-        command: GitReflogCommandLiteral | None = None,
+        command: GitSparseCheckoutCommandLiteral | None = None,
         local_flags: list[str] | None = None,
         *,
         # Pass-through to run()
@@ -7964,24 +12584,24 @@ class GitReflogManager:
         check_returncode: bool | None = None,
         **kwargs: t.Any,
     ) -> str:
-        """Run a command against a git repository's reflog.
+        """Run a command against a git repository's sparse-checkout.
 
-        Wraps `git reflog <https://git-scm.com/docs/git-reflog>`_.
+        Wraps `git sparse-checkout <https://git-scm.com/docs/git-sparse-checkout>`_.
 
         Parameters
         ----------
         command :
-            Reflog command to run.
+            Sparse-checkout command to run.
         local_flags :
             Additional flags to pass.
 
         Examples
         --------
-        >>> len(GitReflogManager(path=example_git_repo.path).run('show')) > 0
-        True
+        >>> GitSparseCheckoutManager(path=example_git_repo.path).run('list', trim=True)
+        'fatal: this worktree is not sparse'
         """
         local_flags = local_flags if local_flags is not None else []
-        _cmd: list[str] = ["reflog"]
+        _cmd: list[str] = ["sparse-checkout"]
 
         if command is not None:
             _cmd.append(command)
@@ -7995,376 +12615,438 @@ class GitReflogManager:
             **kwargs,
         )
 
-    def show(
+    @staticmethod
+    def _mode_flags(
+        *,
+        cone: bool | None,
+        sparse_index: bool | None,
+    ) -> list[str]:
+        flags: list[str] = []
+        if cone is True:
+            flags.append("--cone")
+        elif cone is False:
+            flags.append("--no-cone")
+        if sparse_index is True:
+            flags.append("--sparse-index")
+        elif sparse_index is False:
+            flags.append("--no-sparse-index")
+        return flags
+
+    def init(
         self,
-        ref: str = "HEAD",
         *,
-        number: int | None = None,
+        cone: bool | None = None,
+        sparse_index: bool | None = None,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
     ) -> str:
-        """Show reflog for a ref.
+        """Enable sparse-checkout with only top-level files checked out.
 
         Parameters
         ----------
-        ref :
-            Reference to show reflog for (default: HEAD).
-        number :
-            Limit number of entries to show.
+        cone :
+            ``--cone`` / ``--no-cone``: patterns are directories (git's
+            default, and much faster to match) or gitignore-style patterns.
+        sparse_index :
+            ``--sparse-index`` / ``--no-sparse-index``: collapse the index to
+            the checked-out directories, so index-wide operations scale with
+            the sparse tree instead of the whole repository.
 
         Examples
         --------
-        >>> result = GitReflogManager(path=example_git_repo.path).show()
-        >>> len(result) > 0
-        True
-
-        >>> result = GitReflogManager(path=example_git_repo.path).show(number=5)
-        >>> len(result) > 0
-        True
+        >>> sparse = GitSparseCheckoutManager(path=example_git_repo.path)
+        >>> sparse.init(cone=True)
+        ''
+        >>> sparse.ls()
+        []
         """
-        local_flags: list[str] = []
+        return self.run(
+            "init",
+            local_flags=self._mode_flags(cone=cone, sparse_index=sparse_index),
+            check_returncode=check_returncode,
+            log_in_real_time=log_in_real_time,
+        )
 
-        if number is not None:
-            local_flags.extend(["-n", str(number)])
+    def set(
+        self,
+        patterns: Sequence[str],
+        *,
+        cone: bool | None = None,
+        sparse_index: bool | None = None,
+        skip_checks: bool | None = None,
+        # Pass-through to run()
+        log_in_real_time: bool = False,
+        check_returncode: bool | None = None,
+    ) -> str:
+        """Enable sparse-checkout and check out exactly ``patterns``.
 
-        local_flags.append(ref)
+        Parameters
+        ----------
+        patterns :
+            Directories in cone mode, gitignore-style patterns otherwise.
+        cone :
+            ``--cone`` / ``--no-cone``, see :meth:`init`.
+        sparse_index :
+            ``--sparse-index`` / ``--no-sparse-index``, see :meth:`init`.
+        skip_checks :
+            ``--skip-checks``: accept paths that are not directories in HEAD.
+
+        Examples
+        --------
+        >>> sparse = GitSparseCheckoutManager(path=example_git_repo.path)
+        >>> sparse.set(['docs', 'src'])
+        ''
+        >>> sparse.ls()
+        ['docs', 'src']
+        """
+        local_flags = self._mode_flags(cone=cone, sparse_index=sparse_index)
+        if skip_checks is True:
+            local_flags.append("--skip-checks")
 
         return self.run(
-            "show",
-            local_flags=local_flags,
+            "set",
+            local_flags=[*local_flags, *patterns],
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
         )
 
-    def expire(
+    def add(
         self,
+        patterns: Sequence[str],
         *,
-        expire: str | None = None,
-        expire_unreachable: str | None = None,
-        rewrite: bool = False,
-        updateref: bool = False,
-        stale_fix: bool = False,
-        dry_run: bool = False,
-        verbose: bool = False,
-        all_refs: bool = False,
-        single_worktree: bool = False,
-        refs: list[str] | None = None,
+        skip_checks: bool | None = None,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
     ) -> str:
-        """Expire old reflog entries.
+        """Check out ``patterns`` in addition to those already set.
 
         Parameters
         ----------
-        expire :
-            Expire entries older than this time.
-        expire_unreachable :
-            Expire unreachable entries older than this time.
-        rewrite :
-            Adjust reflog entries as old entries are pruned.
-        updateref :
-            Update ref to pruned value.
-        stale_fix :
-            Prune stale git-hierarchies too.
-        dry_run :
-            Don't actually prune, just report.
-        verbose :
-            Print extra information.
-        all_refs :
-            Process reflogs of all refs.
-        single_worktree :
-            Only process reflogs for current worktree.
-        refs :
-            Specific refs to expire.
+        patterns :
+            Directories in cone mode, gitignore-style patterns otherwise.
+        skip_checks :
+            ``--skip-checks``: accept paths that are not directories in HEAD.
 
         Examples
         --------
-        >>> result = GitReflogManager(path=example_git_repo.path).expire(
-        ...     dry_run=True
-        ... )
-        >>> 'error' in result.lower() or result == ''
-        True
+        >>> sparse = GitSparseCheckoutManager(path=example_git_repo.path)
+        >>> sparse.set(['docs'])
+        ''
+        >>> sparse.add(['src'])
+        ''
+        >>> sparse.ls()
+        ['docs', 'src']
         """
         local_flags: list[str] = []
+        if skip_checks is True:
+            local_flags.append("--skip-checks")
 
-        if expire is not None:
-            local_flags.append(f"--expire={expire}")
-        if expire_unreachable is not None:
-            local_flags.append(f"--expire-unreachable={expire_unreachable}")
-        if rewrite:
-            local_flags.append("--rewrite")
-        if updateref:
-            local_flags.append("--updateref")
-        if stale_fix:
-            local_flags.append("--stale-fix")
-        if dry_run:
-            local_flags.append("--dry-run")
-        if verbose:
-            local_flags.append("--verbose")
-        if all_refs:
-            local_flags.append("--all")
-            if single_worktree:
-                local_flags.append("--single-worktree")
-        if refs is not None:
-            local_flags.extend(refs)
+        return self.run(
+            "add",
+            local_flags=[*local_flags, *patterns],
+            check_returncode=check_returncode,
+            log_in_real_time=log_in_real_time,
+        )
+
+    def ls(self) -> list[str]:
+        """Return the sparse-checkout patterns, ``git sparse-checkout list``.
 
+        Empty when the worktree is not sparse.
+
+        Examples
+        --------
+        >>> GitSparseCheckoutManager(path=example_git_repo.path).ls()
+        []
+        """
+        try:
+            output = self.run("list", check_returncode=True)
+        except exc.CommandError:
+            return []
+        return output.splitlines()
+
+    def reapply(
+        self,
+        *,
+        # Pass-through to run()
+        log_in_real_time: bool = False,
+        check_returncode: bool | None = None,
+    ) -> str:
+        """Reapply the patterns to the working tree, e.g. after a merge.
+
+        Examples
+        --------
+        >>> sparse = GitSparseCheckoutManager(path=example_git_repo.path)
+        >>> sparse.set(['docs'])
+        ''
+        >>> sparse.reapply()
+        ''
+        """
         return self.run(
-            "expire",
-            local_flags=local_flags,
+            "reapply",
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
         )
 
-    def exists(
+    def disable(
         self,
-        ref: str,
         *,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
-    ) -> bool:
-        """Check if a reflog exists for a ref.
+    ) -> str:
+        """Check out the full working tree again.
+
+        Examples
+        --------
+        >>> sparse = GitSparseCheckoutManager(path=example_git_repo.path)
+        >>> sparse.set(['docs'])
+        ''
+        >>> sparse.disable()
+        ''
+        >>> sparse.ls()
+        []
+        """
+        return self.run(
+            "disable",
+            check_returncode=check_returncode,
+            log_in_real_time=log_in_real_time,
+        )
+
+
+GitBundleCommandLiteral = t.Literal[
+    "create",
+    "verify",
+    "list-heads",
+    "unbundle",
+]
+
+
+class GitBundleCmd:
+    """Run git bundle commands, for moving history without a network."""
+
+    def __init__(self, *, path: StrPath, cmd: Git | None = None) -> None:
+        """Lite, typed, pythonic wrapper for git-bundle(1).
 
         Parameters
         ----------
-        ref :
-            Reference to check.
-
-        Returns
-        -------
-        bool
-            True if reflog exists, False otherwise.
+        path :
+            Operates as PATH in the corresponding git subcommand.
 
         Examples
         --------
-        >>> GitReflogManager(path=example_git_repo.path).exists('HEAD')
-        True
-
-        >>> GitReflogManager(path=example_git_repo.path).exists(
-        ...     'refs/heads/nonexistent-branch-xyz123456'
-        ... )
-        False
+        >>> GitBundleCmd(path=tmp_path)
+        <GitBundleCmd path=...>
         """
-        from libvcs.exc import CommandError
-
-        try:
-            self.run(
-                "exists",
-                local_flags=[ref],
-                check_returncode=True,
-                log_in_real_time=log_in_real_time,
-            )
-        except CommandError:
-            return False
+        #: Directory to check out
+        self.path: pathlib.Path
+        if isinstance(path, pathlib.Path):
+            self.path = path
         else:
-            return True
+            self.path = pathlib.Path(path)
 
-    def _ls(
+        self.cmd = cmd if isinstance(cmd, Git) else Git(path=self.path)
+
+    def __repr__(self) -> str:
+        """Representation of a git bundle command object."""
+        return f"<GitBundleCmd path={self.path}>"
+
+    def run(
         self,
-        ref: str = "HEAD",
+        command: GitBundleCommandLiteral | None = None,
+        local_flags: list[str] | None = None,
         *,
-        number: int | None = None,
         # Pass-through to run()
         log_in_real_time: bool = False,
         check_returncode: bool | None = None,
-    ) -> list[dict[str, str]]:
-        """Parse reflog output into structured data.
+        **kwargs: t.Any,
+    ) -> str:
+        """Run a command against a git bundle.
+
+        Wraps `git bundle <https://git-scm.com/docs/git-bundle>`_.
 
         Parameters
         ----------
-        ref :
-            Reference to list reflog for.
-        number :
-            Limit number of entries.
-
-        Returns
-        -------
-        list[dict[str, str]]
-            List of parsed reflog entries.
+        command :
+            Bundle command to run.
+        local_flags :
+            Additional flags to pass.
 
         Examples
         --------
-        >>> entries = GitReflogManager(path=example_git_repo.path)._ls()
-        >>> len(entries) > 0
-        True
+        >>> GitBundleCmd(path=example_git_repo.path).run(
+        ...     'list-heads', [str(tmp_path / 'missing.bundle')], trim=True
+        ... )
+        "error: could not open '...missing.bundle'"
         """
-        local_flags: list[str] = []
+        local_flags = local_flags if local_flags is not None else []
+        _cmd: list[str] = ["bundle"]
 
-        if number is not None:
-            local_flags.extend(["-n", str(number)])
+        if command is not None:
+            _cmd.append(command)
 
-        local_flags.append(ref)
+        _cmd.extend(local_flags)
 
-        result = self.run(
-            "show",
-            local_flags=local_flags,
+        return self.cmd.run(
+            _cmd,
             check_returncode=check_returncode,
             log_in_real_time=log_in_real_time,
+            **kwargs,
         )
 
-        entries: list[dict[str, str]] = []
-        for line in result.strip().split("\n"):
-            if not line:
-                continue
-            # Format: <sha> <refspec>: <action>: <message>
-            # Example: d17245c HEAD@{0}: commit: tests/cmd...
-            parts = line.split(" ", 2)
-            if len(parts) >= 2:
-                sha = parts[0]
-                rest = parts[1] if len(parts) == 2 else f"{parts[1]} {parts[2]}"
-                # Split refspec from action:message
-                if ":" in rest:
-                    refspec_end = rest.index(":")
-                    refspec = rest[:refspec_end]
-                    action_message = rest[refspec_end + 1 :].strip()
-                    # Split action from message
-                    if ":" in action_message:
-                        action_end = action_message.index(":")
-                        action = action_message[:action_end].strip()
-                        message = action_message[action_end + 1 :].strip()
-                    else:
-                        action = action_message
-                        message = ""
-                else:
-                    refspec = rest
-                    action = ""
-                    message = ""
-
-                entries.append(
-                    {
-                        "sha": sha,
-                        "refspec": refspec,
-                        "action": action,
-                        "message": message,
-                    }
-                )
-
-        return entries
-
-    def ls(
+    def create(
         self,
-        ref: str = "HEAD",
+        file: StrPath,
+        revs: Sequence[str] = ("--all",),
         *,
-        number: int | None = None,
-    ) -> QueryList[GitReflogEntry]:
-        """List reflog entries as :class:`~libvcs.cmd.git.GitReflogEntry` objects.
+        version: int | None = None,
+        quiet: bool | None = True,
+        # Pass-through to run()
+        log_in_real_time: bool = False,
+        check_returncode: bool | None = None,
+    ) -> str:
+        """Write the history reachable from ``revs`` to ``file``.
 
         Parameters
         ----------
-        ref :
-            Reference to list reflog for.
-        number :
-            Limit number of entries.
-
-        Returns
-        -------
-        QueryList[GitReflogEntry]
-            List of reflog entries with ORM-like filtering.
+        file :
+            Bundle to write.
+        revs :
+            ``git rev-list`` arguments selecting what to include, e.g.
+            ``['--all']`` or ``['main', '^v1.0']`` for an incremental bundle.
+        version :
+            ``--version=<n>``: bundle format version.
+        quiet :
+            ``--quiet``
 
         Examples
         --------
-        >>> entries = GitReflogManager(path=example_git_repo.path).ls()
-        >>> isinstance(entries, QueryList)
-        True
-        >>> len(entries) > 0
+        >>> bundle = GitBundleCmd(path=example_git_repo.path)
+        >>> bundle.create(tmp_path / 'repo.bundle')
+        ''
+        >>> (tmp_path / 'repo.bundle').exists()
         True
         """
-        entries_data = self._ls(ref=ref, number=number)
-        entries: list[GitReflogEntry] = []
+        local_flags: list[str] = []
 
-        for data in entries_data:
-            entry_cmd = GitReflogEntryCmd(
-                path=self.path,
-                refspec=data["refspec"],
-                cmd=self.cmd,
-            )
-            entry = GitReflogEntry(
-                sha=data["sha"],
-                refspec=data["refspec"],
-                action=data["action"],
-                message=data["message"],
-                _cmd=entry_cmd,
-            )
-            entries.append(entry)
+        if quiet is True:
+            local_flags.append("--quiet")
+        if version is not None:
+            local_flags.append(f"--version={version}")
 
-        return QueryList(entries)
+        return self.run(
+            "create",
+            local_flags=[*local_flags, str(file), *revs],
+            check_returncode=check_returncode,
+            log_in_real_time=log_in_real_time,
+        )
 
-    def get(
+    def verify(
         self,
-        refspec: str | None = None,
-        sha: str | None = None,
-        **kwargs: t.Any,
-    ) -> GitReflogEntry:
-        """Get a specific reflog entry.
+        file: StrPath,
+        *,
+        quiet: bool | None = None,
+        # Pass-through to run()
+        log_in_real_time: bool = False,
+        check_returncode: bool | None = None,
+    ) -> str:
+        """Check ``file`` is a valid bundle that applies to this repository.
 
         Parameters
         ----------
-        refspec :
-            Reference specification to find.
-        sha :
-            SHA to find.
-        **kwargs :
-            Additional filter criteria.
-
-        Returns
-        -------
-        GitReflogEntry
-            The matching reflog entry.
-
-        Raises
-        ------
-        :exc:`~libvcs._internal.query_list.ObjectDoesNotExist`
-            If no matching entry found.
-        :exc:`~libvcs._internal.query_list.MultipleObjectsReturned`
-            If multiple entries match.
+        file :
+            Bundle to check.
+        quiet :
+            ``--quiet``
 
         Examples
         --------
-        >>> entry = GitReflogManager(path=example_git_repo.path).get(
-        ...     refspec='HEAD@{0}'
-        ... )
-        >>> entry.refspec
-        'HEAD@{0}'
+        >>> bundle = GitBundleCmd(path=example_git_repo.path)
+        >>> bundle.create(tmp_path / 'repo.bundle')
+        ''
+        >>> print(bundle.verify(tmp_path / 'repo.bundle'))
+        The bundle contains ...
         """
-        filters: dict[str, t.Any] = {}
-        if refspec is not None:
-            filters["refspec"] = refspec
-        if sha is not None:
-            filters["sha"] = sha
-        filters.update(kwargs)
+        local_flags: list[str] = []
 
-        result = self.ls().get(**filters)
-        assert result is not None  # get() raises ObjectDoesNotExist, never returns None
-        return result
+        if quiet is True:
+            local_flags.append("--quiet")
 
-    def filter(
+        return self.run(
+            "verify",
+            local_flags=[*local_flags, str(file)],
+            check_returncode=check_returncode,
+            log_in_real_time=log_in_real_time,
+        )
+
+    def list_heads(
         self,
-        *args: t.Any,
-        **kwargs: t.Any,
-    ) -> QueryList[GitReflogEntry]:
-        """Filter reflog entries.
+        file: StrPath,
+        refnames: Sequence[str] | None = None,
+    ) -> dict[str, str]:
+        """Return the refs ``file`` contains, mapped to their object ids.
 
         Parameters
         ----------
-        *args :
-            Positional arguments for
-            :meth:`~libvcs._internal.query_list.QueryList.filter`.
-        **kwargs :
-            Keyword arguments for filtering (supports Django-style lookups).
+        file :
+            Bundle to read.
+        refnames :
+            Only report these refs.
 
-        Returns
-        -------
-        QueryList[GitReflogEntry]
-            Filtered list of reflog entries.
+        Examples
+        --------
+        >>> bundle = GitBundleCmd(path=example_git_repo.path)
+        >>> bundle.create(tmp_path / 'repo.bundle')
+        ''
+        >>> heads = bundle.list_heads(tmp_path / 'repo.bundle')
+        >>> sorted(heads)
+        ['HEAD', 'refs/heads/master', 'refs/remotes/origin/HEAD', ...]
+        """
+        output = self.run(
+            "list-heads",
+            local_flags=[str(file), *(refnames or ())],
+            check_returncode=True,
+        )
+        heads: dict[str, str] = {}
+        for line in output.splitlines():
+            oid, _, ref = line.partition(" ")
+            if ref:
+                heads[ref] = oid
+        return heads
+
+    def unbundle(
+        self,
+        file: StrPath,
+        refnames: Sequence[str] | None = None,
+        *,
+        # Pass-through to run()
+        log_in_real_time: bool = False,
+        check_returncode: bool | None = None,
+    ) -> str:
+        r"""Store the objects in ``file`` in this repository.
+
+        Refs are not updated; use the returned ``<oid> <ref>`` lines, or
+        fetch from the bundle instead.
+
+        Parameters
+        ----------
+        file :
+            Bundle to read.
+        refnames :
+            Only unbundle these refs.
 
         Examples
         --------
-        >>> entries = GitReflogManager(path=example_git_repo.path).filter(
-        ...     action='commit'
-        ... )
-        >>> isinstance(entries, QueryList)
-        True
+        >>> bundle = GitBundleCmd(path=example_git_repo.path)
+        >>> bundle.create(tmp_path / 'repo.bundle', ['master'])
+        ''
+        >>> bundle.unbundle(tmp_path / 'repo.bundle')
+        '... refs/heads/master\n'
         """
-        return self.ls().filter(*args, **kwargs)
+        return self.run(
+            "unbundle",
+            local_flags=[str(file), *(refnames or ())],
+            check_returncode=check_returncode,
+            log_in_real_time=log_in_real_time,
+        )
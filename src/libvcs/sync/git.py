@@ -19,15 +19,22 @@ from __future__ import annotations
 
 import contextlib
 import dataclasses
+import hashlib
+import io
 import logging
 import pathlib
 import re
+import shutil
+import tarfile
+import threading
+import time
 import typing as t
 from urllib import parse as urlparse
 
 from libvcs import exc
+from libvcs._internal import gitfs
 from libvcs._internal.types import StrPath
-from libvcs.cmd.git import Git
+from libvcs.cmd.git import Git, GitRemoteCmd
 from libvcs.sync.base import (
     BaseSync,
     SyncResult,
@@ -35,6 +42,18 @@ from libvcs.sync.base import (
     convert_pip_url as base_convert_pip_url,
 )
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+    from _typeshed import WriteableBuffer
+
+    from libvcs.cmd.git import GitLsRemoteCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -108,6 +127,132 @@ GitSyncRemoteDict = dict[str, GitRemote]
 GitRemotesArgs = None | GitSyncRemoteDict | dict[str, str]
 
 
+GitStatusEntryKind = t.Literal[
+    "ordinary",
+    "renamed",
+    "unmerged",
+    "untracked",
+    "ignored",
+]
+
+
+@dataclasses.dataclass(slots=True)
+class GitStatusEntry:
+    """A changed path from ``git status --porcelain=2``.
+
+    Attributes
+    ----------
+    kind : str
+        ``ordinary`` (``1``), ``renamed`` (``2``, renamed or copied),
+        ``unmerged`` (``u``), ``untracked`` (``?``) or ``ignored`` (``!``).
+    path : str
+        Path relative to the repository root, never quoted.
+    xy : str | None
+        Two-letter staged/unstaged status, e.g. ``.M``. ``None`` for
+        untracked and ignored paths.
+    submodule : str | None
+        Four-letter submodule state, ``N...`` for non-submodules.
+    modes : tuple[str, ...]
+        Octal file modes: ``HEAD``, index and worktree for ordinary and
+        renamed entries; stages 1-3 and worktree for unmerged ones.
+    oids : tuple[str, ...]
+        Object names: ``HEAD`` and index for ordinary and renamed entries;
+        stages 1-3 for unmerged ones.
+    score : str | None
+        Rename or copy score, e.g. ``R100``.
+    orig_path : str | None
+        Source path of a rename or copy.
+
+    Examples
+    --------
+    >>> GitStatusEntry.from_record('? new file.txt')
+    GitStatusEntry(kind='untracked', path='new file.txt', ...)
+    """
+
+    kind: GitStatusEntryKind
+    path: str
+    xy: str | None = None
+    submodule: str | None = None
+    modes: tuple[str, ...] = ()
+    oids: tuple[str, ...] = ()
+    score: str | None = None
+    orig_path: str | None = None
+
+    @classmethod
+    def from_record(
+        cls,
+        record: str,
+        orig_path: str | None = None,
+    ) -> GitStatusEntry:
+        """Return entry parsed from a single porcelain v2 record.
+
+        Parameters
+        ----------
+        record : str
+            One entry line (``-z`` record) without its terminator.
+        orig_path : str, optional
+            For ``-z`` output of renamed entries, the record following this
+            one.
+
+        Examples
+        --------
+        >>> GitStatusEntry.from_record(
+        ...     '1 .M N... 100644 100644 100644 '
+        ...     'e69de29bb2d1d6434b8b29ae775ad8c2e48c5391 '
+        ...     'e69de29bb2d1d6434b8b29ae775ad8c2e48c5391 README.md'
+        ... ).xy
+        '.M'
+
+        >>> GitStatusEntry.from_record(
+        ...     '2 R. N... 100644 100644 100644 '
+        ...     'e69de29bb2d1d6434b8b29ae775ad8c2e48c5391 '
+        ...     'e69de29bb2d1d6434b8b29ae775ad8c2e48c5391 R100 new.txt',
+        ...     orig_path='old.txt',
+        ... ).orig_path
+        'old.txt'
+        """
+        marker = record[:1]
+        if marker == "1":
+            _, xy, sub, m_h, m_i, m_w, h_h, h_i, path = record.split(" ", 8)
+            return cls(
+                kind="ordinary",
+                path=path,
+                xy=xy,
+                submodule=sub,
+                modes=(m_h, m_i, m_w),
+                oids=(h_h, h_i),
+            )
+        if marker == "2":
+            _, xy, sub, m_h, m_i, m_w, h_h, h_i, score, path = record.split(" ", 9)
+            if orig_path is None and "\t" in path:
+                path, orig_path = path.split("\t", 1)
+            return cls(
+                kind="renamed",
+                path=path,
+                xy=xy,
+                submodule=sub,
+                modes=(m_h, m_i, m_w),
+                oids=(h_h, h_i),
+                score=score,
+                orig_path=orig_path,
+            )
+        if marker == "u":
+            _, xy, sub, m1, m2, m3, m_w, h1, h2, h3, path = record.split(" ", 10)
+            return cls(
+                kind="unmerged",
+                path=path,
+                xy=xy,
+                submodule=sub,
+                modes=(m1, m2, m3, m_w),
+                oids=(h1, h2, h3),
+            )
+        if marker == "?":
+            return cls(kind="untracked", path=record[2:])
+        if marker == "!":
+            return cls(kind="ignored", path=record[2:])
+        raise GitStatusParsingException(git_status_output=record)
+
+
 @dataclasses.dataclass
 class GitStatus:
     """Git status information.
@@ -134,6 +279,9 @@ class GitStatus:
         Commit count ahead of the upstream, taken from ``branch_ab``.
     branch_behind : str | None
         Commit count behind the upstream, taken from ``branch_ab``.
+    entries : list[GitStatusEntry]
+        Changed, untracked and ignored paths. Only filled by
+        :meth:`GitStatus.from_porcelain_v2`.
     """
 
     branch_oid: str | None = None
@@ -142,6 +290,10 @@ class GitStatus:
     branch_ab: str | None = None
     branch_ahead: str | None = None
     branch_behind: str | None = None
+    entries: list[GitStatusEntry] = dataclasses.field(
+        default_factory=list,
+        repr=False,
+    )
 
     @classmethod
     def from_stdout(cls, value: str) -> GitStatus:
@@ -198,7 +350,338 @@ class GitStatus:
 
         if matches is None:
             raise GitStatusParsingException(git_status_output=value)
-        return cls(**matches.groupdict())
+        groups = matches.groupdict()
+        return cls(
+            branch_oid=groups["branch_oid"],
+            branch_head=groups["branch_head"],
+            branch_upstream=groups["branch_upstream"],
+            branch_ab=groups["branch_ab"],
+            branch_ahead=groups["branch_ahead"],
+            branch_behind=groups["branch_behind"],
+        )
+
+    @classmethod
+    def from_porcelain_v2(cls, value: str | Iterable[str]) -> GitStatus:
+        r"""Return ``git status --branch --porcelain=2 -z`` output parsed.
+
+        Records are NUL-terminated, so paths with spaces, newlines or
+        non-ASCII bytes come through verbatim. Renamed entries are followed
+        by a second record holding the original path.
+
+        ``value`` is either the raw output or an iterable of records already
+        split on NUL, e.g. from :func:`libvcs._internal.run.split_records`,
+        which lets large outputs be parsed as they arrive.
+
+        Examples
+        --------
+        >>> status = GitStatus.from_porcelain_v2(
+        ...     '# branch.oid (initial)\0# branch.head master\0'
+        ...     '? with space.txt\0! build/\0'
+        ... )
+        >>> status
+        GitStatus(branch_oid=None, branch_head='master', ...)
+        >>> [(entry.kind, entry.path) for entry in status.entries]
+        [('untracked', 'with space.txt'), ('ignored', 'build/')]
+
+        >>> GitStatus.from_porcelain_v2(
+        ...     ['# branch.head master', '2 R. N... 100644 100644 100644 '
+        ...      'abc abc R100 new.txt', 'old.txt']
+        ... ).entries[0].orig_path
+        'old.txt'
+        """
+        status = cls()
+        records = iter(value.split("\0") if isinstance(value, str) else value)
+        for record in records:
+            if not record:
+                continue
+            if record.startswith("# "):
+                key, _, header = record[2:].partition(" ")
+                if key == "branch.oid":
+                    status.branch_oid = None if header == "(initial)" else header
+                elif key == "branch.head":
+                    status.branch_head = header
+                elif key == "branch.upstream":
+                    status.branch_upstream = header
+                elif key == "branch.ab":
+                    status.branch_ab = header
+                    ahead, _, behind = header.partition(" ")
+                    status.branch_ahead = ahead.lstrip("+")
+                    status.branch_behind = behind.lstrip("-")
+                continue
+            if record.startswith("2 "):
+                orig_path = next(records, None)
+                status.entries.append(
+                    GitStatusEntry.from_record(record, orig_path=orig_path),
+                )
+                continue
+            status.entries.append(GitStatusEntry.from_record(record))
+        return status
+
+
+class GitMirrorCacheLockTimeout(exc.LibVCSException):
+    """Raised when a mirror's lock is not acquired within the timeout."""
+
+    def __init__(self, lock_path: pathlib.Path, timeout: float) -> None:
+        super().__init__(f"Could not lock {lock_path} within {timeout}s")
+
+
+class GitMirrorCache:
+    """Bare mirrors of remote repositories, shared by many checkouts.
+
+    One ``git clone --mirror`` is kept per canonical remote URL under
+    ``root``. Checkouts clone with ``--reference-if-able`` pointing at the
+    mirror, so objects are stored and downloaded once however many
+    checkouts of an upstream exist (see ``mirror_cache`` on
+    :class:`GitSync`).
+
+    Updates are serialized per mirror by a lock held across threads and
+    processes. Callers that queued up behind a fetch which started after
+    they asked are served by it instead of fetching again, so concurrent
+    syncs of one upstream coalesce into a single fetch.
+
+    Examples
+    --------
+    >>> cache = GitMirrorCache(tmp_path / 'mirrors')
+    >>> url = f'file://{create_git_remote_repo()}'
+    >>> mirror = cache.ensure(url)
+    >>> mirror == cache.mirror_path(url)
+    True
+    >>> (mirror / 'HEAD').exists()
+    True
+    """
+
+    _thread_locks: t.ClassVar[dict[pathlib.Path, threading.Lock]] = {}
+    _thread_locks_guard: t.ClassVar[threading.Lock] = threading.Lock()
+
+    #: Marker recording when the last mirror fetch started (ns since epoch)
+    fetched_marker = "libvcs-fetched"
+
+    def __init__(
+        self,
+        root: StrPath,
+        *,
+        lock_timeout: float | None = None,
+    ) -> None:
+        """Create a mirror cache.
+
+        Parameters
+        ----------
+        root :
+            Directory holding the mirrors; created on first use.
+        lock_timeout :
+            Seconds to wait for another process updating the same mirror.
+            ``None`` (default) waits indefinitely.
+        """
+        self.root = pathlib.Path(root)
+        self.lock_timeout = lock_timeout
+
+    def __repr__(self) -> str:
+        """Representation of a git mirror cache."""
+        return f"<GitMirrorCache root={self.root}>"
+
+    @staticmethod
+    def canonical_url(url: str) -> str:
+        """Return ``url`` normalized so spellings of one remote share a mirror.
+
+        Examples
+        --------
+        >>> GitMirrorCache.canonical_url('git+https://GitHub.com/vcs-python/libvcs.git/')
+        'https://github.com/vcs-python/libvcs'
+        >>> GitMirrorCache.canonical_url('git@github.com:vcs-python/libvcs.git')
+        'ssh://git@github.com/vcs-python/libvcs'
+        """
+        url = url.strip().removeprefix("git+")
+        if "://" not in url and re.match(r"^[^/:]+:", url):
+            # scp-like syntax: [user@]host:path
+            host, _, path = url.partition(":")
+            url = f"ssh://{host}/{path.lstrip('/')}"
+
+        parsed = urlparse.urlsplit(url)
+        netloc = parsed.netloc
+        if "@" in netloc:
+            userinfo, _, host = netloc.rpartition("@")
+            netloc = f"{userinfo}@{host.lower()}"
+        else:
+            netloc = netloc.lower()
+        path = parsed.path.rstrip("/")
+        path = path.removesuffix(".git")
+        return urlparse.urlunsplit(
+            (parsed.scheme.lower(), netloc, path, parsed.query, ""),
+        )
+
+    def mirror_path(self, url: str) -> pathlib.Path:
+        """Return where the mirror of ``url`` lives.
+
+        Examples
+        --------
+        >>> cache = GitMirrorCache(tmp_path)
+        >>> cache.mirror_path('https://example.com/org/repo.git').name
+        'repo-...git'
+        >>> (
+        ...     cache.mirror_path('https://example.com/org/repo.git')
+        ...     == cache.mirror_path('git+https://EXAMPLE.com/org/repo')
+        ... )
+        True
+        """
+        canonical = self.canonical_url(url)
+        digest = hashlib.sha256(canonical.encode()).hexdigest()[:16]
+        name = re.sub(r"[^A-Za-z0-9._-]", "_", canonical.rsplit("/", 1)[-1])
+        return self.root / f"{name or 'repo'}-{digest}.git"
+
+    @contextlib.contextmanager
+    def lock(self, url: str) -> t.Iterator[pathlib.Path]:
+        """Hold the update lock of the mirror of ``url``.
+
+        Yields the mirror path. Taken by :meth:`ensure`; hold it to read the
+        mirror while no update runs.
+
+        Examples
+        --------
+        >>> cache = GitMirrorCache(tmp_path)
+        >>> with cache.lock('https://example.com/org/repo.git') as mirror:
+        ...     mirror.name.startswith('repo-')
+        True
+        """
+        mirror = self.mirror_path(url)
+        self.root.mkdir(parents=True, exist_ok=True)
+        with self._thread_locks_guard:
+            thread_lock = self._thread_locks.setdefault(mirror, threading.Lock())
+
+        lock_path = mirror.with_name(f"{mirror.name}.lock")
+        if not thread_lock.acquire(
+            timeout=-1 if self.lock_timeout is None else self.lock_timeout
+        ):
+            raise GitMirrorCacheLockTimeout(
+                lock_path, t.cast("float", self.lock_timeout)
+            )
+        try:
+            with lock_path.open("a") as lock_file:
+                self._lock_file(lock_file, lock_path)
+                yield mirror
+        finally:
+            thread_lock.release()
+
+    def _lock_file(self, lock_file: t.IO[str], lock_path: pathlib.Path) -> None:
+        if fcntl is None:
+            # No advisory file locks (Windows): only threads are serialized.
+            return
+        if self.lock_timeout is None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            return
+        deadline = time.monotonic() + self.lock_timeout
+        while not self._try_lock_file(lock_file):
+            if time.monotonic() >= deadline:
+                raise GitMirrorCacheLockTimeout(lock_path, self.lock_timeout)
+            time.sleep(0.05)
+
+    @staticmethod
+    def _try_lock_file(lock_file: t.IO[str]) -> bool:
+        assert fcntl is not None
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+        return True
+
+    def fetched_at(self, url: str) -> int | None:
+        """Return when the last fetch of the mirror of ``url`` started.
+
+        Nanoseconds since the epoch, or ``None`` if it was never fetched.
+        """
+        try:
+            return int(
+                (self.mirror_path(url) / self.fetched_marker).read_text().strip(),
+            )
+        except (OSError, ValueError):
+            return None
+
+    def ensure(self, url: str, *, fetch: bool = True) -> pathlib.Path:
+        """Return the mirror of ``url``, cloning or updating it first.
+
+        Parameters
+        ----------
+        url :
+            Remote to mirror.
+        fetch :
+            Update an existing mirror. A fetch that started after this call
+            was made, e.g. by a concurrent caller, counts as an update.
+
+        Raises
+        ------
+        libvcs.exc.CommandError
+            If cloning or fetching the mirror fails.
+        GitMirrorCacheLockTimeout
+            If ``lock_timeout`` elapses while another update runs.
+        """
+        requested_at = time.time_ns()
+        with self.lock(url) as mirror:
+            if not (mirror / "HEAD").exists():
+                self._clone(url, mirror)
+            elif fetch and (self.fetched_at(url) or 0) < requested_at:
+                started_at = time.time_ns()
+                logger.info("Updating mirror %s of %s.", mirror, url)
+                Git(path=mirror).fetch(
+                    reftag="origin",
+                    prune=True,
+                    check_returncode=True,
+                )
+                (mirror / self.fetched_marker).write_text(f"{started_at}\n")
+            else:
+                logger.debug("Mirror %s is up to date.", mirror)
+        return mirror
+
+    def _clone(self, url: str, mirror: pathlib.Path) -> None:
+        started_at = time.time_ns()
+        logger.info("Mirroring %s to %s.", url, mirror)
+        partial = mirror.with_name(f"{mirror.name}.partial")
+        if partial.exists():
+            shutil.rmtree(partial)
+        try:
+            Git(path=partial).clone(
+                url=url,
+                mirror=True,
+                quiet=True,
+                check_returncode=True,
+            )
+            (partial / self.fetched_marker).write_text(f"{started_at}\n")
+            partial.rename(mirror)
+        finally:
+            if partial.exists():
+                shutil.rmtree(partial)
+
+
+#: Full SHA-1 or SHA-256 commit id, as opposed to a ref or abbreviation.
+_FULL_OID_RE = re.compile(r"[0-9a-fA-F]{40}(?:[0-9a-fA-F]{24})?")
+
+#: Reject archive members escaping the target, where Python supports it.
+_TAR_EXTRACT_OPTIONS: dict[str, t.Any] = (
+    {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+)
+
+
+class _ChunkReader(io.RawIOBase):
+    """Read-only file over an iterator of byte chunks, for :mod:`tarfile`."""
+
+    def __init__(self, chunks: Iterator[bytes]) -> None:
+        self._chunks = chunks
+        self._pending = b""
+
+    def readable(self) -> bool:
+        """Return True: this file is only read."""
+        return True
+
+    def readinto(self, buffer: WriteableBuffer) -> int:
+        """Fill ``buffer`` from the next chunk; 0 once the chunks run out."""
+        while not self._pending:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._pending = chunk
+        view = memoryview(buffer).cast("B")
+        size = min(len(view), len(self._pending))
+        view[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
 
 
 def convert_pip_url(pip_url: str) -> VCSLocation:
@@ -249,6 +732,20 @@ class GitSync(BaseSync):
         git_shallow: bool = False,
         tls_verify: bool = False,
         depth: int | None = None,
+        filter_spec: str | None = None,
+        sparse_paths: Sequence[str] | None = None,
+        bundle_path: StrPath | None = None,
+        mirror_cache: GitMirrorCache | None = None,
+        dissociate: bool = False,
+        fetch_refspecs: Sequence[str] | None = None,
+        fetch_tags: bool | None = None,
+        fetch_remotes: Sequence[str] | None = None,
+        fetch_jobs: int | None = None,
+        skip_unchanged_fetch: bool = False,
+        ls_remote_cache: GitLsRemoteCache | None = None,
+        read_refs_in_process: bool = False,
+        check_dirty_in_process: bool = False,
+        read_config_in_process: bool = False,
         **kwargs: t.Any,
     ) -> None:
         """Local git repository.
@@ -267,6 +764,85 @@ class GitSync(BaseSync):
             (``git clone --depth N``). Takes precedence over ``git_shallow``.
             Default None (full clone).
 
+        filter_spec : str, optional
+            Partial clone filter (``git clone --filter``), e.g. ``blob:none``,
+            ``tree:0`` or ``blob:limit=1m``. Git records it on the remote, so
+            later fetches stay partial. Default None (all objects).
+
+        sparse_paths : list of str, optional
+            Directories to check out (cone-mode sparse-checkout). The clone
+            checks out only these and top-level files, and
+            :meth:`update_repo` reapplies them when they change. Default None
+            (full working tree).
+
+        bundle_path : str or pathlib.Path, optional
+            Local ``.bundle`` file (see :class:`~libvcs.cmd.git.GitBundleCmd`)
+            to seed :meth:`obtain` from. The checkout is cloned from the
+            bundle without touching the network, then pointed at ``url`` and
+            brought up to date with one incremental fetch. Ignored when the
+            file does not exist. Default None.
+
+        mirror_cache : GitMirrorCache, optional
+            Share objects with other checkouts of the same upstream:
+            :meth:`obtain` updates the cache's mirror of ``url`` and clones
+            with ``--reference-if-able`` from it. Default None.
+
+        dissociate : bool
+            With ``mirror_cache``, copy the borrowed objects
+            (``--dissociate``) so the checkout survives the mirror being
+            removed, at the cost of the disk savings (default False).
+
+        fetch_refspecs : list of str, optional
+            Refs :meth:`update_repo` fetches from the checkout's remote
+            instead of every configured one, e.g. ``['main']`` for a checkout
+            pinned to ``origin/main``. Default None (all).
+
+        fetch_tags : bool, optional
+            ``False`` fetches no tags (``--no-tags``), ``True`` all tags
+            (``--tags``). Default None (tags pointing into fetched history).
+
+        fetch_remotes : list of str, optional
+            Remotes :meth:`update_repo` fetches, concurrently
+            (``--multiple``), instead of only the checkout's remote. Cannot
+            be combined with ``fetch_refspecs``. Default None.
+
+        fetch_jobs : int, optional
+            Parallel fetches for ``fetch_remotes`` and submodules
+            (``--jobs``). Default None (``fetch.parallel``).
+
+        skip_unchanged_fetch : bool
+            Before fetching a tracked branch, ask the remote for its tip
+            (``git ls-remote``) and skip the fetch when the remote-tracking
+            ref already matches it. Turns a sync of an unchanged repository
+            into one ref advertisement. New tags on an unchanged branch are
+            not picked up (default False).
+
+        ls_remote_cache : GitLsRemoteCache, optional
+            With ``skip_unchanged_fetch``, reuse recent advertisements of the
+            same remote URL, e.g. across checkouts sharing an upstream.
+            Default None.
+
+        read_refs_in_process : bool
+            Read ``HEAD`` and refs straight from ``.git`` (see
+            :mod:`libvcs._internal.gitfs`) in :meth:`get_revision` and
+            :meth:`update_repo` instead of running git for each. With
+            ``rev`` pinned to a full commit id, :meth:`update_repo` also
+            checks the pack indexes for it and skips the fetch when it is
+            already present. Falls back to git for repositories it cannot
+            read, e.g. reftable (default False).
+
+        check_dirty_in_process : bool
+            In :meth:`is_dirty`, and so when :meth:`update_repo` decides
+            whether to stash, compare ``.git/index``'s cached stat data with
+            the worktree and only run ``git status`` when a file may have
+            changed (default False).
+
+        read_config_in_process : bool
+            Read remotes in :meth:`remotes`, :meth:`remote`,
+            :meth:`set_remote` and :meth:`set_remotes` from the parsed
+            ``.git/config`` (and the files it includes) instead of running
+            ``git remote --verbose`` for each (default False).
+
         tls_verify : bool
             Should certificate for https be checked (default False)
 
@@ -308,6 +884,30 @@ class GitSync(BaseSync):
         self.git_shallow = git_shallow
         self.tls_verify = tls_verify
         self.depth = depth
+        self.filter_spec = filter_spec
+        self.sparse_paths = (
+            [path.strip("/") for path in sparse_paths]
+            if sparse_paths is not None
+            else None
+        )
+        self.bundle_path = (
+            pathlib.Path(bundle_path) if bundle_path is not None else None
+        )
+        self.mirror_cache = mirror_cache
+        self.dissociate = dissociate
+        if fetch_refspecs and fetch_remotes:
+            msg = "fetch_refspecs and fetch_remotes are mutually exclusive"
+            raise ValueError(msg)
+        self.fetch_refspecs = list(fetch_refspecs) if fetch_refspecs else None
+        self.fetch_tags = fetch_tags
+        self.fetch_remotes = list(fetch_remotes) if fetch_remotes else None
+        self.fetch_jobs = fetch_jobs
+        self.skip_unchanged_fetch = skip_unchanged_fetch
+        self.ls_remote_cache = ls_remote_cache
+        self.read_refs_in_process = read_refs_in_process
+        self._object_store: gitfs.GitObjectStore | None = None
+        self.check_dirty_in_process = check_dirty_in_process
+        self.read_config_in_process = read_config_in_process
 
         self._remotes: GitSyncRemoteDict
 
@@ -360,6 +960,9 @@ class GitSync(BaseSync):
 
     def get_revision(self) -> str:
         """Return current revision. Initial repositories return 'initial'."""
+        head = self._head_in_process()
+        if head is not None:
+            return head
         try:
             return self.cmd.rev_parse(
                 verify=True, args="HEAD", check_returncode=True
@@ -367,6 +970,54 @@ class GitSync(BaseSync):
         except exc.CommandError:
             return "initial"
 
+    def _ref_reader(self) -> gitfs.GitRefReader | None:
+        """Return an in-process ref reader, if enabled and usable here."""
+        if not self.read_refs_in_process:
+            return None
+        try:
+            return gitfs.GitRefReader(self.path)
+        except (gitfs.GitFsUnsupported, OSError):
+            return None
+
+    def _head_in_process(self) -> str | None:
+        """Return HEAD's commit read from disk; None defers to git."""
+        refs = self._ref_reader()
+        if refs is None:
+            return None
+        try:
+            return refs.head()
+        except (gitfs.GitFsUnsupported, OSError):
+            return None
+
+    def _branch_in_process(self) -> str | None:
+        """Return the short name of HEAD's branch read from disk.
+
+        None defers to git, including when HEAD is detached so that git
+        reports the error.
+        """
+        refs = self._ref_reader()
+        if refs is None:
+            return None
+        try:
+            target = refs.symbolic_ref("HEAD")
+            return refs.shorten(target) if target is not None else None
+        except (gitfs.GitFsUnsupported, OSError):
+            return None
+
+    def _has_commit_in_process(self, rev: str) -> bool:
+        """Return True if ``rev`` is a full commit id already stored locally.
+
+        False when unsure, leaving the decision to git.
+        """
+        if not self.read_refs_in_process or not _FULL_OID_RE.fullmatch(rev):
+            return False
+        try:
+            if self._object_store is None:
+                self._object_store = gitfs.GitObjectStore(self.path)
+            return self._object_store.has_object(rev)
+        except (gitfs.GitFsUnsupported, OSError, ValueError):
+            return False
+
     def set_remotes(self, overwrite: bool = False) -> None:
         """Apply remotes in local repository to match GitSync's configuration."""
         remotes = self._remotes
@@ -411,24 +1062,62 @@ class GitSync(BaseSync):
 
         url = self.url
 
-        self.log.info("Cloning.")
+        bundle = self.bundle_path
+        if bundle is not None and not bundle.is_file():
+            self.log.info("Bundle %s not found, cloning from %s.", bundle, url)
+            bundle = None
+
         # An explicit depth wins; otherwise git_shallow keeps the depth-1
         # behavior, and neither means a full clone.
         clone_depth: int | None
-        if self.depth is not None:
+        if bundle is not None:
+            clone_depth = None
+        elif self.depth is not None:
             clone_depth = self.depth
         elif self.git_shallow:
             clone_depth = 1
         else:
             clone_depth = None
+
+        reference: pathlib.Path | None = None
+        if bundle is None and self.mirror_cache is not None:
+            try:
+                reference = self.mirror_cache.ensure(url)
+            except exc.CommandError:
+                self.log.warning(
+                    "Could not update mirror of %s, cloning without it.",
+                    url,
+                    exc_info=True,
+                )
+
+        if bundle is not None:
+            self.log.info("Cloning from bundle %s.", bundle)
+        else:
+            self.log.info("Cloning.")
         self.cmd.clone(
-            url=url,
+            url=str(bundle) if bundle is not None else url,
             progress=True,
             depth=clone_depth,
+            reference_if_able=str(reference) if reference is not None else None,
+            dissociate=True if reference is not None and self.dissociate else None,
+            _filter=self.filter_spec if bundle is None else None,
+            sparse=True if self.sparse_paths is not None else None,
             config={"http.sslVerify": False} if self.tls_verify else None,
             log_in_real_time=True,
         )
 
+        if bundle is not None:
+            self._catch_up_from_bundle()
+
+        if self.sparse_paths is not None:
+            self.log.info("Setting sparse-checkout paths.")
+            self.cmd.sparse_checkout.set(
+                self.sparse_paths,
+                cone=True,
+                check_returncode=True,
+                log_in_real_time=True,
+            )
+
         self.log.info("Initializing submodules.")
         self.cmd.submodule.init(
             log_in_real_time=True,
@@ -441,6 +1130,82 @@ class GitSync(BaseSync):
 
         self.set_remotes(overwrite=True)
 
+    def _catch_up_from_bundle(self) -> None:
+        """Point a checkout cloned from a bundle at its URL and fetch the delta.
+
+        The bundle clone's ``origin`` is the bundle file. Retarget it, fetch
+        what the bundle lacks, and fast-forward the checked out branch to its
+        upstream.
+        """
+        self.set_remotes(overwrite=True)
+
+        self.log.info("Fetching changes since the bundle.")
+        self.cmd.fetch(
+            reftag="origin",
+            prune=True,
+            log_in_real_time=True,
+            check_returncode=True,
+        )
+        try:
+            self.cmd.rev_parse(
+                verify=True,
+                args="@{upstream}",
+                check_returncode=True,
+            )
+        except exc.CommandError:
+            self.log.debug("Checked out branch has no upstream, not updating.")
+            return
+        self.cmd.run(
+            ["merge", "--ff-only", "--quiet", "@{upstream}"],
+            check_returncode=True,
+        )
+
+    def _fetch(self, *, remote_name: str) -> str:
+        """Fetch what :meth:`update_repo` needs, as configured on this object."""
+        options: dict[str, t.Any] = {
+            "no_tags": True if self.fetch_tags is False else None,
+            "tags": True if self.fetch_tags is True else None,
+            "jobs": self.fetch_jobs,
+        }
+        if self.fetch_remotes is not None:
+            options.update(repositories=self.fetch_remotes, multiple=True)
+        elif self.fetch_refspecs is not None:
+            options.update(reftag=remote_name, refspecs=self.fetch_refspecs)
+        return self.cmd.fetch(
+            log_in_real_time=True,
+            check_returncode=True,
+            **options,
+        )
+
+    def _remote_branch_unchanged(
+        self,
+        *,
+        remote_name: str,
+        branch: str,
+        tracking_sha: str,
+    ) -> bool:
+        """Return True if the remote's ``branch`` is still at ``tracking_sha``.
+
+        Any failure to ask the remote returns False, leaving the fetch to
+        report it.
+        """
+        remote = self.remote(remote_name)
+        if remote is None:
+            return False
+        ref = f"refs/heads/{branch}"
+        try:
+            remote_refs = self.cmd.ls_remote(
+                remote.fetch_url,
+                [ref],
+                symref=False,
+                cache=self.ls_remote_cache,
+                check_returncode=True,
+            )
+        except exc.CommandError:
+            self.log.debug("ls-remote of '%s' failed", remote.fetch_url)
+            return False
+        return remote_refs.refs.get(ref) == tracking_sha
+
     def update_repo(
         self,
         set_remotes: bool = False,
@@ -488,13 +1253,28 @@ class GitSync(BaseSync):
                 result.add_error("set-remotes", str(e), exception=e)
                 return result
 
+        if (
+            self.sparse_paths is not None
+            and self.cmd.sparse_checkout.ls() != self.sparse_paths
+        ):
+            try:
+                self.cmd.sparse_checkout.set(
+                    self.sparse_paths,
+                    cone=True,
+                    check_returncode=True,
+                )
+            except exc.CommandError as e:
+                self.log.exception("Failed to set sparse-checkout paths")
+                result.add_error("sparse-checkout", str(e), exception=e)
+                return result
+
         # Get requested revision or tag
         url, git_tag = self.url, getattr(self, "rev", None)
 
         if not git_tag:
             self.log.debug("No git revision set, defaulting to origin/master")
             try:
-                symref = self.cmd.symbolic_ref(
+                symref = self._branch_in_process() or self.cmd.symbolic_ref(
                     name="HEAD",
                     short=True,
                     check_returncode=True,
@@ -510,11 +1290,14 @@ class GitSync(BaseSync):
 
         # Get head sha
         try:
-            head_sha = self.cmd.rev_list(
-                commit="HEAD",
-                max_count=1,
-                check_returncode=True,
-            ).strip()
+            head_sha = (
+                self._head_in_process()
+                or self.cmd.rev_list(
+                    commit="HEAD",
+                    max_count=1,
+                    check_returncode=True,
+                ).strip()
+            )
         except exc.CommandError as e:
             self.log.exception("Failed to get the hash for HEAD")
             result.add_error("rev-list-head", str(e), exception=e)
@@ -522,6 +1305,13 @@ class GitSync(BaseSync):
 
         self.log.debug("head_sha: %s", head_sha)
 
+        # A commit id names the same commit forever: once it is stored
+        # locally there is nothing to fetch.
+        commit_present = self._has_commit_in_process(git_tag)
+        if commit_present and git_tag.lower() == head_sha:
+            self.log.info("Already up-to-date.")
+            return result
+
         # If a remote ref is asked for, which can possibly move around,
         # we must always do a fetch and checkout.
         show_ref_output = self.cmd.show_ref(pattern=git_tag, check_returncode=False)
@@ -597,22 +1387,37 @@ class GitSync(BaseSync):
             self.log.info("Already up-to-date.")
             return result
 
-        try:
-            process = self.cmd.fetch(log_in_real_time=True, check_returncode=True)
-        except exc.CommandError as e:
-            self.log.exception("Failed to fetch repository '%s'", url)
-            result.add_error("fetch", str(e), exception=e)
+        remote_unchanged = (
+            self.skip_unchanged_fetch
+            and is_remote_ref
+            and not error_code
+            and self.fetch_remotes is None
+            and self._remote_branch_unchanged(
+                remote_name=git_remote_name,
+                branch=git_tag,
+                tracking_sha=tag_sha,
+            )
+        )
+        if remote_unchanged and tag_sha == head_sha:
+            self.log.info("Already up-to-date.")
             return result
 
+        if not remote_unchanged and not commit_present:
+            try:
+                self._fetch(remote_name=git_remote_name)
+            except exc.CommandError as e:
+                self.log.exception("Failed to fetch repository '%s'", url)
+                result.add_error("fetch", str(e), exception=e)
+                return result
+
         if is_remote_ref:
             # Check if stash is needed
             try:
-                process = self.cmd.status(porcelain=True, untracked_files="no")
+                need_stash = self.is_dirty()
             except exc.CommandError as e:
                 self.log.exception("Failed to get the status")
                 result.add_error("status", str(e), exception=e)
                 return result
-            need_stash = len(process) > 0
 
             # If not in clean state, stash changes in order to be able
             # to be able to perform git pull --rebase
@@ -620,7 +1425,7 @@ class GitSync(BaseSync):
                 # If Git < 1.7.6, uses --quiet --all
                 git_stash_save_options = "--quiet"
                 try:
-                    process = self.cmd.stash.save(message=git_stash_save_options)
+                    self.cmd.stash.save(message=git_stash_save_options)
                 except exc.CommandError as e:
                     self.log.exception("Failed to stash changes")
                     result.add_error("stash-save", str(e), exception=e)
@@ -628,7 +1433,7 @@ class GitSync(BaseSync):
 
             # Checkout the remote branch
             try:
-                process = self.cmd.checkout(
+                self.cmd.checkout(
                     branch=git_tag,
                     check_returncode=True,
                 )
@@ -639,7 +1444,7 @@ class GitSync(BaseSync):
 
             # Rebase changes from the remote branch
             try:
-                process = self.cmd.rebase(upstream=git_remote_name + "/" + git_tag)
+                self.cmd.rebase(upstream=git_remote_name + "/" + git_tag)
             except exc.CommandError as e:
                 if any(msg in str(e) for msg in ["invalid_upstream", "Aborting"]):
                     self.log.exception("Invalid upstream remote. Rebase aborted.")
@@ -662,13 +1467,13 @@ class GitSync(BaseSync):
 
             if need_stash:
                 try:
-                    process = self.cmd.stash.pop(index=True, quiet=True)
+                    self.cmd.stash.pop(index=True, quiet=True)
                 except exc.CommandError:
                     # Stash pop --index failed: Try again dropping the index
                     with contextlib.suppress(exc.CommandError):
                         self.cmd.reset(hard=True, quiet=True)
                     try:
-                        process = self.cmd.stash.pop(quiet=True)
+                        self.cmd.stash.pop(quiet=True)
                     except exc.CommandError as e:
                         # Stash pop failed: Restore previous state.
                         with contextlib.suppress(exc.CommandError):
@@ -689,7 +1494,7 @@ class GitSync(BaseSync):
 
         else:
             try:
-                process = self.cmd.checkout(
+                self.cmd.checkout(
                     branch=git_tag,
                     check_returncode=True,
                 )
@@ -705,6 +1510,72 @@ class GitSync(BaseSync):
             result.add_error("submodule-update", str(e), exception=e)
         return result
 
+    def export(
+        self,
+        target: StrPath,
+        *,
+        rev: str | None = None,
+        pathspecs: Sequence[str] = (),
+    ) -> pathlib.Path:
+        """Write the files of a revision into ``target``, without a checkout.
+
+        Streams ``git archive`` (see :meth:`Git.archive
+        <libvcs.cmd.git.Git.archive>`) of ``rev`` straight into ``target``,
+        one tar member at a time. The source is the clone at :attr:`path`
+        when there is one. Otherwise, with ``mirror_cache``, it is the
+        cache's bare mirror of :attr:`url`, so a deployment needs no working
+        tree at all; without either, the repository is obtained first.
+
+        Submodules are not exported, and ``export-ignore`` /
+        ``export-subst`` attributes apply, as with ``git archive``.
+
+        Parameters
+        ----------
+        target :
+            Directory to write to; created if missing. Existing files are
+            overwritten, others are left alone.
+        rev :
+            Commit, tag or branch to export. Default: ``rev``, else ``HEAD``.
+        pathspecs :
+            Only export these paths.
+
+        Returns
+        -------
+        pathlib.Path
+            ``target``.
+
+        Examples
+        --------
+        >>> repo = GitSync(
+        ...     url=f'file://{create_git_remote_repo()}',
+        ...     path=tmp_path / 'checkout',
+        ...     mirror_cache=GitMirrorCache(tmp_path / 'mirrors'),
+        ... )
+        >>> deployed = repo.export(tmp_path / 'deploy')
+        >>> [file.name for file in deployed.iterdir()]
+        ['testfile.test']
+        >>> repo.path.exists()
+        False
+        """
+        if (self.path / ".git").exists():
+            source = self.cmd
+        elif self.mirror_cache is not None:
+            source = Git(path=self.mirror_cache.ensure(self.url))
+        else:
+            self.obtain()
+            source = self.cmd
+
+        target = pathlib.Path(target)
+        target.mkdir(parents=True, exist_ok=True)
+        rev = rev or getattr(self, "rev", None) or "HEAD"
+        self.log.info("Exporting %s to %s.", rev, target)
+        with (
+            contextlib.closing(source.archive(rev, pathspecs)) as chunks,
+            tarfile.open(fileobj=_ChunkReader(chunks), mode="r|") as tar,
+        ):
+            tar.extractall(target, **_TAR_EXTRACT_OPTIONS)
+        return target
+
     def remotes(self) -> GitSyncRemoteDict:
         """Return remotes like git remote -v.
 
@@ -719,13 +1590,11 @@ class GitSync(BaseSync):
         """
         remotes = {}
 
-        ret = self.cmd.remotes.ls()
-
-        for r in ret:
-            # FIXME: Cast to the GitRemote that sync uses, for now
-            remote = self.remote(r.remote_name)
+        # A single ``git remote -v`` lists every remote with both URLs.
+        for remote_cmd in self.cmd.remotes.ls(in_process=self.read_config_in_process):
+            remote = self._remote_from_cmd(remote_cmd)
             if remote is not None:
-                remotes[r.remote_name] = remote
+                remotes[remote.name] = remote
         return remotes
 
     def remote(self, name: str, **kwargs: t.Any) -> GitRemote | None:
@@ -750,7 +1619,7 @@ class GitSync(BaseSync):
         hang. ``git remote -v`` is O(remotes) and cannot block on ref
         enumeration. The remote manager is uncached -- each call shells
         out -- so repeated calls in a loop will still spawn one
-        subprocess apiece.
+        subprocess apiece, unless ``read_config_in_process`` is set.
 
         Subprocess failures from the underlying ``git remote -v`` are
         suppressed and returned as ``None`` to preserve the resilience
@@ -759,12 +1628,21 @@ class GitSync(BaseSync):
         LibVCSException``).
         """
         try:
-            remote_cmd = self.cmd.remotes.get(remote_name=name, default=None)
+            remote_cmd = self.cmd.remotes.get(
+                remote_name=name,
+                default=None,
+                in_process=self.read_config_in_process,
+            )
         except exc.LibVCSException:
             return None
         if remote_cmd is None:
             return None
 
+        return self._remote_from_cmd(remote_cmd)
+
+    @staticmethod
+    def _remote_from_cmd(remote_cmd: GitRemoteCmd) -> GitRemote | None:
+        """Return :class:`GitRemote` for a listed remote, ``None`` without URL."""
         fetch_url = (remote_cmd.fetch_url or "").strip()
         if not fetch_url:
             return None
@@ -774,7 +1652,7 @@ class GitSync(BaseSync):
         push_url = (remote_cmd.push_url or fetch_url).strip()
 
         return GitRemote(
-            name=name,
+            name=remote_cmd.remote_name,
             fetch_url=fetch_url,
             push_url=push_url,
         )
@@ -797,7 +1675,11 @@ class GitSync(BaseSync):
             defines the remote URL
         """
         url = self.chomp_protocol(url)
-        remote_cmd = self.cmd.remotes.get(remote_name=name, default=None)
+        remote_cmd = self.cmd.remotes.get(
+            remote_name=name,
+            default=None,
+            in_process=self.read_config_in_process,
+        )
 
         if remote_cmd is not None and overwrite:
             remote_cmd.set_url(url=url, check_returncode=True)
@@ -849,10 +1731,33 @@ class GitSync(BaseSync):
             version = ""
         return ".".join(version.split(".")[:3])
 
-    def status(self) -> GitStatus:
-        """Retrieve status of project in dict format.
+    def status(
+        self,
+        *,
+        untracked_files: t.Literal["no", "normal", "all"] | None = None,
+        ignored: t.Literal["traditional", "no", "matching"] | None = None,
+        ignore_submodules: t.Literal["none", "untracked", "dirty", "all"] | None = None,
+        no_optional_locks: bool | None = None,
+        fsmonitor: bool | None = None,
+        untracked_cache: bool | None = None,
+    ) -> GitStatus:
+        """Retrieve status of project, including changed paths.
+
+        Wraps ``git status --branch --porcelain=2 -z``.
 
-        Wraps ``git status --sb --porcelain=2``. Does not include changed files, yet.
+        Parameters
+        ----------
+        untracked_files : "no", "normal", "all", optional
+            ``no`` skips the untracked scan, the most expensive part of
+            ``git status`` on large trees.
+        ignored : "traditional", "no", "matching", optional
+        ignore_submodules : "none", "untracked", "dirty", "all", optional
+        no_optional_locks : bool, optional
+            Don't refresh the index, so concurrent writers are not blocked.
+        fsmonitor : bool, optional
+            Override ``core.fsmonitor``.
+        untracked_cache : bool, optional
+            Override ``core.untrackedCache``.
 
         Returns
         -------
@@ -873,11 +1778,63 @@ branch_ab='+0 -0', \
 branch_ahead='0', \
 branch_behind='0'\
 )
+
+        >>> (tmp_path / 'new file.txt').touch()
+        >>> git_repo.status().entries
+        [GitStatusEntry(kind='untracked', path='new file.txt', ...)]
+        >>> git_repo.status(untracked_files='no').entries
+        []
         """
-        return GitStatus.from_stdout(
-            self.cmd.status(short=True, branch=True, porcelain="2"),
+        options: dict[str, t.Any] = {
+            "untracked_files": untracked_files,
+            "ignored": ignored,
+            "ignore_submodules": ignore_submodules,
+            "no_optional_locks": no_optional_locks,
+            "fsmonitor": fsmonitor,
+            "untracked_cache": untracked_cache,
+        }
+        return GitStatus.from_porcelain_v2(
+            self.cmd.status(
+                branch=True,
+                porcelain="2",
+                z=True,
+                **{k: v for k, v in options.items() if v is not None},
+            ),
         )
 
+    def is_dirty(self) -> bool:
+        """Return whether tracked files differ from ``HEAD``.
+
+        Staged and unstaged changes count; untracked files do not. With
+        ``check_dirty_in_process``, the index's cached stat data is compared
+        with the worktree first, and git is only asked when something
+        differs.
+
+        Examples
+        --------
+        >>> git_repo = GitSync(
+        ...     url=f'file://{create_git_remote_repo()}',
+        ...     path=tmp_path,
+        ...     check_dirty_in_process=True,
+        ... )
+        >>> git_repo.obtain()
+        >>> git_repo.is_dirty()
+        False
+        >>> _ = (git_repo.path / 'untracked.txt').write_text('new')
+        >>> git_repo.is_dirty()
+        False
+        >>> _ = (git_repo.path / 'testfile.test').write_text('modified')
+        >>> git_repo.is_dirty()
+        True
+        """
+        if self.check_dirty_in_process:
+            try:
+                if not gitfs.possibly_dirty(self.path):
+                    return False
+            except (gitfs.GitFsUnsupported, OSError, ValueError):
+                self.log.debug("Index not readable in-process, asking git")
+        return bool(self.cmd.status(porcelain=True, untracked_files="no"))
+
     def get_current_remote_name(self) -> str:
         """Retrieve name of the remote / upstream of currently checked out branch.
 
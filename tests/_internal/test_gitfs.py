@@ -0,0 +1,718 @@
+"""Tests for libvcs._internal.gitfs, cross-checked against git."""
+
+from __future__ import annotations
+
+import os
+import pathlib
+import shutil
+import timeit
+import typing as t
+
+import pytest
+
+from libvcs import exc
+from libvcs._internal import gitfs
+from libvcs.cmd.git import Git, GitConfigSnapshot, GitRemoteCmd, GitRemoteManager
+
+if t.TYPE_CHECKING:
+    from libvcs.sync.git import GitSync
+
+
+def _git_refs(git: Git) -> dict[str, tuple[str, str]]:
+    """Map every ref to (oid, fully peeled oid) as git reports them."""
+    output = git.run(["for-each-ref", "--format=%(refname) %(objectname)"], trim=True)
+    refs = {}
+    for line in output.splitlines():
+        name, oid = line.split(" ")
+        refs[name] = (oid, git.rev_parse(args=f"{name}^{{}}", trim=True))
+    return refs
+
+
+def _assert_reader_matches_git(path: pathlib.Path, *, packed: bool) -> None:
+    git = Git(path=path)
+    reader = gitfs.GitRefReader(path)
+    refs = _git_refs(git)
+    assert refs
+    for name, (oid, peeled) in refs.items():
+        assert reader.resolve(name) == oid, name
+        if packed:
+            assert reader.peel(name) == peeled, name
+    assert reader.head() == git.rev_parse(args="HEAD", trim=True)
+    assert reader.symbolic_ref("HEAD") == git.run(["symbolic-ref", "HEAD"], trim=True)
+
+
+def test_ref_reader_matches_git_loose_and_packed(git_repo: GitSync) -> None:
+    """Loose refs, packed refs and peeled tags resolve as git resolves them."""
+    git = git_repo.cmd
+    git.run(["branch", "feature"])
+    git.run(["tag", "light"])
+    git.run(["tag", "-a", "annotated", "-m", "Annotated"])
+    git.run(["tag", "-a", "nested", "-m", "Tag of a tag", "annotated"])
+    git.run(["symbolic-ref", "refs/heads/alias", "refs/heads/feature"])
+
+    _assert_reader_matches_git(git_repo.path, packed=False)
+    reader = gitfs.GitRefReader(git_repo.path)
+    assert reader.symbolic_ref("refs/heads/alias") == "refs/heads/feature"
+    with pytest.raises(gitfs.GitFsUnsupported):
+        reader.peel("refs/tags/annotated")
+
+    git.run(["pack-refs", "--all"])
+    assert not (git_repo.path / ".git" / "refs" / "tags" / "annotated").exists()
+    _assert_reader_matches_git(git_repo.path, packed=True)
+
+    # A loose ref written after packing shadows the packed entry.
+    git.run(["commit", "--allow-empty", "-m", "Move feature"])
+    git.run(["branch", "-f", "feature", "HEAD"])
+    _assert_reader_matches_git(git_repo.path, packed=False)
+    assert reader.resolve("refs/heads/missing") is None
+
+
+def test_packed_refs_binary_search(tmp_path: pathlib.Path) -> None:
+    """Every packed ref is found, and misses return None."""
+    names = sorted(f"refs/tags/v{i}" for i in range(500))
+    lines = [b"# pack-refs with: peeled fully-peeled sorted \n"]
+    for i, name in enumerate(names):
+        lines.append(f"{i:040x} {name}\n".encode())
+        if i % 3 == 0:
+            lines.append(f"^{i + 1:040x}\n".encode())
+    path = tmp_path / "packed-refs"
+    path.write_bytes(b"".join(lines))
+
+    refs = gitfs.PackedRefs(path)
+    for i, name in enumerate(names):
+        ref = refs.get(name)
+        assert ref is not None
+        assert ref.oid == f"{i:040x}"
+        assert ref.peeled == (f"{i + 1:040x}" if i % 3 == 0 else None)
+    for missing in ("refs/heads/master", "refs/tags/v", "refs/tags/v9999", "z"):
+        assert refs.get(missing) is None
+    refs.close()
+
+
+def test_packed_refs_reloaded_when_rewritten(git_repo: GitSync) -> None:
+    """The shared mapping is replaced once git rewrites packed-refs."""
+    git = git_repo.cmd
+    git.run(["pack-refs", "--all"])
+    reader = gitfs.GitRefReader(git_repo.path)
+    before = reader.packed_refs()
+    assert before is not None
+    assert reader.packed_refs() is before
+
+    git.run(["tag", "later"])
+    git.run(["pack-refs", "--all"])
+    after = reader.packed_refs()
+    assert after is not before
+    assert reader.resolve("refs/tags/later") == reader.head()
+
+
+def test_ref_reader_linked_worktree(git_repo: GitSync) -> None:
+    """Worktrees read HEAD and per-worktree refs from their own gitdir."""
+    worktree = git_repo.path.parent / f"{git_repo.path.name}-wt"
+    git_repo.cmd.run(["worktree", "add", "-q", "-b", "wt-branch", str(worktree)])
+    wt_git = Git(path=worktree)
+    wt_git.run(["commit", "--allow-empty", "-m", "On worktree"])
+    wt_git.run(["update-ref", "refs/worktree/marker", "HEAD"])
+
+    _assert_reader_matches_git(worktree, packed=False)
+    reader = gitfs.GitRefReader(worktree)
+    assert reader.dirs.common_dir.resolve() == (git_repo.path / ".git").resolve()
+    assert reader.symbolic_ref("HEAD") == "refs/heads/wt-branch"
+    assert reader.resolve("refs/worktree/marker") == reader.head()
+
+    main = gitfs.GitRefReader(git_repo.path)
+    assert main.resolve("refs/heads/wt-branch") == reader.head()
+    assert main.resolve("refs/worktree/marker") is None
+    assert main.head() != reader.head()
+
+
+def test_ref_reader_gitdir_file(git_repo: GitSync) -> None:
+    """A relative ``gitdir:`` file points at the repository."""
+    store = git_repo.path.parent / f"{git_repo.path.name}-store.git"
+    shutil.move(git_repo.path / ".git", store)
+    (git_repo.path / ".git").write_text(f"gitdir: ../{store.name}\n")
+
+    _assert_reader_matches_git(git_repo.path, packed=False)
+
+
+def test_ref_reader_unborn_branch(tmp_path: pathlib.Path) -> None:
+    """HEAD of a fresh repository names a branch that does not exist yet."""
+    git = Git(path=tmp_path / "fresh")
+    git.init(initial_branch="trunk")
+    reader = gitfs.GitRefReader(git.path)
+
+    assert reader.symbolic_ref("HEAD") == "refs/heads/trunk"
+    assert reader.head() is None
+    assert reader.shorten("refs/heads/trunk") == "trunk"
+
+
+def test_ref_reader_unsupported(git_repo: GitSync, tmp_path: pathlib.Path) -> None:
+    """Anything unusual is left to git."""
+    dot_git = git_repo.path / ".git"
+    reader = gitfs.GitRefReader(git_repo.path)
+
+    (dot_git / "refs" / "heads" / "loop").write_text("ref: refs/heads/loop\n")
+    with pytest.raises(gitfs.GitFsUnsupported):
+        reader.resolve("refs/heads/loop")
+    (dot_git / "refs" / "heads" / "garbage").write_text("not an oid\n")
+    with pytest.raises(gitfs.GitFsUnsupported):
+        reader.resolve("refs/heads/garbage")
+    with pytest.raises(gitfs.GitFsUnsupported):
+        reader.resolve("refs/../../config")
+
+    git_repo.cmd.run(["tag", "master"])
+    with pytest.raises(gitfs.GitFsUnsupported):
+        reader.shorten("refs/heads/master")
+
+    (dot_git / "reftable").mkdir()
+    with pytest.raises(gitfs.GitFsUnsupported):
+        gitfs.GitRefReader(git_repo.path)
+    with pytest.raises(gitfs.GitFsUnsupported):
+        gitfs.GitRefReader(tmp_path)
+
+
+def test_GitSync_reads_refs_in_process(
+    git_repo: GitSync,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """With ``read_refs_in_process``, syncing reads HEAD without forking."""
+    expected = git_repo.get_revision()
+    git_repo.read_refs_in_process = True
+    forked: list[str] = []
+    run = Git.run
+
+    def spy(self: Git, args: t.Any, *a: t.Any, **kw: t.Any) -> t.Any:
+        forked.append(str(args[0] if isinstance(args, list) else args))
+        return run(self, args, *a, **kw)
+
+    monkeypatch.setattr(Git, "run", spy)
+    assert git_repo.get_revision() == expected
+    result = git_repo.update_repo()
+    assert result.ok
+    assert "rev-parse" not in forked
+    assert "symbolic-ref" not in forked
+
+    # Detached HEAD: git reports the missing branch, as without the option.
+    git_repo.cmd.run(["checkout", "-q", "--detach"])
+    assert git_repo.get_revision() == expected
+    assert not git_repo.update_repo().ok
+    assert "symbolic-ref" in forked
+
+
+def test_reading_refs_in_process_beats_forking(git_repo: GitSync) -> None:
+    """Benchmark: resolving HEAD from disk against ``git rev-parse HEAD``."""
+    git = git_repo.cmd
+    git.run(["pack-refs", "--all"])
+    reader = gitfs.GitRefReader(git_repo.path)
+    assert reader.head() == git.rev_parse(args="HEAD", trim=True)
+
+    number = 20
+    forked = min(
+        timeit.repeat(lambda: git.rev_parse(args="HEAD"), number=number, repeat=3)
+    )
+    in_process = min(
+        timeit.repeat(
+            lambda: gitfs.GitRefReader(git_repo.path).head(),
+            number=number,
+            repeat=3,
+        )
+    )
+    assert in_process < forked
+
+
+def _git_objects(git: Git) -> list[str]:
+    return git.run(
+        ["cat-file", "--batch-all-objects", "--batch-check=%(objectname)"],
+        trim=True,
+    ).splitlines()
+
+
+def test_object_store_matches_git(git_repo: GitSync) -> None:
+    """Loose, packed and multi-pack-indexed objects are all found."""
+    git = git_repo.cmd
+    store = gitfs.GitObjectStore(git_repo.path)
+    missing = "f" * 40
+
+    git.run(["repack", "-adq"])
+    (git_repo.path / "second.txt").write_text("second\n")
+    git.run(["add", "second.txt"])
+    git.run(["commit", "-m", "Loose commit"])
+    objects = _git_objects(git)
+    assert all(store.has_object(oid) for oid in objects)
+    assert not store.has_object(missing)
+
+    # A second pack, then a multi-pack-index covering both.
+    git.run(["repack", "-dq"])
+    assert len(list((git_repo.path / ".git/objects/pack").glob("*.idx"))) == 2
+    assert all(store.has_object(oid) for oid in objects)
+    git.run(["multi-pack-index", "write"])
+    store = gitfs.GitObjectStore(git_repo.path)
+    assert isinstance(store._indexes[0], gitfs.MultiPackIndex)
+    assert len(store._indexes) == 1
+    assert all(store.has_object(oid) for oid in objects)
+    assert not store.has_object(missing)
+
+    with pytest.raises(ValueError):
+        store.has_object("abc")
+
+
+def test_object_store_follows_alternates(
+    git_repo: GitSync,
+    tmp_path: pathlib.Path,
+) -> None:
+    """Objects borrowed through ``objects/info/alternates`` are present."""
+    borrower = tmp_path / "borrower"
+    git_repo.cmd.run(["clone", "-q", "--shared", str(git_repo.path), str(borrower)])
+    assert (borrower / ".git/objects/info/alternates").is_file()
+
+    store = gitfs.GitObjectStore(borrower)
+    assert len(store.object_dirs) == 2
+    assert all(store.has_object(oid) for oid in _git_objects(git_repo.cmd))
+
+
+def test_GitSync_pinned_commit_present_skips_fetch(
+    git_repo: GitSync,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A pinned commit already stored locally is checked out without fetching."""
+    git = git_repo.cmd
+    pinned = git.rev_parse(args="HEAD", trim=True)
+    git.run(["commit", "--allow-empty", "-m", "Newer"])
+    git.run(["repack", "-adq"])
+
+    def fail_fetch(*args: t.Any, **kwargs: t.Any) -> str:
+        pytest.fail("update_repo fetched a commit it already had")
+
+    monkeypatch.setattr(git_repo, "_fetch", fail_fetch)
+    git_repo.rev = pinned
+    git_repo.read_refs_in_process = True
+    assert git_repo.update_repo().ok
+    assert git.rev_parse(args="HEAD", trim=True) == pinned
+    assert git_repo.update_repo().ok
+
+
+def test_has_object_beats_forking(git_repo: GitSync) -> None:
+    """Benchmark: pack index lookups against ``git cat-file -e``."""
+    git = git_repo.cmd
+    git.run(["repack", "-adq"])
+    objects = _git_objects(git)
+    store = gitfs.GitObjectStore(git_repo.path)
+
+    forked = (
+        min(
+            timeit.repeat(
+                lambda: git.run(["cat-file", "-e", objects[0]]), number=5, repeat=3
+            )
+        )
+        / 5
+    )
+    lookups = 10_000
+    in_process = (
+        min(
+            timeit.repeat(
+                lambda: [
+                    store.has_object(objects[i % len(objects)]) for i in range(lookups)
+                ],
+                number=1,
+                repeat=3,
+            )
+        )
+        / lookups
+    )
+    assert in_process * 100 < forked
+
+
+def _index_layout(git_repo: GitSync) -> Git:
+    """Give the checkout nested, executable, symlinked and flagged entries."""
+    git = git_repo.cmd
+    (git_repo.path / "docs" / "api").mkdir(parents=True)
+    (git_repo.path / "docs" / "api" / "index.md").write_text("# API\n")
+    (git_repo.path / "docs" / "intro.md").write_text("# Intro\n")
+    script = git_repo.path / "run.sh"
+    script.write_text("#!/bin/sh\n")
+    script.chmod(0o755)
+    (git_repo.path / "link").symlink_to("run.sh")
+    git.run(["add", "."])
+    git.run(["commit", "-m", "Layout"])
+    return git
+
+
+@pytest.mark.parametrize("version", [2, 3, 4])
+def test_index_reader_matches_git(git_repo: GitSync, version: int) -> None:
+    """Entries of every index version match ``git ls-files --stage``."""
+    git = _index_layout(git_repo)
+    (git_repo.path / "planned.txt").write_text("later\n")
+    git.run(["add", "--intent-to-add", "planned.txt"])
+    git.run(["update-index", "--skip-worktree", "docs/intro.md"])
+    git.run(["update-index", "--index-version", str(version)])
+
+    index = gitfs.GitIndex(git_repo.path / ".git" / "index")
+    assert index.version == (3 if version == 2 else version)
+    stage = git.run(["ls-files", "--stage"], trim=True).splitlines()
+    assert [
+        f"{entry.mode:o} {entry.oid} {entry.stage}\t{entry.path}"
+        for entry in index.entries
+    ] == stage
+    flags = {entry.path: entry for entry in index.entries}
+    assert flags["planned.txt"].intent_to_add
+    assert flags["docs/intro.md"].skip_worktree
+    assert not flags["run.sh"].skip_worktree
+
+
+def test_changed_paths_matches_git(git_repo: GitSync) -> None:
+    """The stat scan lists every path git reports as modified or deleted."""
+    git = _index_layout(git_repo)
+    git.run(["update-index", "--refresh"])
+    index = gitfs.GitIndex(git_repo.path / ".git" / "index")
+    assert index.changed_paths(git_repo.path) == []
+
+    (git_repo.path / "docs" / "api" / "index.md").write_text("# Changed\n")
+    (git_repo.path / "docs" / "intro.md").unlink()
+    (git_repo.path / "run.sh").chmod(0o644)
+    (git_repo.path / "link").unlink()
+    (git_repo.path / "link").write_text("no longer a symlink")
+
+    changed = index.changed_paths(git_repo.path, max_workers=2)
+    modified = git.run(["diff", "--name-only"], trim=True).splitlines()
+    assert changed == sorted(modified)
+    assert changed == ["docs/api/index.md", "docs/intro.md", "link", "run.sh"]
+
+
+def test_possibly_dirty_staged_and_committed(git_repo: GitSync) -> None:
+    """Staged changes are caught through the cache tree; commits clear them."""
+    git = git_repo.cmd
+    git.run(["update-index", "--refresh"])
+    assert not gitfs.possibly_dirty(git_repo.path)
+
+    (git_repo.path / "testfile.test").write_text("staged\n")
+    git.run(["add", "testfile.test"])
+    assert gitfs.possibly_dirty(git_repo.path)
+    assert git.status(porcelain=True, untracked_files="no")
+
+    git.run(["commit", "-m", "Commit staged change"])
+    git.run(["repack", "-adq"])
+    assert not gitfs.possibly_dirty(git_repo.path)
+    store = gitfs.GitObjectStore(git_repo.path)
+    assert store.commit_tree(git.rev_parse(args="HEAD", trim=True)) == (
+        git.rev_parse(args="HEAD^{tree}", trim=True)
+    )
+
+
+def test_index_split_is_unsupported(git_repo: GitSync) -> None:
+    """Split indexes keep entries elsewhere, so they are left to git."""
+    git_repo.cmd.run(["update-index", "--split-index"])
+    with pytest.raises(gitfs.GitFsUnsupported):
+        gitfs.GitIndex(git_repo.path / ".git" / "index")
+
+
+def test_GitSync_is_dirty_in_process(
+    git_repo: GitSync,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A clean checkout is confirmed without running ``git status``."""
+    git_repo.cmd.run(["update-index", "--refresh"])
+    git_repo.check_dirty_in_process = True
+    statuses: list[t.Any] = []
+    status = Git.status
+
+    def spy(self: Git, *args: t.Any, **kwargs: t.Any) -> t.Any:
+        statuses.append(kwargs)
+        return status(self, *args, **kwargs)
+
+    monkeypatch.setattr(Git, "status", spy)
+    assert not git_repo.is_dirty()
+    assert statuses == []
+
+    # Touched but unchanged: the scan is unsure, git settles it.
+    testfile = git_repo.path / "testfile.test"
+    testfile.write_text(testfile.read_text())
+    assert not git_repo.is_dirty()
+    assert len(statuses) == 1
+
+    testfile.write_text("modified\n")
+    assert git_repo.is_dirty()
+
+
+_CONFIG_SAMPLES = {
+    "quoting": (
+        "[core]\n\tbare\n\tEditor = vim  -n \\\n  -f   ; trailing\n"
+        '[alias]\n\tlg = "log\\t--oneline ; not a comment"  # comment\n'
+        '\tempty =\n\tspaced = "  a "  b  \n'
+    ),
+    "subsections": (
+        '[remote "Origin"]\n\turl = a\n[remote "o\\"x\\\\y"]\n\turl = b\n'
+        '[Legacy.Sub]\n\tk = v\n[sec "Sub"] inline = 1\n'
+    ),
+    "multi_values": (
+        '[remote "origin"]\n\tfetch = +refs/heads/*:refs/remotes/origin/*\n'
+        '\tfetch = +refs/tags/*:refs/tags/*\n[Remote "origin"]\n\tFETCH = x\n'
+    ),
+    "crlf_and_bom": "\ufeff[core]\r\n\tautocrlf = true\r\n",
+}
+
+
+def _git_config_list(git: Git, *args: str) -> list[tuple[str, str | None, str]]:
+    """``git config --list -z --show-origin`` as (key, value, origin)."""
+    output = git.run(["config", "--list", "-z", "--show-origin", *args])
+    records = iter(output.split("\0"))
+    entries = []
+    for origin in records:
+        if not origin:
+            continue
+        key, newline, value = next(records).partition("\n")
+        entries.append((key, value if newline else None, origin))
+    return entries
+
+
+@pytest.mark.parametrize("sample", list(_CONFIG_SAMPLES))
+def test_parse_config_matches_git(tmp_path: pathlib.Path, sample: str) -> None:
+    """Keys and values come out exactly as ``git config --list`` prints them."""
+    config = tmp_path / "config"
+    config.write_bytes(_CONFIG_SAMPLES[sample].encode())
+    expected = _git_config_list(Git(path=tmp_path), "--file", str(config))
+    assert gitfs.parse_config(_CONFIG_SAMPLES[sample]) == [
+        (key, value) for key, value, _origin in expected
+    ]
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["[core\n", "[core]\nbad name = 1\n", '[core]\nk = "open\n', "[core]\nk = \\q\n"],
+)
+def test_parse_config_rejects_what_git_rejects(
+    tmp_path: pathlib.Path,
+    text: str,
+) -> None:
+    """Invalid config raises instead of guessing."""
+    config = tmp_path / "config"
+    config.write_text(text)
+    with pytest.raises(exc.CommandError):
+        Git(path=tmp_path).run(["config", "--file", str(config), "--list"])
+    with pytest.raises(gitfs.GitFsUnsupported):
+        gitfs.parse_config(text)
+
+
+def _assert_config_matches_git(path: pathlib.Path) -> None:
+    """Compare :func:`gitfs.load_config` with git, origins resolved."""
+    git = Git(path=path)
+    env = {k: v for k, v in os.environ.items() if k != "GIT_CONFIG"}
+    output = git.run(
+        ["config", "--list", "-z", "--show-origin", "--show-scope"],
+        env=env,
+    )
+    records = iter(output.split("\0"))
+    expected = []
+    for scope in records:
+        if not scope:
+            continue
+        origin = next(records)
+        key, newline, value = next(records).partition("\n")
+        expected.append(
+            (key, value if newline else None, (path / origin[5:]).resolve(), scope),
+        )
+    items, _sources = gitfs.load_config(path)
+    assert [
+        (key, value, pathlib.Path(origin[5:]).resolve(), scope)
+        for key, value, origin, scope in items
+    ] == expected
+
+
+def test_load_config_matches_git(
+    git_repo: GitSync,
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Includes and ``includeIf`` conditions are followed like git does."""
+    git = git_repo.cmd
+    repo = git_repo.path
+    git.run(["checkout", "-b", "feature/parser"])
+    includes = tmp_path / "includes"
+    includes.mkdir()
+    for name in ("plain", "gitdir", "gitdir_i", "gitdir_miss", "branch", "nested"):
+        (includes / f"{name}.cfg").write_text(f"[libvcs]\n\tinclude = {name}\n")
+    (includes / "plain.cfg").write_text(
+        "[libvcs]\n\tinclude = plain\n[include]\n\tpath = nested.cfg\n",
+    )
+    config = repo / ".git" / "config"
+    with config.open("a") as f:
+        f.write(
+            f"[include]\n\tpath = {includes}/plain.cfg\n"
+            f"\tpath = {includes}/missing.cfg\n"
+            f'[includeIf "gitdir:{repo.name}/"]\n\tpath = {includes}/gitdir.cfg\n'
+            f'[includeIf "gitdir/i:{repo.name.upper()}/.GIT"]\n'
+            f"\tpath = {includes}/gitdir_i.cfg\n"
+            f'[includeIf "gitdir:/nowhere/"]\n\tpath = {includes}/gitdir_miss.cfg\n'
+            f'[includeIf "onbranch:feature/"]\n\tpath = {includes}/branch.cfg\n'
+            '[remote "o\\"dd"]\n\turl = "x y"\n',
+        )
+    monkeypatch.setenv("GIT_CONFIG_COUNT", "1")
+    monkeypatch.setenv("GIT_CONFIG_KEY_0", "Libvcs.Sub.Key")
+    monkeypatch.setenv("GIT_CONFIG_VALUE_0", "from env")
+
+    items, sources = gitfs.load_config(repo)
+    included = [value for key, value, *_ in items if key == "libvcs.include"]
+    assert included == ["plain", "nested", "gitdir", "gitdir_i", "branch"]
+    assert includes / "missing.cfg" in sources
+    assert items[-1] == ("libvcs.Sub.key", "from env", "command line:", "command")
+
+    monkeypatch.delenv("GIT_CONFIG_COUNT")
+    _assert_config_matches_git(repo)
+    git.run(["checkout", "-"])
+    _assert_config_matches_git(repo)
+
+
+def test_load_config_worktree(
+    git_repo: GitSync,
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """``config.worktree`` is read once ``extensions.worktreeConfig`` is on."""
+    monkeypatch.delenv("GIT_CONFIG", raising=False)
+    git = git_repo.cmd
+    worktree = tmp_path / "worktree"
+    git.run(["worktree", "add", "-b", "wt", str(worktree)])
+    git.run(["config", "extensions.worktreeConfig", "true"])
+    Git(path=worktree).run(["config", "--worktree", "libvcs.where", "worktree"])
+    _assert_config_matches_git(worktree)
+    _assert_config_matches_git(git_repo.path)
+
+
+def test_load_config_unsupported(
+    git_repo: GitSync,
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Setups the loader does not cover are left to git."""
+    with pytest.raises(gitfs.GitFsUnsupported):
+        gitfs.load_config(tmp_path)
+    config = git_repo.path / ".git" / "config"
+    config.write_text(
+        config.read_text() + '[includeIf "hasconfig:remote.*.url:*"]\n\tpath = x\n',
+    )
+    with pytest.raises(gitfs.GitFsUnsupported):
+        gitfs.load_config(git_repo.path)
+
+    snapshot = Git(path=git_repo.path).config_snapshot(in_process=True)
+    assert snapshot.get("core.bare") == "false"
+    assert str(snapshot.entries[0].origin).startswith("file:")
+
+    monkeypatch.setenv("GIT_CONFIG_PARAMETERS", "'libvcs.key'='value'")
+    Git(path=tmp_path).init()
+    with pytest.raises(gitfs.GitFsUnsupported):
+        gitfs.load_config(tmp_path)
+
+
+def test_load_config_cached_until_changed(
+    git_repo: GitSync,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Files are parsed once and again only after they change."""
+    monkeypatch.delenv("GIT_CONFIG", raising=False)
+    config = git_repo.path / ".git" / "config"
+    parsed = gitfs._parse_config_file(config)
+    assert gitfs._parse_config_file(config) is parsed
+
+    git_repo.cmd.run(["config", "libvcs.cached", "no"])
+    reparsed = gitfs._parse_config_file(config)
+    assert reparsed is not parsed
+    assert reparsed is not None
+    assert ("libvcs.cached", "no") in reparsed
+
+
+def test_config_snapshot_in_process_matches_git(
+    git_repo: GitSync,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """``in_process`` snapshots agree with ``git config`` ones, .gitmodules too."""
+    monkeypatch.delenv("GIT_CONFIG", raising=False)
+    git_repo.cmd.run(["config", "--add", "libvcs.multi", "a"])
+    git_repo.cmd.run(["config", "--add", "libvcs.multi", "b"])
+    (git_repo.path / ".gitmodules").write_text(
+        '[submodule "vendor/lib"]\n\tpath = vendor/lib\n\turl = ../lib\n',
+    )
+    for file in (None, ".gitmodules"):
+        forked = GitConfigSnapshot(path=git_repo.path, file=file, show_scope=True)
+        parsed = GitConfigSnapshot(
+            path=git_repo.path,
+            file=file,
+            show_scope=True,
+            in_process=True,
+        )
+        assert [(e.key, e.value, e.scope) for e in parsed.entries] == [
+            (e.key, e.value, e.scope) for e in forked.entries
+        ]
+        assert parsed._fingerprint.keys() >= forked._fingerprint.keys()
+    assert parsed.subsections("submodule") == ["vendor/lib"]
+
+
+def test_remotes_in_process_match_git(
+    git_repo: GitSync,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Remote URLs, ``insteadOf`` and ``pushInsteadOf`` resolve like git's."""
+    monkeypatch.delenv("GIT_CONFIG", raising=False)
+    git = git_repo.cmd
+    git.run(["remote", "add", "upstream", "gh:vcs-python/libvcs"])
+    git.run(["remote", "set-url", "--add", "upstream", "gh:second/url"])
+    git.run(["remote", "add", "forked", "gh:me/libvcs"])
+    git.run(["remote", "set-url", "--push", "forked", "gh:me/push"])
+    git.run(["remote", "add", "mirror", "git@internal:mirror"])
+    git.run(["config", "url.https://github.com/.insteadOf", "gh:"])
+    git.run(
+        ["config", "url.https://github.com/vcs-python/.insteadOf", "gh:vcs-python/"]
+    )
+    git.run(
+        ["config", "url.ssh://git@github.com/.pushInsteadOf", "https://github.com/"]
+    )
+    git.run(["config", "url.ssh://mirror/.pushInsteadOf", "git@internal:"])
+
+    def listed(remotes: t.Iterable[GitRemoteCmd]) -> list[tuple[str, t.Any, t.Any]]:
+        return [(r.remote_name, r.fetch_url, r.push_url) for r in remotes]
+
+    forked = listed(git.remotes.ls())
+    assert len(forked) == 4
+    assert listed(git.remotes.ls(in_process=True)) == forked
+
+    # Without a url, ``git remote -v`` prints an empty fetch line.
+    git.run(["config", "remote.pushonly.pushurl", "gh:push/only"])
+    git.run(["config", "remote.fetchonly.fetch", "+refs/*:refs/*"])
+    assert listed(git.remotes.ls(in_process=True).filter(remote_name="pushonly")) == [
+        ("pushonly", None, "https://github.com/push/only"),
+    ]
+    assert not git.remotes.ls(in_process=True).filter(remote_name="fetchonly")
+
+
+def test_GitSync_reads_remotes_in_process(
+    git_repo: GitSync,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """``read_config_in_process`` lists and sets remotes without ``git remote -v``."""
+    expected = git_repo.remotes()
+    git_repo.read_config_in_process = True
+    listings: list[t.Any] = []
+    _ls = GitRemoteManager._ls
+
+    def spy(self: GitRemoteManager, *args: t.Any, **kwargs: t.Any) -> str:
+        listings.append(args)
+        return _ls(self, *args, **kwargs)
+
+    monkeypatch.setattr(GitRemoteManager, "_ls", spy)
+    assert git_repo.remotes() == expected
+    assert git_repo.remote("origin") == expected["origin"]
+    assert git_repo.remote("missing") is None
+    remote = git_repo.set_remote(name="second", url="file:///dev/null")
+    assert remote.fetch_url == "file:///dev/null"
+    git_repo.set_remotes(overwrite=True)
+    assert listings == []
+
+
+def test_listing_remotes_in_process_beats_forking(git_repo: GitSync) -> None:
+    """Benchmark: remotes from the parsed config against ``git remote -v``."""
+    remotes = git_repo.cmd.remotes
+    assert remotes.ls(in_process=True)
+
+    number = 20
+    forked = min(timeit.repeat(remotes.ls, number=number, repeat=3))
+    in_process = min(
+        timeit.repeat(lambda: remotes.ls(in_process=True), number=number, repeat=3)
+    )
+    assert in_process < forked
@@ -14,7 +14,7 @@ import pytest
 
 from libvcs import exc
 from libvcs._internal import run as run_module
-from libvcs._internal.run import _normalize_command_args, run
+from libvcs._internal.run import Pipe, _normalize_command_args, run
 
 
 def test_normalize_command_args_keeps_scalar_string() -> None:
@@ -191,6 +191,15 @@ def test_run_timeout_does_not_deadlock_on_chatty_stdout() -> None:
     assert len(output) >= 200000
 
 
+def test_run_without_timeout_does_not_deadlock_on_chatty_stdout() -> None:
+    """Without a timeout, output past the pipe buffer is still drained."""
+    script = "import sys; sys.stdout.write('x' * 200000); sys.stdout.flush()"
+
+    output = run([sys.executable, "-c", script])
+
+    assert len(output) == 200000
+
+
 def test_run_timeout_preserves_stdout_after_exit() -> None:
     """Captured stdout from the deadline loop survives back to the caller."""
     script = "print('preserved'); print('lines')"
@@ -313,3 +322,20 @@ def test_run_timeout_handles_early_stderr_close_without_hanging() -> None:
     # An upper bound that's loose enough not to flake but tight enough to
     # catch a regression where the EOF unregister is undone.
     assert elapsed < 5.0, f"early-stderr-close path took too long: {elapsed:.2f}s"
+
+
+def test_pipe_reports_exited_command() -> None:
+    """Reading from or writing to a command that died raises its stderr."""
+    script = (
+        "import sys; "
+        "line = sys.stdin.readline(); "
+        "sys.stdout.write(line); sys.stdout.flush(); "
+        "sys.stderr.write('bad request'); sys.exit(3)"
+    )
+    with Pipe([sys.executable, "-c", script]) as pipe:
+        pipe.write(b"first\n")
+        assert pipe.readline() == b"first\n"
+        with pytest.raises(exc.CommandError, match="bad request") as excinfo:
+            pipe.readline()
+    assert excinfo.value.returncode == 3
+    assert not pipe.alive
@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+import concurrent.futures
+import datetime
+import io
 import os
 import pathlib
+import shutil
 import subprocess
+import tarfile
 import time
+import timeit
 import typing as t
+import zipfile
 
 import pytest
 
@@ -49,6 +56,37 @@ def test_git_run_accepts_scalar_string(tmp_path: pathlib.Path) -> None:
     assert result.startswith("git version ")
 
 
+def test_git_run_global_options_precede_subcommand(
+    tmp_path: pathlib.Path,
+    mocker: MockerFixture,
+) -> None:
+    """Git run() emits global options and ``-c`` overrides before the command."""
+    repo = git.Git(path=tmp_path)
+    mock_run = mocker.patch("libvcs.cmd.git.run", return_value="")
+
+    repo.run(
+        ["status", "-z"],
+        no_optional_locks=True,
+        config={"core.untrackedCache": True},
+    )
+
+    _args, kwargs = mock_run.call_args
+    assert kwargs["args"] == [
+        "git",
+        "-c",
+        "core.untrackedCache=true",
+        "--no-optional-locks",
+        "status",
+        "-z",
+    ]
+
+
+def test_git_run_config_override(git_repo: GitSync) -> None:
+    """Git run() applies ``config`` overrides to the command."""
+    output = git_repo.cmd.run(["var", "-l"], config={"libvcs.test": "value"})
+    assert "libvcs.test=value" in output.splitlines()
+
+
 def test_git_run_timeout_propagates_to_runner(
     tmp_path: pathlib.Path,
     mocker: MockerFixture,
@@ -1605,6 +1643,60 @@ def test_stash_entry_create_branch(git_repo: GitSync) -> None:
     assert "stash-branch" in branch_names or "master" in branch_names
 
 
+def test_stash_ls_metadata(git_repo: GitSync, mocker: MockerFixture) -> None:
+    """GitStashManager.ls() reports oid, parents, timestamp and branch."""
+    test_file = git_repo.path / "meta_test.txt"
+    test_file.write_text("initial content")
+    git_repo.cmd.run(["add", "meta_test.txt"])
+    git_repo.cmd.run(["commit", "-m", "Add test file"])
+    test_file.write_text("modified for stash")
+    git_repo.cmd.stashes.push(message="fix: parser: handle a:b")
+
+    spy = mocker.spy(git_repo.cmd, "stream")
+    stashes = git_repo.cmd.stashes.ls()
+    assert spy.call_count == 1
+
+    stash = stashes[0]
+    head = git_repo.cmd.run(["rev-parse", "HEAD"], trim=True)
+    assert stash.index == 0
+    assert stash.branch == "master"
+    assert stash.message == "fix: parser: handle a:b"
+    assert stash.oid == git_repo.cmd.run(["rev-parse", "stash@{0}"], trim=True)
+    assert stash.parents[0] == head
+    assert len(stash.parents) == 2
+    assert stash.timestamp is not None
+    assert stash.timestamp.tzinfo == datetime.timezone.utc
+
+
+def test_stash_ls_large_count(git_repo: GitSync) -> None:
+    """GitStashManager.ls() parses thousands of stashes from one listing."""
+    test_file = git_repo.path / "large_test.txt"
+    test_file.write_text("initial content")
+    git_repo.cmd.run(["add", "large_test.txt"])
+    git_repo.cmd.run(["commit", "-m", "Add test file"])
+    test_file.write_text("modified for stash")
+    git_repo.cmd.stashes.push(message="seed")
+
+    # Replay the seed stash into a synthetic 2,000 entry stash reflog.
+    oid = git_repo.cmd.run(["rev-parse", "refs/stash"], trim=True)
+    zero = "0" * 40
+    lines = [
+        f"{zero if i == 0 else oid} {oid} Tester <tester@example.com> "
+        f"{1_700_000_000 + i} +0000\tOn master: stash {i}\n"
+        for i in range(2_000)
+    ]
+    (git_repo.path / ".git" / "logs" / "refs" / "stash").write_text("".join(lines))
+
+    started = time.monotonic()
+    stashes = git_repo.cmd.stashes.ls()
+    elapsed = time.monotonic() - started
+
+    assert len(stashes) == 2_000
+    assert stashes[0].message == "stash 1999"
+    assert stashes[-1].index == 1_999
+    assert elapsed < 10.0, f"2,000 stashes took {elapsed:.2f}s"
+
+
 # =============================================================================
 # GitWorktreeManager / GitWorktreeCmd Tests
 # =============================================================================
@@ -1829,6 +1921,67 @@ def test_worktree_repair(git_repo: GitSync, tmp_path: pathlib.Path) -> None:
     assert result == "" or "error" not in result.lower()
 
 
+def test_worktree_ls_metadata(
+    git_repo: GitSync,
+    tmp_path: pathlib.Path,
+    mocker: MockerFixture,
+) -> None:
+    """GitWorktreeManager.ls() reports detached, lock and prune reasons."""
+    locked_path = tmp_path / "locked-worktree"
+    git_repo.cmd.worktrees.add(path=locked_path, new_branch="locked-branch")
+    git_repo.cmd.run(
+        ["worktree", "lock", "--reason", "on usb\ndrive", str(locked_path)],
+    )
+
+    detached_path = tmp_path / "detached worktree"
+    git_repo.cmd.worktrees.add(path=detached_path, detach=True)
+
+    gone_path = tmp_path / "gone-worktree"
+    git_repo.cmd.worktrees.add(path=gone_path, new_branch="gone-branch")
+    shutil.rmtree(gone_path)
+
+    spy = mocker.spy(git_repo.cmd, "stream")
+    worktrees = {wt.worktree_path: wt for wt in git_repo.cmd.worktrees.ls()}
+    assert spy.call_count == 1
+
+    main = worktrees[str(git_repo.path)]
+    assert main.branch == "refs/heads/master"
+    assert not main.detached
+    assert not main.bare
+
+    locked = worktrees[str(locked_path)]
+    assert locked.locked is True
+    assert locked.locked_reason == "on usb\ndrive"
+
+    detached = worktrees[str(detached_path)]
+    assert detached.detached is True
+    assert detached.branch is None
+    assert detached.head == main.head
+
+    gone = worktrees[str(gone_path)]
+    assert gone.prunable is True
+    assert gone.prunable_reason is not None
+
+
+def test_worktree_ls_large_count(git_repo: GitSync) -> None:
+    """GitWorktreeManager.ls() parses hundreds of worktrees from one listing."""
+    admin_root = git_repo.path / ".git" / "worktrees"
+    for i in range(500):
+        admin = admin_root / f"wt-{i}"
+        admin.mkdir(parents=True)
+        (admin / "gitdir").write_text(f"/nonexistent/wt-{i}/.git\n")
+        (admin / "HEAD").write_text("ref: refs/heads/master\n")
+        (admin / "commondir").write_text("../..\n")
+
+    started = time.monotonic()
+    worktrees = git_repo.cmd.worktrees.ls()
+    elapsed = time.monotonic() - started
+
+    assert len(worktrees) == 501
+    assert sum(wt.prunable for wt in worktrees) == 500
+    assert elapsed < 10.0, f"500 worktrees took {elapsed:.2f}s"
+
+
 # GitNotes tests
 
 
@@ -2331,6 +2484,127 @@ def test_reflog_entry_delete(git_repo: GitSync) -> None:
     assert result == "" or isinstance(result, str)
 
 
+def _write_reflog(git_repo: GitSync, ref: str, messages: list[str]) -> int:
+    """Write a synthetic reflog for ``ref``, oldest first, one second apart.
+
+    Returns the timestamp of the first entry.
+    """
+    head = git_repo.cmd.run(["rev-parse", "HEAD"], trim=True)
+    git_repo.cmd.run(["update-ref", ref, head])
+    start = 1_700_000_000
+    lines = [
+        f"{head} {head} Tester <tester@example.com> {start + i} +0000\t{message}\n"
+        for i, message in enumerate(messages)
+    ]
+    log_path = git_repo.path / ".git" / "logs" / ref
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    log_path.write_text("".join(lines))
+    return start
+
+
+def test_reflog_iter_entries_fields(git_repo: GitSync) -> None:
+    """iter_entries() keeps colons in messages and reports who and when."""
+    start = _write_reflog(
+        git_repo,
+        "refs/heads/reflog-fields",
+        ["commit: fix: handle a:b:c", "reset: moving to HEAD~1", "custom note"],
+    )
+
+    entries = list(git_repo.cmd.reflog.iter_entries("refs/heads/reflog-fields"))
+
+    assert [e.refspec for e in entries] == [
+        "reflog-fields@{0}",
+        "reflog-fields@{1}",
+        "reflog-fields@{2}",
+    ]
+    assert (entries[0].action, entries[0].message) == ("custom note", "")
+    assert (entries[1].action, entries[1].message) == ("reset", "moving to HEAD~1")
+    assert (entries[2].action, entries[2].message) == ("commit", "fix: handle a:b:c")
+    assert entries[2].identity == "Tester <tester@example.com>"
+    assert entries[2].timestamp == datetime.datetime.fromtimestamp(
+        start,
+        tz=datetime.timezone.utc,
+    )
+
+
+def test_reflog_iter_entries_cursor_and_dates(git_repo: GitSync) -> None:
+    """iter_entries() pages with skip/number and bounds by reflog date."""
+    ref = "refs/heads/reflog-cursor"
+    start = _write_reflog(git_repo, ref, [f"commit: entry {i}" for i in range(10)])
+    reflog = git_repo.cmd.reflog
+
+    page = list(reflog.iter_entries(ref, skip=3, number=2))
+    assert [e.refspec for e in page] == ["reflog-cursor@{3}", "reflog-cursor@{4}"]
+    assert [e.message for e in page] == ["entry 6", "entry 5"]
+
+    def at(offset: int) -> datetime.datetime:
+        return datetime.datetime.fromtimestamp(
+            start + offset,
+            tz=datetime.timezone.utc,
+        )
+
+    bounded = reflog.ls(ref, since=at(2), until=at(4))
+    assert [e.message for e in bounded] == ["entry 4", "entry 3", "entry 2"]
+
+
+def test_reflog_iter_entries_since_unordered(git_repo: GitSync) -> None:
+    """``since`` filters each entry instead of stopping at the first older one."""
+    ref = "refs/heads/reflog-unordered"
+    start = _write_reflog(git_repo, ref, ["commit: a", "commit: b", "commit: c"])
+    log_path = git_repo.path / ".git" / "logs" / ref
+    # Skewed clock: the middle entry predates the one written before it.
+    log_path.write_text(
+        log_path.read_text().replace(f" {start + 1} +0000", f" {start - 60} +0000"),
+    )
+
+    since = datetime.datetime.fromtimestamp(start, tz=datetime.timezone.utc)
+    entries = git_repo.cmd.reflog.ls(ref, since=since)
+
+    assert [e.message for e in entries] == ["c", "a"]
+
+
+def test_git_stream_global_options(git_repo: GitSync) -> None:
+    """Git.stream() accepts the same global options as Git.run()."""
+    output = b"".join(
+        git_repo.cmd.stream(
+            ["rev-parse", "--show-toplevel", "--absolute-git-dir"],
+            cwd=git_repo.path.parent,
+            C=git_repo.path.name,
+        ),
+    )
+    assert output.decode().split() == [
+        str(git_repo.path),
+        str(git_repo.path / ".git"),
+    ]
+
+    output = b"".join(
+        git_repo.cmd.stream(
+            ["rev-parse", "--is-bare-repository"],
+            git_dir=git_repo.path / ".git",
+            work_tree=git_repo.path,
+        ),
+    )
+    assert output == b"false\n"
+
+
+def test_reflog_iter_entries_large_count(git_repo: GitSync) -> None:
+    """iter_entries() streams a large reflog and can stop early."""
+    ref = "refs/heads/reflog-large"
+    _write_reflog(git_repo, ref, [f"commit: entry {i}" for i in range(20_000)])
+
+    entries = git_repo.cmd.reflog.iter_entries(ref)
+    first = next(entries)
+    assert first.message == "entry 19999"
+    entries.close()
+
+    started = time.monotonic()
+    count = sum(1 for _ in git_repo.cmd.reflog.iter_entries(ref))
+    elapsed = time.monotonic() - started
+
+    assert count == 20_000
+    assert elapsed < 10.0, f"20k reflog entries took {elapsed:.2f}s"
+
+
 # GitSubmodule tests
 # ==================
 
@@ -2413,6 +2687,22 @@ def test_submodule_ls(
     assert submodule.name is not None
 
 
+def test_submodule_ls_reads_gitmodules(
+    git_repo: GitSync,
+    submodule_repo: git.Git,
+) -> None:
+    """GitSubmoduleManager.ls() resolves url and branch from one snapshot."""
+    _setup_submodule_test(git_repo, submodule_repo)
+    git_repo.cmd.run(
+        ["config", "-f", ".gitmodules", "submodule.vendor/lib.branch", "main"],
+    )
+
+    submodule = git_repo.cmd.submodules.get(path="vendor/lib")
+    assert submodule.name == "vendor/lib"
+    assert submodule.url == str(submodule_repo.path)
+    assert submodule.branch == "main"
+
+
 def test_submodule_get(
     git_repo: GitSync,
     submodule_repo: git.Git,
@@ -2785,3 +3075,936 @@ def test_run_failure_preserves_stderr_lines(git_repo: GitSync) -> None:
     # localize, rather than on translatable English error text.
     assert "\n" in output
     assert "no-such-remote" in output
+
+
+# GitConfigSnapshot tests
+# =======================
+
+
+class ConfigSnapshotLookupFixture(t.NamedTuple):
+    """Test fixture for GitConfigSnapshot typed lookups."""
+
+    test_id: str
+    config_lines: str
+    method: str
+    key: str
+    expected: t.Any
+
+
+CONFIG_SNAPSHOT_LOOKUP_FIXTURES: list[ConfigSnapshotLookupFixture] = [
+    ConfigSnapshotLookupFixture(
+        test_id="get-mixed-case-key",
+        config_lines='[Libvcs "SubSection"]\n\tSomeKey = value\n',
+        method="get",
+        key="LIBVCS.SubSection.somekey",
+        expected="value",
+    ),
+    ConfigSnapshotLookupFixture(
+        test_id="get-quoted-value",
+        config_lines='[libvcs]\n\tquoted = "a b ; c"\n',
+        method="get",
+        key="libvcs.quoted",
+        expected="a b ; c",
+    ),
+    ConfigSnapshotLookupFixture(
+        test_id="get-last-value-wins",
+        config_lines="[libvcs]\n\tkey = one\n\tkey = two\n",
+        method="get",
+        key="libvcs.key",
+        expected="two",
+    ),
+    ConfigSnapshotLookupFixture(
+        test_id="get-all-multi-value",
+        config_lines="[libvcs]\n\tkey = one\n\tkey = two\n",
+        method="get_all",
+        key="libvcs.key",
+        expected=["one", "two"],
+    ),
+    ConfigSnapshotLookupFixture(
+        test_id="bool-bare-key",
+        config_lines="[libvcs]\n\tflag\n",
+        method="get_bool",
+        key="libvcs.flag",
+        expected=True,
+    ),
+    ConfigSnapshotLookupFixture(
+        test_id="bool-off",
+        config_lines="[libvcs]\n\tflag = off\n",
+        method="get_bool",
+        key="libvcs.flag",
+        expected=False,
+    ),
+    ConfigSnapshotLookupFixture(
+        test_id="bool-int",
+        config_lines="[libvcs]\n\tflag = 2\n",
+        method="get_bool",
+        key="libvcs.flag",
+        expected=True,
+    ),
+    ConfigSnapshotLookupFixture(
+        test_id="int-unit-suffix",
+        config_lines="[libvcs]\n\tsize = 2k\n",
+        method="get_int",
+        key="libvcs.size",
+        expected=2048,
+    ),
+    ConfigSnapshotLookupFixture(
+        test_id="path-expands-home",
+        config_lines="[libvcs]\n\tpath = ~/repos\n",
+        method="get_path",
+        key="libvcs.path",
+        expected=pathlib.Path("~/repos"),
+    ),
+    ConfigSnapshotLookupFixture(
+        test_id="missing-key",
+        config_lines="",
+        method="get_int",
+        key="libvcs.missing",
+        expected=None,
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    list(ConfigSnapshotLookupFixture._fields),
+    CONFIG_SNAPSHOT_LOOKUP_FIXTURES,
+    ids=[f.test_id for f in CONFIG_SNAPSHOT_LOOKUP_FIXTURES],
+)
+def test_config_snapshot_lookup(
+    git_repo: GitSync,
+    test_id: str,
+    config_lines: str,
+    method: str,
+    key: str,
+    expected: t.Any,
+) -> None:
+    """Test GitConfigSnapshot typed lookups match git's conversions."""
+    with (git_repo.path / ".git" / "config").open("a") as config_file:
+        config_file.write(config_lines)
+
+    if isinstance(expected, pathlib.Path):
+        expected = expected.expanduser()
+
+    snapshot = git.GitConfigSnapshot(path=git_repo.path)
+    assert getattr(snapshot, method)(key) == expected
+
+
+def test_config_snapshot_matches_git(git_repo: GitSync) -> None:
+    """Every key resolves to the value git itself reads.
+
+    ``git var -l`` is used as the reference because, unlike ``git config``,
+    it ignores the ``GIT_CONFIG`` override the test environment sets.
+    """
+    snapshot = git_repo.cmd.config_snapshot()
+    keys = {entry.key for entry in snapshot.entries}
+
+    expected: dict[str, str] = {}
+    for line in git_repo.cmd.run(["var", "-l"]).splitlines():
+        key, _, value = line.partition("=")
+        expected[key] = value
+
+    assert "remote.origin.url" in keys
+    assert "user.email" in keys
+    for key in keys:
+        assert snapshot.get(key) == expected[key]
+
+
+def test_config_snapshot_bad_bool(git_repo: GitSync) -> None:
+    """GitConfigSnapshot.get_bool() rejects values git would reject."""
+    git_repo.cmd.run(["config", "libvcs.flag", "maybe"])
+
+    with pytest.raises(ValueError, match="bad boolean"):
+        git_repo.cmd.config_snapshot().get_bool("libvcs.flag")
+
+
+def test_config_snapshot_single_subprocess(
+    git_repo: GitSync,
+    mocker: MockerFixture,
+) -> None:
+    """Lookups reuse one ``git config --list`` until a config file changes."""
+    snapshot = git.GitConfigSnapshot(path=git_repo.path)
+    spy = mocker.spy(snapshot.cmd, "run")
+
+    for _ in range(10):
+        snapshot.get("remote.origin.url")
+        snapshot.get_bool("core.bare")
+    assert spy.call_count == 1
+
+    # Written by another process, so only the file's mtime/size tells.
+    subprocess.run(
+        ["git", "config", "libvcs.added", "yes"],
+        cwd=git_repo.path,
+        check=True,
+    )
+    assert snapshot.is_stale
+    assert snapshot.get_bool("libvcs.added") is True
+    assert spy.call_count == 2
+
+
+def test_config_snapshot_sees_new_global_config(
+    git_repo: GitSync,
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A global config file created after loading invalidates the snapshot."""
+    global_config = tmp_path / "global.gitconfig"
+    monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(global_config))
+
+    snapshot = git.GitConfigSnapshot(path=git_repo.path, show_scope=True)
+    assert "libvcs.global" not in snapshot
+
+    global_config.write_text("[libvcs]\n\tglobal = 1\n")
+
+    assert snapshot.is_stale
+    assert snapshot.get_int("libvcs.global") == 1
+    assert [e.scope for e in snapshot.entries if e.key == "libvcs.global"] == [
+        "global",
+    ]
+
+
+def test_config_snapshot_missing_file(git_repo: GitSync) -> None:
+    """A snapshot of a file that doesn't exist is empty, not an error."""
+    snapshot = git.GitConfigSnapshot(path=git_repo.path, file=".gitmodules")
+
+    assert snapshot.entries == []
+    assert snapshot.subsections("submodule") == []
+
+
+def test_config_snapshot_unparsable_file(git_repo: GitSync) -> None:
+    """A file git refuses to parse loads as empty instead of as records."""
+    (git_repo.path / "broken.config").write_text("[core\n\tbare = false\n")
+    snapshot = git.GitConfigSnapshot(path=git_repo.path, file="broken.config")
+
+    assert snapshot.entries == []
+
+
+def test_maintenance_health_and_tasks(git_repo: GitSync) -> None:
+    """GitMaintenanceManager writes indexes and reports object health."""
+    maintenance = git_repo.cmd.maintenance
+    blobs = []
+    for index in range(5):
+        blob = git_repo.path / f"loose-{index}.txt"
+        blob.write_text(f"loose object {index}\n")
+        blobs.append(str(blob))
+    git_repo.cmd.run(["hash-object", "-w", *blobs])
+    git_repo.cmd.branches.create(branch="loose-branch")
+
+    before = maintenance.count_objects()
+    assert before.loose_objects >= 5
+    assert before.loose_size > 0
+    assert before.needs_repack(loose_objects_limit=1)
+
+    objects = git_repo.path / ".git" / "objects"
+    maintenance.write_commit_graph()
+    assert (objects / "info" / "commit-graph").exists()
+
+    maintenance.pack_refs()
+    assert not (git_repo.path / ".git" / "refs" / "heads" / "loose-branch").exists()
+    assert (
+        "refs/heads/loose-branch"
+        in (git_repo.path / ".git" / "packed-refs").read_text()
+    )
+
+    # The loose-objects task packs loose objects, then prunes them next run.
+    maintenance.run_tasks(["loose-objects"])
+    packed = maintenance.count_objects()
+    assert packed.packs > before.packs
+    assert packed.prunable_objects >= 5
+    maintenance.run_tasks(["loose-objects"])
+    assert maintenance.count_objects().loose_objects < before.loose_objects
+
+    maintenance.write_multi_pack_index()
+    assert (objects / "pack" / "multi-pack-index").exists()
+    maintenance.repack_multi_pack_index(batch_size=0)
+
+
+def test_sparse_checkout_modes(git_repo: GitSync) -> None:
+    """GitSparseCheckoutManager narrows the working tree and restores it."""
+    for name in ("keep/a.txt", "drop/b.txt"):
+        (git_repo.path / name).parent.mkdir(exist_ok=True)
+        (git_repo.path / name).write_text(name)
+    git_repo.cmd.run(["add", "keep", "drop"])
+    git_repo.cmd.run(["commit", "-m", "layout"])
+    sparse = git_repo.cmd.sparse_checkout
+
+    sparse.set(["keep"], cone=True, sparse_index=True, check_returncode=True)
+    assert sparse.ls() == ["keep"]
+    assert not (git_repo.path / "drop").exists()
+    index_sparse = git_repo.cmd.run(
+        ["config", "-f", ".git/config.worktree", "index.sparse"],
+        trim=True,
+    )
+    assert index_sparse == "true"
+
+    sparse.set(["/drop/*.txt"], cone=False, check_returncode=True)
+    assert sparse.ls() == ["/drop/*.txt"]
+    assert (git_repo.path / "drop" / "b.txt").exists()
+    assert not (git_repo.path / "keep").exists()
+
+    sparse.disable(check_returncode=True)
+    assert sparse.ls() == []
+    assert (git_repo.path / "keep" / "a.txt").exists()
+
+
+def test_remote_ls_partial_clone(
+    create_git_remote_repo: CreateRepoFn,
+    tmp_path: pathlib.Path,
+) -> None:
+    """Remotes of a partial clone list despite git's ``[filter]`` suffix."""
+    remote = create_git_remote_repo()
+    repo = git.Git(path=tmp_path / "partial")
+    repo.clone(url=remote.as_uri(), _filter="blob:none", check_returncode=True)
+
+    origin = repo.remotes.get(remote_name="origin")
+
+    assert origin is not None
+    assert origin.fetch_url == remote.as_uri()
+
+
+def test_bundle_incremental(git_repo: GitSync, tmp_path: pathlib.Path) -> None:
+    """An incremental bundle lists its heads and needs its prerequisites."""
+    base = git_repo.cmd.run(["rev-parse", "HEAD"], trim=True)
+    (git_repo.path / "delta.txt").write_text("delta\n")
+    git_repo.cmd.run(["add", "delta.txt"])
+    git_repo.cmd.run(["commit", "-m", "delta"])
+    tip = git_repo.cmd.run(["rev-parse", "HEAD"], trim=True)
+
+    bundle = tmp_path / "delta.bundle"
+    git_repo.cmd.bundle.create(bundle, ["master", f"^{base}"], check_returncode=True)
+
+    assert git_repo.cmd.bundle.list_heads(bundle) == {"refs/heads/master": tip}
+    assert git_repo.cmd.bundle.list_heads(bundle, ["refs/heads/other"]) == {}
+
+    empty = git.Git(path=tmp_path / "empty")
+    empty.init(check_returncode=True)
+    with pytest.raises(exc.CommandError):
+        empty.bundle.verify(bundle, check_returncode=True)
+
+
+def test_ls_remote_tags_and_cache(
+    git_repo: GitSync,
+    mocker: MockerFixture,
+) -> None:
+    """ls_remote() reports peeled tags and serves repeats from its cache."""
+    git_repo.cmd.run(["tag", "-a", "v1.0", "-m", "release"])
+    tip = git_repo.cmd.run(["rev-parse", "HEAD"], trim=True)
+    url = git_repo.path.as_uri()
+    cmd = git.Git(path=git_repo.path)
+
+    remote = cmd.ls_remote(url, tags=True)
+    assert remote.refs["refs/tags/v1.0^{}"] == tip
+    assert remote.head is None
+    assert cmd.ls_remote(url, tags=True, refs=True).refs.keys() == {
+        "refs/tags/v1.0",
+    }
+
+    cache = git.GitLsRemoteCache(ttl=60)
+    spy = mocker.spy(cmd, "run")
+    first = cmd.ls_remote(url, cache=cache)
+    assert cmd.ls_remote(url, cache=cache) is first
+    assert spy.call_count == 1
+
+    cache.ttl = 0
+    assert cmd.ls_remote(url, cache=cache) == first
+    assert spy.call_count == 2
+
+    with pytest.raises(ValueError, match="require a repository"):
+        cmd.ls_remote(patterns=["master"])
+
+
+def test_ref_transaction_atomic(git_repo: GitSync, mocker: MockerFixture) -> None:
+    """A ref transaction applies every change in one process, or none."""
+    cmd = git.Git(path=git_repo.path)
+    head = cmd.run(["rev-parse", "HEAD"], trim=True)
+    tags = [f"refs/tags/mass-{n}" for n in range(500)]
+    pipe = mocker.spy(git, "Pipe")
+
+    with cmd.ref_transaction() as tx:
+        for tag in tags:
+            tx.create(tag, head)
+    assert pipe.call_count == 1
+    assert len(cmd.run(["tag", "--list", "mass-*"], trim=True).splitlines()) == 500
+
+    tx = cmd.ref_transaction()
+    for tag in tags:
+        tx.delete(tag, head)
+    tx.verify("refs/heads/master", "0" * 40)
+    with pytest.raises(exc.CommandError):
+        tx.commit()
+    assert tx.state == "aborted"
+    assert len(cmd.run(["tag", "--list", "mass-*"], trim=True).splitlines()) == 500
+
+    with pytest.raises(RuntimeError), cmd.ref_transaction() as tx:
+        tx.delete(tags[0], head)
+        tx.prepare()
+        raise RuntimeError
+    assert tx.state == "aborted"
+    assert cmd.run(["tag", "--list", "mass-0"], trim=True) == "mass-0"
+
+    with pytest.raises(ValueError, match="aborted"):
+        tx.delete(tags[0])
+
+
+def test_batch_sessions_pair_and_restart(
+    git_repo: GitSync,
+    mocker: MockerFixture,
+) -> None:
+    """Batch sessions answer many queries from one process, in order."""
+    (git_repo.path / ".gitignore").write_text("*.log\n!keep.log\n")
+    paths = [f"dir/file-{n}.{'log' if n % 3 == 0 else 'txt'}" for n in range(2000)]
+    pipe = mocker.spy(git, "Pipe")
+
+    with git.GitCheckIgnoreSession(path=git_repo.path) as ignore:
+        matches = list(ignore.check_many(paths))
+        negated = ignore.check("keep.log")
+    assert pipe.call_count == 1
+    assert [match is not None for match in matches] == [
+        path.endswith(".log") for path in paths
+    ]
+    assert negated is not None
+    assert not negated.ignored
+
+    for name in ("a.txt", "b.txt"):
+        (git_repo.path / name).write_text(name)
+    expected = [
+        git_repo.cmd.run(["hash-object", name], trim=True)
+        for name in ("a.txt", "b.txt")
+    ]
+    with git.GitHashObjectSession(path=git_repo.path) as hasher:
+        assert list(hasher.hash_files(["a.txt", "b.txt"])) == expected
+
+    head = git_repo.cmd.run(["rev-parse", "HEAD"], trim=True)
+    with git.GitCatFileSession(path=git_repo.path) as cat_file:
+        replies = cat_file.info_many(["HEAD", "HEAD^{tree}", "missing"])
+        info = next(replies)
+        replies.close()
+        assert cat_file.info("HEAD") == info
+        assert info is not None
+        assert info.oid == head
+
+        with pytest.raises(ValueError, match="newline"):
+            list(cat_file.info_many(["HEAD", "two\nlines"]))
+        assert cat_file.info("HEAD") == info
+
+        assert cat_file._pipe is not None
+        cat_file._pipe.proc.kill()
+        cat_file._pipe.proc.wait()
+        assert cat_file.info("missing") is None
+        assert cat_file.restarts == 1
+
+
+def test_resolve_many_missing_and_ambiguous(git_repo: GitSync) -> None:
+    """resolve_many() reports missing names and ambiguous abbreviations."""
+    cmd = git.Git(path=git_repo.path)
+    blobs = git_repo.path / "blobs"
+    blobs.mkdir()
+    for n in range(1000):
+        (blobs / str(n)).write_text(f"blob {n}\n")
+    with git.GitHashObjectSession(path=git_repo.path, write=True) as hasher:
+        oids = list(hasher.hash_files(f"blobs/{n}" for n in range(1000)))
+    prefixes = [oid[:4] for oid in oids]
+    shared = next(prefix for prefix in prefixes if prefixes.count(prefix) > 1)
+
+    cmd.run(["tag", "-a", "v1.0", "-m", "release"])
+    head = cmd.run(["rev-parse", "HEAD"], trim=True)
+    tag = cmd.run(["rev-parse", "v1.0"], trim=True)
+
+    resolved = cmd.resolve_many(["v1.0", "HEAD^{tree}", shared, "nope", "v1.0"])
+    assert list(resolved.oids) == ["v1.0", "HEAD^{tree}", shared, "nope"]
+    assert resolved.oids["v1.0"] == tag
+    assert resolved.oids[shared] is None
+    assert resolved.ambiguous == [shared]
+    assert resolved.missing == ["nope"]
+
+    peeled = cmd.resolve_many(["v1.0", "HEAD^{tree}"], commits=True)
+    assert peeled.oids == {"v1.0": head, "HEAD^{tree}": None}
+    assert cmd.resolve_many([]).oids == {}
+
+
+def test_merge_base_and_is_ancestor_many(
+    git_repo: GitSync,
+    mocker: MockerFixture,
+) -> None:
+    """is_ancestor_many() agrees with is_ancestor() using one walk per tip."""
+    cmd = git.Git(path=git_repo.path)
+
+    def commit(message: str) -> str:
+        cmd.run(["commit", "--allow-empty", "-m", message])
+        return cmd.run(["rev-parse", "HEAD"], trim=True)
+
+    base = cmd.run(["rev-parse", "HEAD"], trim=True)
+    cmd.run(["checkout", "-q", "-b", "left"])
+    left = [commit(f"left {n}") for n in range(3)]
+    cmd.run(["checkout", "-q", "-b", "right", base])
+    right = [commit(f"right {n}") for n in range(2)]
+    cmd.run(["checkout", "-q", "--orphan", "unrelated"])
+    orphan = commit("orphan")
+
+    assert cmd.merge_base("left", "right") == [base]
+    assert cmd.merge_base("left", "right", "master", octopus=True) == [base]
+    assert cmd.merge_base("left", left[0], right[0], independent=True) == [
+        left[-1],
+        right[0],
+    ]
+    assert cmd.merge_base("left", "unrelated") == []
+
+    commits = [base, *left, *right, orphan]
+    pairs = [(a, d) for a in commits for d in ("left", "right", "unrelated")]
+    pipe = mocker.spy(git, "Pipe")
+    batched = cmd.is_ancestor_many(pairs)
+    assert pipe.call_count == 1 + 3
+    assert batched == {pair: cmd.is_ancestor(*pair) for pair in pairs}
+    assert batched[left[0], "left"]
+    assert not batched[left[0], "right"]
+
+    cmd.maintenance.write_commit_graph(check_returncode=True)
+    assert cmd.is_ancestor_many(pairs) == batched
+
+    with pytest.raises(ValueError, match="not a commit: nope"):
+        cmd.is_ancestor_many([("nope", "left")])
+
+
+def test_grep_streams_matches(git_repo: GitSync) -> None:
+    """grep() parses revisions, trees, odd paths and combined patterns."""
+    cmd = git.Git(path=git_repo.path)
+    (git_repo.path / "sub").mkdir()
+    (git_repo.path / "sub" / "a:b.txt").write_text("alpha beta\nbeta\n")
+    (git_repo.path / "top.txt").write_text("gamma alpha\n")
+    cmd.run(["add", "sub", "top.txt"])
+    cmd.run(["commit", "-m", "grep fixtures"])
+
+    matches = list(cmd.grep("alpha", revs=["HEAD:sub", "HEAD"], threads=2))
+    assert sorted((m.rev, m.path, m.line_number, m.column) for m in matches) == [
+        ("HEAD", "sub/a:b.txt", 1, 1),
+        ("HEAD", "top.txt", 1, 7),
+        ("HEAD:sub", "a:b.txt", 1, 1),
+    ]
+
+    worktree = list(cmd.grep(["alpha", "--and", "--not", "beta"]))
+    assert [(m.rev, m.path, m.text) for m in worktree] == [
+        (None, "top.txt", "gamma alpha"),
+    ]
+    either = cmd.grep(["gamma", "--or", "beta"], pathspecs=["sub"])
+    assert [m.line_number for m in either] == [1, 2]
+    assert list(cmd.grep("ALPHA", fixed_strings=True)) == []
+    assert len(list(cmd.grep("ALPHA", ignore_case=True))) == 2
+
+    streamed = cmd.grep("a")
+    assert next(streamed).path
+    streamed.close()
+
+    with pytest.raises(exc.CommandError):
+        list(cmd.grep("x", revs=["no-such-rev"]))
+
+
+def test_archive_streams_and_writes_fd(
+    git_repo: GitSync,
+    tmp_path: pathlib.Path,
+) -> None:
+    """archive() yields bounded chunks, or hands git a file descriptor."""
+    cmd = git.Git(path=git_repo.path)
+    (git_repo.path / "data").mkdir()
+    payload = os.urandom(200_000)
+    (git_repo.path / "data" / "blob.bin").write_bytes(payload)
+    (git_repo.path / "data" / "text.txt").write_text("hello\n" * 10_000)
+    cmd.run(["add", "data"])
+    cmd.run(["commit", "-m", "archive fixtures"])
+
+    chunks = list(cmd.archive("HEAD", ["data"], prefix="v1/", chunk_size=4096))
+    assert max(len(chunk) for chunk in chunks) <= 4096
+    with tarfile.open(fileobj=io.BytesIO(b"".join(chunks))) as tar:
+        assert sorted(tar.getnames()) == [
+            "v1",
+            "v1/data",
+            "v1/data/blob.bin",
+            "v1/data/text.txt",
+        ]
+        blob = tar.extractfile("v1/data/blob.bin")
+        assert blob is not None
+        assert blob.read() == payload
+
+    sizes = {}
+    for level in (0, 9):
+        archive_path = tmp_path / f"level{level}.zip"
+        fd = os.open(archive_path, os.O_WRONLY | os.O_CREAT)
+        try:
+            assert (
+                cmd.archive(output=fd, _format="zip", compression_level=level) is None
+            )
+        finally:
+            os.close(fd)
+        with zipfile.ZipFile(archive_path) as archive:
+            assert archive.read("data/text.txt") == b"hello\n" * 10_000
+        sizes[level] = archive_path.stat().st_size
+    assert sizes[9] < sizes[0]
+
+    with pytest.raises(ValueError, match="compression_level"):
+        cmd.archive(compression_level=10)
+    with pytest.raises(exc.CommandError):
+        list(cmd.archive("no-such-rev"))
+    with (tmp_path / "bad.tar").open("wb") as f, pytest.raises(exc.CommandError):
+        cmd.archive("no-such-rev", output=f)
+
+
+def test_merge_tree_concurrent_on_bare_repo(
+    git_repo: GitSync,
+    tmp_path: pathlib.Path,
+) -> None:
+    """merge_tree() reports conflicts without an index or working tree."""
+    cmd = git.Git(path=git_repo.path)
+
+    def commit(branch: str, files: dict[str, str | None]) -> None:
+        cmd.run(["checkout", "-q", branch])
+        for name, text in files.items():
+            if text is None:
+                cmd.run(["rm", "-q", name])
+            else:
+                (git_repo.path / name).write_text(text)
+                cmd.run(["add", name])
+        cmd.run(["commit", "-m", f"{branch} {sorted(files)}"])
+
+    commit("master", {"shared.txt": "base\n", "gone.txt": "base\n"})
+    for branch in ("clean", "content", "deleted"):
+        cmd.run(["branch", branch])
+    commit("clean", {"other.txt": "clean\n"})
+    commit("content", {"shared.txt": "content\n"})
+    commit("deleted", {"gone.txt": None})
+    commit("master", {"shared.txt": "master\n", "gone.txt": "master\n"})
+
+    bare = git.Git(path=tmp_path / "bare.git")
+    bare.clone(url=str(git_repo.path), mirror=True, check_returncode=True)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as pool:
+        clean, content, deleted = pool.map(
+            lambda branch: bare.merge_tree("master", branch),
+            ["clean", "content", "deleted"],
+        )
+
+    assert clean.clean
+    assert clean.conflicts == ()
+    assert bare.run(["ls-tree", "--name-only", clean.tree]).split() == [
+        "gone.txt",
+        "other.txt",
+        "shared.txt",
+        "testfile.test",
+    ]
+
+    assert not content.clean
+    assert [(e.path, e.stage) for e in content.conflicts] == [
+        ("shared.txt", 1),
+        ("shared.txt", 2),
+        ("shared.txt", 3),
+    ]
+    assert any(
+        m.kind.startswith("CONFLICT") and m.paths == ("shared.txt",)
+        for m in content.messages
+    )
+    assert not bare.merge_tree("master", "content", messages=False).messages
+
+    assert deleted.conflicted_paths == ["gone.txt"]
+    assert [e.stage for e in deleted.conflicts] == [1, 2]
+
+    cmd.run(["checkout", "-q", "--orphan", "unrelated"])
+    cmd.run(["commit", "-q", "-m", "unrelated"])
+    with pytest.raises(exc.CommandError):
+        cmd.merge_tree("master", "unrelated")
+    assert cmd.merge_tree("master", "unrelated", allow_unrelated_histories=True)
+
+
+def test_commit_files_in_bare_repo(git_repo: GitSync, tmp_path: pathlib.Path) -> None:
+    """commit_files() builds commits from bytes, without any working tree."""
+    source = git.Git(path=git_repo.path)
+    (git_repo.path / "run.sh").write_text("#!/bin/sh\n")
+    (git_repo.path / "run.sh").chmod(0o755)
+    (git_repo.path / "old.txt").write_text("old\n")
+    source.run(["add", "run.sh", "old.txt"])
+    source.run(["commit", "-m", "fixtures"])
+
+    bare = git.Git(path=tmp_path / "bare.git")
+    bare.clone(url=str(git_repo.path), bare=True, check_returncode=True)
+    parent = bare.run(["rev-parse", "master"], trim=True)
+
+    commit = bare.commit_files(
+        parent,
+        {
+            "run.sh": b"#!/bin/sh\necho hi\n",
+            "gen/deep/data.json": b"{}\n",
+            "old.txt": None,
+        },
+        message="Regenerate",
+        ref="refs/heads/master",
+    )
+    assert bare.run(["rev-parse", "master"], trim=True) == commit
+    assert bare.run(["log", "-1", "--format=%P %s", commit], trim=True) == (
+        f"{parent} Regenerate"
+    )
+    listing = bare.run(["ls-tree", "-r", "-z", commit]).strip("\0").split("\0")
+    entries = {e.path: e for e in map(git.GitTreeEntry.from_record, listing)}
+    assert "old.txt" not in entries
+    assert entries["run.sh"].mode == "100755"
+    assert entries["gen/deep/data.json"].mode == "100644"
+    assert bare.run(["cat-file", "-p", "master:run.sh"]) == "#!/bin/sh\necho hi\n"
+
+    # The ref only moves if it still points at the parent.
+    with pytest.raises(exc.CommandError):
+        bare.commit_files(parent, {"x": b"x"}, message="stale", ref="refs/heads/master")
+    assert bare.run(["rev-parse", "master"], trim=True) == commit
+
+    root = bare.commit_files(
+        None, {"a.txt": b"a"}, message="root", ref="refs/heads/new"
+    )
+    assert bare.run(["rev-list", "--count", "new"], trim=True) == "1"
+    assert bare.run(["ls-tree", "--name-only", root], trim=True) == "a.txt"
+
+    blob = bare.hash_object(b"sub\n", write=True)
+    subtree = bare.mktree([git.GitTreeEntry("100644", "blob", blob, "f")])
+    tree = bare.mktree(
+        [
+            git.GitTreeEntry("040000", "tree", subtree, "dir"),
+            git.GitTreeEntry("100644", "blob", blob, "top"),
+        ]
+    )
+    assert bare.run(["ls-tree", "-r", "--name-only", tree]).split() == ["dir/f", "top"]
+    with pytest.raises(exc.CommandError):
+        bare.mktree([git.GitTreeEntry("100644", "blob", "1" * 40, "missing")])
+    with pytest.raises(ValueError, match="NUL"):
+        git.GitTreeEntry("100644", "blob", blob, "a\0b").to_record()
+
+
+def test_fast_export_import_round_trip(
+    git_repo: GitSync,
+    tmp_path: pathlib.Path,
+) -> None:
+    """fast_export() output re-imports to identical history, marks and all."""
+    source = git.Git(path=git_repo.path)
+    odd = ['"quoted"', "tab\there", "café.txt", "dir/space name"]
+    for name in odd:
+        (git_repo.path / name).parent.mkdir(exist_ok=True)
+        (git_repo.path / name).write_bytes(b"bin\0ary " + name.encode())
+    (git_repo.path / "tool.sh").write_text("#!/bin/sh\n")
+    (git_repo.path / "tool.sh").chmod(0o755)
+    source.run(["add", "--", *odd, "tool.sh"])
+    source.run(["commit", "-m", "odd paths\n\nwith a body"])
+    source.run(["checkout", "-q", "-b", "side"])
+    source.run(["rm", "-q", "--", "tab\there"])
+    source.run(["commit", "-m", "remove"])
+    source.run(["checkout", "-q", "master"])
+    source.run(["commit", "--allow-empty", "-m", "main"])
+    source.run(["merge", "-q", "--no-edit", "side"])
+    source.run(["tag", "-a", "v1", "-m", "release"])
+
+    commands = list(source.fast_export(["--all"], show_original_ids=True))
+    merge = next(c for c in commands if isinstance(c, git.GitFastCommit) and c.merges)
+    assert merge.message.startswith("Merge branch 'side'")
+    paths = {
+        change.path
+        for c in commands
+        if isinstance(c, git.GitFastCommit)
+        for change in c.changes
+    }
+    assert set(odd) <= paths
+    assert any(isinstance(c, git.GitFastTag) and c.name == "v1" for c in commands)
+
+    copy = git.Git(path=tmp_path / "copy")
+    copy.init(bare=True)
+    marks = copy.fast_import(commands, export_marks=tmp_path / "marks")
+    for ref in ("master", "side", "v1"):
+        assert copy.run(["rev-parse", ref]) == source.run(["rev-parse", ref])
+    assert len(marks) == len(
+        [c for c in commands if getattr(c, "mark", None) is not None]
+    )
+    assert (tmp_path / "marks").read_text().count("\n") == len(marks)
+
+    # Incremental: later commits refer to marks from the earlier import.
+    last = max(marks)
+    me = "A U Thor <author@example.com> 1700000000 +0000"
+    copy.fast_import(
+        [
+            git.GitFastCommit(
+                ref="refs/heads/master",
+                committer=me,
+                message="inline",
+                parent=f":{last - 1}",
+                mark=last + 1,
+                changes=(
+                    git.GitFastFileModify("new\nline", b"inline\n"),
+                    git.GitFastFileDelete("tool.sh"),
+                ),
+            ),
+        ],
+        import_marks=tmp_path / "marks",
+        force=True,
+    )
+    assert copy.run(["show", "master:new\nline"]) == "inline\n"
+
+    def broken() -> t.Iterator[git.GitFastCommand]:
+        yield git.GitFastReset("refs/heads/broken", parent="master")
+        msg = "generator failed"
+        raise RuntimeError(msg)
+
+    with pytest.raises(RuntimeError, match="generator failed"):
+        copy.fast_import(broken())
+    with pytest.raises(exc.CommandError):
+        copy.run(["rev-parse", "--verify", "broken"])
+
+    streamed = source.fast_export(no_data=True)
+    first = next(streamed)
+    assert isinstance(first, (git.GitFastReset, git.GitFastCommit))
+    streamed.close()
+
+
+def test_repo_registry_demultiplexes_one_batch(
+    git_repo: GitSync,
+    tmp_path: pathlib.Path,
+    mocker: MockerFixture,
+) -> None:
+    """GitRepoRegistry.run() splits one for-each-repo's output per repo."""
+    odd = tmp_path / 'odd "name" \\ dir'
+    git.Git(path=odd).init(bare=True)
+    registry = git.GitRepoRegistry("libvcs.repo", config_file=tmp_path / "repos")
+    registry.register(git_repo.path)
+    registry.register(odd)
+    registry.register(git_repo.path)
+    registry.register(tmp_path / "gone")
+    assert registry.paths() == [str(git_repo.path), str(odd), str(tmp_path / "gone")]
+
+    stream = mocker.spy(git.Git, "stream")
+    results = list(registry.run(["ls-files", "-z"]))
+    assert stream.call_count == 1
+    by_path = {result.path: result for result in results}
+    assert by_path[str(tmp_path / "gone")].returncode == 128
+    assert by_path[str(git_repo.path)].ok
+    assert (
+        by_path[str(git_repo.path)].output.split("\0")[:-1]
+        == (git.Git(path=git_repo.path).run(["ls-files", "-z"]).split("\0")[:-1])
+    )
+    assert by_path[str(odd)].ok
+
+    # A failure in one repository does not stop the others.
+    status = {r.path: r for r in registry.run(["status", "--porcelain"])}
+    assert "must be run in a work tree" in status[str(odd)].output
+    assert not status[str(odd)].ok
+    assert status[str(git_repo.path)].ok
+    assert [r.path for r in results] == [
+        str(tmp_path / "gone"),
+        str(git_repo.path),
+        str(odd),
+    ]
+
+    registry.unregister(tmp_path / "gone")
+    registry.unregister(tmp_path / "never-registered")
+    assert [r.ok for r in registry.run(["rev-parse", "--git-dir"])] == [True, True]
+
+    user = git.GitRepoRegistry("libvcs.repo")
+    assert user.paths() == []
+    user.register(git_repo.path)
+    assert [r.output for r in user.run(["rev-parse", "--is-bare-repository"])] == [
+        "false\n"
+    ]
+    user.unregister(git_repo.path)
+    assert user.paths() == []
+
+
+def test_query_cache_until_repository_changes(
+    git_repo: GitSync,
+    mocker: MockerFixture,
+) -> None:
+    """Read-only queries run git once, again only after the repository changes."""
+
+    def external(*args: str) -> None:
+        subprocess.run(["git", *args], cwd=git_repo.path, check=True)
+
+    # Racily clean files make every ``git status`` rewrite the index.
+    for tracked in git_repo.cmd.run(["ls-files", "-z"]).split("\0")[:-1]:
+        os.utime(git_repo.path / tracked, (0, 0))
+    external("update-index", "--refresh")
+
+    cache = git.GitQueryCache()
+    cmd = git.Git(path=git_repo.path, query_cache=cache)
+    spy = mocker.spy(git, "run")
+
+    def queries() -> list[t.Any]:
+        return [
+            cmd.rev_parse(args="HEAD"),
+            cmd.show_ref(),
+            cmd.symbolic_ref(name="HEAD"),
+            cmd.status(porcelain=True),
+            [b.branch_name for b in cmd.branches.ls()],
+            [tag.tag_name for tag in cmd.tags.ls()],
+            [(r.remote_name, r.fetch_url) for r in cmd.remotes.ls()],
+        ]
+
+    first = queries()
+    assert spy.call_count == 7
+    assert queries() == first
+    assert spy.call_count == 7
+    assert (cache.hits, cache.misses) == (7, 7)
+
+    # Changes made by other processes, caught by the fingerprint
+    external("branch", "external")
+    assert "external" in queries()[4]
+    external("update-ref", "refs/heads/external", "HEAD")
+    external("pack-refs", "--all")
+    assert queries()[1] == cmd.run(["show-ref"])
+    external("config", "-f", ".git/config", "remote.upstream.url", "file:///up")
+    assert ("upstream", "file:///up") in queries()[6]
+    spy.reset_mock()
+    assert queries()[3] == first[3]
+    assert spy.call_count == 0
+
+    # Worktree edits only matter to status
+    (git_repo.path / "untracked.txt").write_text("new")
+    assert "?? untracked.txt" in cmd.status(porcelain=True)
+    (git_repo.path / "testfile.test").write_text("modified")
+    assert " M testfile.test" in cmd.status(porcelain=True)
+    spy.reset_mock()
+    cmd.rev_parse(args="HEAD")
+    assert spy.call_count == 0
+
+    # Commands libvcs runs that may write drop the repository's entries
+    cmd.run(["tag", "v-from-libvcs"])
+    assert "v-from-libvcs" in queries()[5]
+    assert spy.call_count == 1 + 7
+    external("symbolic-ref", "refs/heads/alias", "refs/heads/master")
+    assert cmd.symbolic_ref(name="refs/heads/alias", trim=True) == "refs/heads/master"
+    cmd.symbolic_ref(name="refs/heads/alias", delete=True)
+    assert cmd.symbolic_ref(name="refs/heads/alias", trim=True).startswith("fatal:")
+
+
+def test_query_cache_skips_what_it_cannot_fingerprint(
+    git_repo: GitSync,
+    mocker: MockerFixture,
+) -> None:
+    """Outside a repository root, queries always run git."""
+    subdir = git_repo.path / "subdir"
+    subdir.mkdir()
+    cache = git.GitQueryCache()
+    cmd = git.Git(path=subdir, query_cache=cache)
+    spy = mocker.spy(git, "run")
+    assert cmd.rev_parse(args="HEAD") == cmd.rev_parse(args="HEAD")
+    assert spy.call_count == 2
+    assert (cache.hits, cache.misses) == (0, 0)
+
+    # Shared caches keep repositories apart
+    other = git.Git(path=git_repo.path, query_cache=cache)
+    other.rev_parse(args="HEAD")
+    cache.invalidate(subdir)
+    other.rev_parse(args="HEAD")
+    assert cache.hits == 1
+    cache.invalidate()
+    assert repr(cache) == "<GitQueryCache entries=0 hits=1 misses=1>"
+
+
+def test_query_cache_beats_forking(git_repo: GitSync) -> None:
+    """Benchmark: a fingerprint check against ``git rev-parse HEAD``."""
+    uncached = git.Git(path=git_repo.path)
+    cached = git.Git(path=git_repo.path, query_cache=git.GitQueryCache())
+    assert cached.rev_parse(args="HEAD") == uncached.rev_parse(args="HEAD")
+
+    number = 20
+    forked = min(
+        timeit.repeat(lambda: uncached.rev_parse(args="HEAD"), number=number, repeat=3)
+    )
+    memoized = min(
+        timeit.repeat(lambda: cached.rev_parse(args="HEAD"), number=number, repeat=3)
+    )
+    assert memoized < forked
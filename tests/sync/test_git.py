@@ -8,7 +8,9 @@ import pathlib
 import random
 import shutil
 import subprocess
+import sys
 import textwrap
+import threading
 import time
 import typing as t
 from collections.abc import Callable
@@ -18,10 +20,14 @@ import pytest
 from libvcs import exc
 from libvcs._internal.run import run
 from libvcs._internal.shortcuts import create_project
+from libvcs.cmd.git import Git
 from libvcs.sync.base import SyncResult
 from libvcs.sync.git import (
+    GitMirrorCache,
+    GitMirrorCacheLockTimeout,
     GitRemote,
     GitStatus,
+    GitStatusEntry,
     GitSync,
     convert_pip_url as git_convert_pip_url,
 )
@@ -1023,6 +1029,164 @@ def test_GitRemote__from_stdout_c(fixture: str, expected_result: GitStatus) -> N
     assert expected_result == GitStatus.from_stdout(textwrap.dedent(fixture))
 
 
+OID_A = "e69de29bb2d1d6434b8b29ae775ad8c2e48c5391"
+OID_B = "8baef1b4abc478178b004d62031cf7fe6db6f903"
+
+
+class PorcelainV2Fixture(t.NamedTuple):
+    """Test fixture for GitStatus.from_porcelain_v2()."""
+
+    test_id: str
+    output: str
+    expected: GitStatus
+
+
+PORCELAIN_V2_FIXTURES: list[PorcelainV2Fixture] = [
+    PorcelainV2Fixture(
+        test_id="empty",
+        output="",
+        expected=GitStatus(),
+    ),
+    PorcelainV2Fixture(
+        test_id="headers",
+        output=(
+            f"# branch.oid {OID_A}\0"
+            "# branch.head master\0"
+            "# branch.upstream origin/master\0"
+            "# branch.ab +3 -12\0"
+        ),
+        expected=GitStatus(
+            branch_oid=OID_A,
+            branch_head="master",
+            branch_upstream="origin/master",
+            branch_ab="+3 -12",
+            branch_ahead="3",
+            branch_behind="12",
+        ),
+    ),
+    PorcelainV2Fixture(
+        test_id="unborn-branch",
+        output="# branch.oid (initial)\0# branch.head main\0",
+        expected=GitStatus(branch_oid=None, branch_head="main"),
+    ),
+    PorcelainV2Fixture(
+        test_id="ordinary-path-with-spaces",
+        output=f"1 .M N... 100644 100644 100644 {OID_A} {OID_A} dir/a b c.txt\0",
+        expected=GitStatus(
+            entries=[
+                GitStatusEntry(
+                    kind="ordinary",
+                    path="dir/a b c.txt",
+                    xy=".M",
+                    submodule="N...",
+                    modes=("100644", "100644", "100644"),
+                    oids=(OID_A, OID_A),
+                ),
+            ],
+        ),
+    ),
+    PorcelainV2Fixture(
+        test_id="renamed",
+        output=(
+            f"2 R. N... 100644 100644 100644 {OID_A} {OID_A} R100 new name.txt\0"
+            "old\nname.txt\0"
+        ),
+        expected=GitStatus(
+            entries=[
+                GitStatusEntry(
+                    kind="renamed",
+                    path="new name.txt",
+                    xy="R.",
+                    submodule="N...",
+                    modes=("100644", "100644", "100644"),
+                    oids=(OID_A, OID_A),
+                    score="R100",
+                    orig_path="old\nname.txt",
+                ),
+            ],
+        ),
+    ),
+    PorcelainV2Fixture(
+        test_id="unmerged",
+        output=(
+            f"u UU N... 100644 100644 100644 100644 {OID_A} {OID_B} {OID_A} f.txt\0"
+        ),
+        expected=GitStatus(
+            entries=[
+                GitStatusEntry(
+                    kind="unmerged",
+                    path="f.txt",
+                    xy="UU",
+                    submodule="N...",
+                    modes=("100644", "100644", "100644", "100644"),
+                    oids=(OID_A, OID_B, OID_A),
+                ),
+            ],
+        ),
+    ),
+    PorcelainV2Fixture(
+        test_id="untracked-and-ignored",
+        output="? new.txt\0! build/\0",
+        expected=GitStatus(
+            entries=[
+                GitStatusEntry(kind="untracked", path="new.txt"),
+                GitStatusEntry(kind="ignored", path="build/"),
+            ],
+        ),
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    list(PorcelainV2Fixture._fields),
+    PORCELAIN_V2_FIXTURES,
+    ids=[f.test_id for f in PORCELAIN_V2_FIXTURES],
+)
+def test_GitStatus_from_porcelain_v2(
+    test_id: str,
+    output: str,
+    expected: GitStatus,
+) -> None:
+    """Test GitStatus.from_porcelain_v2() parses headers and entries."""
+    status = GitStatus.from_porcelain_v2(output)
+    assert status == expected
+    assert status.entries == expected.entries
+
+
+def test_GitSync_status_entries(git_repo: GitSync) -> None:
+    """Test GitSync.status() reports renamed, modified and untracked paths."""
+    path = git_repo.path
+    (path / "before rename.txt").write_text("content\n" * 20)
+    git_repo.cmd.run(["add", "before rename.txt"])
+    git_repo.cmd.run(["commit", "-m", "add file"])
+    git_repo.cmd.run(["mv", "before rename.txt", "after rename.txt"])
+    (path / "untracked file.txt").touch()
+
+    status = git_repo.status()
+    by_kind = {entry.kind: entry for entry in status.entries}
+
+    assert status.branch_head == "master"
+    assert by_kind["renamed"].path == "after rename.txt"
+    assert by_kind["renamed"].orig_path == "before rename.txt"
+    assert by_kind["untracked"].path == "untracked file.txt"
+
+    status = git_repo.status(untracked_files="no", no_optional_locks=True)
+    assert [entry.kind for entry in status.entries] == ["renamed"]
+
+
+def test_GitSync_status_large_output(git_repo: GitSync) -> None:
+    """Test GitSync.status() drains output larger than a pipe buffer."""
+    untracked = git_repo.path / "untracked"
+    untracked.mkdir()
+    for index in range(3_000):
+        (untracked / f"file-with-a-fairly-long-name-{index:05d}.txt").touch()
+
+    status = git_repo.status(untracked_files="all")
+
+    assert len(status.entries) == 3_000
+    assert all(entry.kind == "untracked" for entry in status.entries)
+
+
 def test_repo_git_remote_checkout(
     create_git_remote_repo: CreateRepoFn,
     tmp_path: pathlib.Path,
@@ -1042,6 +1206,328 @@ def test_repo_git_remote_checkout(
     assert pathlib.Path(git_repo_checkout_dir / ".git").exists()
 
 
+def test_GitSync_partial_sparse_clone(
+    create_git_remote_repo: CreateRepoFn,
+    git_commit_envvars: GitCommitEnvVars,
+    tmp_path: pathlib.Path,
+) -> None:
+    """Partial clone filter and sparse paths apply on obtain and persist."""
+    git_server = create_git_remote_repo()
+    for name in ("top.txt", "wanted/a.txt", "other/b.txt"):
+        (git_server / name).parent.mkdir(exist_ok=True)
+        (git_server / name).write_text(f"{name}\n")
+    run(["git", "add", "."], cwd=git_server)
+    run(["git", "commit", "-m", "layout"], cwd=git_server, env=git_commit_envvars)
+    run(
+        ["git", "config", "-f", ".git/config", "uploadpack.allowFilter", "true"],
+        cwd=git_server,
+    )
+
+    checkout = tmp_path / "sparse"
+    git_repo = GitSync(
+        url=git_server.as_uri(),
+        path=checkout,
+        filter_spec="blob:none",
+        sparse_paths=["wanted/"],
+    )
+    git_repo.obtain()
+
+    assert (checkout / "top.txt").exists()
+    assert (checkout / "wanted" / "a.txt").exists()
+    assert not (checkout / "other").exists()
+    assert git_repo.cmd.sparse_checkout.ls() == ["wanted"]
+    partial_filter = git_repo.cmd.run(
+        ["config", "-f", ".git/config", "remote.origin.partialclonefilter"],
+        trim=True,
+    )
+    assert partial_filter == "blob:none"
+
+    # Unchanged paths are left alone; new ones are applied by update_repo().
+    assert git_repo.update_repo().ok
+    git_repo = GitSync(
+        url=git_server.as_uri(),
+        path=checkout,
+        filter_spec="blob:none",
+        sparse_paths=["wanted", "other"],
+    )
+    assert git_repo.update_repo().ok
+    assert (checkout / "other" / "b.txt").read_text() == "other/b.txt\n"
+    assert git_repo.cmd.sparse_checkout.ls() == ["other", "wanted"]
+
+
+def test_GitSync_obtain_from_bundle(
+    create_git_remote_repo: CreateRepoFn,
+    git_commit_envvars: GitCommitEnvVars,
+    tmp_path: pathlib.Path,
+) -> None:
+    """obtain() seeds from a bundle, then fetches what the bundle lacks."""
+    git_server = create_git_remote_repo()
+    server = GitSync(url=git_server.as_uri(), path=git_server)
+    (git_server / "seeded.txt").write_text("in bundle\n")
+    server.cmd.run(["add", "seeded.txt"])
+    server.cmd.run(["commit", "-m", "seeded"], env=git_commit_envvars)
+    bundle = tmp_path / "seed.bundle"
+    server.cmd.bundle.create(bundle, check_returncode=True)
+
+    (git_server / "after.txt").write_text("after bundle\n")
+    server.cmd.run(["add", "after.txt"])
+    server.cmd.run(["commit", "-m", "after bundle"], env=git_commit_envvars)
+
+    git_repo = GitSync(
+        url=git_server.as_uri(),
+        path=tmp_path / "checkout",
+        bundle_path=bundle,
+    )
+    git_repo.obtain()
+
+    assert git_repo.get_revision() == server.get_revision()
+    assert (git_repo.path / "after.txt").exists()
+    origin = git_repo.remote("origin")
+    assert origin is not None
+    assert origin.fetch_url == git_server.as_uri()
+
+
+def test_GitSync_obtain_missing_bundle(
+    create_git_remote_repo: CreateRepoFn,
+    tmp_path: pathlib.Path,
+) -> None:
+    """A missing bundle falls back to a regular clone."""
+    git_server = create_git_remote_repo()
+    git_repo = GitSync(
+        url=git_server.as_uri(),
+        path=tmp_path / "checkout",
+        bundle_path=tmp_path / "missing.bundle",
+    )
+    git_repo.obtain()
+
+    origin = git_repo.remote("origin")
+    assert origin is not None
+    assert origin.fetch_url == git_server.as_uri()
+
+
+def test_GitSync_obtain_with_mirror_cache(
+    create_git_remote_repo: CreateRepoFn,
+    git_commit_envvars: GitCommitEnvVars,
+    tmp_path: pathlib.Path,
+) -> None:
+    """Checkouts of one upstream borrow objects from a single mirror."""
+    git_server = create_git_remote_repo()
+    (git_server / "file.txt").write_text("content\n")
+    run(["git", "add", "file.txt"], cwd=git_server)
+    run(["git", "commit", "-m", "file"], cwd=git_server, env=git_commit_envvars)
+    cache = GitMirrorCache(tmp_path / "mirrors")
+
+    first = GitSync(
+        url=git_server.as_uri(),
+        path=tmp_path / "first",
+        mirror_cache=cache,
+    )
+    first.obtain()
+    second = GitSync(
+        url=f"{git_server.as_uri()}/",
+        path=tmp_path / "second",
+        mirror_cache=cache,
+        dissociate=True,
+    )
+    second.obtain()
+
+    mirrors = [p for p in cache.root.iterdir() if p.suffix == ".git"]
+    assert mirrors == [cache.mirror_path(git_server.as_uri())]
+    alternates = first.path / ".git" / "objects" / "info" / "alternates"
+    assert alternates.read_text().strip() == str(mirrors[0] / "objects")
+    assert not (second.path / ".git" / "objects" / "info" / "alternates").exists()
+    assert first.get_revision() == second.get_revision()
+
+
+def test_GitMirrorCache_coalesces_fetches(
+    create_git_remote_repo: CreateRepoFn,
+    tmp_path: pathlib.Path,
+    mocker: MockerFixture,
+) -> None:
+    """Callers waiting on an in-flight update share one mirror fetch."""
+    url = create_git_remote_repo().as_uri()
+    cache = GitMirrorCache(tmp_path / "mirrors")
+    cache.ensure(url)
+    fetch = mocker.spy(Git, "fetch")
+
+    with cache.lock(url):
+        workers = [threading.Thread(target=cache.ensure, args=(url,)) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        time.sleep(0.2)
+        assert fetch.call_count == 0
+    for worker in workers:
+        worker.join()
+
+    assert fetch.call_count == 1
+    cache.ensure(url)
+    assert fetch.call_count == 2
+
+
+def test_GitMirrorCache_lock_timeout(tmp_path: pathlib.Path) -> None:
+    """A held mirror lock times out other processes' updates."""
+    url = "https://example.com/org/repo.git"
+    cache = GitMirrorCache(tmp_path, lock_timeout=0.1)
+    lock_path = cache.mirror_path(url).with_name(
+        f"{cache.mirror_path(url).name}.lock",
+    )
+    script = (
+        "import fcntl, sys, time; f = open(sys.argv[1], 'a');"
+        "fcntl.flock(f, fcntl.LOCK_EX); print('locked', flush=True); time.sleep(5)"
+    )
+    with subprocess.Popen(
+        [sys.executable, "-c", script, str(lock_path)],
+        stdout=subprocess.PIPE,
+    ) as holder:
+        assert holder.stdout is not None
+        assert holder.stdout.readline() == b"locked\n"
+        with pytest.raises(GitMirrorCacheLockTimeout), cache.lock(url):
+            pass
+        holder.kill()
+
+
+def test_GitSync_update_repo_fetch_refspecs(
+    create_git_remote_repo: CreateRepoFn,
+    git_commit_envvars: GitCommitEnvVars,
+    tmp_path: pathlib.Path,
+) -> None:
+    """update_repo() fetches only the declared refs, without tags."""
+    git_server = create_git_remote_repo()
+    server = GitSync(url=git_server.as_uri(), path=git_server)
+
+    def commit(message: str) -> None:
+        server.cmd.run(
+            ["commit", "--allow-empty", "-m", message], env=git_commit_envvars
+        )
+
+    commit("first")
+    git_repo = GitSync(
+        url=git_server.as_uri(),
+        path=tmp_path / "checkout",
+        fetch_refspecs=["master"],
+        fetch_tags=False,
+    )
+    git_repo.obtain()
+
+    commit("second")
+    server.cmd.run(["tag", "v2.0"])
+    server.cmd.run(["branch", "unwanted"])
+
+    assert git_repo.update_repo().ok
+    assert git_repo.get_revision() == server.get_revision()
+    assert git_repo.cmd.run(["tag", "--list"]) == ""
+    remote_refs = git_repo.cmd.run(["for-each-ref", "--format=%(refname)"])
+    assert "refs/remotes/origin/unwanted" not in remote_refs
+
+
+def test_GitSync_update_repo_fetch_remotes(
+    create_git_remote_repo: CreateRepoFn,
+    git_commit_envvars: GitCommitEnvVars,
+    tmp_path: pathlib.Path,
+) -> None:
+    """update_repo() fetches every declared remote in one --multiple call."""
+    servers = [create_git_remote_repo() for _ in range(3)]
+    for server in servers:
+        run(
+            ["git", "commit", "--allow-empty", "-m", "init"],
+            cwd=server,
+            env=git_commit_envvars,
+        )
+    remotes = {f"mirror{i}": server.as_uri() for i, server in enumerate(servers[1:])}
+    git_repo = GitSync(
+        url=servers[0].as_uri(),
+        path=tmp_path / "checkout",
+        remotes=remotes,
+        fetch_remotes=["origin", *remotes],
+        fetch_jobs=3,
+    )
+    git_repo.obtain()
+
+    assert git_repo.update_repo().ok
+    remote_refs = git_repo.cmd.run(["for-each-ref", "--format=%(refname)"])
+    for name in remotes:
+        assert f"refs/remotes/{name}/master" in remote_refs
+
+    with pytest.raises(ValueError, match="mutually exclusive"):
+        GitSync(
+            url=servers[0].as_uri(),
+            path=tmp_path / "invalid",
+            fetch_refspecs=["master"],
+            fetch_remotes=["origin"],
+        )
+
+
+def test_GitSync_update_repo_skip_unchanged_fetch(
+    create_git_remote_repo: CreateRepoFn,
+    git_commit_envvars: GitCommitEnvVars,
+    tmp_path: pathlib.Path,
+    mocker: MockerFixture,
+) -> None:
+    """update_repo() fetches only once ls-remote shows the branch moved."""
+    git_server = create_git_remote_repo()
+    server = GitSync(url=git_server.as_uri(), path=git_server)
+
+    def commit(message: str) -> None:
+        server.cmd.run(
+            ["commit", "--allow-empty", "-m", message], env=git_commit_envvars
+        )
+
+    commit("first")
+    git_repo = GitSync(
+        url=git_server.as_uri(),
+        path=tmp_path / "checkout",
+        skip_unchanged_fetch=True,
+    )
+    git_repo.obtain()
+    fetch = mocker.spy(git_repo, "_fetch")
+
+    assert git_repo.update_repo().ok
+    assert fetch.call_count == 0
+
+    commit("second")
+    assert git_repo.update_repo().ok
+    assert fetch.call_count == 1
+    assert git_repo.get_revision() == server.get_revision()
+
+
+def test_GitSync_export(
+    create_git_remote_repo: CreateRepoFn,
+    git_commit_envvars: GitCommitEnvVars,
+    tmp_path: pathlib.Path,
+) -> None:
+    """export() writes a revision's files from a checkout or a bare mirror."""
+    git_server = create_git_remote_repo()
+    server = GitSync(url=git_server.as_uri(), path=git_server)
+    (git_server / "app").mkdir()
+    (git_server / "app" / "main.py").write_bytes(os.urandom(300_000))
+    (git_server / "README").write_text("v1\n")
+    server.cmd.run(["add", "app", "README"])
+    server.cmd.run(["commit", "-m", "v1"], env=git_commit_envvars)
+    server.cmd.run(["tag", "v1"])
+    (git_server / "README").write_text("v2\n")
+    server.cmd.run(["commit", "-am", "v2"], env=git_commit_envvars)
+
+    mirrored = GitSync(
+        url=git_server.as_uri(),
+        path=tmp_path / "unused",
+        mirror_cache=GitMirrorCache(tmp_path / "mirrors"),
+    )
+    deployed = mirrored.export(tmp_path / "deploy", rev="v1", pathspecs=["app"])
+    assert not mirrored.path.exists()
+    assert sorted(p.name for p in deployed.iterdir()) == ["app"]
+    main = (deployed / "app" / "main.py").read_bytes()
+    assert main == (git_server / "app" / "main.py").read_bytes()
+
+    git_repo = GitSync(url=git_server.as_uri(), path=tmp_path / "checkout")
+    git_repo.obtain()
+    (git_repo.path / "README").write_text("local edit\n")
+    git_repo.export(tmp_path / "deploy")
+    assert (tmp_path / "deploy" / "README").read_text() == "v2\n"
+
+    with pytest.raises(exc.CommandError):
+        git_repo.export(tmp_path / "missing", rev="no-such-rev")
+
+
 def test_update_repo_success_returns_sync_result(
     create_git_remote_bare_repo: CreateRepoFn,
     tmp_path: pathlib.Path,